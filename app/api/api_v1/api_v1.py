@@ -1,8 +1,21 @@
 from fastapi import APIRouter
-from .endpoints import mission, robot
+from .endpoints import changes, metrics, mission, robot, route, stats, telemetry
 
 router = APIRouter()
 
+"""
+    Route for listing all mission route endpoints.
+
+    Included before the mission routes so that `/missions/routes` is not taken for
+    a mission ID.
+
+    Includes routes for:
+    - Uploading the routes of many missions
+    - Computing the route metrics of many missions
+    - Uploading, retrieving and deleting the route of a single mission
+    """
+router.include_router(route.router, prefix="/missions", tags=["routes"])
+
 """
     Route for listing all mission-related endpoints.
 
@@ -11,6 +24,7 @@ router = APIRouter()
     - Retrieving a single mission by ID
     - Creating a new mission
     - Updating an existing mission
+    - Scheduling a mission
     """
 router.include_router(mission.router, prefix="/missions", tags=["missions"])
 
@@ -19,8 +33,47 @@ router.include_router(mission.router, prefix="/missions", tags=["missions"])
 
     Includes routes for:
     - Retrieving a list of robots
+    - Retrieving the latest reported state of every robot
+    - Finding the robots nearest a location or inside a box
     - Retrieving a single robot by ID
     - Creating a new robot
     - Updating an existing robot
+    - Handing a ready robot its next due mission
     """
 router.include_router(robot.router, prefix="/robots", tags=["robots"])
+
+"""
+    Route for listing all operational metrics endpoints.
+
+    Includes routes for:
+    - Retrieving database connection pool statistics
+    - Retrieving entity cache statistics
+    - Retrieving fleet statistics reconciliation counters
+    """
+router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+
+"""
+    Route for listing all change-feed endpoints.
+
+    Includes routes for:
+    - Streaming mission and robot changes as Server-Sent Events
+    - Streaming mission and robot changes over a WebSocket
+    """
+router.include_router(changes.router, prefix="/changes", tags=["changes"])
+
+"""
+    Route for listing all telemetry endpoints.
+
+    Includes routes for:
+    - Ingesting batches of robot telemetry samples
+    - Retrieving a robot's telemetry within a time range, optionally downsampled
+    """
+router.include_router(telemetry.router, prefix="/telemetry", tags=["telemetry"])
+
+"""
+    Route for the fleet dashboard statistics.
+
+    Includes routes for:
+    - Retrieving mission counts per status, robot model and robot, and the status history
+    """
+router.include_router(stats.router, prefix="/stats", tags=["stats"])
@@ -0,0 +1,46 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from app.schemas.bulk import BulkItemError, BulkResult
+
+
+def validate_items(schema: type[BaseModel], items: list[Any]) -> tuple[list[int], list[BaseModel], list[BulkItemError]]:
+    """
+    Validate every item of a bulk request body independently.
+
+    Args:
+        schema (type[BaseModel]): The Pydantic model each item must satisfy.
+        items (list[Any]): The raw items of the request body.
+
+    Returns:
+        tuple: The indices of the valid items, the validated models, and one error per invalid item.
+    """
+    indices, valid, errors = [], [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append(schema.model_validate(item))
+            indices.append(index)
+        except ValidationError as exc:
+            detail = "; ".join(f"{'.'.join(map(str, err['loc'])) or 'item'}: {err['msg']}" for err in exc.errors())
+            errors.append(BulkItemError(index=index, detail=detail))
+    return indices, valid, errors
+
+
+def build_result(total: int, indices: list[int], ids: list[Optional[int]], errors: list[BulkItemError]) -> BulkResult:
+    """
+    Assemble a `BulkResult` whose IDs line up with the request body.
+
+    Args:
+        total (int): The number of items in the request body.
+        indices (list[int]): The request positions of the items that were written.
+        ids (list[Optional[int]]): The ID for each written item; None marks a failure.
+        errors (list[BulkItemError]): Errors collected so far.
+
+    Returns:
+        BulkResult: The combined result, with errors sorted by index.
+    """
+    aligned = [None] * total
+    for index, item_id in zip(indices, ids):
+        aligned[index] = item_id
+    return BulkResult(ids=aligned, errors=sorted(errors, key=lambda err: err.index))
@@ -0,0 +1,155 @@
+import asyncio
+from typing import AsyncIterator, Literal, Optional
+
+import orjson
+from fastapi import APIRouter, Header, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.events import Subscription, SubscriptionLagged, broadcaster
+
+router = APIRouter()
+
+# Idle connections get a keep-alive message this often, which also detects dead clients
+HEARTBEAT_SECONDS = 15.0
+
+# WebSocket close code telling the client to reconnect later (RFC 6455 "Try Again Later")
+WS_TRY_AGAIN_LATER = 1013
+
+Entity = Literal["mission", "robot"]
+
+
+async def feed_messages(subscription: Subscription, heartbeat: float = HEARTBEAT_SECONDS) -> AsyncIterator[dict]:
+    """
+    Turn a subscription into the messages sent to a client.
+
+    Yields a `reset` message first if events after the requested sequence number are
+    no longer buffered, then one `change` message per event, with a `ping` after every
+    `heartbeat` seconds of silence. Ends with a `lagged` message if the client fell
+    too far behind; it can reconnect with `since` set to the message's `last_seq`.
+
+    Args:
+        subscription (Subscription): The subscription to read from.
+        heartbeat (float): Seconds of silence before a `ping` is sent.
+
+    Yields:
+        dict: Messages with a `type` of `reset`, `change`, `ping` or `lagged`.
+    """
+    if subscription.gap:
+        yield {"type": "reset"}
+    while True:
+        try:
+            event = await asyncio.wait_for(subscription.get(), heartbeat)
+        except asyncio.TimeoutError:
+            yield {"type": "ping"}
+            continue
+        except SubscriptionLagged as exc:
+            yield {"type": "lagged", "last_seq": exc.last_seq}
+            return
+        yield {"type": "change", **event.to_dict()}
+
+
+def sse_frame(message: dict) -> bytes:
+    """
+    Encode a feed message as a Server-Sent Events frame.
+
+    Changes are sent as unnamed events whose ID is the sequence number, so the
+    browser's `EventSource` resumes from it on reconnect; other messages are named
+    events, and pings are comments.
+
+    Args:
+        message (dict): A message from `feed_messages`.
+
+    Returns:
+        bytes: The frame, terminated by a blank line.
+    """
+    if message["type"] == "ping":
+        return b": ping\n\n"
+    data = orjson.dumps(message)
+    if message["type"] == "change":
+        return b"id: %d\ndata: %s\n\n" % (message["seq"], data)
+    return b"event: %s\ndata: %s\n\n" % (message["type"].encode(), data)
+
+
+@router.get("/stream")
+async def stream_changes(
+    entity: Optional[Entity] = None,
+    robot_id: Optional[int] = None,
+    since: Optional[int] = None,
+    last_event_id: Optional[int] = Header(None),
+):
+    """
+    Stream mission and robot changes as Server-Sent Events.
+
+    Args:
+        entity (Optional[str]): Only stream changes of `mission` or `robot`.
+        robot_id (Optional[int]): Only stream changes to this robot and its missions.
+        since (Optional[int]): Replay buffered changes after this sequence number.
+        last_event_id (Optional[int]): Sent by `EventSource` on reconnect; takes
+            precedence over `since`.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` that stays open until the client leaves.
+    """
+    subscription = broadcaster.subscribe(
+        entity=entity, robot_id=robot_id, since=last_event_id if last_event_id is not None else since
+    )
+
+    async def frames():
+        try:
+            async for message in feed_messages(subscription):
+                yield sse_frame(message)
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def watch_changes(
+    websocket: WebSocket,
+    entity: Optional[Entity] = Query(None),
+    robot_id: Optional[int] = Query(None),
+    since: Optional[int] = Query(None),
+):
+    """
+    Stream mission and robot changes over a WebSocket as JSON messages.
+
+    The messages are those of `feed_messages`. After a `lagged` message the socket is
+    closed with code 1013, and the client should reconnect with `since`.
+
+    Args:
+        websocket (WebSocket): The client connection.
+        entity (Optional[str]): Only stream changes of `mission` or `robot`.
+        robot_id (Optional[int]): Only stream changes to this robot and its missions.
+        since (Optional[int]): Replay buffered changes after this sequence number.
+    """
+    # Subscribe before accepting so no change made after the handshake is missed
+    subscription = broadcaster.subscribe(entity=entity, robot_id=robot_id, since=since)
+
+    async def send_feed():
+        async for message in feed_messages(subscription):
+            await websocket.send_text(orjson.dumps(message).decode())
+            if message["type"] == "lagged":
+                await websocket.close(code=WS_TRY_AGAIN_LATER)
+
+    async def wait_for_disconnect():
+        # Messages from the client are ignored; reading them is how a hang-up is noticed
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    try:
+        await websocket.accept()
+        tasks = {asyncio.ensure_future(send_feed()), asyncio.ensure_future(wait_for_disconnect())}
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            task.result()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broadcaster.unsubscribe(subscription)
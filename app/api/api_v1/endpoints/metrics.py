@@ -0,0 +1,133 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.cache import mission_cache, robot_cache
+from app.db.async_base import async_engine
+from app.db.base import engine
+from app.events import broadcaster
+from app.instrumentation import CONTENT_TYPE, Exposition, add_request_metrics, request_metrics
+from app.scheduler import dispatcher, scheduler_running
+from app.stats import fleet_stats
+from app.telemetry import telemetry_buffer
+
+router = APIRouter()
+
+# Serves `GET /metrics` at the root of the application, where Prometheus scrapes by default
+prometheus_router = APIRouter()
+
+
+@router.get("/db")
+def read_db_metrics():
+    """
+    Report connection pool usage for the sync and async engines.
+
+    Returns:
+        dict: Checkout/checkin/connect counters, time spent waiting for a free
+        connection and, for queue pools, the current size, checked-out and overflow counts.
+    """
+    return {
+        "sync": engine.pool_stats.snapshot(engine.pool),
+        "async": async_engine.sync_engine.pool_stats.snapshot(async_engine.sync_engine.pool),
+    }
+
+
+@router.get("/cache")
+def read_cache_metrics():
+    """
+    Report hit, miss, eviction and expiration counters of the entity caches.
+
+    Returns:
+        dict: The counters of the mission and robot caches.
+    """
+    return {"mission": mission_cache.stats(), "robot": robot_cache.stats()}
+
+
+@router.get("/events")
+def read_event_metrics():
+    """
+    Report the state of the change feed.
+
+    Returns:
+        dict: The current sequence number, events published, buffered events,
+        connected subscribers and subscribers dropped for lagging.
+    """
+    return broadcaster.stats()
+
+
+@router.get("/telemetry")
+def read_telemetry_metrics():
+    """
+    Report the state of the telemetry write-behind buffer.
+
+    Returns:
+        dict: Pending samples, samples received, written, refused and dropped, the
+        number of flushes and the size and duration of the last one.
+    """
+    return telemetry_buffer.stats()
+
+
+@router.get("/dispatch")
+def read_dispatch_metrics():
+    """
+    Report the state of the mission scheduler and dispatcher.
+
+    Returns:
+        dict: Whether this process runs the scheduler, the missions waiting in the
+        dispatch queues, the robots waiting idle, and the missions queued and
+        assigned so far.
+    """
+    return {"scheduler_running": scheduler_running(), **dispatcher.stats()}
+
+
+@router.get("/stats")
+def read_stats_metrics():
+    """
+    Report how the incremental fleet statistics have been reconciled.
+
+    Returns:
+        dict: The number of reconciliations, the counts they corrected in total and
+        when the last one ran.
+    """
+    return fleet_stats.stats()
+
+
+@prometheus_router.get("/metrics", response_class=Response)
+async def read_prometheus_metrics():
+    """
+    Serve the request metrics and the counters of every component in the Prometheus text format.
+
+    Returns:
+        Response: Per-route request counts, latency, SQL statement and database time
+        histograms, the statements executed by each engine, and the fields of the
+        JSON metrics endpoints as untyped samples.
+    """
+    exposition = Exposition()
+    add_request_metrics(exposition, request_metrics)
+    engines = (("sync", engine), ("async", async_engine.sync_engine))
+    exposition.family(
+        "missions_app_db_statements_total",
+        "counter",
+        "SQL statements executed, in and out of requests.",
+        [({"engine": name}, db.statement_stats.statements) for name, db in engines],
+    )
+    exposition.family(
+        "missions_app_db_statement_seconds_total",
+        "counter",
+        "Time spent executing SQL statements.",
+        [({"engine": name}, db.statement_stats.seconds) for name, db in engines],
+    )
+    exposition.stats(
+        "missions_app_db_pool",
+        "Connection pool",
+        [({"engine": name}, db.pool_stats.snapshot(db.pool)) for name, db in engines],
+    )
+    exposition.stats(
+        "missions_app_cache",
+        "Entity cache",
+        [({"cache": "mission"}, mission_cache.stats()), ({"cache": "robot"}, robot_cache.stats())],
+    )
+    exposition.stats("missions_app_events", "Change feed", [({}, broadcaster.stats())])
+    exposition.stats("missions_app_telemetry", "Telemetry buffer", [({}, telemetry_buffer.stats())])
+    exposition.stats("missions_app_dispatch", "Dispatcher", [({}, read_dispatch_metrics())])
+    exposition.stats("missions_app_stats", "Fleet statistics", [({}, fleet_stats.stats())])
+    return Response(exposition.render(), media_type=CONTENT_TYPE)
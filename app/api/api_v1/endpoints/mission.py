@@ -1,81 +1,566 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import Any, Literal, Optional
+
+from fastapi import APIRouter, Body, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import mission as schemas
-from app.crud import mission as crud
-from app.db.session import get_db
+from app.schemas.bulk import BulkItemError, BulkResult, ImportReport
+from app.schemas.schedule import MissionSchedule, MissionScheduleCreate
+from app.crud import async_mission as crud
+from app.crud.mission import (
+    EXPANDED_ROBOT_PREFIX,
+    KEYSET_SORTS,
+    MISSION_ROW_FIELDS,
+    MISSION_STATUS_FIELDS,
+    iter_missions,
+)
+from app.crud.robot import ROBOT_ROW_FIELDS
+from app.crud.errors import InvalidTransitionError, VersionConflictError
+from app.db.session import get_async_db
+from app.api.api_v1.bulk import build_result, validate_items
+from app.api.api_v1.etag import entity_etag, expected_version, is_not_modified, list_etag, not_modified
+from app.api.api_v1.imports import detect_format, import_stream
+from app.api.api_v1.ndjson import export_response
+from app.api.api_v1.rows import row_dict, rows_response
+from app.api.api_v1.pagination import NEXT_CURSOR_HEADER, decode_sorted_cursor, set_next_cursor
+from app.api.api_v1.scheduling import require_scheduler, schedule_body
+from app.scheduler import archive_finished_missions, job_id, now_ms, schedule_mission
 
 router = APIRouter()
 
 
-@router.get("/", response_model=list[schemas.Mission])
-def read_missions(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def _with_robot(row) -> dict:
+    """Build the `MissionWithRobot` body of a mission row carrying its robot's columns."""
+    mission = row_dict(row, MISSION_ROW_FIELDS)
+    mission["robot"] = (
+        row_dict(row, ROBOT_ROW_FIELDS, EXPANDED_ROBOT_PREFIX)
+        if row._mapping[EXPANDED_ROBOT_PREFIX + "id"] is not None
+        else None
+    )
+    return mission
+
+
+def _robot_version(row) -> Optional[dict]:
+    """Return the ID and version of the robot joined to a mission row, for ETags."""
+    robot = row_dict(row, ("id", "version"), EXPANDED_ROBOT_PREFIX)
+    return robot if robot["id"] is not None else None
+
+
+
+@router.get("/", response_model=list[schemas.MissionWithRobot], response_model_exclude_unset=True)
+async def read_missions(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    expand: Optional[Literal["robot"]] = None,
+    robot_id: Optional[int] = None,
+    name_prefix: Optional[str] = None,
+    model_name: Optional[str] = None,
+    sort: schemas.MissionSort = "id",
+    status: Optional[schemas.MissionStatusName] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve a filtered and sorted list of missions with optional pagination.
+
+    Pages can be requested either by offset (`skip`) or by cursor. When a page is full,
+    the cursor for the next one is returned in the `X-Next-Cursor` header; passing it
+    back as `cursor` continues the listing with a keyset query on the primary key.
+
+    Missions can be filtered by robot, by name prefix, by the robot's model name and
+    by status, and sorted by `id`, `name`, `robot_id` or `queued_at` (prefix with `-`
+    for descending order).
+    Cursors are only available for the `id` and `-id` sorts; other sorts page by offset.
+
+    With `expand=robot` each mission embeds its robot, joined in the same query.
+
+    The page carries a strong ETag derived from the IDs and versions of its rows; a
+    matching `If-None-Match` header is answered with 304 and no body.
+
+    The page is read as column rows and encoded directly with orjson, skipping ORM
+    hydration and response-model validation.
+
+    Args:
+        request (Request): The incoming request, checked for `If-None-Match`.
+        response (Response): The outgoing response, used to set the next cursor and ETag.
+        skip (int): The number of missions to skip (default is 0). Ignored when `cursor` is given.
+        limit (int): The maximum number of missions to return (default is 100).
+        cursor (Optional[str]): The opaque cursor returned with the previous page.
+        expand (Optional[str]): `robot` to embed each mission's robot.
+        robot_id (Optional[int]): Only include missions of this robot.
+        name_prefix (Optional[str]): Only include missions whose name starts with this prefix.
+        model_name (Optional[str]): Only include missions whose robot has this model name.
+        sort (schemas.MissionSort): The sort key (default is "id").
+        status (Optional[schemas.MissionStatusName]): Only include missions in this status.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        list[schemas.MissionWithRobot]: A list of mission objects, with `robot` only when expanded.
+
+    Raises:
+        HTTPException: If the cursor is malformed or combined with a non-ID sort.
+    """
+    after_id = decode_sorted_cursor(cursor, sort, KEYSET_SORTS)
+    expand_robot = expand == "robot"
+    missions = await crud.get_mission_rows(
+        db,
+        skip=skip,
+        limit=limit,
+        after_id=after_id,
+        expand_robot=expand_robot,
+        robot_id=robot_id,
+        name_prefix=name_prefix,
+        model_name=model_name,
+        sort=sort,
+        status=status,
+    )
+    next_cursor = set_next_cursor(response, missions, limit) if sort in KEYSET_SORTS else None
+    cursor_headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    etag = list_etag(missions, related=[_robot_version(mission) for mission in missions] if expand_robot else ())
+    if is_not_modified(request, etag):
+        return not_modified(etag, cursor_headers)
+    headers = {"ETag": etag, **cursor_headers}
+    if expand_robot:
+        return ORJSONResponse([_with_robot(mission) for mission in missions], headers=headers)
+    return rows_response(missions, MISSION_ROW_FIELDS, headers)
+
+
+@router.get("/search", response_model=list[schemas.Mission])
+async def search_missions(
+    q: str = Query(..., min_length=1),
+    skip: int = 0,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Search missions by keywords in their name and description.
+
+    Every word of `q` must match. Results are ranked by relevance, with name matches
+    weighted above description matches, and paginated by offset.
+
+    Args:
+        q (str): The search query.
+        skip (int): The number of results to skip (default is 0).
+        limit (int): The maximum number of results to return (default is 20).
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        list[schemas.Mission]: The matching missions, best match first.
+    """
+    missions = await crud.search_missions(db, q=q, skip=skip, limit=limit)
+    return rows_response(missions, MISSION_ROW_FIELDS)
+
+
+@router.get("/export")
+def export_missions(gzip: bool = False):
+    """
+    Stream every mission as newline-delimited JSON.
+
+    Rows are read with a server-side cursor and written out as they arrive, so the
+    export runs in constant memory regardless of the table size.
+
+    Args:
+        gzip (bool): Whether to gzip-compress the stream (default is False).
+
+    Returns:
+        StreamingResponse: One JSON object per line, ordered by ID.
+    """
+    return export_response(iter_missions, "missions.ndjson", gzip=gzip)
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def create_missions_bulk(items: list[Any] = Body(...), db: AsyncSession = Depends(get_async_db)):
+    """
+    Create many missions in one request and one database transaction.
+
+    Items are validated independently; invalid items are reported in `errors` and the
+    remaining ones are still created.
+
+    Args:
+        items (list[Any]): The mission payloads, each matching `schemas.MissionCreate`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        BulkResult: The generated ID of each item, aligned with the request body.
+    """
+    indices, missions, errors = validate_items(schemas.MissionCreate, items)
+    ids = await crud.create_missions(db, missions) if missions else []
+    return build_result(len(items), indices, ids, errors)
+
+
+@router.put("/bulk", response_model=BulkResult)
+async def update_missions_bulk(items: list[Any] = Body(...), db: AsyncSession = Depends(get_async_db)):
+    """
+    Update many missions in one request and one database transaction.
+
+    Items are validated independently; invalid items and unknown IDs are reported in
+    `errors` and the remaining ones are still updated.
+
+    Args:
+        items (list[Any]): The mission payloads, each matching `schemas.MissionBulkUpdate`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        BulkResult: The ID of each updated item, aligned with the request body.
+    """
+    indices, missions, errors = validate_items(schemas.MissionBulkUpdate, items)
+    found = await crud.update_missions(db, missions) if missions else []
+    for index, ok in zip(indices, found):
+        if not ok:
+            errors.append(BulkItemError(index=index, detail="Mission not found"))
+    ids = [mission.id if ok else None for mission, ok in zip(missions, found)]
+    return build_result(len(items), indices, ids, errors)
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_missions(request: Request, format: Optional[str] = None):
+    """
+    Import missions from an NDJSON or CSV upload of any size.
+
+    The body is read incrementally and written in batches, each in its own
+    transaction, so memory use stays bounded. CSV uploads need a header row naming
+    the `schemas.MissionCreate` fields.
+
+    Args:
+        request (Request): The incoming request whose body is streamed.
+        format (Optional[str]): `ndjson` or `csv`; defaults to the Content-Type header.
+
+    Returns:
+        ImportReport: Row counts, throughput and the first errors.
+    """
+    format = detect_format(request.headers.get("content-type"), format)
+    return await import_stream(request.stream(), format, schemas.MissionCreate, crud.create_missions)
+
+
+@router.post("/archive", response_model=schemas.ArchiveResult, dependencies=[Depends(require_scheduler)])
+async def archive_missions(finished_before: datetime):
     """
-    Retrieve a list of missions with optional pagination.
+    Move the missions that finished before a cutoff to the `missions_archive` table.
+
+    Only missions that are `done` or `failed` are archived, and missions with a
+    schedule are kept since they will run again. Archived missions are no longer
+    served by the mission endpoints.
 
     Args:
-        skip (int): The number of missions to skip (default is 0).
-        limit (int): The maximum number of missions to return (default is 10).
-        db (Session): The database session dependency.
+        finished_before (datetime): The cutoff; a time without a timezone is taken as UTC.
 
     Returns:
-        list[schemas.Mission]: A list of mission objects.
+        schemas.ArchiveResult: The number of missions archived.
+
+    Raises:
+        HTTPException: 503 if this process does not run the scheduler.
     """
-    return crud.get_missions(db, skip=skip, limit=limit)
+    if finished_before.tzinfo is None:
+        finished_before = finished_before.replace(tzinfo=timezone.utc)
+    return {"archived": await archive_finished_missions(int(finished_before.timestamp() * 1000))}
 
 
-@router.get("/{mission_id}", response_model=schemas.Mission)
-def read_mission(mission_id: int, db: Session = Depends(get_db)):
+@router.get("/{mission_id}", response_model=schemas.MissionWithRobot, response_model_exclude_unset=True)
+async def read_mission(
+    mission_id: int,
+    request: Request,
+    expand: Optional[Literal["robot"]] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
     """
     Retrieve a single mission by its ID.
 
+    The response carries a strong ETag; a matching `If-None-Match` header is
+    answered with 304 and no body.
+
     Args:
         mission_id (int): The ID of the mission to retrieve.
-        db (Session): The database session dependency.
+        request (Request): The incoming request, checked for `If-None-Match`.
+        expand (Optional[str]): `robot` to embed the mission's robot.
+        db (AsyncSession): The async database session dependency.
 
     Returns:
-        schemas.Mission: The mission object.
+        schemas.MissionWithRobot: The mission object, with `robot` only when expanded.
 
     Raises:
         HTTPException: If the mission with the given ID is not found.
     """
-    mission = crud.get_mission(db, mission_id=mission_id)
+    expand_robot = expand == "robot"
+    mission = await crud.get_mission(db, mission_id=mission_id, expand_robot=expand_robot)
     if mission is None:
         raise HTTPException(status_code=404, detail="Mission not found")
-    return mission
+    etag = list_etag([mission], related=[_robot_version(mission)]) if expand_robot else entity_etag(mission)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    body = _with_robot(mission) if expand_robot else row_dict(mission, MISSION_ROW_FIELDS)
+    return ORJSONResponse(body, headers={"ETag": etag})
 
 
 @router.post("/", response_model=schemas.Mission)
-def create_mission(mission: schemas.MissionCreate, db: Session = Depends(get_db)):
+async def create_mission(mission: schemas.MissionCreate, response: Response, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new mission.
 
     Args:
         mission (schemas.MissionCreate): The mission data to create.
-        db (Session): The database session dependency.
+        response (Response): The outgoing response, used to set the ETag.
+        db (AsyncSession): The async database session dependency.
 
     Returns:
         schemas.Mission: The created mission object.
     """
-    return crud.create_mission(db=db, mission=mission)
+    db_mission = await crud.create_mission(db=db, mission=mission)
+    response.headers["ETag"] = entity_etag(db_mission)
+    return db_mission
+
+
+async def _apply_update(db: AsyncSession, request: Request, mission_id: int, data) -> ORJSONResponse:
+    """Run a PUT or PATCH in one UPDATE statement and map its outcome to a response."""
+    version = expected_version(request, mission_id)
+    try:
+        mission = await crud.update_mission(db=db, mission=data, mission_id=mission_id, expected_version=version)
+    except VersionConflictError:
+        raise HTTPException(status_code=412, detail="Precondition failed")
+    if mission is None:
+        raise HTTPException(status_code=404, detail="Mission not found")
+    return ORJSONResponse(row_dict(mission, MISSION_ROW_FIELDS), headers={"ETag": entity_etag(mission)})
 
 
 @router.put("/{mission_id}", response_model=schemas.Mission)
-def update_mission(mission_id: int, mission: schemas.MissionUpdate, db: Session = Depends(get_db)):
+async def update_mission(
+    mission_id: int,
+    mission: schemas.MissionUpdate,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
     """
     Update an existing mission by its ID.
 
+    The update is a single UPDATE statement; a missing mission is detected from the
+    affected row count rather than a separate lookup.
+
+    An `If-Match` header carrying the mission's ETag makes the update conditional: it
+    is rejected with 412 if the mission has changed since that ETag was issued.
+
     Args:
         mission_id (int): The ID of the mission to update.
         mission (schemas.MissionUpdate): The updated mission data.
-        db (Session): The database session dependency.
+        request (Request): The incoming request, checked for `If-Match`.
+        db (AsyncSession): The async database session dependency.
 
     Returns:
-        schemas.Mission: The updated mission object.
+        schemas.Mission: The updated mission object, with its new ETag.
+
+    Raises:
+        HTTPException: If the mission with the given ID is not found, or the
+            `If-Match` precondition fails.
+    """
+    return await _apply_update(db, request, mission_id, mission)
+
+
+@router.patch("/{mission_id}", response_model=schemas.Mission)
+async def patch_mission(
+    mission_id: int,
+    mission: schemas.MissionPatch,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Partially update an existing mission by its ID.
+
+    Only the fields present in the body are written. `If-Match` is honoured as for PUT.
+
+    Args:
+        mission_id (int): The ID of the mission to update.
+        mission (schemas.MissionPatch): The fields to change.
+        request (Request): The incoming request, checked for `If-Match`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.Mission: The updated mission object, with its new ETag.
+
+    Raises:
+        HTTPException: If the mission with the given ID is not found, or the
+            `If-Match` precondition fails.
+    """
+    return await _apply_update(db, request, mission_id, mission)
+
+
+@router.put("/{mission_id}/schedule", response_model=MissionSchedule)
+async def put_mission_schedule(
+    mission_id: int,
+    schedule: MissionScheduleCreate,
+    db: AsyncSession = Depends(get_async_db),
+    scheduler=Depends(require_scheduler),
+):
+    """
+    Create or replace the schedule of a mission.
+
+    Each run queues the mission for its robot with the schedule's priority; the
+    robot receives it from `POST /robots/{robot_id}/ready`. The schedule is stored
+    in the database and survives restarts.
+
+    Args:
+        mission_id (int): The ID of the mission to schedule.
+        schedule (MissionScheduleCreate): When and with which priority the mission runs.
+        db (AsyncSession): The async database session dependency.
+        scheduler (AsyncIOScheduler): The running scheduler dependency.
+
+    Returns:
+        MissionSchedule: The stored schedule with its next run time.
+
+    Raises:
+        HTTPException: 404 if the mission is not found, 503 if this process does not
+            run the scheduler.
+    """
+    if await crud.get_mission(db, mission_id=mission_id) is None:
+        raise HTTPException(status_code=404, detail="Mission not found")
+    job = schedule_mission(mission_id, schedule)
+    return schedule_body(mission_id, scheduler.get_job(job.id) or job)
+
+
+@router.get("/{mission_id}/schedule", response_model=MissionSchedule)
+def read_mission_schedule(mission_id: int, scheduler=Depends(require_scheduler)):
+    """
+    Retrieve the schedule of a mission.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        scheduler (AsyncIOScheduler): The running scheduler dependency.
+
+    Returns:
+        MissionSchedule: The schedule with its next run time.
+
+    Raises:
+        HTTPException: 404 if the mission has no pending schedule, 503 if this process
+            does not run the scheduler.
+    """
+    job = scheduler.get_job(job_id(mission_id))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Mission is not scheduled")
+    return schedule_body(mission_id, job)
+
+
+@router.delete("/{mission_id}/schedule", status_code=204)
+def delete_mission_schedule(mission_id: int, scheduler=Depends(require_scheduler)):
+    """
+    Cancel the future runs of a mission. A run that was already queued stays queued.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        scheduler (AsyncIOScheduler): The running scheduler dependency.
+
+    Raises:
+        HTTPException: 404 if the mission has no pending schedule, 503 if this process
+            does not run the scheduler.
+    """
+    if scheduler.get_job(job_id(mission_id)) is None:
+        raise HTTPException(status_code=404, detail="Mission is not scheduled")
+    scheduler.remove_job(job_id(mission_id))
+    return Response(status_code=204)
+
+
+def _status_response(row) -> ORJSONResponse:
+    """Build the `MissionStatus` body of a mission row, with the mission's ETag."""
+    return ORJSONResponse(
+        {field: row[field] for field in MISSION_STATUS_FIELDS if field != "version"},
+        headers={"ETag": entity_etag(row)},
+    )
+
+
+async def _transition(db: AsyncSession, request: Request, mission_id: int, status: str) -> ORJSONResponse:
+    """Move a mission to another status and map the outcome to a response."""
+    version = expected_version(request, mission_id)
+    try:
+        mission = await crud.transition_mission(
+            db, mission_id=mission_id, status=status, at=now_ms(), expected_version=version
+        )
+    except VersionConflictError:
+        raise HTTPException(status_code=412, detail="Precondition failed")
+    except InvalidTransitionError as exc:
+        raise HTTPException(status_code=409, detail=f"Mission is {exc.status} and cannot become {status}")
+    if mission is None:
+        raise HTTPException(status_code=404, detail="Mission not found")
+    return _status_response(mission)
+
+
+@router.get("/{mission_id}/status", response_model=schemas.MissionStatus)
+async def read_mission_status(mission_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Retrieve where a mission is in its lifecycle.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.MissionStatus: The mission's status and the times of its current run.
 
     Raises:
         HTTPException: If the mission with the given ID is not found.
     """
-    db_mission = crud.get_mission(db, mission_id=mission_id)
-    if db_mission is None:
+    row = await crud.get_mission_status(db, mission_id=mission_id)
+    if row is None:
         raise HTTPException(status_code=404, detail="Mission not found")
-    return crud.update_mission(db=db, mission=mission, mission_id=mission_id)
+    return _status_response(row._mapping)
+
+
+@router.post("/{mission_id}/start", response_model=schemas.MissionStatus)
+async def start_mission(mission_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Record that the robot started a mission it was assigned.
+
+    Every transition is one conditional UPDATE, so concurrent reports cannot both
+    succeed. `If-Match` with the mission's ETag is honoured as for PUT.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        request (Request): The incoming request, checked for `If-Match`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.MissionStatus: The mission's new status, with its new ETag.
+
+    Raises:
+        HTTPException: 404 if the mission is not found, 409 if it is not `assigned`,
+            412 if the `If-Match` precondition fails.
+    """
+    return await _transition(db, request, mission_id, "running")
+
+
+@router.post("/{mission_id}/complete", response_model=schemas.MissionStatus)
+async def complete_mission(mission_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Record that a running mission finished successfully.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        request (Request): The incoming request, checked for `If-Match`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.MissionStatus: The mission's new status, with its new ETag.
+
+    Raises:
+        HTTPException: 404 if the mission is not found, 409 if it is not `running`,
+            412 if the `If-Match` precondition fails.
+    """
+    return await _transition(db, request, mission_id, "done")
+
+
+@router.post("/{mission_id}/fail", response_model=schemas.MissionStatus)
+async def fail_mission(mission_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Record that an assigned or running mission failed.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        request (Request): The incoming request, checked for `If-Match`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.MissionStatus: The mission's new status, with its new ETag.
+
+    Raises:
+        HTTPException: 404 if the mission is not found, 409 if it is neither `assigned`
+            nor `running`, 412 if the `If-Match` precondition fails.
+    """
+    return await _transition(db, request, mission_id, "failed")
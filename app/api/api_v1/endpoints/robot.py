@@ -1,36 +1,257 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from typing import Any, Optional
+
+from fastapi import APIRouter, Body, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import robot as schemas
-from app.crud import robot as crud
-from app.db.session import get_db
+from app.schemas import mission as mission_schemas
+from app.schemas import telemetry as telemetry_schemas
+from app.schemas.bulk import BulkItemError, BulkResult, ImportReport
+from app.crud import async_robot as crud
+from app.crud import async_mission as mission_crud
+from app.crud.mission import KEYSET_SORTS, MISSION_ROW_FIELDS
+from app.crud.robot import ROBOT_ROW_FIELDS, iter_robots
+from app.crud.telemetry import ROBOT_STATE_FIELDS
+from app.crud.errors import VersionConflictError
+from app.db.session import get_async_db
+from app.api.api_v1.bulk import build_result, validate_items
+from app.api.api_v1.etag import entity_etag, expected_version, is_not_modified, list_etag, not_modified
+from app.api.api_v1.imports import detect_format, import_stream
+from app.api.api_v1.ndjson import export_response
+from app.api.api_v1.rows import row_dict, rows_response
+from app.api.api_v1.pagination import NEXT_CURSOR_HEADER, decode_cursor, decode_sorted_cursor, set_next_cursor
+from app.api.api_v1.scheduling import require_scheduler
+from app.scheduler import next_mission
+from app.telemetry import RobotStateStore, get_robot_state_store
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[schemas.Robot])
-def read_robots(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def read_robots(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
     """
     Retrieve a list of robots with optional pagination.
 
+    Pages can be requested either by offset (`skip`) or by cursor. When a page is full,
+    the cursor for the next one is returned in the `X-Next-Cursor` header; passing it
+    back as `cursor` continues the listing with a keyset query on the primary key.
+
+    The page carries a strong ETag derived from the IDs and versions of its rows; a
+    matching `If-None-Match` header is answered with 304 and no body.
+
+    The page is read as column tuples and encoded directly with orjson, skipping ORM
+    hydration and response-model validation.
+
     Args:
-        skip (int): The number of robots to skip (default is 0).
-        limit (int): The maximum number of robots to return (default is 10).
-        db (Session): The database session dependency.
+        request (Request): The incoming request, checked for `If-None-Match`.
+        response (Response): The outgoing response, used to compute the next cursor.
+        skip (int): The number of robots to skip (default is 0). Ignored when `cursor` is given.
+        limit (int): The maximum number of robots to return (default is 100).
+        cursor (Optional[str]): The opaque cursor returned with the previous page.
+        db (AsyncSession): The async database session dependency.
 
     Returns:
         list[schemas.Robot]: A list of robot objects.
     """
-    return crud.get_robots(db, skip=skip, limit=limit)
+    after_id = decode_cursor(cursor) if cursor is not None else None
+    robots = await crud.get_robot_rows(db, skip=skip, limit=limit, after_id=after_id)
+    next_cursor = set_next_cursor(response, robots, limit)
+    cursor_headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    etag = list_etag(robots)
+    if is_not_modified(request, etag):
+        return not_modified(etag, cursor_headers)
+    return rows_response(robots, ROBOT_ROW_FIELDS, {"ETag": etag, **cursor_headers})
+
+
+@router.get("/export")
+def export_robots(gzip: bool = False):
+    """
+    Stream every robot as newline-delimited JSON.
+
+    Rows are read with a server-side cursor and written out as they arrive, so the
+    export runs in constant memory regardless of the table size.
+
+    Args:
+        gzip (bool): Whether to gzip-compress the stream (default is False).
+
+    Returns:
+        StreamingResponse: One JSON object per line, ordered by ID.
+    """
+    return export_response(iter_robots, "robots.ndjson", gzip=gzip)
+
+
+@router.get("/state", response_model=list[telemetry_schemas.RobotState])
+async def read_robot_states(states: RobotStateStore = Depends(get_robot_state_store)):
+    """
+    Retrieve the latest reported state of every robot, ordered by robot ID.
+
+    The states are served from memory, where every telemetry flush updates them, so
+    the cost is one pass over the fleet and no database query. Robots that never
+    reported telemetry are not listed, and samples still in the write-behind buffer
+    are not yet reflected.
+
+    Args:
+        states (RobotStateStore): The latest-state store dependency.
+
+    Returns:
+        list[telemetry_schemas.RobotState]: One state per robot.
+    """
+    return rows_response(states.rows(), ROBOT_STATE_FIELDS)
+
+
+@router.get("/nearby", response_model=list[telemetry_schemas.NearbyRobot])
+async def read_nearby_robots(
+    x: float,
+    y: float,
+    radius: Optional[float] = Query(None, gt=0),
+    limit: int = Query(10, ge=1, le=1000),
+    state: Optional[str] = None,
+    states: RobotStateStore = Depends(get_robot_state_store),
+):
+    """
+    Retrieve the robots closest to a location, nearest first.
+
+    Positions are the latest reported ones, looked up in the in-memory spatial
+    index of the latest-state store, so neither the database nor the whole fleet
+    is scanned. With `state=idle&limit=1` this finds the nearest available robot.
+
+    Args:
+        x (float): The x coordinate of the location.
+        y (float): The y coordinate of the location.
+        radius (Optional[float]): Only robots at most this far away.
+        limit (int): The most robots to return (default is 10).
+        state (Optional[str]): Only robots in this operating state, e.g. `idle`.
+        states (RobotStateStore): The latest-state store dependency.
+
+    Returns:
+        list[telemetry_schemas.NearbyRobot]: The robots with their distance from the location.
+    """
+    rows = states.nearest(x, y, limit, radius=radius, state=state)
+    return rows_response(rows, (*ROBOT_STATE_FIELDS, "distance"))
+
+
+@router.get("/within-bbox", response_model=list[telemetry_schemas.RobotState])
+async def read_robots_within_bbox(
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+    state: Optional[str] = None,
+    limit: int = Query(10_000, ge=1, le=100_000),
+    states: RobotStateStore = Depends(get_robot_state_store),
+):
+    """
+    Retrieve the robots whose latest position is inside a box, ordered by robot ID.
+
+    Served from the spatial index of the latest-state store; robots on the edges
+    of the box are included.
+
+    Args:
+        min_x (float): The smallest x coordinate of the box.
+        min_y (float): The smallest y coordinate of the box.
+        max_x (float): The largest x coordinate of the box.
+        max_y (float): The largest y coordinate of the box.
+        state (Optional[str]): Only robots in this operating state, e.g. `idle`.
+        limit (int): The most robots to return (default is 10000).
+        states (RobotStateStore): The latest-state store dependency.
+
+    Returns:
+        list[telemetry_schemas.RobotState]: The robots inside the box.
+
+    Raises:
+        HTTPException: 400 if the minimum of a coordinate exceeds its maximum.
+    """
+    if min_x > max_x or min_y > max_y:
+        raise HTTPException(status_code=400, detail="The box minimum must not exceed its maximum")
+    rows = states.within_bbox(min_x, min_y, max_x, max_y, state=state)
+    return rows_response(rows[:limit], ROBOT_STATE_FIELDS)
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def create_robots_bulk(items: list[Any] = Body(...), db: AsyncSession = Depends(get_async_db)):
+    """
+    Create many robots in one request and one database transaction.
+
+    Items are validated independently; invalid items are reported in `errors` and the
+    remaining ones are still created.
+
+    Args:
+        items (list[Any]): The robot payloads, each matching `schemas.RobotCreate`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        BulkResult: The generated ID of each item, aligned with the request body.
+    """
+    indices, robots, errors = validate_items(schemas.RobotCreate, items)
+    ids = await crud.create_robots(db, robots) if robots else []
+    return build_result(len(items), indices, ids, errors)
+
+
+@router.put("/bulk", response_model=BulkResult)
+async def update_robots_bulk(items: list[Any] = Body(...), db: AsyncSession = Depends(get_async_db)):
+    """
+    Update many robots in one request and one database transaction.
+
+    Items are validated independently; invalid items and unknown IDs are reported in
+    `errors` and the remaining ones are still updated.
+
+    Args:
+        items (list[Any]): The robot payloads, each matching `schemas.RobotBulkUpdate`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        BulkResult: The ID of each updated item, aligned with the request body.
+    """
+    indices, robots, errors = validate_items(schemas.RobotBulkUpdate, items)
+    found = await crud.update_robots(db, robots) if robots else []
+    for index, ok in zip(indices, found):
+        if not ok:
+            errors.append(BulkItemError(index=index, detail="Robot not found"))
+    ids = [robot.id if ok else None for robot, ok in zip(robots, found)]
+    return build_result(len(items), indices, ids, errors)
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_robots(request: Request, format: Optional[str] = None):
+    """
+    Import robots from an NDJSON or CSV upload of any size.
+
+    The body is read incrementally and written in batches, each in its own
+    transaction, so memory use stays bounded. CSV uploads need a header row naming
+    the `schemas.RobotCreate` fields.
+
+    Args:
+        request (Request): The incoming request whose body is streamed.
+        format (Optional[str]): `ndjson` or `csv`; defaults to the Content-Type header.
+
+    Returns:
+        ImportReport: Row counts, throughput and the first errors.
+    """
+    format = detect_format(request.headers.get("content-type"), format)
+    return await import_stream(request.stream(), format, schemas.RobotCreate, crud.create_robots)
 
 
 @router.get("/{robot_id}", response_model=schemas.Robot)
-def read_robot(robot_id: int, db: Session = Depends(get_db)):
+async def read_robot(
+    robot_id: int, request: Request, db: AsyncSession = Depends(get_async_db)
+):
     """
     Retrieve a single robot by its ID.
 
+    The response carries a strong ETag; a matching `If-None-Match` header is
+    answered with 304 and no body.
+
     Args:
         robot_id (int): The ID of the robot to retrieve.
-        db (Session): The database session dependency.
+        request (Request): The incoming request, checked for `If-None-Match`.
+        db (AsyncSession): The async database session dependency.
 
     Returns:
         schemas.Robot: The robot object.
@@ -38,44 +259,185 @@ def read_robot(robot_id: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If the robot with the given ID is not found.
     """
-    robot = crud.get_robot(db, robot_id=robot_id)
+    robot = await crud.get_robot(db, robot_id=robot_id)
     if robot is None:
         raise HTTPException(status_code=404, detail="Robot not found")
-    return robot
+    etag = entity_etag(robot)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    return ORJSONResponse(row_dict(robot, ROBOT_ROW_FIELDS), headers={"ETag": etag})
+
+
+@router.get("/{robot_id}/missions", response_model=list[mission_schemas.Mission])
+async def read_robot_missions(
+    robot_id: int,
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    sort: mission_schemas.MissionSort = "id",
+    status: Optional[mission_schemas.MissionStatusName] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve the missions of one robot.
+
+    The query is served by the `(robot_id, id)` index, or `(robot_id, status)` when
+    filtering by status, so a page costs the same no matter how many missions other
+    robots have. Pagination, sorting and ETags behave as on `GET /missions`.
+
+    Args:
+        robot_id (int): The ID of the robot whose missions to retrieve.
+        request (Request): The incoming request, checked for `If-None-Match`.
+        response (Response): The outgoing response, used to compute the next cursor.
+        skip (int): The number of missions to skip (default is 0). Ignored when `cursor` is given.
+        limit (int): The maximum number of missions to return (default is 100).
+        cursor (Optional[str]): The opaque cursor returned with the previous page.
+        sort (mission_schemas.MissionSort): The sort key (default is "id").
+        status (Optional[mission_schemas.MissionStatusName]): Only include missions in this status.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        list[mission_schemas.Mission]: A list of mission objects.
+
+    Raises:
+        HTTPException: If the robot is not found, or the cursor is malformed or
+            combined with a non-ID sort.
+    """
+    after_id = decode_sorted_cursor(cursor, sort, KEYSET_SORTS)
+    if await crud.get_robot(db, robot_id=robot_id) is None:
+        raise HTTPException(status_code=404, detail="Robot not found")
+    missions = await mission_crud.get_mission_rows(
+        db, skip=skip, limit=limit, after_id=after_id, robot_id=robot_id, sort=sort, status=status
+    )
+    next_cursor = set_next_cursor(response, missions, limit) if sort in KEYSET_SORTS else None
+    cursor_headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    etag = list_etag(missions)
+    if is_not_modified(request, etag):
+        return not_modified(etag, cursor_headers)
+    return rows_response(missions, MISSION_ROW_FIELDS, {"ETag": etag, **cursor_headers})
 
 
 @router.post("/", response_model=schemas.Robot)
-def create_robot(robot: schemas.RobotCreate, db: Session = Depends(get_db)):
+async def create_robot(robot: schemas.RobotCreate, response: Response, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new robot.
 
     Args:
         robot (schemas.RobotCreate): The robot data to create.
-        db (Session): The database session dependency.
+        response (Response): The outgoing response, used to set the ETag.
+        db (AsyncSession): The async database session dependency.
 
     Returns:
         schemas.Robot: The created robot object.
     """
-    return crud.create_robot(db=db, robot=robot)
+    db_robot = await crud.create_robot(db=db, robot=robot)
+    response.headers["ETag"] = entity_etag(db_robot)
+    return db_robot
+
+
+async def _apply_update(db: AsyncSession, request: Request, robot_id: int, data) -> ORJSONResponse:
+    """Run a PUT or PATCH in one UPDATE statement and map its outcome to a response."""
+    version = expected_version(request, robot_id)
+    try:
+        robot = await crud.update_robot(db=db, robot=data, robot_id=robot_id, expected_version=version)
+    except VersionConflictError:
+        raise HTTPException(status_code=412, detail="Precondition failed")
+    if robot is None:
+        raise HTTPException(status_code=404, detail="Robot not found")
+    return ORJSONResponse(row_dict(robot, ROBOT_ROW_FIELDS), headers={"ETag": entity_etag(robot)})
 
 
 @router.put("/{robot_id}", response_model=schemas.Robot)
-def update_robot(robot_id: int, robot: schemas.RobotUpdate, db: Session = Depends(get_db)):
+async def update_robot(
+    robot_id: int,
+    robot: schemas.RobotUpdate,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
     """
     Update an existing robot by its ID.
 
+    The update is a single UPDATE statement; a missing robot is detected from the
+    affected row count rather than a separate lookup.
+
+    An `If-Match` header carrying the robot's ETag makes the update conditional: it
+    is rejected with 412 if the robot has changed since that ETag was issued.
+
     Args:
         robot_id (int): The ID of the robot to update.
         robot (schemas.RobotUpdate): The updated robot data.
-        db (Session): The database session dependency.
+        request (Request): The incoming request, checked for `If-Match`.
+        db (AsyncSession): The async database session dependency.
 
     Returns:
-        schemas.Robot: The updated robot object.
+        schemas.Robot: The updated robot object, with its new ETag.
 
     Raises:
-        HTTPException: If the robot with the given ID is not found.
+        HTTPException: If the robot with the given ID is not found, or the
+            `If-Match` precondition fails.
+    """
+    return await _apply_update(db, request, robot_id, robot)
+
+
+@router.patch("/{robot_id}", response_model=schemas.Robot)
+async def patch_robot(
+    robot_id: int,
+    robot: schemas.RobotPatch,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Partially update an existing robot by its ID.
+
+    Only the fields present in the body are written. `If-Match` is honoured as for PUT.
+
+    Args:
+        robot_id (int): The ID of the robot to update.
+        robot (schemas.RobotPatch): The fields to change.
+        request (Request): The incoming request, checked for `If-Match`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.Robot: The updated robot object, with its new ETag.
+
+    Raises:
+        HTTPException: If the robot with the given ID is not found, or the
+            `If-Match` precondition fails.
+    """
+    return await _apply_update(db, request, robot_id, robot)
+
+
+@router.post(
+    "/{robot_id}/ready",
+    response_model=mission_schemas.Mission,
+    responses={204: {"description": "No mission is due; the robot waits idle"}},
+    dependencies=[Depends(require_scheduler)],
+)
+async def robot_ready(robot_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Report a robot as ready for work and assign it its most urgent due mission.
+
+    Due missions of the robot are handed out by priority, then by how long they
+    have been queued. If none is due, the robot is registered as idle and the next
+    mission that becomes due for it is assigned immediately; the assignment is
+    published on the change feed as an update setting its status to `assigned`.
+
+    Args:
+        robot_id (int): The ID of the robot.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.Mission: The assigned mission, or 204 with no body if none is due.
+
+    Raises:
+        HTTPException: 404 if the robot is not found, 503 if this process does not
+            run the scheduler.
     """
-    db_robot = crud.get_robot(db, robot_id=robot_id)
-    if db_robot is None:
+    if await crud.get_robot(db, robot_id=robot_id) is None:
         raise HTTPException(status_code=404, detail="Robot not found")
-    return crud.update_robot(db=db, robot=robot, robot_id=robot_id)
+    mission = await next_mission(db, robot_id)
+    if mission is None:
+        return Response(status_code=204)
+    return ORJSONResponse(row_dict(mission, MISSION_ROW_FIELDS), headers={"ETag": entity_etag(mission)})
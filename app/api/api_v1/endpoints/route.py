@@ -0,0 +1,232 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import route as schemas
+from app.schemas.bulk import BulkItemError, BulkResult
+from app.crud import async_route as crud
+from app.db.session import get_async_db
+from app.api.api_v1.bulk import build_result, validate_items
+from app import waypoints
+
+if TYPE_CHECKING:
+    import numpy as np
+
+router = APIRouter()
+
+# Most routes accepted in one batch upload
+MAX_BATCH_ROUTES = 5_000
+
+# Media type of a packed route: consecutive little-endian 64-bit x, y pairs
+PACKED_ROUTE_TYPE = "application/octet-stream"
+
+# Keys of a bounding box, in the order `bounding_box` and `batch_metrics` return them
+BBOX_FIELDS = ("min_x", "min_y", "max_x", "max_y")
+
+
+def _summary(mission_id: int, points: "np.ndarray", speed: Optional[float]) -> dict:
+    """Build the `RouteSummary` body of a route."""
+    length = waypoints.path_length(points)
+    return {
+        "mission_id": mission_id,
+        "point_count": len(points),
+        "length": length,
+        "bbox": dict(zip(BBOX_FIELDS, waypoints.bounding_box(points))),
+        "eta_seconds": waypoints.eta_seconds(length, speed),
+    }
+
+
+def _unpack_upload(body: bytes) -> "np.ndarray":
+    """
+    Check a packed route uploaded as the request body.
+
+    Args:
+        body (bytes): The request body.
+
+    Returns:
+        np.ndarray: The waypoints.
+
+    Raises:
+        HTTPException: 422 if the body is not between 1 and `MAX_WAYPOINTS` whole
+        waypoints or holds a coordinate that is not finite.
+    """
+    size = waypoints.BYTES_PER_WAYPOINT
+    if not body or len(body) % size or len(body) // size > schemas.MAX_WAYPOINTS:
+        raise HTTPException(
+            status_code=422, detail=f"A packed route is 1 to {schemas.MAX_WAYPOINTS} waypoints of {size} bytes"
+        )
+    points = waypoints.unpack(body)
+    if not waypoints.all_finite(points):
+        raise HTTPException(status_code=422, detail="Waypoint coordinates must be finite")
+    return points
+
+
+@router.put("/routes", response_model=BulkResult)
+async def upload_routes(items: list[Any] = Body(...), db: AsyncSession = Depends(get_async_db)):
+    """
+    Store the routes of many missions in one request and one database transaction.
+
+    Items are validated independently; invalid items and unknown missions are
+    reported in `errors` and the remaining routes are still stored, each replacing
+    its mission's previous route.
+
+    Args:
+        items (list[Any]): The routes, each matching `schemas.RouteBatchItem`.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        BulkResult: The mission ID of each stored route, aligned with the request body.
+
+    Raises:
+        HTTPException: 413 if the batch holds more than `MAX_BATCH_ROUTES` routes.
+    """
+    if len(items) > MAX_BATCH_ROUTES:
+        raise HTTPException(status_code=413, detail=f"Batches are limited to {MAX_BATCH_ROUTES} routes")
+    indices, routes, errors = validate_items(schemas.RouteBatchItem, items)
+    rows = [
+        {"mission_id": route.mission_id, "points": waypoints.pack(route.waypoints), "point_count": len(route.waypoints)}
+        for route in routes
+    ]
+    found = await crud.upsert_routes(db, rows)
+    for index, ok in zip(indices, found):
+        if not ok:
+            errors.append(BulkItemError(index=index, detail="Mission not found"))
+    ids = [route.mission_id if ok else None for route, ok in zip(routes, found)]
+    return build_result(len(items), indices, ids, errors)
+
+
+@router.post("/routes/metrics", response_model=list[schemas.RouteSummary])
+async def read_route_metrics(query: schemas.RouteMetricsRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Compute the length, bounding box and travel time of the routes of many missions.
+
+    The routes are read in chunked queries and measured together in one vectorized
+    pass (see `app.waypoints.batch_metrics`), off the event loop.
+
+    Args:
+        query (schemas.RouteMetricsRequest): The mission IDs and an optional robot speed.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        list[schemas.RouteSummary]: One summary per requested mission that has a
+        route, in request order; missions without a route are left out.
+    """
+    routes = await crud.get_routes(db, query.mission_ids)
+    ids = [mission_id for mission_id in query.mission_ids if mission_id in routes]
+    counts, lengths, boxes = await asyncio.to_thread(
+        waypoints.batch_metrics, [routes[mission_id] for mission_id in ids]
+    )
+    etas = (lengths / query.speed).tolist() if query.speed else [None] * len(ids)
+    return ORJSONResponse(
+        [
+            {
+                "mission_id": mission_id,
+                "point_count": count,
+                "length": length,
+                "bbox": dict(zip(BBOX_FIELDS, bbox)),
+                "eta_seconds": eta,
+            }
+            for mission_id, count, length, bbox, eta in zip(
+                ids, counts.tolist(), lengths.tolist(), boxes.tolist(), etas
+            )
+        ]
+    )
+
+
+@router.put("/{mission_id}/route", response_model=schemas.RouteSummary)
+async def upload_route(mission_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Store the route of a mission, replacing any previous one.
+
+    The body is either JSON matching `schemas.RouteUpload` or, with Content-Type
+    `application/octet-stream`, the waypoints already packed as consecutive
+    little-endian 64-bit `x, y` pairs, which skips parsing a JSON number per
+    coordinate.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        request (Request): The incoming request whose body is the route.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.RouteSummary: The metrics of the stored route.
+
+    Raises:
+        HTTPException: 404 if the mission is not found, 422 if the route is invalid.
+    """
+    body = await request.body()
+    if request.headers.get("content-type", "").split(";")[0].strip().lower() == PACKED_ROUTE_TYPE:
+        points = _unpack_upload(body)
+        blob = body
+    else:
+        try:
+            upload = schemas.RouteUpload.model_validate_json(body)
+        except ValidationError as exc:
+            raise RequestValidationError(exc.errors(include_url=False))
+        blob = waypoints.pack(upload.waypoints)
+        points = waypoints.unpack(blob)
+    [found] = await crud.upsert_routes(db, [{"mission_id": mission_id, "points": blob, "point_count": len(points)}])
+    if not found:
+        raise HTTPException(status_code=404, detail="Mission not found")
+    return _summary(mission_id, points, None)
+
+
+@router.get("/{mission_id}/route", response_model=schemas.Route)
+async def read_route(
+    mission_id: int,
+    request: Request,
+    simplify_tolerance: Optional[float] = Query(None, alias="simplify", gt=0),
+    speed: Optional[float] = Query(None, gt=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve the route of a mission with its metrics.
+
+    With `simplify`, the returned waypoints are reduced with the Douglas–Peucker
+    algorithm so that none of the stored ones is farther than that distance from
+    the returned path; the metrics still describe the stored route. A client
+    accepting `application/octet-stream` receives the (possibly simplified)
+    waypoints packed, without the metrics.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        request (Request): The incoming request, for its Accept header.
+        simplify_tolerance (Optional[float]): The simplification tolerance, in coordinate units.
+        speed (Optional[float]): A robot speed in coordinate units per second, to estimate the travel time.
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        schemas.Route: The route's metrics and waypoints.
+
+    Raises:
+        HTTPException: 404 if the mission has no route.
+    """
+    blob = await crud.get_route(db, mission_id)
+    if blob is None:
+        raise HTTPException(status_code=404, detail="Route not found")
+    points = waypoints.unpack(blob)
+    returned = waypoints.simplify(points, simplify_tolerance) if simplify_tolerance else points
+    if PACKED_ROUTE_TYPE in request.headers.get("accept", ""):
+        return Response(returned.tobytes() if simplify_tolerance else blob, media_type=PACKED_ROUTE_TYPE)
+    return ORJSONResponse({**_summary(mission_id, points, speed), "waypoints": returned.tolist()})
+
+
+@router.delete("/{mission_id}/route", status_code=204)
+async def delete_route(mission_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Delete the route of a mission.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        db (AsyncSession): The async database session dependency.
+
+    Raises:
+        HTTPException: 404 if the mission has no route.
+    """
+    if not await crud.delete_route(db, mission_id):
+        raise HTTPException(status_code=404, detail="Route not found")
+    return Response(status_code=204)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+
+from app.schemas.stats import FleetStatistics
+from app.stats import FleetStats, get_fleet_stats
+
+router = APIRouter()
+
+
+@router.get("/", response_model=FleetStatistics)
+def read_stats(stats: FleetStats = Depends(get_fleet_stats)):
+    """
+    Retrieve mission counts per status, per robot model and per robot, and the status history.
+
+    The counts are kept up to date by every write and served from memory; no
+    aggregate query runs. They are rebuilt from the tables on startup and every
+    `STATS_RECONCILE_SECONDS`, which bounds how long writes made by other worker
+    processes take to show.
+
+    Args:
+        stats (FleetStats): The fleet statistics dependency.
+
+    Returns:
+        FleetStatistics: The current counts, encoded directly with orjson.
+    """
+    return ORJSONResponse(stats.snapshot())
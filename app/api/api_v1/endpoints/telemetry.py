@@ -0,0 +1,95 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import telemetry as schemas
+from app.crud import async_telemetry as crud
+from app.crud.telemetry import TELEMETRY_BUCKET_FIELDS, TELEMETRY_ROW_FIELDS
+from app.db.session import get_async_db
+from app.api.api_v1.rows import rows_response
+from app.telemetry import BufferFull, TelemetryBuffer, get_telemetry_buffer
+
+router = APIRouter()
+
+# Largest batch accepted in one request
+MAX_BATCH_SIZE = 10_000
+
+# Seconds a client is asked to wait before resending a refused batch
+RETRY_AFTER_SECONDS = 1
+
+
+@router.post("/", response_model=schemas.TelemetryAccepted, status_code=202)
+async def ingest_telemetry(
+    points: list[schemas.TelemetryPoint], buffer: TelemetryBuffer = Depends(get_telemetry_buffer)
+):
+    """
+    Accept a batch of telemetry samples from any number of robots.
+
+    The samples are queued in the write-behind buffer and written in large batches,
+    so the response only confirms they were accepted. Samples already stored for the
+    same robot and timestamp are ignored, which makes resending a batch safe.
+
+    Args:
+        points (list[schemas.TelemetryPoint]): The samples, at most `MAX_BATCH_SIZE`.
+        buffer (TelemetryBuffer): The write-behind buffer dependency.
+
+    Returns:
+        schemas.TelemetryAccepted: The number of samples accepted.
+
+    Raises:
+        HTTPException: 413 if the batch is too large, 503 with `Retry-After` if the
+        buffer is full.
+    """
+    if len(points) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batches are limited to {MAX_BATCH_SIZE} samples")
+    try:
+        accepted = await buffer.submit([point.dict() for point in points])
+    except BufferFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Telemetry buffer is full",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+    return {"accepted": accepted}
+
+
+@router.get("/{robot_id}", response_model=list[schemas.TelemetrySample] | list[schemas.TelemetryBucket])
+async def read_telemetry(
+    robot_id: int,
+    start: int = Query(..., ge=0),
+    end: int = Query(..., ge=0),
+    bucket_ms: Optional[int] = Query(None, ge=1),
+    limit: int = Query(10_000, ge=1, le=100_000),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve the telemetry of one robot within a time range, oldest first.
+
+    Without `bucket_ms` the stored samples are returned. With it, the range is
+    downsampled in the database to one averaged row per non-empty bucket of that
+    width. Samples still in the write-behind buffer are not yet visible.
+
+    Args:
+        robot_id (int): The ID of the robot.
+        start (int): The inclusive start of the range, in epoch milliseconds.
+        end (int): The exclusive end of the range, in epoch milliseconds.
+        bucket_ms (Optional[int]): Downsample to buckets of this many milliseconds.
+        limit (int): The maximum number of rows to return (default is 10000).
+        db (AsyncSession): The async database session dependency.
+
+    Returns:
+        list[schemas.TelemetrySample] | list[schemas.TelemetryBucket]: The samples,
+        or the buckets when `bucket_ms` is given.
+
+    Raises:
+        HTTPException: 400 if `end` is not after `start`.
+    """
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if bucket_ms is None:
+        rows = await crud.get_telemetry(db, robot_id=robot_id, start=start, end=end, limit=limit)
+        return rows_response(rows, TELEMETRY_ROW_FIELDS)
+    rows = await crud.get_telemetry_buckets(
+        db, robot_id=robot_id, start=start, end=end, bucket_ms=bucket_ms, limit=limit
+    )
+    return rows_response(rows, TELEMETRY_BUCKET_FIELDS)
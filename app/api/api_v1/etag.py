@@ -0,0 +1,108 @@
+import hashlib
+from typing import Iterable, Optional
+
+from fastapi import HTTPException, Request, Response
+
+
+def _field(row, name: str):
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def entity_etag(row) -> str:
+    """
+    Return the strong ETag of a single mission or robot.
+
+    Args:
+        row: The entity, as an ORM instance or a dict of its columns.
+
+    Returns:
+        str: A quoted ETag combining the ID and the row version.
+    """
+    return f'"{_field(row, "id")}-{_field(row, "version")}"'
+
+
+def list_etag(rows: Iterable, related: Iterable = ()) -> str:
+    """
+    Return the strong ETag of a page of entities.
+
+    The tag covers the ID and version of each row, and of each embedded related row,
+    so it changes whenever any of them is added or updated.
+
+    Args:
+        rows (Iterable): The entities on the page.
+        related (Iterable): Embedded related entities; None entries are skipped.
+
+    Returns:
+        str: A quoted ETag.
+    """
+    digest = hashlib.sha1()
+    for row in rows:
+        digest.update(f"{_field(row, 'id')}:{_field(row, 'version')},".encode())
+    digest.update(b"|")
+    for row in related:
+        if row is not None:
+            digest.update(f"{_field(row, 'id')}:{_field(row, 'version')},".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _tags(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's `If-None-Match` header matches the current ETag.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        bool: True if the client already holds the current representation.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # If-None-Match uses the weak comparison, so a W/ prefix is ignored.
+    tags = [tag[2:] if tag.startswith("W/") else tag for tag in _tags(header)]
+    return "*" in tags or etag in tags
+
+
+def not_modified(etag: str, headers: Optional[dict] = None) -> Response:
+    """
+    Build an empty 304 response carrying the current ETag.
+
+    Args:
+        etag (str): The current ETag of the resource.
+        headers (Optional[dict]): Extra headers the full response would have carried.
+
+    Returns:
+        Response: The 304 response.
+    """
+    return Response(status_code=304, headers={"ETag": etag, **(headers or {})})
+
+
+def expected_version(request: Request, entity_id: int) -> Optional[int]:
+    """
+    Extract the row version required by the request's `If-Match` header.
+
+    Args:
+        request (Request): The incoming request.
+        entity_id (int): The ID of the entity being updated.
+
+    Returns:
+        Optional[int]: The version the update must apply to, or None when the request
+        has no `If-Match` header or sends `*`.
+
+    Raises:
+        HTTPException: 412 if the header names a tag that cannot match this entity.
+    """
+    header = request.headers.get("if-match")
+    if not header or header.strip() == "*":
+        return None
+    tags = _tags(header)
+    if len(tags) == 1 and not tags[0].startswith("W/"):
+        entity, _, version = tags[0].strip('"').partition("-")
+        if entity == str(entity_id) and version.isdigit():
+            return int(version)
+    raise HTTPException(status_code=412, detail="Precondition failed")
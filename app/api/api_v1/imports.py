@@ -0,0 +1,175 @@
+import codecs
+import csv
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from app.api.api_v1.bulk import validate_items
+from app.db.async_base import AsyncSessionLocal
+from app.schemas.bulk import BulkItemError, ImportReport
+
+# Rows validated and written per transaction.
+BATCH_SIZE = 5000
+
+# Only the first errors are reported in detail so the report itself stays bounded.
+MAX_REPORTED_ERRORS = 100
+
+FORMATS = {
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json": "ndjson",
+    "text/csv": "csv",
+}
+
+
+def detect_format(content_type: Optional[str], format: Optional[str]) -> str:
+    """
+    Resolve the upload format from an explicit override or the Content-Type header.
+
+    Args:
+        content_type (Optional[str]): The request's Content-Type header.
+        format (Optional[str]): An explicit `ndjson` or `csv` override.
+
+    Returns:
+        str: Either "ndjson" or "csv".
+
+    Raises:
+        HTTPException: If the format is not supported.
+    """
+    if format is None:
+        format = FORMATS.get((content_type or "").split(";")[0].strip().lower())
+    if format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=415, detail="Upload must be NDJSON or CSV")
+    return format
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a UTF-8 byte stream into lines without buffering more than one partial line.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The raw body chunks.
+
+    Yields:
+        str: Each line, without its line terminator.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_records(chunks: AsyncIterator[bytes], format: str) -> AsyncIterator[Any]:
+    """
+    Parse an NDJSON or CSV byte stream into records.
+
+    CSV uploads must start with a header row. Quoted CSV fields may span lines. A line
+    that cannot be parsed is yielded as a `ValueError` so it can be reported in place.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The raw body chunks.
+        format (str): Either "ndjson" or "csv".
+
+    Yields:
+        Any: A parsed record, or a `ValueError` for an unparseable line.
+    """
+    header, record = None, []
+    async for line in iter_lines(chunks):
+        if format == "ndjson":
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError as exc:
+                    yield ValueError(f"Invalid JSON: {exc}")
+            continue
+        # An odd number of quotes means a quoted field continues on the next line.
+        record.append(line)
+        if sum(part.count('"') for part in record) % 2:
+            continue
+        text, record = "\n".join(record), []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = values
+        elif len(values) != len(header):
+            yield ValueError(f"Expected {len(header)} columns, got {len(values)}")
+        else:
+            yield dict(zip(header, values))
+    if record:
+        yield ValueError("Unterminated quoted field")
+
+
+async def import_stream(
+    chunks: AsyncIterator[bytes],
+    format: str,
+    schema: type[BaseModel],
+    create_many: Callable,
+    batch_size: int = BATCH_SIZE,
+) -> ImportReport:
+    """
+    Validate and write an uploaded file batch by batch.
+
+    Each batch is written in its own transaction. The body is not read while a batch
+    is being written, so a fast client is slowed to the database's pace instead of
+    the upload piling up in memory.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The raw body chunks.
+        format (str): Either "ndjson" or "csv".
+        schema (type[BaseModel]): The Pydantic model each record must satisfy.
+        create_many (Callable): The async `app.crud` bulk create function for the entity.
+        batch_size (int): The number of rows per batch and transaction.
+
+    Returns:
+        ImportReport: Row counts, throughput and the first errors.
+    """
+    start = time.perf_counter()
+    report = ImportReport(rows=0, created=0, failed=0, errors=[], seconds=0.0, rows_per_sec=0.0)
+
+    def fail(index: int, detail: str):
+        report.failed += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append(BulkItemError(index=index, detail=detail))
+
+    async def flush(offset: int, records: list[Any]):
+        parsed = [(index, record) for index, record in enumerate(records) if not isinstance(record, ValueError)]
+        for index, record in enumerate(records):
+            if isinstance(record, ValueError):
+                fail(offset + index, str(record))
+        indices, items, errors = validate_items(schema, [record for _, record in parsed])
+        for error in errors:
+            fail(offset + parsed[error.index][0], error.detail)
+        if not items:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                report.created += len(await create_many(db, items))
+        except Exception as exc:  # pylint: disable=broad-except
+            for index in indices:
+                fail(offset + parsed[index][0], f"Write failed: {exc}")
+
+    batch = []
+    async for record in iter_records(chunks, format):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            await flush(report.rows, batch)
+            report.rows += len(batch)
+            batch = []
+    if batch:
+        await flush(report.rows, batch)
+        report.rows += len(batch)
+
+    report.errors.sort(key=lambda error: error.index)
+    report.seconds = time.perf_counter() - start
+    report.rows_per_sec = report.rows / report.seconds if report.seconds else 0.0
+    return report
@@ -0,0 +1,83 @@
+import json
+import zlib
+from typing import Callable, Iterable, Iterator
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows are grouped into chunks of roughly this many bytes before being sent.
+CHUNK_BYTES = 64 * 1024
+
+
+def encode_rows(rows: Iterable[dict]) -> Iterator[bytes]:
+    """
+    Encode rows as newline-delimited JSON, grouped into chunks of about `CHUNK_BYTES`.
+
+    Args:
+        rows (Iterable[dict]): The rows to encode.
+
+    Yields:
+        bytes: A chunk of complete NDJSON lines.
+    """
+    buffer, size = [], 0
+    for row in rows:
+        line = json.dumps(row, separators=(",", ":")) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Compress a byte stream incrementally into a single gzip member.
+
+    Args:
+        chunks (Iterable[bytes]): The uncompressed chunks.
+
+    Yields:
+        bytes: Compressed chunks; empty intermediate outputs are skipped.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_response(iter_rows: Callable[[Session], Iterable[dict]], filename: str, gzip: bool = False):
+    """
+    Build a streaming NDJSON response over rows read from a dedicated session.
+
+    The session is opened when streaming starts and closed when it ends, since the
+    request-scoped session is already closed by the time the body is sent.
+
+    Args:
+        iter_rows (Callable[[Session], Iterable[dict]]): Produces the rows from a session.
+        filename (str): The file name suggested to the client.
+        gzip (bool): Whether to gzip the body (sent with `Content-Encoding: gzip`).
+
+    Returns:
+        StreamingResponse: The streaming response.
+    """
+
+    def body():
+        db = SessionLocal()
+        try:
+            chunks = encode_rows(iter_rows(db))
+            yield from gzip_chunks(chunks) if gzip else chunks
+        finally:
+            db.close()
+
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
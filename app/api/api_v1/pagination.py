@@ -0,0 +1,88 @@
+import base64
+from typing import Optional, Sequence
+
+from fastapi import HTTPException, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the last ID of a page into an opaque cursor.
+
+    Args:
+        last_id (int): The ID of the last row returned on the current page.
+
+    Returns:
+        str: A URL-safe cursor that resumes the listing after `last_id`.
+    """
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor sent by the client.
+
+    Returns:
+        int: The ID after which the next page starts.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, _, value = base64.urlsafe_b64decode(padded.encode()).decode().partition(":")
+        if prefix != "id":
+            raise ValueError(cursor)
+        return int(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def decode_sorted_cursor(cursor: Optional[str], sort: str, keyset_sorts: Sequence[str]) -> Optional[int]:
+    """
+    Decode an optional cursor for a sorted listing.
+
+    Cursors carry an ID, so they can only continue listings ordered by ID.
+
+    Args:
+        cursor (Optional[str]): The opaque cursor sent by the client, if any.
+        sort (str): The requested sort key.
+        keyset_sorts (Sequence[str]): The sort keys that can be paged by ID.
+
+    Returns:
+        Optional[int]: The ID after which the page starts, or None without a cursor.
+
+    Raises:
+        HTTPException: If the cursor is malformed or the sort cannot be paged by ID.
+    """
+    if cursor is None:
+        return None
+    if sort not in keyset_sorts:
+        raise HTTPException(status_code=400, detail=f"Cursors require sort to be one of {', '.join(keyset_sorts)}")
+    return decode_cursor(cursor)
+
+
+def set_next_cursor(response: Response, rows: Sequence, limit: int) -> Optional[str]:
+    """
+    Attach the cursor for the following page to the response headers.
+
+    The header is only set when the page is full, so its absence tells the client
+    that the listing is exhausted.
+
+    Args:
+        response (Response): The outgoing response.
+        rows (Sequence): The rows returned on the current page, ordered by ID.
+        limit (int): The requested page size.
+
+    Returns:
+        Optional[str]: The cursor that was set, or None if this was the last page.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    cursor = encode_cursor(rows[-1].id)
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
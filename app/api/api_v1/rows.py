@@ -0,0 +1,39 @@
+from typing import Optional, Sequence
+
+from fastapi.responses import ORJSONResponse
+
+
+def rows_response(rows: Sequence, fields: Sequence[str], headers: Optional[dict] = None) -> ORJSONResponse:
+    """
+    Serialize column rows straight to JSON with orjson.
+
+    Returning a response object makes FastAPI skip response-model validation and its
+    own JSON encoding, which dominate the cost of large pages built from ORM objects.
+    The rows must therefore already match the endpoint's documented response model.
+
+    Args:
+        rows (Sequence): Column tuples whose leading values correspond to `fields`;
+            trailing columns (such as `version`) are left out of the output.
+        fields (Sequence[str]): The JSON keys of the leading columns.
+        headers (Optional[dict]): Headers to send with the response.
+
+    Returns:
+        ORJSONResponse: A JSON array with one object per row.
+    """
+    return ORJSONResponse([dict(zip(fields, row)) for row in rows], headers=headers)
+
+
+def row_dict(row, fields: Sequence[str], prefix: str = "") -> dict:
+    """
+    Pick named columns out of a column row or a cached dict.
+
+    Args:
+        row: A row with named columns, or a dict of column values.
+        fields (Sequence[str]): The column names to pick, used as the output keys.
+        prefix (str): A label prefix to strip, for columns of a joined related row.
+
+    Returns:
+        dict: One entry per field.
+    """
+    mapping = row if isinstance(row, dict) else row._mapping
+    return {field: mapping[prefix + field] for field in fields}
@@ -0,0 +1,37 @@
+from fastapi import HTTPException
+
+from app.scheduler import get_scheduler, scheduler_running
+
+
+def require_scheduler():
+    """
+    Dependency that lets scheduling and dispatch requests through only where the scheduler runs.
+
+    Returns:
+        AsyncIOScheduler: The running scheduler of this process.
+
+    Raises:
+        HTTPException: 503 if this process does not run the scheduler.
+    """
+    if not scheduler_running():
+        raise HTTPException(status_code=503, detail="Scheduling is not enabled in this process")
+    return get_scheduler()
+
+
+def schedule_body(mission_id: int, job) -> dict:
+    """
+    Describe a mission's scheduler job as a `MissionSchedule`.
+
+    Args:
+        mission_id (int): The ID of the scheduled mission.
+        job (Job): The mission's scheduler job.
+
+    Returns:
+        dict: The schedule's priority, trigger and next run time.
+    """
+    return {
+        "mission_id": mission_id,
+        "priority": job.kwargs.get("priority", 0),
+        "trigger": str(job.trigger),
+        "next_run_time": job.next_run_time,
+    }
@@ -0,0 +1,90 @@
+"""
+Read-through cache for single missions and robots.
+
+The backend is chosen from the environment:
+
+- `CACHE_BACKEND`: `memory` (default), `redis` or `none`.
+- `CACHE_MAX_ENTRIES`: entry bound of the in-process cache (default 10000).
+- `CACHE_TTL_SECONDS`: lifetime of an entry (default 5). With several worker
+  processes and the in-process backend, this bounds how long another worker can
+  serve a stale entry after an update.
+- `CACHE_REDIS_URL`: connection URL for the `redis` backend, which needs the
+  optional `redis` package (`poetry install -E redis`).
+"""
+import os
+from typing import Iterable, Optional
+
+from .backends import CacheBackend, MemoryCache, NullCache, RedisCache
+
+
+class EntityCache:
+    """
+    Caches the column values of one model, keyed by primary key.
+
+    Args:
+        name (str): The key prefix, e.g. `mission`.
+        backend (CacheBackend): Where the entries are stored.
+    """
+
+    def __init__(self, name: str, backend: CacheBackend):
+        self.name = name
+        self.backend = backend
+
+    def _key(self, entity_id: int) -> str:
+        return f"{self.name}:{entity_id}"
+
+    @staticmethod
+    def to_dict(obj) -> dict:
+        """
+        Return the column values of an ORM instance as a dict.
+
+        Args:
+            obj: The ORM instance.
+
+        Returns:
+            dict: One entry per mapped column.
+        """
+        return {column.key: getattr(obj, column.key) for column in obj.__table__.columns}
+
+    def get(self, entity_id: int) -> Optional[dict]:
+        """Return the cached columns of an entity, or None on a miss."""
+        return self.backend.get(self._key(entity_id))
+
+    async def aget(self, entity_id: int) -> Optional[dict]:
+        """Like `get`, without blocking the event loop on an out-of-process backend."""
+        return await self.backend.aget(self._key(entity_id))
+
+    def put(self, obj) -> dict:
+        """Store an ORM instance, or a dict of all its columns, and return the cached dict."""
+        value = obj if isinstance(obj, dict) else self.to_dict(obj)
+        self.backend.set(self._key(value["id"]), value)
+        return value
+
+    def invalidate(self, entity_ids: Iterable[int]):
+        """Drop the entries of the given IDs."""
+        for entity_id in entity_ids:
+            self.backend.delete(self._key(entity_id))
+
+    def stats(self) -> dict:
+        """Return the backend's hit/miss/eviction counters."""
+        return self.backend.stats()
+
+
+def backend_from_env() -> CacheBackend:
+    """
+    Build the cache backend selected by the `CACHE_*` environment variables.
+
+    Returns:
+        CacheBackend: The configured backend.
+    """
+    kind = os.getenv("CACHE_BACKEND", "memory").lower()
+    ttl = float(os.getenv("CACHE_TTL_SECONDS", "5"))
+    if kind == "none":
+        return NullCache()
+    if kind == "redis":
+        return RedisCache(os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0"), ttl=ttl)
+    return MemoryCache(max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "10000")), ttl=ttl)
+
+
+mission_cache = EntityCache("mission", backend_from_env())
+robot_cache = EntityCache("robot", backend_from_env())
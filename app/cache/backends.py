@@ -0,0 +1,228 @@
+import asyncio
+import functools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """
+    Interface shared by the cache backends.
+
+    Values are plain JSON-serialisable dicts so that out-of-process backends can
+    store them without knowing the models. `set` and `delete` are called from
+    synchronous code running on the event loop, so they must not wait on the network;
+    async readers use `aget`.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        """Return the value stored under a key, or None on a miss."""
+
+    async def aget(self, key: str) -> Optional[dict]:
+        """Like `get`, for callers on the event loop; in-process backends answer inline."""
+        return self.get(key)
+
+    @abstractmethod
+    def set(self, key: str, value: dict):
+        """Store a value under a key."""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Drop the value stored under a key, if any."""
+
+    @abstractmethod
+    def clear(self):
+        """Drop every value."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters."""
+
+
+class NullCache(CacheBackend):
+    """Backend that stores nothing; every lookup is a miss."""
+
+    def __init__(self):
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: dict):
+        pass
+
+    def delete(self, key: str):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self) -> dict:
+        return {"backend": "none", "hits": 0, "misses": self.misses, "evictions": 0, "expirations": 0, "size": 0}
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process cache with a per-entry TTL and least-recently-used eviction.
+
+    Args:
+        max_entries (int): The maximum number of entries kept; the least recently used
+            entry is evicted when a new one would exceed it.
+        ttl (float): Seconds an entry stays valid after it was written.
+        clock (Callable[[], float]): Monotonic time source, replaceable in tests.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: dict):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+            }
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache stored in Redis, shared by every worker process.
+
+    Requires the optional `redis` package (`poetry install -E redis`). The client is
+    synchronous, so it is kept off the event loop: `aget` runs the lookup in a worker
+    thread, and writes are handed to a background writer thread and applied in order
+    without waiting for them. A write that fails is logged; the entry then ages out
+    with the TTL. Expiry is delegated to Redis and its `maxmemory` policy, so
+    evictions are not counted here.
+
+    Args:
+        url (str): The Redis connection URL.
+        ttl (float): Seconds an entry stays valid after it was written.
+        namespace (str): Prefix for every key written by this cache.
+        client: A ready Redis client to use instead of connecting to `url`.
+    """
+
+    def __init__(self, url: Optional[str] = None, ttl: float = 5.0, namespace: str = "missions-app", client=None):
+        if client is None:
+            try:
+                import redis  # pylint: disable=import-outside-toplevel
+            except ImportError as exc:
+                raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from exc
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self.ttl_ms = max(1, int(ttl * 1000))
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+        self._start_writer()
+        os.register_at_fork(after_in_child=self._start_writer)
+
+    def _start_writer(self):
+        # Threads do not survive a fork, so a worker forked from a preloading server starts its own writer
+        self._writes = queue.SimpleQueue()
+        threading.Thread(target=self._apply_writes, name="cache-redis-writer", daemon=True).start()
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _apply_writes(self):
+        while True:
+            write, args = self._writes.get()
+            try:
+                write(*args)
+            except Exception:  # pylint: disable=broad-except
+                self.write_errors += 1
+                logger.exception("Redis cache write failed")
+
+    def drain(self):
+        """Block until every write queued so far has been applied."""
+        done = threading.Event()
+        self._writes.put((done.set, ()))
+        done.wait()
+
+    def get(self, key: str) -> Optional[dict]:
+        raw = self._client.get(self._key(key))
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    async def aget(self, key: str) -> Optional[dict]:
+        return await asyncio.to_thread(self.get, key)
+
+    def set(self, key: str, value: Any):
+        self._writes.put((functools.partial(self._client.set, px=self.ttl_ms), (self._key(key), json.dumps(value))))
+
+    def delete(self, key: str):
+        self._writes.put((self._client.delete, (self._key(key),)))
+
+    def clear(self):
+        self.drain()
+        keys = list(self._client.scan_iter(match=self._key("*")))
+        if keys:
+            self._client.delete(*keys)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "redis",
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": 0,
+            "expirations": 0,
+            "write_errors": self.write_errors,
+        }
@@ -0,0 +1,293 @@
+"""
+Async versions of the functions in `app.crud.mission`.
+
+Each function runs its synchronous counterpart on the async session's connection
+with `AsyncSession.run_sync`, so queries are issued through the async driver
+without occupying a worker thread, and both variants share one implementation.
+Single-mission reads go through `app.cache.mission_cache` first.
+"""
+from typing import Iterable, Optional, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cache import mission_cache
+from app.crud import mission as crud
+from app.schemas.mission import MissionBulkUpdate, MissionCreate, MissionPatch, MissionUpdate
+
+
+async def get_mission_rows(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: Optional[int] = None,
+    expand_robot: bool = False,
+    robot_id: Optional[int] = None,
+    name_prefix: Optional[str] = None,
+    model_name: Optional[str] = None,
+    sort: str = "id",
+    status: Optional[str] = None,
+):
+    """
+    Retrieve a page of missions as plain `(id, name, description, robot_id, version)` rows.
+
+    Args:
+        db (AsyncSession): The async database session.
+        skip (int): The number of records to skip (default is 0).
+        limit (int): The maximum number of records to return (default is 10).
+        after_id (Optional[int]): Only return missions after this ID in sort order.
+        expand_robot (bool): Append the robot's columns through a join in the same query.
+        robot_id (Optional[int]): Only include missions of this robot.
+        name_prefix (Optional[str]): Only include missions whose name starts with this prefix.
+        model_name (Optional[str]): Only include missions whose robot has this model name.
+        sort (str): One of `app.crud.mission.SORT_COLUMNS` (default is "id").
+        status (Optional[str]): Only include missions in this status.
+
+    Returns:
+        List[Row]: One row per mission, in sort order.
+    """
+    return await db.run_sync(
+        crud.get_mission_rows,
+        skip=skip,
+        limit=limit,
+        after_id=after_id,
+        expand_robot=expand_robot,
+        robot_id=robot_id,
+        name_prefix=name_prefix,
+        model_name=model_name,
+        sort=sort,
+        status=status,
+    )
+
+
+async def search_missions(db: AsyncSession, q: str, skip: int = 0, limit: int = 20):
+    """
+    Search missions by keywords in their name and description, best matches first.
+
+    Args:
+        db (AsyncSession): The async database session.
+        q (str): The search query.
+        skip (int): The number of results to skip (default is 0).
+        limit (int): The maximum number of results to return (default is 20).
+
+    Returns:
+        List[Row]: One `(id, name, description, robot_id, version)` row per match, best match first.
+    """
+    return await db.run_sync(crud.search_missions, q=q, skip=skip, limit=limit)
+
+
+async def get_mission(db: AsyncSession, mission_id: int, expand_robot: bool = False):
+    """
+    Retrieve a single mission by its ID, reading through the mission cache.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission_id (int): The ID of the mission to retrieve.
+        expand_robot (bool): Join the mission's robot in the same query. Expanded
+            reads bypass the cache and return the row from `get_mission_row`.
+
+    Returns:
+        dict: The columns of the mission with the specified ID, or None if not found.
+    """
+    if expand_robot:
+        return await db.run_sync(crud.get_mission_row, mission_id=mission_id, expand_robot=True)
+    cached = await mission_cache.aget(mission_id)
+    if cached is not None:
+        return cached
+    row = await db.run_sync(crud.get_mission_row, mission_id=mission_id)
+    return mission_cache.put(row._asdict()) if row is not None else None
+
+
+async def create_mission(db: AsyncSession, mission: MissionCreate):
+    """
+    Create a new mission and add it to the database.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission (MissionCreate): The mission data to create.
+
+    Returns:
+        MissionModel: The created mission.
+    """
+    return await db.run_sync(crud.create_mission, mission=mission)
+
+
+async def update_mission(
+    db: AsyncSession,
+    mission: Union[MissionUpdate, MissionPatch],
+    mission_id: int,
+    expected_version: Optional[int] = None,
+):
+    """
+    Update an existing mission with the provided data in a single UPDATE statement.
+
+    When the robot is written, the cached mission supplies the robot it leaves, so
+    the update usually needs no extra read.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission (MissionUpdate | MissionPatch): The updated mission data; only set fields are written.
+        mission_id (int): The ID of the mission to update.
+        expected_version (Optional[int]): If given, the version the caller last saw.
+
+    Returns:
+        dict: The columns of the updated mission, or None if the mission was not found.
+
+    Raises:
+        VersionConflictError: If the stored version differs from `expected_version`.
+    """
+    robot_id_hint = None
+    if "robot_id" in mission.model_fields_set:
+        cached = await mission_cache.aget(mission_id)
+        robot_id_hint = cached["robot_id"] if cached is not None else None
+    return await db.run_sync(
+        crud.update_mission,
+        mission=mission,
+        mission_id=mission_id,
+        expected_version=expected_version,
+        robot_id_hint=robot_id_hint,
+    )
+
+
+async def create_missions(db: AsyncSession, missions: list[MissionCreate]):
+    """
+    Create many missions in chunked multi-row INSERTs within one transaction.
+
+    Args:
+        db (AsyncSession): The async database session.
+        missions (list[MissionCreate]): The mission data to create.
+
+    Returns:
+        list[int]: The IDs of the created missions, in input order.
+    """
+    return await db.run_sync(crud.create_missions, missions)
+
+
+async def update_missions(db: AsyncSession, missions: list[MissionBulkUpdate]):
+    """
+    Update many missions by ID within one transaction.
+
+    Args:
+        db (AsyncSession): The async database session.
+        missions (list[MissionBulkUpdate]): The updated mission data, each carrying its ID.
+
+    Returns:
+        list[bool]: Whether each mission was found and updated, in input order.
+    """
+    return await db.run_sync(crud.update_missions, missions)
+
+
+async def queue_mission(db: AsyncSession, mission_id: int, priority: int, queued_at: int) -> Optional[dict]:
+    """
+    Record that a mission became due and entered the dispatch queue.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission_id (int): The ID of the mission.
+        priority (int): The dispatch priority of this run.
+        queued_at (int): The current time in epoch milliseconds.
+
+    Returns:
+        Optional[dict]: All columns of the mission, or None if it does not exist.
+
+    Raises:
+        InvalidTransitionError: If the previous run of the mission is still in flight.
+    """
+    return await db.run_sync(crud.queue_mission, mission_id=mission_id, priority=priority, queued_at=queued_at)
+
+
+async def assign_mission(db: AsyncSession, mission_id: int, assigned_at: int) -> Optional[dict]:
+    """
+    Record that the dispatcher handed a queued mission to its robot.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission_id (int): The ID of the mission.
+        assigned_at (int): The current time in epoch milliseconds.
+
+    Returns:
+        Optional[dict]: All columns of the mission, or None if it does not exist.
+
+    Raises:
+        InvalidTransitionError: If the mission is no longer queued.
+    """
+    return await db.run_sync(crud.assign_mission, mission_id=mission_id, assigned_at=assigned_at)
+
+
+async def get_queued_missions(db: AsyncSession):
+    """
+    Retrieve the missions waiting in the dispatch queue, oldest first.
+
+    Args:
+        db (AsyncSession): The async database session.
+
+    Returns:
+        List[Row]: One `(id, robot_id, priority, queued_at)` row per queued mission.
+    """
+    return await db.run_sync(crud.get_queued_missions)
+
+
+async def transition_mission(
+    db: AsyncSession,
+    mission_id: int,
+    status: str,
+    at: int,
+    expected_version: Optional[int] = None,
+):
+    """
+    Move a mission to another status, if its current status allows it.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission_id (int): The ID of the mission.
+        status (str): The status to enter; a key of `app.crud.mission.TRANSITIONS`.
+        at (int): The time of the transition in epoch milliseconds.
+        expected_version (Optional[int]): If given, the version the caller last saw.
+
+    Returns:
+        Optional[dict]: All columns of the mission, or None if it does not exist.
+
+    Raises:
+        VersionConflictError: If the stored version differs from `expected_version`.
+        InvalidTransitionError: If the mission's status does not allow the transition.
+    """
+    return await db.run_sync(
+        crud.transition_mission, mission_id=mission_id, status=status, at=at, expected_version=expected_version
+    )
+
+
+async def get_mission_status(db: AsyncSession, mission_id: int):
+    """
+    Retrieve the lifecycle columns of a mission.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission_id (int): The ID of the mission.
+
+    Returns:
+        Row: The `app.crud.mission.MISSION_STATUS_FIELDS` of the mission, or None if not found.
+    """
+    return await db.run_sync(crud.get_mission_status, mission_id=mission_id)
+
+
+async def archive_missions(
+    db: AsyncSession, finished_before: int, archived_at: int, batch_size: int = 1000, keep_ids: Iterable[int] = ()
+) -> int:
+    """
+    Move missions that finished before a cutoff to the `missions_archive` table.
+
+    Args:
+        db (AsyncSession): The async database session.
+        finished_before (int): Archive missions that finished before this time, in epoch milliseconds.
+        archived_at (int): The current time in epoch milliseconds.
+        batch_size (int): The number of missions moved per transaction (default is 1000).
+        keep_ids (Iterable[int]): Missions never to archive, e.g. those that will run again.
+
+    Returns:
+        int: The number of missions archived.
+    """
+    return await db.run_sync(
+        crud.archive_missions,
+        finished_before=finished_before,
+        archived_at=archived_at,
+        batch_size=batch_size,
+        keep_ids=keep_ids,
+    )
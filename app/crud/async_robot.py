@@ -0,0 +1,111 @@
+"""
+Async versions of the functions in `app.crud.robot`.
+
+Each function runs its synchronous counterpart on the async session's connection
+with `AsyncSession.run_sync`, so queries are issued through the async driver
+without occupying a worker thread, and both variants share one implementation.
+Single-robot reads go through `app.cache.robot_cache` first.
+"""
+from typing import Optional, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cache import robot_cache
+from app.crud import robot as crud
+from app.schemas.robot import RobotBulkUpdate, RobotCreate, RobotPatch, RobotUpdate
+
+
+async def get_robot_rows(db: AsyncSession, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    """
+    Retrieve a page of robots as plain `(id, name, model_name, version)` rows.
+
+    Args:
+        db (AsyncSession): The async database session.
+        skip (int): The number of records to skip (default is 0).
+        limit (int): The maximum number of records to return (default is 100).
+        after_id (Optional[int]): Only return robots with an ID greater than this one.
+
+    Returns:
+        List[Row]: One row per robot, ordered by ID.
+    """
+    return await db.run_sync(crud.get_robot_rows, skip=skip, limit=limit, after_id=after_id)
+
+
+async def get_robot(db: AsyncSession, robot_id: int):
+    """
+    Retrieve a single robot by its ID, reading through the robot cache.
+
+    Args:
+        db (AsyncSession): The async database session.
+        robot_id (int): The ID of the robot to retrieve.
+
+    Returns:
+        dict: The columns of the robot with the specified ID, or None if not found.
+    """
+    cached = await robot_cache.aget(robot_id)
+    if cached is not None:
+        return cached
+    row = await db.run_sync(crud.get_robot_row, robot_id=robot_id)
+    return robot_cache.put(row._asdict()) if row is not None else None
+
+
+async def create_robot(db: AsyncSession, robot: RobotCreate):
+    """
+    Create a new robot and add it to the database.
+
+    Args:
+        db (AsyncSession): The async database session.
+        robot (RobotCreate): The robot data to create.
+
+    Returns:
+        RobotModel: The created robot.
+    """
+    return await db.run_sync(crud.create_robot, robot=robot)
+
+
+async def update_robot(
+    db: AsyncSession, robot: Union[RobotUpdate, RobotPatch], robot_id: int, expected_version: Optional[int] = None
+):
+    """
+    Update an existing robot with the provided data in a single UPDATE statement.
+
+    Args:
+        db (AsyncSession): The async database session.
+        robot (RobotUpdate | RobotPatch): The updated robot data; only set fields are written.
+        robot_id (int): The ID of the robot to update.
+        expected_version (Optional[int]): If given, the version the caller last saw.
+
+    Returns:
+        dict: The columns of the updated robot, or None if the robot was not found.
+
+    Raises:
+        VersionConflictError: If the stored version differs from `expected_version`.
+    """
+    return await db.run_sync(crud.update_robot, robot=robot, robot_id=robot_id, expected_version=expected_version)
+
+
+async def create_robots(db: AsyncSession, robots: list[RobotCreate]):
+    """
+    Create many robots in chunked multi-row INSERTs within one transaction.
+
+    Args:
+        db (AsyncSession): The async database session.
+        robots (list[RobotCreate]): The robot data to create.
+
+    Returns:
+        list[int]: The IDs of the created robots, in input order.
+    """
+    return await db.run_sync(crud.create_robots, robots)
+
+
+async def update_robots(db: AsyncSession, robots: list[RobotBulkUpdate]):
+    """
+    Update many robots by ID within one transaction.
+
+    Args:
+        db (AsyncSession): The async database session.
+        robots (list[RobotBulkUpdate]): The updated robot data, each carrying its ID.
+
+    Returns:
+        list[bool]: Whether each robot was found and updated, in input order.
+    """
+    return await db.run_sync(crud.update_robots, robots)
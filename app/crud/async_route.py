@@ -0,0 +1,66 @@
+"""
+Async versions of the functions in `app.crud.route`.
+
+Each function runs its synchronous counterpart on the async session's connection
+with `AsyncSession.run_sync`, so both variants share one implementation.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud import route as crud
+
+
+async def upsert_routes(db: AsyncSession, routes: list[dict]) -> list[bool]:
+    """
+    Store the routes of many missions with one executemany upsert within one transaction.
+
+    Args:
+        db (AsyncSession): The async database session.
+        routes (list[dict]): The routes, each with `mission_id`, the packed `points`
+            and their `point_count`.
+
+    Returns:
+        list[bool]: Whether each route's mission was found and the route stored, in input order.
+    """
+    return await db.run_sync(crud.upsert_routes, routes)
+
+
+async def get_route(db: AsyncSession, mission_id: int):
+    """
+    Retrieve the stored route of one mission.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission_id (int): The ID of the mission.
+
+    Returns:
+        Optional[bytes]: The packed waypoints, or None if the mission has no route.
+    """
+    return await db.run_sync(crud.get_route, mission_id)
+
+
+async def get_routes(db: AsyncSession, mission_ids: list[int]):
+    """
+    Retrieve the stored routes of many missions.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission_ids (list[int]): The IDs of the missions.
+
+    Returns:
+        dict: The packed waypoints keyed by mission ID, for the missions that have a route.
+    """
+    return await db.run_sync(crud.get_routes, mission_ids)
+
+
+async def delete_route(db: AsyncSession, mission_id: int) -> bool:
+    """
+    Delete the stored route of one mission.
+
+    Args:
+        db (AsyncSession): The async database session.
+        mission_id (int): The ID of the mission.
+
+    Returns:
+        bool: True if the mission had a route.
+    """
+    return await db.run_sync(crud.delete_route, mission_id)
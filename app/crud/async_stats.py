@@ -0,0 +1,23 @@
+"""
+Async versions of the functions in `app.crud.stats`.
+
+Each function runs its synchronous counterpart on the async session's connection
+with `AsyncSession.run_sync`, so both variants share one implementation.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud import stats as crud
+
+
+async def get_mission_counts(db: AsyncSession) -> tuple[dict, dict, dict]:
+    """
+    Aggregate the mission counts per robot and per status, and every robot's model.
+
+    Args:
+        db (AsyncSession): The async database session.
+
+    Returns:
+        tuple[dict, dict, dict]: The mission count of each robot that has missions,
+        the model of every robot, and the mission count of each status.
+    """
+    return await db.run_sync(crud.get_mission_counts)
@@ -0,0 +1,75 @@
+"""
+Async versions of the functions in `app.crud.telemetry`.
+
+Each function runs its synchronous counterpart on the async session's connection
+with `AsyncSession.run_sync`, so both variants share one implementation.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud import telemetry as crud
+
+
+async def insert_telemetry(db: AsyncSession, rows: list[dict]) -> int:
+    """
+    Write telemetry samples with one executemany INSERT within one transaction.
+
+    Args:
+        db (AsyncSession): The async database session.
+        rows (list[dict]): The samples, each with every column of `TelemetryModel`.
+
+    Returns:
+        int: The number of samples written; duplicates of stored samples are skipped.
+    """
+    return await db.run_sync(crud.insert_telemetry, rows)
+
+
+async def get_telemetry(db: AsyncSession, robot_id: int, start: int, end: int, limit: int = 10_000):
+    """
+    Retrieve the samples of one robot within a time range, oldest first.
+
+    Args:
+        db (AsyncSession): The async database session.
+        robot_id (int): The ID of the robot.
+        start (int): The inclusive start of the range, in epoch milliseconds.
+        end (int): The exclusive end of the range, in epoch milliseconds.
+        limit (int): The maximum number of samples to return (default is 10000).
+
+    Returns:
+        List[Row]: One `(ts, x, y, battery, state)` row per sample.
+    """
+    return await db.run_sync(crud.get_telemetry, robot_id=robot_id, start=start, end=end, limit=limit)
+
+
+async def get_telemetry_buckets(
+    db: AsyncSession, robot_id: int, start: int, end: int, bucket_ms: int, limit: int = 10_000
+):
+    """
+    Downsample the samples of one robot within a time range by averaging fixed buckets.
+
+    Args:
+        db (AsyncSession): The async database session.
+        robot_id (int): The ID of the robot.
+        start (int): The inclusive start of the range, in epoch milliseconds.
+        end (int): The exclusive end of the range, in epoch milliseconds.
+        bucket_ms (int): The bucket width in milliseconds.
+        limit (int): The maximum number of buckets to return (default is 10000).
+
+    Returns:
+        List[Row]: One `(ts, x, y, battery, samples)` row per non-empty bucket.
+    """
+    return await db.run_sync(
+        crud.get_telemetry_buckets, robot_id=robot_id, start=start, end=end, bucket_ms=bucket_ms, limit=limit
+    )
+
+
+async def get_robot_states(db: AsyncSession):
+    """
+    Retrieve the stored latest state of every robot.
+
+    Args:
+        db (AsyncSession): The async database session.
+
+    Returns:
+        List[Row]: One `(robot_id, ts, x, y, battery, state)` row per robot.
+    """
+    return await db.run_sync(crud.get_robot_states)
@@ -0,0 +1,118 @@
+from typing import Optional
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+# SQLite builds older than 3.32 reject statements with more than 999 bound parameters.
+MAX_BOUND_PARAMETERS = 999
+
+
+def default_chunk_size(table) -> int:
+    """
+    Return the largest multi-row INSERT chunk that stays under the bound-parameter limit.
+
+    Args:
+        table (Table): The table being written to.
+
+    Returns:
+        int: The number of rows per chunk.
+    """
+    return max(1, MAX_BOUND_PARAMETERS // max(1, len(table.columns) - 1))
+
+
+def _insert_rows(db: Session, table, rows: list[dict]) -> list[int]:
+    """
+    Insert rows with a single multi-row INSERT and return their generated IDs.
+
+    Uses RETURNING where the dialect supports it. Otherwise the IDs are derived from
+    the cursor's `lastrowid`, which for one multi-row INSERT is the last generated ID
+    on SQLite and the first one on MySQL; IDs within one statement are consecutive.
+
+    Args:
+        db (Session): The database session.
+        table (Table): The table to insert into.
+        rows (list[dict]): The column values of each row.
+
+    Returns:
+        list[int]: The generated IDs, in the order of `rows`.
+    """
+    dialect = db.get_bind().dialect
+    if getattr(dialect, "insert_returning", dialect.implicit_returning):
+        return list(db.execute(table.insert().values(rows).returning(table.c.id)).scalars())
+    last_id = db.execute(table.insert().values(rows)).lastrowid
+    first_id = last_id if dialect.name == "mysql" else last_id - len(rows) + 1
+    return list(range(first_id, first_id + len(rows)))
+
+
+def insert_chunked(db: Session, model, rows: list[dict], chunk_size: Optional[int] = None) -> list[int]:
+    """
+    Insert many rows in chunked multi-row INSERTs inside a single transaction.
+
+    No ORM instances are created and no rows are read back; if any chunk fails, the
+    whole batch is rolled back.
+
+    Args:
+        db (Session): The database session.
+        model: The SQLAlchemy model whose table receives the rows.
+        rows (list[dict]): The column values of each row.
+        chunk_size (Optional[int]): Rows per INSERT statement (defaults to `default_chunk_size`).
+
+    Returns:
+        list[int]: The generated IDs, in the order of `rows`.
+    """
+    table = model.__table__
+    chunk_size = chunk_size or default_chunk_size(table)
+    ids = []
+    try:
+        for start in range(0, len(rows), chunk_size):
+            ids.extend(_insert_rows(db, table, rows[start : start + chunk_size]))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return ids
+
+
+def update_chunked(db: Session, model, rows: list[dict], chunk_size: Optional[int] = None) -> list[bool]:
+    """
+    Update many rows by ID with executemany UPDATEs inside a single transaction.
+
+    Each chunk first looks up which of its IDs exist, so rows that are not found can be
+    reported individually instead of failing the batch. Tables with a `version`
+    column have it incremented.
+
+    Args:
+        db (Session): The database session.
+        model: The SQLAlchemy model whose table is updated.
+        rows (list[dict]): The new column values of each row, including its `id`.
+        chunk_size (Optional[int]): Rows per lookup and UPDATE batch (defaults to `default_chunk_size`).
+
+    Returns:
+        list[bool]: Whether each row was found and updated, in the order of `rows`.
+    """
+    table = model.__table__
+    chunk_size = chunk_size or default_chunk_size(table)
+    columns = [key for key in rows[0] if key != "id"] if rows else []
+    values = {column: bindparam(column) for column in columns}
+    if "version" in table.c:
+        values["version"] = table.c.version + 1
+    statement = table.update().where(table.c.id == bindparam("_id")).values(values)
+    updated = []
+    try:
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            wanted = {row["id"] for row in chunk}
+            existing = set(db.execute(select(table.c.id).where(table.c.id.in_(wanted))).scalars())
+            params = [
+                {"_id": row["id"], **{column: row[column] for column in columns}}
+                for row in chunk
+                if row["id"] in existing
+            ]
+            if params:
+                db.execute(statement, params)
+            updated.extend(row["id"] in existing for row in chunk)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return updated
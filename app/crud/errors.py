@@ -0,0 +1,26 @@
+class VersionConflictError(Exception):
+    """
+    Raised when an update expected a different row version than the one stored.
+
+    Attributes:
+        entity_id (int): The ID of the row that was not updated.
+    """
+
+    def __init__(self, entity_id: int):
+        super().__init__(f"Row {entity_id} was modified concurrently")
+        self.entity_id = entity_id
+
+
+class InvalidTransitionError(Exception):
+    """
+    Raised when a row's current status does not allow the requested transition.
+
+    Attributes:
+        entity_id (int): The ID of the row that was not updated.
+        status (str): The row's current status.
+    """
+
+    def __init__(self, entity_id: int, status: str):
+        super().__init__(f"Row {entity_id} cannot leave status {status!r} that way")
+        self.entity_id = entity_id
+        self.status = status
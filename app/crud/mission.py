@@ -1,34 +1,352 @@
-from sqlalchemy.orm import Session
-from app.models.mission import Mission as MissionModel
-from app.schemas.mission import MissionCreate, MissionUpdate
+import sys
+from typing import Iterable, Optional, Union
 
-def get_missions(db: Session, skip: int = 0, limit: int = 10):
+from sqlalchemy import and_, column, func, literal, literal_column, or_, select, table, text
+from sqlalchemy.orm import Session, joinedload, selectinload
+from app.models.mission import SEARCH_COLUMNS, Mission as MissionModel, MissionArchive as MissionArchiveModel
+from app.models.mission_route import MissionRoute as RouteModel
+from app.models.robot import Robot as RobotModel
+from app.schemas.mission import MissionBulkUpdate, MissionCreate, MissionPatch, MissionUpdate
+from app.crud.bulk import MAX_BOUND_PARAMETERS, insert_chunked, update_chunked
+from app.crud.errors import InvalidTransitionError, VersionConflictError
+from app.crud.statements import update_by_id
+from app.crud.robot import ROBOT_ROW_COLUMNS
+from app.db.search import POSTGRES_TS_CONFIG, fts5_query, postgres_document, search_terms
+from app.cache import mission_cache
+from app.events import broadcaster
+from app.stats import fleet_stats
+
+# Whitelisted sort keys and their ORDER BY columns; the ID breaks ties so pages are stable.
+SORT_COLUMNS = {
+    "id": (MissionModel.id,),
+    "-id": (MissionModel.id.desc(),),
+    "name": (MissionModel.name, MissionModel.id),
+    "-name": (MissionModel.name.desc(), MissionModel.id.desc()),
+    "robot_id": (MissionModel.robot_id, MissionModel.id),
+    "-robot_id": (MissionModel.robot_id.desc(), MissionModel.id.desc()),
+    "queued_at": (MissionModel.queued_at, MissionModel.id),
+    "-queued_at": (MissionModel.queued_at.desc(), MissionModel.id.desc()),
+}
+
+# Sort keys that can be paged with a keyset condition on the ID.
+KEYSET_SORTS = ("id", "-id")
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Return the smallest string greater than every string starting with `prefix`.
+
+    Trailing U+10FFFF characters cannot be incremented and are dropped first; None is
+    returned when nothing is left, in which case the range has no upper end. The
+    surrogate block is skipped, since lone surrogates cannot be stored.
+    """
+    stem = prefix.rstrip(chr(sys.maxunicode))
+    if not stem:
+        return None
+    code = ord(stem[-1]) + 1
+    if 0xD800 <= code <= 0xDFFF:
+        code = 0xE000
+    return stem[:-1] + chr(code)
+
+
+def missions_query(
+    db: Session,
+    robot_id: Optional[int] = None,
+    name_prefix: Optional[str] = None,
+    model_name: Optional[str] = None,
+    sort: str = "id",
+    after_id: Optional[int] = None,
+    status: Optional[str] = None,
+):
+    """
+    Build the filtered and sorted mission query used by the listing endpoints.
+
+    Every filter is written so that it can be answered from an index: the robot
+    filter and ID keyset use `ix_missions_robot_id_id`, the name prefix is a range
+    on `ix_missions_name`, the model filter resolves robot IDs through
+    `ix_robots_model_name`, and the status filter uses `ix_missions_robot_id_status`
+    within a robot or `ix_missions_status_queued_at` across the fleet.
+
+    Args:
+        db (Session): The database session.
+        robot_id (Optional[int]): Only include missions of this robot.
+        name_prefix (Optional[str]): Only include missions whose name starts with this prefix.
+        model_name (Optional[str]): Only include missions whose robot has this model name.
+        sort (str): One of `SORT_COLUMNS` (default is "id").
+        after_id (Optional[int]): Keyset position; requires an ID sort.
+        status (Optional[str]): Only include missions in this status.
+
+    Returns:
+        Query: The mission query, without offset or limit.
+    """
+    query = db.query(MissionModel)
+    if robot_id is not None:
+        query = query.filter(MissionModel.robot_id == robot_id)
+    if name_prefix:
+        # The range is what the index serves; LIKE keeps the result exact under
+        # collations that do not sort byte-wise, where the range alone over-matches
+        query = query.filter(
+            MissionModel.name >= name_prefix, MissionModel.name.startswith(name_prefix, autoescape=True)
+        )
+        upper_bound = _prefix_upper_bound(name_prefix)
+        if upper_bound is not None:
+            query = query.filter(MissionModel.name < upper_bound)
+    if status is not None:
+        query = query.filter(MissionModel.status == status)
+    if model_name is not None:
+        robot_ids = select(RobotModel.id).where(RobotModel.model_name == model_name)
+        query = query.filter(MissionModel.robot_id.in_(robot_ids))
+    if after_id is not None:
+        if sort not in KEYSET_SORTS:
+            raise ValueError(f"Keyset pagination requires one of {KEYSET_SORTS}")
+        query = query.filter(MissionModel.id < after_id if sort == "-id" else MissionModel.id > after_id)
+    return query.order_by(*SORT_COLUMNS[sort])
+
+
+# Columns of a mission list row, in response order; `version` is last and only feeds the ETag
+MISSION_ROW_COLUMNS = (
+    MissionModel.id,
+    MissionModel.name,
+    MissionModel.description,
+    MissionModel.robot_id,
+    MissionModel.version,
+)
+
+# JSON keys of a mission list row, matching `schemas.Mission`
+MISSION_ROW_FIELDS = ("id", "name", "description", "robot_id")
+
+# Label prefix of the robot columns appended to a mission row by `expand_robot`
+EXPANDED_ROBOT_PREFIX = "robot__"
+EXPANDED_ROBOT_COLUMNS = tuple(column.label(EXPANDED_ROBOT_PREFIX + column.key) for column in ROBOT_ROW_COLUMNS)
+
+
+def _with_robot(query):
+    """Append the robot's columns to a mission row query; they are None for missions without a robot."""
+    return query.outerjoin(RobotModel, RobotModel.id == MissionModel.robot_id).add_columns(*EXPANDED_ROBOT_COLUMNS)
+
+
+def _page(query, skip: int, limit: int, after_id: Optional[int]):
+    """Apply offset or keyset paging to a query and fetch the page."""
+    if after_id is None:
+        query = query.offset(skip)
+    return query.limit(limit).all()
+
+
+def get_missions(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: Optional[int] = None,
+    expand_robot: bool = False,
+    robot_id: Optional[int] = None,
+    name_prefix: Optional[str] = None,
+    model_name: Optional[str] = None,
+    sort: str = "id",
+    status: Optional[str] = None,
+):
     """
-    Retrieve a list of missions from the database.
+    Retrieve a filtered and sorted list of missions from the database.
+
+    When `after_id` is given the page is located with a keyset condition on the
+    primary key (`WHERE id > after_id`, or `<` for `-id`) instead of an offset, so the
+    cost of a page does not grow with its depth. `skip` is ignored in that case.
+
+    Endpoints read pages with `get_mission_rows`; this ORM variant is kept as the
+    baseline the benchmarks compare it with.
 
     Args:
         db (Session): The database session.
         skip (int): The number of records to skip (default is 0).
         limit (int): The maximum number of records to return (default is 10).
+        after_id (Optional[int]): Only return missions after this ID in sort order.
+        expand_robot (bool): Load the robots of the page with one extra `IN` query.
+        robot_id (Optional[int]): Only include missions of this robot.
+        name_prefix (Optional[str]): Only include missions whose name starts with this prefix.
+        model_name (Optional[str]): Only include missions whose robot has this model name.
+        sort (str): One of `SORT_COLUMNS` (default is "id").
+        status (Optional[str]): Only include missions in this status.
 
     Returns:
         List[MissionModel]: A list of missions.
     """
-    return db.query(MissionModel).offset(skip).limit(limit).all()
+    query = missions_query(
+        db,
+        robot_id=robot_id,
+        name_prefix=name_prefix,
+        model_name=model_name,
+        sort=sort,
+        after_id=after_id,
+        status=status,
+    )
+    if expand_robot:
+        query = query.options(selectinload(MissionModel.robot))
+    return _page(query, skip, limit, after_id)
+
+
+def get_mission_rows(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: Optional[int] = None,
+    expand_robot: bool = False,
+    robot_id: Optional[int] = None,
+    name_prefix: Optional[str] = None,
+    model_name: Optional[str] = None,
+    sort: str = "id",
+    status: Optional[str] = None,
+):
+    """
+    Retrieve the same page as `get_missions`, as read-only column rows.
+
+    Only the columns in `MISSION_ROW_COLUMNS` are selected. The rows are plain named
+    tuples: no ORM instances are built, registered in the identity map or
+    instrumented, which makes large pages several times cheaper to load.
+
+    Args:
+        db (Session): The database session.
+        skip (int): The number of records to skip (default is 0).
+        limit (int): The maximum number of records to return (default is 10).
+        after_id (Optional[int]): Only return missions after this ID in sort order.
+        expand_robot (bool): Append the robot's columns, labelled with
+            `EXPANDED_ROBOT_PREFIX`, through a join in the same query.
+        robot_id (Optional[int]): Only include missions of this robot.
+        name_prefix (Optional[str]): Only include missions whose name starts with this prefix.
+        model_name (Optional[str]): Only include missions whose robot has this model name.
+        sort (str): One of `SORT_COLUMNS` (default is "id").
+        status (Optional[str]): Only include missions in this status.
+
+    Returns:
+        List[Row]: One `(id, name, description, robot_id, version)` row per mission.
+    """
+    query = missions_query(
+        db,
+        robot_id=robot_id,
+        name_prefix=name_prefix,
+        model_name=model_name,
+        sort=sort,
+        after_id=after_id,
+        status=status,
+    ).with_entities(*MISSION_ROW_COLUMNS)
+    if expand_robot:
+        query = _with_robot(query)
+    return _page(query, skip, limit, after_id)
 
 
-def get_mission(db: Session, mission_id: int):
+def get_mission_row(db: Session, mission_id: int, expand_robot: bool = False):
+    """
+    Retrieve a single mission by its ID as a read-only column row.
+
+    Args:
+        db (Session): The database session.
+        mission_id (int): The ID of the mission to retrieve.
+        expand_robot (bool): Append the robot's columns, labelled with
+            `EXPANDED_ROBOT_PREFIX`, through a join in the same query.
+
+    Returns:
+        Row: The `(id, name, description, robot_id, version)` row, or None if not found.
+    """
+    query = db.query(*MISSION_ROW_COLUMNS).filter(MissionModel.id == mission_id)
+    if expand_robot:
+        query = _with_robot(query)
+    return query.first()
+
+
+# BM25 column weights for FTS5 search; a match in the name counts more than one in the description
+SEARCH_WEIGHTS = (10.0, 1.0)
+
+
+def search_missions(db: Session, q: str, skip: int = 0, limit: int = 20):
+    """
+    Search missions by keywords in their name and description, best matches first.
+
+    Like the other read paths, this returns read-only column rows. Every word of `q` must appear. On SQLite the query
+    runs against the FTS5 index and is ranked by BM25, on PostgreSQL against the GIN
+    tsvector index ranked by `ts_rank`. Other backends fall back to unranked
+    `LIKE '%word%'` scans ordered by ID.
+
+    Args:
+        db (Session): The database session.
+        q (str): The search query.
+        skip (int): The number of results to skip (default is 0).
+        limit (int): The maximum number of results to return (default is 20).
+
+    Returns:
+        List[Row]: One `(id, name, description, robot_id, version)` row per match, best match first.
+    """
+    terms = search_terms(q)
+    if not terms:
+        return []
+    dialect = db.get_bind().dialect.name
+    query = db.query(*MISSION_ROW_COLUMNS)
+    if dialect == "sqlite":
+        fts = table(f"{MissionModel.__tablename__}_fts", column("rowid"))
+        match = literal_column(fts.name)
+        score = func.bm25(match, *SEARCH_WEIGHTS)
+        # Rank and page inside the index so only the returned rows are read from missions
+        ranked = (
+            select(fts.c.rowid, score.label("score"))
+            .where(match.op("MATCH")(fts5_query(terms)))
+            .order_by(score, fts.c.rowid)
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
+        return (
+            query.join(ranked, ranked.c.rowid == MissionModel.id).order_by(ranked.c.score, MissionModel.id).all()
+        )
+    elif dialect == "postgresql":
+        document = text(postgres_document(MissionModel.__table__, SEARCH_COLUMNS))
+        tsquery = func.plainto_tsquery(POSTGRES_TS_CONFIG, " ".join(terms))
+        query = query.filter(document.op("@@")(tsquery)).order_by(
+            func.ts_rank(document, tsquery).desc(), MissionModel.id
+        )
+    else:
+        columns = [getattr(MissionModel, name) for name in SEARCH_COLUMNS]
+        query = query.filter(
+            and_(*(or_(*(col.contains(term, autoescape=True) for col in columns)) for term in terms))
+        ).order_by(MissionModel.id)
+    return query.offset(skip).limit(limit).all()
+
+
+def iter_missions(db: Session, batch_size: int = 1000):
+    """
+    Stream every mission as a plain dict, ordered by ID.
+
+    Rows are fetched through a server-side cursor `batch_size` at a time and no ORM
+    instances are built, so memory use does not depend on the size of the table.
+
+    Args:
+        db (Session): The database session.
+        batch_size (int): The number of rows fetched per round trip (default is 1000).
+
+    Yields:
+        dict: The columns of one mission.
+    """
+    query = (
+        db.query(MissionModel.id, MissionModel.name, MissionModel.description, MissionModel.robot_id)
+        .order_by(MissionModel.id)
+        .execution_options(stream_results=True)
+        .yield_per(batch_size)
+    )
+    for row in query:
+        yield dict(row._mapping)
+
+def get_mission(db: Session, mission_id: int, expand_robot: bool = False):
     """
     Retrieve a single mission by its ID.
 
     Args:
         db (Session): The database session.
         mission_id (int): The ID of the mission to retrieve.
+        expand_robot (bool): Load the mission's robot in the same query.
 
     Returns:
         MissionModel: The mission with the specified ID, or None if not found.
     """
-    return db.query(MissionModel).filter(MissionModel.id == mission_id).first()
+    query = db.query(MissionModel).filter(MissionModel.id == mission_id)
+    if expand_robot:
+        query = query.options(joinedload(MissionModel.robot))
+    return query.first()
 
 
 def create_mission(db: Session, mission: MissionCreate):
@@ -46,26 +364,346 @@ def create_mission(db: Session, mission: MissionCreate):
     db.add(db_mission)
     db.commit()
     db.refresh(db_mission)
+    broadcaster.publish("mission", "created", mission_cache.put(db_mission))
+    fleet_stats.missions_added([(db_mission.robot_id, db_mission.status)])
     return db_mission
 
 
-def update_mission(db: Session, mission: MissionUpdate, mission_id: int):
+def update_mission(
+    db: Session,
+    mission: Union[MissionUpdate, MissionPatch],
+    mission_id: int,
+    expected_version: Optional[int] = None,
+    robot_id_hint: Optional[int] = None,
+):
     """
-    Update an existing mission with the provided data.
+    Update an existing mission with the provided data in a single UPDATE statement.
+
+    Only the fields set on `mission` are written, so a `MissionPatch` changes just the
+    columns it carries. The row's version is incremented, and with `expected_version`
+    the UPDATE only matches that version, so a concurrent update makes this one fail
+    instead of overwriting it.
+
+    Writing `robot_id` moves the mission between robots in `fleet_stats`, which
+    needs the robot it leaves. The UPDATE is then also conditional on that robot:
+    `robot_id_hint`, e.g. from the cache, is tried first, and only when there is no
+    hint or it turns out stale is the current robot read before the UPDATE.
 
     Args:
         db (Session): The database session.
-        mission (MissionUpdate): The updated mission data.
+        mission (MissionUpdate | MissionPatch): The updated mission data.
         mission_id (int): The ID of the mission to update.
+        expected_version (Optional[int]): If given, the version the caller last saw.
+        robot_id_hint (Optional[int]): The robot the mission is believed to belong to.
 
     Returns:
-        MissionModel: The updated mission, or None if the mission was not found.
+        dict: The columns of the updated mission, or None if the mission was not found.
+
+    Raises:
+        VersionConflictError: If the stored version differs from `expected_version`.
     """
-    db_mission = db.query(MissionModel).filter(MissionModel.id == mission_id).first()
-    if db_mission is None:
-        return None
-    for key, value in mission.dict().items():
-        setattr(db_mission, key, value)
-    db.commit()
-    db.refresh(db_mission)
-    return db_mission
+    values = mission.dict(exclude_unset=True)
+    if "robot_id" not in values:
+        row = update_by_id(db, MissionModel, mission_id, values, expected_version)
+        if row is None or not values:
+            # An empty patch writes nothing: no version bump, so no event and no cache refresh
+            return row
+        broadcaster.publish("mission", "updated", mission_cache.put(row))
+        return row
+    old_robot_id = robot_id_hint
+    while True:
+        if old_robot_id is None:
+            current = db.execute(
+                select(MissionModel.robot_id, MissionModel.version).where(MissionModel.id == mission_id)
+            ).first()
+            if current is None:
+                return None
+            if expected_version is not None and current.version != expected_version:
+                raise VersionConflictError(mission_id)
+            old_robot_id = current.robot_id
+        row = update_by_id(
+            db, MissionModel, mission_id, values, expected_version, where=MissionModel.robot_id == old_robot_id
+        )
+        if row is not None:
+            break
+        # Stale hint, a missing mission or a concurrent write: read the current row and decide
+        old_robot_id = None
+    broadcaster.publish("mission", "updated", mission_cache.put(row))
+    fleet_stats.missions_moved([(old_robot_id, row["robot_id"])])
+    return row
+
+
+def create_missions(db: Session, missions: list[MissionCreate]):
+    """
+    Create many missions in chunked multi-row INSERTs within one transaction.
+
+    One `created` change event is published per mission after the commit.
+
+    Args:
+        db (Session): The database session.
+        missions (list[MissionCreate]): The mission data to create.
+
+    Returns:
+        list[int]: The IDs of the created missions, in input order.
+    """
+    rows = [mission.dict() for mission in missions]
+    ids = insert_chunked(db, MissionModel, rows)
+    for mission_id, row in zip(ids, rows):
+        broadcaster.publish("mission", "created", {"id": mission_id, **row, "version": 1})
+    fleet_stats.missions_added((row["robot_id"], "pending") for row in rows)
+    return ids
+
+
+def update_missions(db: Session, missions: list[MissionBulkUpdate]):
+    """
+    Update many missions by ID within one transaction.
+
+    One `updated` change event is published per mission that was found.
+
+    Args:
+        db (Session): The database session.
+        missions (list[MissionBulkUpdate]): The updated mission data, each carrying its ID.
+
+    Returns:
+        list[bool]: Whether each mission was found and updated, in input order.
+    """
+    rows = [mission.dict() for mission in missions]
+    old_robot_ids = _robot_ids(db, [row["id"] for row in rows])
+    updated = update_chunked(db, MissionModel, rows)
+    mission_cache.invalidate(mission.id for mission in missions)
+    for row, found in zip(rows, updated):
+        if found:
+            # The new version is not read back; the event carries the written columns
+            broadcaster.publish("mission", "updated", row)
+    fleet_stats.missions_moved(
+        (old_robot_ids.get(row["id"]), row["robot_id"]) for row, found in zip(rows, updated) if found
+    )
+    return updated
+
+
+def _robot_ids(db: Session, mission_ids: list[int]) -> dict:
+    """Return the robot ID of each mission found, keyed by mission ID, looked up in chunks."""
+    robot_ids = {}
+    for start in range(0, len(mission_ids), MAX_BOUND_PARAMETERS):
+        chunk = mission_ids[start : start + MAX_BOUND_PARAMETERS]
+        robot_ids.update(
+            db.execute(select(MissionModel.id, MissionModel.robot_id).where(MissionModel.id.in_(chunk))).all()
+        )
+    return robot_ids
+
+
+# Statuses each status can be entered from; recurring missions are queued again once finished
+TRANSITIONS = {
+    "queued": ("pending", "done", "failed"),
+    "assigned": ("queued",),
+    "running": ("assigned",),
+    "done": ("running",),
+    "failed": ("assigned", "running"),
+}
+
+# The timestamp column set on entering each status
+STATUS_TIMESTAMPS = {
+    "queued": "queued_at",
+    "assigned": "assigned_at",
+    "running": "started_at",
+    "done": "finished_at",
+    "failed": "finished_at",
+}
+
+# Columns of a mission's lifecycle, matching `schemas.MissionStatus`
+MISSION_STATUS_FIELDS = (
+    "id",
+    "status",
+    "priority",
+    "queued_at",
+    "assigned_at",
+    "started_at",
+    "finished_at",
+    "version",
+)
+
+
+def transition_mission(
+    db: Session,
+    mission_id: int,
+    status: str,
+    at: int,
+    expected_version: Optional[int] = None,
+    values: Optional[dict] = None,
+) -> Optional[dict]:
+    """
+    Move a mission to another status with a conditional UPDATE.
+
+    The statement only matches while the mission is in the status it leaves and,
+    with `expected_version`, at that version, so concurrent transitions cannot both
+    succeed. Where `TRANSITIONS` allows a single source status, that is one
+    statement; otherwise the current status is read first and the UPDATE is
+    conditional on it. Knowing the status left keeps `fleet_stats` exact. Entering
+    `queued` clears the timestamps of the previous run.
+
+    Args:
+        db (Session): The database session.
+        mission_id (int): The ID of the mission.
+        status (str): The status to enter; a key of `TRANSITIONS`.
+        at (int): The time of the transition in epoch milliseconds.
+        expected_version (Optional[int]): If given, the version the caller last saw.
+        values (Optional[dict]): Other columns to write in the same statement.
+
+    Returns:
+        Optional[dict]: All columns of the mission, or None if it does not exist.
+
+    Raises:
+        VersionConflictError: If the stored version differs from `expected_version`.
+        InvalidTransitionError: If the mission's status does not allow the transition.
+    """
+    new_values = dict(values or {}, status=status)
+    if status == "queued":
+        new_values.update(assigned_at=None, started_at=None, finished_at=None)
+    new_values[STATUS_TIMESTAMPS[status]] = at
+    sources = TRANSITIONS[status]
+    source = sources[0] if len(sources) == 1 else None
+    while True:
+        if source is not None:
+            row = update_by_id(
+                db, MissionModel, mission_id, new_values, expected_version, where=MissionModel.status == source
+            )
+            if row is not None:
+                break
+        current = db.execute(
+            select(MissionModel.status, MissionModel.version).where(MissionModel.id == mission_id)
+        ).first()
+        if current is None:
+            return None
+        if expected_version is not None and current.version != expected_version:
+            raise VersionConflictError(mission_id)
+        if current.status not in sources:
+            raise InvalidTransitionError(mission_id, current.status)
+        # Either the first attempt, or the status changed between the read and the UPDATE
+        source = current.status
+    broadcaster.publish("mission", "updated", mission_cache.put(row))
+    fleet_stats.status_changed(source, status)
+    return row
+
+
+def queue_mission(db: Session, mission_id: int, priority: int, queued_at: int) -> Optional[dict]:
+    """
+    Record that a mission became due and entered the dispatch queue.
+
+    Args:
+        db (Session): The database session.
+        mission_id (int): The ID of the mission.
+        priority (int): The dispatch priority of this run.
+        queued_at (int): The current time in epoch milliseconds.
+
+    Returns:
+        Optional[dict]: All columns of the mission, or None if it does not exist.
+
+    Raises:
+        InvalidTransitionError: If the previous run of the mission is still in flight.
+    """
+    return transition_mission(db, mission_id, "queued", queued_at, values={"priority": priority})
+
+
+def assign_mission(db: Session, mission_id: int, assigned_at: int) -> Optional[dict]:
+    """
+    Record that the dispatcher handed a queued mission to its robot.
+
+    Args:
+        db (Session): The database session.
+        mission_id (int): The ID of the mission.
+        assigned_at (int): The current time in epoch milliseconds.
+
+    Returns:
+        Optional[dict]: All columns of the mission, or None if it does not exist.
+
+    Raises:
+        InvalidTransitionError: If the mission is no longer queued.
+    """
+    return transition_mission(db, mission_id, "assigned", assigned_at)
+
+
+def get_queued_missions(db: Session):
+    """
+    Retrieve the missions waiting in the dispatch queue, oldest first.
+
+    Served by the `(status, queued_at)` index, so only queued missions are read.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        List[Row]: One `(id, robot_id, priority, queued_at)` row per queued mission.
+    """
+    return (
+        db.query(MissionModel.id, MissionModel.robot_id, MissionModel.priority, MissionModel.queued_at)
+        .filter(MissionModel.status == "queued")
+        .order_by(MissionModel.queued_at)
+        .all()
+    )
+
+
+def get_mission_status(db: Session, mission_id: int):
+    """
+    Retrieve the lifecycle columns of a mission.
+
+    Args:
+        db (Session): The database session.
+        mission_id (int): The ID of the mission.
+
+    Returns:
+        Row: The `MISSION_STATUS_FIELDS` of the mission, or None if not found.
+    """
+    columns = [MissionModel.__table__.c[field] for field in MISSION_STATUS_FIELDS]
+    return db.execute(select(*columns).where(MissionModel.id == mission_id)).first()
+
+
+def archive_missions(
+    db: Session, finished_before: int, archived_at: int, batch_size: int = 1000, keep_ids: Iterable[int] = ()
+) -> int:
+    """
+    Move missions that finished before a cutoff from `missions` to `missions_archive`.
+
+    Missions are moved in batches, each copied with INSERT ... SELECT and deleted in
+    its own transaction, so locks are held briefly and an interrupted run loses
+    nothing. The candidates are found through the `(status, finished_at)` index.
+    Their routes are deleted with them: the archive may share IDs with new missions.
+    The cache entries of archived missions are dropped; no change events are
+    published.
+
+    Args:
+        db (Session): The database session.
+        finished_before (int): Archive missions that finished before this time, in epoch milliseconds.
+        archived_at (int): The current time in epoch milliseconds.
+        batch_size (int): The number of missions moved per transaction (default is 1000).
+        keep_ids (Iterable[int]): Missions never to archive, e.g. those that will run again.
+
+    Returns:
+        int: The number of missions archived.
+    """
+    missions = MissionModel.__table__
+    archive = MissionArchiveModel.__table__
+    copied = [column.key for column in missions.columns]
+    candidates = select(missions.c.id, missions.c.robot_id, missions.c.status).where(
+        missions.c.status.in_(("done", "failed")), missions.c.finished_at < finished_before
+    )
+    keep_ids = list(keep_ids)
+    if keep_ids:
+        candidates = candidates.where(missions.c.id.notin_(keep_ids))
+    archived = 0
+    while True:
+        batch = db.execute(candidates.limit(batch_size)).all()
+        if not batch:
+            return archived
+        ids = [row.id for row in batch]
+        db.execute(
+            archive.insert().from_select(
+                copied + ["archived_at"],
+                select(*(missions.c[key] for key in copied), literal(archived_at)).where(missions.c.id.in_(ids)),
+            )
+        )
+        db.execute(RouteModel.__table__.delete().where(RouteModel.mission_id.in_(ids)))
+        db.execute(missions.delete().where(missions.c.id.in_(ids)))
+        db.commit()
+        mission_cache.invalidate(ids)
+        fleet_stats.missions_removed((row.robot_id, row.status) for row in batch)
+        archived += len(ids)
@@ -1,21 +1,106 @@
+from typing import Optional, Union
+
 from sqlalchemy.orm import Session
 from app.models.robot import Robot as RobotModel
-from app.schemas.robot import RobotCreate, RobotUpdate
+from app.schemas.robot import RobotBulkUpdate, RobotCreate, RobotPatch, RobotUpdate
+from app.crud.bulk import insert_chunked, update_chunked
+from app.crud.statements import update_by_id
+from app.cache import robot_cache
+from app.events import broadcaster
+from app.stats import fleet_stats
 
-def get_robots(db: Session, skip: int = 0, limit: int = 100):
+def get_robots(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
     """
-    Retrieve a list of robots from the database.
+    Retrieve a list of robots from the database, ordered by ID.
+
+    When `after_id` is given the page is located with a keyset condition on the
+    primary key (`WHERE id > after_id`) instead of an offset, so the cost of a page
+    does not grow with its depth. `skip` is ignored in that case.
+
+    Endpoints read pages with `get_robot_rows`; this ORM variant is kept as the
+    baseline the benchmarks compare it with.
 
     Args:
         db (Session): The database session.
         skip (int): The number of records to skip (default is 0).
         limit (int): The maximum number of records to return (default is 100).
+        after_id (Optional[int]): Only return robots with an ID greater than this one.
 
     Returns:
         List[RobotModel]: A list of robots.
     """
-    return db.query(RobotModel).offset(skip).limit(limit).all()
+    query = db.query(RobotModel).order_by(RobotModel.id)
+    if after_id is not None:
+        return query.filter(RobotModel.id > after_id).limit(limit).all()
+    return query.offset(skip).limit(limit).all()
+
+
+# Columns of a robot list row, in response order; `version` is last and only feeds the ETag
+ROBOT_ROW_COLUMNS = (RobotModel.id, RobotModel.name, RobotModel.model_name, RobotModel.version)
+
+# JSON keys of a robot list row, matching `schemas.Robot`
+ROBOT_ROW_FIELDS = ("id", "name", "model_name")
+
+
+def get_robot_rows(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    """
+    Retrieve the same page as `get_robots`, as read-only column rows.
+
+    Only the columns in `ROBOT_ROW_COLUMNS` are selected. The rows are plain named
+    tuples: no ORM instances are built, registered in the identity map or
+    instrumented, which makes large pages several times cheaper to load.
+
+    Args:
+        db (Session): The database session.
+        skip (int): The number of records to skip (default is 0).
+        limit (int): The maximum number of records to return (default is 100).
+        after_id (Optional[int]): Only return robots with an ID greater than this one.
+
+    Returns:
+        List[Row]: One `(id, name, model_name, version)` row per robot.
+    """
+    query = db.query(*ROBOT_ROW_COLUMNS).order_by(RobotModel.id)
+    if after_id is not None:
+        return query.filter(RobotModel.id > after_id).limit(limit).all()
+    return query.offset(skip).limit(limit).all()
+
+
+def get_robot_row(db: Session, robot_id: int):
+    """
+    Retrieve a single robot by its ID as a read-only column row.
+
+    Args:
+        db (Session): The database session.
+        robot_id (int): The ID of the robot to retrieve.
+
+    Returns:
+        Row: The `(id, name, model_name, version)` row, or None if not found.
+    """
+    return db.query(*ROBOT_ROW_COLUMNS).filter(RobotModel.id == robot_id).first()
+
+
+def iter_robots(db: Session, batch_size: int = 1000):
+    """
+    Stream every robot as a plain dict, ordered by ID.
 
+    Rows are fetched through a server-side cursor `batch_size` at a time and no ORM
+    instances are built, so memory use does not depend on the size of the table.
+
+    Args:
+        db (Session): The database session.
+        batch_size (int): The number of rows fetched per round trip (default is 1000).
+
+    Yields:
+        dict: The columns of one robot.
+    """
+    query = (
+        db.query(RobotModel.id, RobotModel.name, RobotModel.model_name)
+        .order_by(RobotModel.id)
+        .execution_options(stream_results=True)
+        .yield_per(batch_size)
+    )
+    for row in query:
+        yield dict(row._mapping)
 
 def get_robot(db: Session, robot_id: int):
     """
@@ -46,26 +131,85 @@ def create_robot(db: Session, robot: RobotCreate):
     db.add(db_robot)
     db.commit()
     db.refresh(db_robot)
+    broadcaster.publish("robot", "created", robot_cache.put(db_robot))
+    fleet_stats.robots_changed([(db_robot.id, db_robot.model_name)])
     return db_robot
 
 
-def update_robot(db: Session, robot: RobotUpdate, robot_id: int):
+def update_robot(
+    db: Session, robot: Union[RobotUpdate, RobotPatch], robot_id: int, expected_version: Optional[int] = None
+):
     """
-    Update an existing robot with the provided data.
+    Update an existing robot with the provided data in a single UPDATE statement.
+
+    Only the fields set on `robot` are written, so a `RobotPatch` changes just the
+    columns it carries. The row's version is incremented, and with `expected_version`
+    the UPDATE only matches that version, so a concurrent update makes this one fail
+    instead of overwriting it.
 
     Args:
         db (Session): The database session.
-        robot (RobotUpdate): The updated robot data.
+        robot (RobotUpdate | RobotPatch): The updated robot data.
         robot_id (int): The ID of the robot to update.
+        expected_version (Optional[int]): If given, the version the caller last saw.
 
     Returns:
-        RobotModel: The updated robot, or None if the robot was not found.
+        dict: The columns of the updated robot, or None if the robot was not found.
+
+    Raises:
+        VersionConflictError: If the stored version differs from `expected_version`.
     """
-    db_robot = db.query(RobotModel).filter(RobotModel.id == robot_id).first()
-    if db_robot is None:
-        return None
-    for key, value in robot.dict().items():
-        setattr(db_robot, key, value)
-    db.commit()
-    db.refresh(db_robot)
-    return db_robot
+    values = robot.dict(exclude_unset=True)
+    row = update_by_id(db, RobotModel, robot_id, values, expected_version)
+    if row is None or not values:
+        # An empty patch writes nothing: no version bump, so no event and no cache refresh
+        return row
+    broadcaster.publish("robot", "updated", robot_cache.put(row))
+    if "model_name" in values:
+        fleet_stats.robots_changed([(robot_id, row["model_name"])])
+    return row
+
+
+def create_robots(db: Session, robots: list[RobotCreate]):
+    """
+    Create many robots in chunked multi-row INSERTs within one transaction.
+
+    One `created` change event is published per robot after the commit.
+
+    Args:
+        db (Session): The database session.
+        robots (list[RobotCreate]): The robot data to create.
+
+    Returns:
+        list[int]: The IDs of the created robots, in input order.
+    """
+    rows = [robot.dict() for robot in robots]
+    ids = insert_chunked(db, RobotModel, rows)
+    for robot_id, row in zip(ids, rows):
+        broadcaster.publish("robot", "created", {"id": robot_id, **row, "version": 1})
+    fleet_stats.robots_changed((robot_id, row["model_name"]) for robot_id, row in zip(ids, rows))
+    return ids
+
+
+def update_robots(db: Session, robots: list[RobotBulkUpdate]):
+    """
+    Update many robots by ID within one transaction.
+
+    One `updated` change event is published per robot that was found.
+
+    Args:
+        db (Session): The database session.
+        robots (list[RobotBulkUpdate]): The updated robot data, each carrying its ID.
+
+    Returns:
+        list[bool]: Whether each robot was found and updated, in input order.
+    """
+    rows = [robot.dict() for robot in robots]
+    updated = update_chunked(db, RobotModel, rows)
+    robot_cache.invalidate(robot.id for robot in robots)
+    for row, found in zip(rows, updated):
+        if found:
+            # The new version is not read back; the event carries the written columns
+            broadcaster.publish("robot", "updated", row)
+    fleet_stats.robots_changed((row["id"], row["model_name"]) for row, found in zip(rows, updated) if found)
+    return updated
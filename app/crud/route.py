@@ -0,0 +1,120 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.mission import Mission as MissionModel
+from app.models.mission_route import MissionRoute as RouteModel
+from app.crud.bulk import MAX_BOUND_PARAMETERS
+
+# Columns written for a route, the primary key first
+ROUTE_FIELDS = ("mission_id", "points", "point_count")
+
+
+def upsert_route(table, dialect):
+    """
+    Build an INSERT that replaces the stored route of a mission.
+
+    Args:
+        table (Table): The routes table.
+        dialect: The dialect of the connection the statement runs on.
+
+    Returns:
+        Insert: `ON CONFLICT DO UPDATE` on SQLite and PostgreSQL and
+        `ON DUPLICATE KEY UPDATE` on MySQL.
+
+    Raises:
+        NotImplementedError: For any other dialect.
+    """
+    if dialect.name in ("sqlite", "postgresql"):
+        insert = (sqlite if dialect.name == "sqlite" else postgresql).insert(table)
+        return insert.on_conflict_do_update(
+            index_elements=[table.c.mission_id],
+            set_={field: insert.excluded[field] for field in ROUTE_FIELDS[1:]},
+        )
+    if dialect.name == "mysql":
+        insert = mysql.insert(table)
+        return insert.on_duplicate_key_update({field: insert.inserted[field] for field in ROUTE_FIELDS[1:]})
+    raise NotImplementedError(f"No route upsert for the {dialect.name} dialect")
+
+
+def _existing_missions(db: Session, mission_ids: list[int]) -> set:
+    """Return the IDs of the missions that exist, looked up in chunks."""
+    found = set()
+    for start in range(0, len(mission_ids), MAX_BOUND_PARAMETERS):
+        chunk = mission_ids[start : start + MAX_BOUND_PARAMETERS]
+        found.update(db.execute(select(MissionModel.id).where(MissionModel.id.in_(chunk))).scalars())
+    return found
+
+
+def upsert_routes(db: Session, routes: list[dict]) -> list[bool]:
+    """
+    Store the routes of many missions with one executemany upsert within one transaction.
+
+    A route replaces any route already stored for its mission. Routes of missions
+    that do not exist are skipped; of several routes for one mission, the last is stored.
+
+    Args:
+        db (Session): The database session.
+        routes (list[dict]): The routes, each with `mission_id`, the packed `points`
+            and their `point_count`.
+
+    Returns:
+        list[bool]: Whether each route's mission was found and the route stored, in input order.
+    """
+    if not routes:
+        return []
+    found = _existing_missions(db, list({route["mission_id"] for route in routes}))
+    # PostgreSQL rejects a multi-row upsert that touches the same row twice
+    rows = {route["mission_id"]: route for route in routes if route["mission_id"] in found}
+    if rows:
+        db.execute(upsert_route(RouteModel.__table__, db.get_bind().dialect), list(rows.values()))
+        db.commit()
+    return [route["mission_id"] in found for route in routes]
+
+
+def get_route(db: Session, mission_id: int):
+    """
+    Retrieve the stored route of one mission.
+
+    Args:
+        db (Session): The database session.
+        mission_id (int): The ID of the mission.
+
+    Returns:
+        Optional[bytes]: The packed waypoints, or None if the mission has no route.
+    """
+    return db.execute(select(RouteModel.points).where(RouteModel.mission_id == mission_id)).scalar()
+
+
+def get_routes(db: Session, mission_ids: list[int]):
+    """
+    Retrieve the stored routes of many missions, looked up in chunks.
+
+    Args:
+        db (Session): The database session.
+        mission_ids (list[int]): The IDs of the missions.
+
+    Returns:
+        dict: The packed waypoints keyed by mission ID, for the missions that have a route.
+    """
+    routes = {}
+    for start in range(0, len(mission_ids), MAX_BOUND_PARAMETERS):
+        chunk = mission_ids[start : start + MAX_BOUND_PARAMETERS]
+        query = select(RouteModel.mission_id, RouteModel.points).where(RouteModel.mission_id.in_(chunk))
+        routes.update(db.execute(query).all())
+    return routes
+
+
+def delete_route(db: Session, mission_id: int) -> bool:
+    """
+    Delete the stored route of one mission.
+
+    Args:
+        db (Session): The database session.
+        mission_id (int): The ID of the mission.
+
+    Returns:
+        bool: True if the mission had a route.
+    """
+    deleted = db.execute(RouteModel.__table__.delete().where(RouteModel.mission_id == mission_id)).rowcount
+    db.commit()
+    return bool(deleted)
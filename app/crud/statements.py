@@ -0,0 +1,82 @@
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.crud.errors import VersionConflictError
+
+
+def supports_update_returning(dialect) -> bool:
+    """
+    Check whether UPDATE ... RETURNING can be used on a dialect.
+
+    SQLAlchemy 2.0 reports this as `update_returning`; 1.4 only knows
+    `implicit_returning`, which is False for SQLite and MySQL.
+
+    Args:
+        dialect (Dialect): The dialect of the session's bind.
+
+    Returns:
+        bool: True if the dialect can compile UPDATE ... RETURNING.
+    """
+    return getattr(dialect, "update_returning", dialect.implicit_returning)
+
+
+def update_by_id(
+    db: Session, model, entity_id: int, values: dict, expected_version: Optional[int] = None, where=None
+) -> Optional[dict]:
+    """
+    Update one row by ID with a single UPDATE statement and return its new columns.
+
+    Only the columns in `values` are written, and `version` is incremented in the same
+    statement. Where the dialect supports it, the new row comes back through
+    `RETURNING`; otherwise it is selected inside the same transaction, which still
+    holds the row's write lock. No ORM instance is loaded or refreshed.
+
+    A missing row is detected from the affected row count. Only when an expected
+    version was given and nothing matched is the ID looked up, to tell a version
+    conflict apart from a missing row. With an extra `where` condition, a row it
+    excludes is reported like a missing one, and the caller tells them apart.
+
+    Args:
+        db (Session): The database session.
+        model: The SQLAlchemy model whose table holds the row.
+        entity_id (int): The ID of the row to update.
+        values (dict): The columns to write; may be empty to only check the row.
+        expected_version (Optional[int]): If given, the version the caller last saw.
+        where: An additional condition the row must meet to be updated.
+
+    Returns:
+        Optional[dict]: All columns of the updated row, or None if the ID does not exist
+        or the row does not meet `where`.
+
+    Raises:
+        VersionConflictError: If the row exists but its version is not `expected_version`.
+            Not raised when `where` is given.
+    """
+    table = model.__table__
+    condition = table.c.id == entity_id
+    if expected_version is not None:
+        condition &= table.c.version == expected_version
+    if where is not None:
+        condition &= where
+
+    row = None
+    if not values:
+        row = db.execute(select(table).where(condition)).first()
+    elif supports_update_returning(db.get_bind().dialect):
+        statement = update(table).where(condition).values(**values, version=table.c.version + 1)
+        row = db.execute(statement.returning(*table.columns)).first()
+    else:
+        statement = update(table).where(condition).values(**values, version=table.c.version + 1)
+        if db.execute(statement).rowcount:
+            row = db.execute(select(table).where(table.c.id == entity_id)).first()
+    db.commit()
+
+    if row is not None:
+        return dict(row._mapping)
+    if where is not None or expected_version is None:
+        return None
+    if db.execute(select(table.c.id).where(table.c.id == entity_id)).first():
+        raise VersionConflictError(entity_id)
+    return None
@@ -0,0 +1,66 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.models.mission import Mission as MissionModel
+from app.models.robot import Robot as RobotModel
+
+
+def get_mission_counts(db: Session) -> tuple[dict, dict, dict]:
+    """
+    Aggregate the mission counts kept by `app.stats.FleetStats` from the base tables.
+
+    The per-robot counts are read from the `(robot_id, id)` index and the per-status
+    counts from the `(status, queued_at)` index; neither reads the table's rows. The
+    per-model counts are derived from them and every robot's model.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        tuple[dict, dict, dict]: The mission count of each robot that has missions,
+        the model of every robot, and the mission count of each status.
+    """
+    robot_counts = dict(
+        db.execute(
+            select(MissionModel.robot_id, func.count())
+            .where(MissionModel.robot_id.isnot(None))
+            .group_by(MissionModel.robot_id)
+        ).all()
+    )
+    robot_models = dict(db.execute(select(RobotModel.id, RobotModel.model_name)).all())
+    status_counts = dict(db.execute(select(MissionModel.status, func.count()).group_by(MissionModel.status)).all())
+    return robot_counts, robot_models, status_counts
+
+
+def aggregate_mission_stats(db: Session) -> dict:
+    """
+    Compute the statistics of `GET /stats` with GROUP BY queries over the whole table.
+
+    This is what the incremental counters replace; it is kept as the baseline the
+    benchmarks compare them with.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        dict: The total and the counts by status, by model and by robot.
+    """
+    by_status = dict(db.execute(select(MissionModel.status, func.count()).group_by(MissionModel.status)).all())
+    by_model = db.execute(
+        select(RobotModel.model_name, func.count())
+        .select_from(MissionModel)
+        .join(RobotModel, RobotModel.id == MissionModel.robot_id)
+        .group_by(RobotModel.model_name)
+        .order_by(RobotModel.model_name)
+    ).all()
+    by_robot = db.execute(
+        select(MissionModel.robot_id, func.count())
+        .where(MissionModel.robot_id.isnot(None))
+        .group_by(MissionModel.robot_id)
+        .order_by(MissionModel.robot_id)
+    ).all()
+    return {
+        "missions": sum(by_status.values()),
+        "by_status": by_status,
+        "by_model": [{"model_name": model_name, "missions": count} for model_name, count in by_model],
+        "by_robot": [{"robot_id": robot_id, "missions": count} for robot_id, count in by_robot],
+    }
@@ -0,0 +1,207 @@
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.robot_state import RobotState as RobotStateModel
+from app.models.telemetry import Telemetry as TelemetryModel
+
+# Columns of a raw sample row, in response order, matching `schemas.TelemetrySample`
+TELEMETRY_ROW_COLUMNS = (
+    TelemetryModel.ts,
+    TelemetryModel.x,
+    TelemetryModel.y,
+    TelemetryModel.battery,
+    TelemetryModel.state,
+)
+
+# JSON keys of a raw sample row
+TELEMETRY_ROW_FIELDS = ("ts", "x", "y", "battery", "state")
+
+# JSON keys of a downsampled row, matching `schemas.TelemetryBucket`
+TELEMETRY_BUCKET_FIELDS = ("ts", "x", "y", "battery", "samples")
+
+# Columns of a latest-state row, in response order, matching `schemas.RobotState`
+ROBOT_STATE_FIELDS = ("robot_id", "ts", "x", "y", "battery", "state")
+
+
+def insert_ignoring_duplicates(table, dialect):
+    """
+    Build an INSERT that skips rows whose primary key already exists.
+
+    Robots resend samples after a timeout, so duplicates are expected and must not
+    fail the batch they arrive in.
+
+    Args:
+        table (Table): The table to insert into.
+        dialect: The dialect of the connection the statement runs on.
+
+    Returns:
+        Insert: `ON CONFLICT DO NOTHING` on SQLite and PostgreSQL, `INSERT IGNORE` on
+        MySQL and a plain INSERT elsewhere.
+    """
+    if dialect.name == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing()
+    if dialect.name == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    if dialect.name == "mysql":
+        return table.insert().prefix_with("IGNORE")
+    return table.insert()
+
+
+def upsert_newer_state(table, dialect):
+    """
+    Build an INSERT that replaces a robot's stored state only with a more recent sample.
+
+    Samples of one robot may be flushed out of order, so an older sample arriving
+    late must not overwrite the state reported after it.
+
+    Args:
+        table (Table): The latest-state table.
+        dialect: The dialect of the connection the statement runs on.
+
+    Returns:
+        Insert: `ON CONFLICT DO UPDATE ... WHERE` on SQLite and PostgreSQL and
+        `ON DUPLICATE KEY UPDATE` with per-column conditions on MySQL.
+
+    Raises:
+        NotImplementedError: For any other dialect.
+    """
+    if dialect.name in ("sqlite", "postgresql"):
+        insert = (sqlite if dialect.name == "sqlite" else postgresql).insert(table)
+        return insert.on_conflict_do_update(
+            index_elements=[table.c.robot_id],
+            set_={field: insert.excluded[field] for field in ROBOT_STATE_FIELDS[1:]},
+            where=insert.excluded.ts > table.c.ts,
+        )
+    if dialect.name == "mysql":
+        insert = mysql.insert(table)
+        newer = insert.inserted.ts > table.c.ts
+        # MySQL assigns left to right and later conditions see earlier assignments, so ts goes last
+        return insert.on_duplicate_key_update(
+            [
+                (field, func.if_(newer, insert.inserted[field], table.c[field]))
+                for field in ("x", "y", "battery", "state", "ts")
+            ]
+        )
+    raise NotImplementedError(f"No latest-state upsert for the {dialect.name} dialect")
+
+
+def latest_samples(rows: list[dict]) -> list[dict]:
+    """
+    Pick the most recent sample of every robot in a batch.
+
+    Args:
+        rows (list[dict]): Telemetry samples of any number of robots.
+
+    Returns:
+        list[dict]: One sample per robot, the one with the highest `ts`.
+    """
+    latest = {}
+    for row in rows:
+        current = latest.get(row["robot_id"])
+        if current is None or row["ts"] > current["ts"]:
+            latest[row["robot_id"]] = row
+    return list(latest.values())
+
+
+def insert_telemetry(db: Session, rows: list[dict]) -> int:
+    """
+    Write telemetry samples with one executemany INSERT within one transaction.
+
+    The statement is compiled once and the driver sends the rows in bulk: SQLite
+    steps one prepared statement per row without leaving C, and psycopg2 pages the
+    rows into multi-row VALUES lists. For a flush of thousands of rows this is an
+    order of magnitude faster than compiling chunked multi-row VALUES statements.
+
+    The latest state of every robot in the batch is upserted into `robot_state` in
+    the same transaction, so the summary never disagrees with the samples.
+
+    Args:
+        db (Session): The database session.
+        rows (list[dict]): The samples, each with every column of `TelemetryModel`.
+
+    Returns:
+        int: The number of samples written; duplicates of stored samples are skipped.
+    """
+    if not rows:
+        return 0
+    dialect = db.get_bind().dialect
+    written = db.execute(insert_ignoring_duplicates(TelemetryModel.__table__, dialect), rows).rowcount
+    db.execute(upsert_newer_state(RobotStateModel.__table__, dialect), latest_samples(rows))
+    db.commit()
+    return written
+
+
+def get_telemetry(db: Session, robot_id: int, start: int, end: int, limit: int = 10_000):
+    """
+    Retrieve the samples of one robot within a time range, oldest first.
+
+    Args:
+        db (Session): The database session.
+        robot_id (int): The ID of the robot.
+        start (int): The inclusive start of the range, in epoch milliseconds.
+        end (int): The exclusive end of the range, in epoch milliseconds.
+        limit (int): The maximum number of samples to return (default is 10000).
+
+    Returns:
+        List[Row]: One `(ts, x, y, battery, state)` row per sample.
+    """
+    return (
+        db.query(*TELEMETRY_ROW_COLUMNS)
+        .filter(TelemetryModel.robot_id == robot_id, TelemetryModel.ts >= start, TelemetryModel.ts < end)
+        .order_by(TelemetryModel.ts)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_telemetry_buckets(db: Session, robot_id: int, start: int, end: int, bucket_ms: int, limit: int = 10_000):
+    """
+    Downsample the samples of one robot within a time range by averaging fixed buckets.
+
+    Buckets are aligned to multiples of `bucket_ms` since the epoch, so the same
+    bucket has the same boundaries whatever range it is requested with. The
+    aggregation runs in the database over a primary-key range scan; empty buckets
+    are left out.
+
+    Args:
+        db (Session): The database session.
+        robot_id (int): The ID of the robot.
+        start (int): The inclusive start of the range, in epoch milliseconds.
+        end (int): The exclusive end of the range, in epoch milliseconds.
+        bucket_ms (int): The bucket width in milliseconds.
+        limit (int): The maximum number of buckets to return (default is 10000).
+
+    Returns:
+        List[Row]: One `(ts, x, y, battery, samples)` row per non-empty bucket, where
+        `ts` is the start of the bucket and the other values are averages.
+    """
+    bucket = (TelemetryModel.ts - TelemetryModel.ts % bucket_ms).label("bucket")
+    return (
+        db.query(
+            bucket,
+            func.avg(TelemetryModel.x),
+            func.avg(TelemetryModel.y),
+            func.avg(TelemetryModel.battery),
+            func.count(),
+        )
+        .filter(TelemetryModel.robot_id == robot_id, TelemetryModel.ts >= start, TelemetryModel.ts < end)
+        .group_by(bucket)
+        .order_by(bucket)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_robot_states(db: Session):
+    """
+    Retrieve the stored latest state of every robot.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        List[Row]: One `(robot_id, ts, x, y, battery, state)` row per robot.
+    """
+    return db.query(*(RobotStateModel.__table__.c[field] for field in ROBOT_STATE_FIELDS)).all()
@@ -0,0 +1,43 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from .base import SQLALCHEMY_DATABASE_URL, configure_engine, engine_options, require_driver, settings
+
+# Async drivers used for each synchronous database backend
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    Convert a synchronous database URL into the equivalent async-driver URL.
+
+    Args:
+        url (str): A database URL such as `sqlite:///./mission-app.db`.
+
+    Returns:
+        str: The same URL using the backend's async driver, e.g. `sqlite+aiosqlite:///./mission-app.db`.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r}")
+    return str(parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}"))
+
+
+# Create the async SQLAlchemy engine on the same database as the synchronous one
+require_driver(to_async_url(SQLALCHEMY_DATABASE_URL))
+async_engine = create_async_engine(to_async_url(SQLALCHEMY_DATABASE_URL), **engine_options(settings, is_async=True))
+configure_engine(async_engine.sync_engine, settings)
+
+# Create a configured "AsyncSession" class
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autocommit=False,  # Disable autocommit to manage transactions manually
+    autoflush=False,  # Disable autoflush to control when changes are flushed to the database
+)
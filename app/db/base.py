@@ -1,14 +1,122 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-# Database URL for SQLite; use a different URL for production (e.g., PostgreSQL)
-SQLALCHEMY_DATABASE_URL = "sqlite:///./mission-app.db"
+from .config import DatabaseSettings
+from .migrations import register_schema_upgrades
+from .pool import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_pool
+from .statements import instrument_statements
+
+# Database settings, read from the environment (DATABASE_URL, DB_POOL_SIZE, ...)
+settings = DatabaseSettings.from_env()
+
+# Database URL; defaults to a local SQLite file, set DATABASE_URL for production (e.g., PostgreSQL)
+SQLALCHEMY_DATABASE_URL = settings.url
+
+
+def engine_options(settings: DatabaseSettings, is_async: bool = False) -> dict:
+    """
+    Build the `create_engine` keyword arguments for the configured backend.
+
+    SQLite keeps SQLAlchemy's default pool for its driver; server databases get a
+    sized queue pool that records checkout waits.
+
+    Args:
+        settings (DatabaseSettings): The database settings.
+        is_async (bool): Whether the options are for an async engine.
+
+    Returns:
+        dict: Keyword arguments for `create_engine` or `create_async_engine`.
+    """
+    if settings.is_sqlite:
+        # Necessary for SQLite to allow multiple threads; aiosqlite manages its own thread
+        return {} if is_async else {"connect_args": {"check_same_thread": False}}
+
+    options = {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_timeout": settings.pool_timeout,
+        "pool_recycle": settings.pool_recycle,
+        "pool_pre_ping": settings.pool_pre_ping,
+    }
+    timeout = settings.statement_timeout_ms
+    if timeout:
+        if settings.backend == "postgresql":
+            options["connect_args"] = (
+                {"server_settings": {"statement_timeout": str(timeout)}}
+                if is_async
+                else {"options": f"-c statement_timeout={timeout}"}
+            )
+        elif settings.backend == "mysql":
+            options["connect_args"] = {"init_command": f"SET SESSION max_execution_time={timeout}"}
+    return options
+
+
+# Optional dependency group of pyproject.toml that installs the drivers of each server backend
+DRIVER_EXTRAS = {"postgresql": "postgresql", "mysql": "mysql"}
+
+
+def require_driver(url: str):
+    """
+    Import the DBAPI driver of a database URL, failing with an actionable message.
+
+    SQLite's drivers ship with the application; the drivers of server databases are
+    optional dependencies and are only needed when `DATABASE_URL` points at one.
+
+    Args:
+        url (str): A synchronous or async database URL.
+
+    Raises:
+        RuntimeError: If the driver is not installed, naming the missing module and
+            the extra that provides it.
+    """
+    parsed = make_url(url)
+    dialect = parsed.get_dialect()
+    import_dbapi = getattr(dialect, "import_dbapi", None) or dialect.dbapi
+    try:
+        import_dbapi()
+    except ImportError as exc:
+        backend = parsed.get_backend_name()
+        extra = DRIVER_EXTRAS.get(backend)
+        hint = f"; install it with `poetry install -E {extra}`" if extra else ""
+        raise RuntimeError(
+            f"The {parsed.drivername} database driver is not installed (missing module {exc.name!r}){hint}"
+        ) from exc
+
+
+def configure_engine(engine, settings: DatabaseSettings):
+    """
+    Attach pool and statement instrumentation and, for SQLite, per-connection pragmas to an engine.
+
+    SQLite connections switch to WAL journaling so readers no longer block on the
+    writer, relax fsyncs to `synchronous=NORMAL` (safe under WAL), memory-map the
+    database file and wait on locks instead of failing immediately.
+
+    Args:
+        engine (Engine): The synchronous engine (`AsyncEngine.sync_engine` for async engines).
+        settings (DatabaseSettings): The database settings.
+    """
+    instrument_pool(engine)
+    instrument_statements(engine)
+    if not settings.is_sqlite or engine.url.database in (None, "", ":memory:"):
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.close()
+
 
 # Create the SQLAlchemy engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}  # Necessary for SQLite to allow multiple threads
-)
+require_driver(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(settings))
+configure_engine(engine, settings)
 
 # Create a configured "Session" class
 SessionLocal = sessionmaker(
@@ -19,3 +127,6 @@ SessionLocal = sessionmaker(
 
 # Base class for declarative models
 Base = declarative_base()
+
+# Add columns introduced since a database was created whenever the schema is created
+register_schema_upgrades(Base.metadata)
@@ -0,0 +1,76 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """
+    Database connection settings read from the environment.
+
+    Attributes:
+        url (str): The SQLAlchemy database URL (`DATABASE_URL`).
+        pool_size (int): Connections kept open per process (`DB_POOL_SIZE`).
+        max_overflow (int): Extra connections allowed under load (`DB_MAX_OVERFLOW`).
+        pool_timeout (int): Seconds to wait for a free connection (`DB_POOL_TIMEOUT`).
+        pool_recycle (int): Seconds after which a connection is replaced (`DB_POOL_RECYCLE`).
+        pool_pre_ping (bool): Test connections before handing them out (`DB_POOL_PRE_PING`).
+        statement_timeout_ms (Optional[int]): Server-side statement timeout for PostgreSQL
+            and MySQL (`DB_STATEMENT_TIMEOUT_MS`); disabled when unset.
+        sqlite_busy_timeout_ms (int): How long SQLite waits on a locked database (`SQLITE_BUSY_TIMEOUT_MS`).
+        sqlite_mmap_size (int): Bytes of the SQLite file to memory-map (`SQLITE_MMAP_SIZE`).
+    """
+
+    url: str = "sqlite:///./mission-app.db"
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout_ms: Optional[int] = None
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        """
+        Build the settings from environment variables, falling back to the defaults.
+
+        Returns:
+            DatabaseSettings: The resolved settings.
+        """
+        return cls(
+            url=os.getenv("DATABASE_URL", cls.url),
+            pool_size=_env_int("DB_POOL_SIZE", cls.pool_size),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", cls.max_overflow),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", cls.pool_timeout),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", cls.pool_recycle),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", cls.pool_pre_ping),
+            statement_timeout_ms=_env_int("DB_STATEMENT_TIMEOUT_MS", cls.statement_timeout_ms),
+            sqlite_busy_timeout_ms=_env_int("SQLITE_BUSY_TIMEOUT_MS", cls.sqlite_busy_timeout_ms),
+            sqlite_mmap_size=_env_int("SQLITE_MMAP_SIZE", cls.sqlite_mmap_size),
+        )
+
+    @property
+    def backend(self) -> str:
+        """str: The database backend name, e.g. `sqlite` or `postgresql`."""
+        return make_url(self.url).get_backend_name()
+
+    @property
+    def is_sqlite(self) -> bool:
+        """bool: Whether the database is SQLite."""
+        return self.backend == "sqlite"
@@ -0,0 +1,77 @@
+from sqlalchemy import event, inspect, text
+
+# Columns added to tables after their first release, with the DDL that adds them
+ADDED_COLUMNS = (
+    ("missions", "version", "INTEGER NOT NULL DEFAULT 1"),
+    ("robots", "version", "INTEGER NOT NULL DEFAULT 1"),
+    ("missions", "priority", "INTEGER NOT NULL DEFAULT 0"),
+    ("missions", "queued_at", "BIGINT"),
+    ("missions", "assigned_at", "BIGINT"),
+    ("missions", "status", "VARCHAR(16) NOT NULL DEFAULT 'pending'"),
+    ("missions", "started_at", "BIGINT"),
+    ("missions", "finished_at", "BIGINT"),
+)
+
+# Statements filling a column from older ones, run once right after the column is added
+BACKFILLS = {
+    ("missions", "status"): (
+        "UPDATE missions SET status = 'assigned' WHERE assigned_at IS NOT NULL",
+        "UPDATE missions SET status = 'queued' WHERE assigned_at IS NULL AND queued_at IS NOT NULL",
+    ),
+}
+
+# Indexes added to tables after their first release: (name, table, columns)
+ADDED_INDEXES = (
+    ("ix_missions_robot_id_id", "missions", ("robot_id", "id")),
+    ("ix_robots_model_name", "robots", ("model_name",)),
+    ("ix_missions_robot_id_status", "missions", ("robot_id", "status")),
+    ("ix_missions_status_queued_at", "missions", ("status", "queued_at")),
+    ("ix_missions_status_finished_at", "missions", ("status", "finished_at")),
+)
+
+# Indexes replaced by later ones: (name, table)
+DROPPED_INDEXES = (("ix_missions_assigned_at_queued_at", "missions"),)
+
+
+def upgrade_schema(connection):
+    """
+    Bring tables created by an earlier release up to date with the models.
+
+    `create_all` only creates missing tables; it never alters existing ones, so a
+    database from before a column was introduced would fail on every query that
+    selects it, and one from before an index was introduced would answer filtered
+    queries with table scans. A column derived from existing data is backfilled in
+    the same transaction that adds it. Indexes that a later one replaced are dropped, so
+    writes stop maintaining them. Each statement here is skipped when it was already
+    applied, so the upgrade is safe to run on every start.
+
+    Args:
+        connection (Connection): A connection inside the transaction creating the schema.
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    for table, column, ddl in ADDED_COLUMNS:
+        if table in tables and column not in {existing["name"] for existing in inspector.get_columns(table)}:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+            for statement in BACKFILLS.get((table, column), ()):
+                connection.execute(text(statement))
+    for name, table, columns in ADDED_INDEXES:
+        if table in tables and name not in {index["name"] for index in inspector.get_indexes(table)}:
+            connection.execute(text(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"))
+    for name, table in DROPPED_INDEXES:
+        if table in tables and name in {index["name"] for index in inspector.get_indexes(table)}:
+            on_table = f" ON {table}" if connection.dialect.name == "mysql" else ""
+            connection.execute(text(f"DROP INDEX {name}{on_table}"))
+
+
+def register_schema_upgrades(metadata):
+    """
+    Run `upgrade_schema` after every `create_all` of the given metadata.
+
+    Args:
+        metadata (MetaData): The metadata whose `create_all` upgrades the schema.
+    """
+
+    @event.listens_for(metadata, "after_create")
+    def run_schema_upgrades(target, connection, **kw):
+        upgrade_schema(connection)
@@ -0,0 +1,116 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolStats:
+    """
+    Thread-safe counters describing how an engine's connection pool is used.
+
+    Attributes:
+        connects (int): Physical connections opened.
+        checkouts (int): Connections handed out by the pool.
+        checkins (int): Connections returned to the pool.
+        waits (int): Checkouts that had to wait because the pool was exhausted.
+        wait_seconds (float): Total time spent waiting for a connection.
+        max_wait_seconds (float): The longest single wait.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self, pool) -> dict:
+        """
+        Return the counters together with the pool's current occupancy.
+
+        Args:
+            pool (Pool): The pool the counters belong to.
+
+        Returns:
+            dict: Counter values, plus size/checked-out/overflow gauges for queue pools.
+        """
+        with self._lock:
+            data = {
+                "pool_class": type(pool).__name__,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(0, pool.overflow()),
+            )
+        return data
+
+
+class _TimedMixin:
+    """Times checkouts that block on an exhausted pool and reports them to `PoolStats`."""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        if self.checkedin() or self._max_overflow == -1 or self.overflow() < self._max_overflow:
+            return super()._do_get()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.stats.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        # Engine.dispose() swaps in a recreated pool; keep reporting to the same counters.
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class TimedQueuePool(_TimedMixin, QueuePool):
+    """`QueuePool` that records how long checkouts wait for a free connection."""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedMixin, AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` that records how long checkouts wait for a free connection."""
+
+
+def instrument_pool(engine) -> PoolStats:
+    """
+    Attach pool event listeners to an engine and return its counters.
+
+    Args:
+        engine (Engine): The synchronous engine (use `AsyncEngine.sync_engine` for async engines).
+
+    Returns:
+        PoolStats: The counters, also reachable as `engine.pool_stats`.
+    """
+    stats = PoolStats()
+    engine.pool_stats = stats
+    if isinstance(engine.pool, _TimedMixin):
+        engine.pool.stats = stats
+    event.listen(engine, "connect", lambda *_: stats.increment("connects"))
+    event.listen(engine, "checkout", lambda *_: stats.increment("checkouts"))
+    event.listen(engine, "checkin", lambda *_: stats.increment("checkins"))
+    return stats
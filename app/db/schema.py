@@ -0,0 +1,58 @@
+"""
+Create and upgrade the database schema.
+
+Importing the application no longer touches the database: the schema is created,
+and tables from earlier releases upgraded (see `app.db.migrations`), by this
+explicit step instead. `app.main` runs it on startup unless `DB_INIT_SCHEMA` is
+`0`, and `app.serve` runs it once in the master process before forking workers.
+It can also be run on its own, e.g. as a release step:
+
+    python -m app.db.schema
+"""
+
+import importlib
+import logging
+import os
+import time
+
+from .base import Base, engine
+
+logger = logging.getLogger(__name__)
+
+# Modules declaring the tables of the application, imported so that they are registered on `Base.metadata`
+MODEL_MODULES = (
+    "app.models.robot",
+    "app.models.mission",
+    "app.models.mission_route",
+    "app.models.robot_state",
+    "app.models.telemetry",
+)
+
+
+def schema_init_enabled() -> bool:
+    """Return whether this process creates the schema on startup, from `DB_INIT_SCHEMA`."""
+    return os.getenv("DB_INIT_SCHEMA", "1") == "1"
+
+
+def create_schema(bind=None) -> float:
+    """
+    Create the missing tables and indexes and upgrade the existing tables.
+
+    Every step is skipped when already applied, so this is safe to run on every start.
+
+    Args:
+        bind (Engine): The engine to create the schema with; defaults to the application engine.
+
+    Returns:
+        float: The time taken, in seconds.
+    """
+    start = time.perf_counter()
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+    Base.metadata.create_all(bind=bind if bind is not None else engine)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    logger.info("Schema of %s is up to date (%.0f ms)", engine.url.render_as_string(), create_schema() * 1000)
@@ -0,0 +1,118 @@
+import re
+
+from sqlalchemy import event, text
+
+# Text search configuration used for PostgreSQL tsvectors and tsqueries
+POSTGRES_TS_CONFIG = "english"
+
+
+def search_terms(q: str) -> list[str]:
+    """
+    Split a user query into the words it is searched by.
+
+    Args:
+        q (str): The raw query string.
+
+    Returns:
+        list[str]: The word tokens of the query, in order.
+    """
+    return re.findall(r"\w+", q)
+
+
+def fts5_query(terms: list[str]) -> str:
+    """
+    Build an FTS5 MATCH expression that requires every term.
+
+    Terms are quoted so FTS5 operators in user input are matched literally.
+
+    Args:
+        terms (list[str]): The query terms, as returned by `search_terms`.
+
+    Returns:
+        str: The MATCH expression.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def postgres_document(table, columns) -> str:
+    """
+    Return the SQL expression of the tsvector indexed for `columns` of `table`.
+
+    The search query must use the exact same expression for PostgreSQL to pick the
+    expression index.
+
+    Args:
+        table (Table): The table being searched.
+        columns (Sequence[str]): The text columns to index.
+
+    Returns:
+        str: The `to_tsvector(...)` expression.
+    """
+    parts = " || ' ' || ".join(f"coalesce({table.name}.{column}, '')" for column in columns)
+    return f"to_tsvector('{POSTGRES_TS_CONFIG}', {parts})"
+
+
+def _sqlite_statements(table, columns):
+    """Yield the DDL of an external-content FTS5 index kept in sync by triggers."""
+    fts = f"{table.name}_fts"
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    yield (
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table.name}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')"
+    )
+    yield (
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table.name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new}); END"
+    )
+    yield (
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table.name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old}); END"
+    )
+    # Only reindex when a searched column changes, not on every version bump
+    yield (
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {names} ON {table.name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new}); END"
+    )
+    # Index rows that existed before the index was created
+    yield f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"
+
+
+def register_fulltext_index(metadata, table, columns):
+    """
+    Create and maintain a full-text index over `columns` whenever the schema is created.
+
+    On SQLite this is an FTS5 table named `<table>_fts` whose rowid is the row's ID,
+    kept in sync by insert, update and delete triggers, so every write path (single
+    rows, bulk inserts, imports) updates it in the same transaction. On PostgreSQL it
+    is a GIN expression index over a tsvector. Other backends get no index.
+
+    The hook runs on every `create_all`, so the index is also added to databases that
+    were created before it existed.
+
+    Args:
+        metadata (MetaData): The metadata whose `create_all` installs the index.
+        table (Table): The table to index; it must have an integer `id` primary key.
+        columns (Sequence[str]): The text columns to index.
+    """
+
+    @event.listens_for(metadata, "after_create")
+    def create_fulltext_index(target, connection, **kw):
+        dialect = connection.dialect.name
+        if dialect == "sqlite":
+            exists = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": f"{table.name}_fts"},
+            ).first()
+            if not exists:
+                for statement in _sqlite_statements(table, columns):
+                    connection.execute(text(statement))
+        elif dialect == "postgresql":
+            connection.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table.name}_fulltext ON {table.name} "
+                    f"USING GIN ({postgres_document(table, columns)})"
+                )
+            )
@@ -1,5 +1,9 @@
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from .base import SessionLocal
+from .async_base import AsyncSessionLocal
 
 def get_db() -> Session:
     """
@@ -15,3 +19,16 @@ def get_db() -> Session:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency that provides an async database session for FastAPI routes.
+
+    Yields:
+        AsyncSession: An SQLAlchemy async database session.
+
+    Closes the session after use.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,91 @@
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+
+class RequestStatements:
+    """
+    The SQL statements one HTTP request has executed so far, and the time they took.
+
+    Attributes:
+        statements (int): Statements sent to the database.
+        seconds (float): Time between sending each statement and its cursor returning.
+    """
+
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+# The statements of the request being served; set by the request timing middleware.
+# Threadpool endpoints and `AsyncSession.run_sync` see the request's value, so its
+# statements are counted wherever they run. Statements run outside a request, e.g.
+# by scheduler jobs or telemetry flushes, are only counted by the engine.
+current_request: ContextVar[Optional[RequestStatements]] = ContextVar("current_request", default=None)
+
+
+class StatementStats:
+    """
+    Thread-safe counters of the SQL statements an engine has executed.
+
+    Attributes:
+        statements (int): Statements executed, in and out of requests.
+        seconds (float): Total time spent executing them.
+        max_seconds (float): The slowest single statement.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.statements = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.statements += 1
+            self.seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        """Return the counter values."""
+        with self._lock:
+            return {"statements": self.statements, "seconds": self.seconds, "max_seconds": self.max_seconds}
+
+
+def instrument_statements(engine) -> StatementStats:
+    """
+    Attach cursor event listeners to an engine that time every statement it executes.
+
+    Each statement is added to the engine's counters and to the `current_request`
+    of the request that executed it, if any.
+
+    Args:
+        engine (Engine): The synchronous engine (use `AsyncEngine.sync_engine` for async engines).
+
+    Returns:
+        StatementStats: The counters, also reachable as `engine.statement_stats`.
+    """
+    stats = StatementStats()
+    engine.statement_stats = stats
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        # A connection executes one statement at a time, so one slot is enough and a
+        # statement that fails leaves nothing behind
+        conn.info["statement_started"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info.pop("statement_started", time.perf_counter())
+        stats.record(elapsed)
+        request = current_request.get()
+        if request is not None:
+            request.statements += 1
+            request.seconds += elapsed
+
+    return stats
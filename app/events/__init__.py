@@ -0,0 +1,38 @@
+"""
+In-process change feed for missions and robots.
+
+Every create and update in `app.crud` publishes a `ChangeEvent`; WebSocket and
+Server-Sent Events clients subscribe to it. The feed is configured from the
+environment:
+
+- `EVENTS_BACKEND`: `memory` (default) or `redis`. With several worker processes,
+  `redis` is needed for every client to see the writes of every worker.
+- `EVENTS_BUFFER_SIZE`: the number of recent events kept for resuming (default 10000).
+- `EVENTS_QUEUE_SIZE`: undelivered events per subscriber before it is dropped as
+  lagging (default 1000).
+- `EVENTS_REDIS_URL`: connection URL for the `redis` backend.
+"""
+import os
+
+from .backends import RedisEventBackend
+from .broadcaster import Broadcaster, ChangeEvent, Subscription, SubscriptionLagged
+
+
+def broadcaster_from_env() -> Broadcaster:
+    """
+    Build the broadcaster selected by the `EVENTS_*` environment variables.
+
+    Returns:
+        Broadcaster: The configured broadcaster.
+    """
+    backend = None
+    if os.getenv("EVENTS_BACKEND", "memory").lower() == "redis":
+        backend = RedisEventBackend(os.getenv("EVENTS_REDIS_URL", "redis://localhost:6379/0"))
+    return Broadcaster(
+        buffer_size=int(os.getenv("EVENTS_BUFFER_SIZE", "10000")),
+        queue_size=int(os.getenv("EVENTS_QUEUE_SIZE", "1000")),
+        backend=backend,
+    )
+
+
+broadcaster = broadcaster_from_env()
@@ -0,0 +1,99 @@
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Callable, Optional
+
+from .broadcaster import ChangeEvent
+
+logger = logging.getLogger(__name__)
+
+# Numbering and publishing in one script makes them atomic: events reach the channel
+# in sequence order, and no number is taken without its event being published.
+# ARGV[1] is the event's JSON object without its opening brace; the script prepends
+# the sequence number it assigned.
+PUBLISH_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+redis.call('PUBLISH', KEYS[2], '{"seq":' .. seq .. ',' .. ARGV[1])
+return seq
+"""
+
+
+class RedisEventBackend:
+    """
+    Shares the change feed between worker processes through Redis pub/sub.
+
+    Sequence numbers come from a Redis counter so they are ordered across workers;
+    the counter is incremented and the event published by one Lua script. The client
+    is synchronous, so publishing is handed to a background thread and the writer
+    never waits on Redis. A second daemon thread listens on the channel and hands
+    each event, from any process, to the local broadcaster. Requires the optional
+    `redis` package (`poetry install -E redis`).
+
+    Args:
+        url (str): The Redis connection URL.
+        channel (str): The pub/sub channel, also used as the counter's key prefix.
+        client: A ready Redis client to use instead of connecting to `url`.
+    """
+
+    def __init__(self, url: Optional[str] = None, channel: str = "missions-app:changes", client=None):
+        if client is None:
+            try:
+                import redis  # pylint: disable=import-outside-toplevel
+            except ImportError as exc:
+                raise RuntimeError("EVENTS_BACKEND=redis requires the 'redis' package") from exc
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self._publish_script = client.register_script(PUBLISH_SCRIPT)
+        self.channel = channel
+        self.publish_errors = 0
+        self._dispatch = None
+        self._start_publisher()
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def _start_publisher(self):
+        self._outbox = queue.SimpleQueue()
+        threading.Thread(target=self._send, name="change-feed-redis-publisher", daemon=True).start()
+
+    def _after_fork(self):
+        # Threads do not survive a fork, so a worker forked from a preloading server starts its own
+        self._start_publisher()
+        if self._dispatch is not None:
+            self.start(self._dispatch)
+
+    def _send(self):
+        keys = [f"{self.channel}:seq", self.channel]
+        while True:
+            payload = self._outbox.get()
+            if isinstance(payload, threading.Event):
+                payload.set()
+                continue
+            try:
+                self._publish_script(keys=keys, args=[payload])
+            except Exception:  # pylint: disable=broad-except
+                self.publish_errors += 1
+                logger.exception("Publishing a change event to Redis failed")
+
+    def publish(self, entity: str, action: str, data: dict, ts: float):
+        """Queue the event; the publisher thread numbers and publishes it."""
+        body = json.dumps({"entity": entity, "action": action, "id": data["id"], "data": data, "ts": ts})
+        self._outbox.put(body[1:])
+
+    def drain(self):
+        """Block until every event queued so far has been sent."""
+        done = threading.Event()
+        self._outbox.put(done)
+        done.wait()
+
+    def start(self, dispatch: Callable[[ChangeEvent], None]):
+        """Deliver every event published on the channel, by any process, to `dispatch`."""
+        self._dispatch = dispatch
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.channel)
+
+        def listen():
+            for message in pubsub.listen():
+                dispatch(ChangeEvent(**json.loads(message["data"])))
+
+        threading.Thread(target=listen, name="change-feed-redis", daemon=True).start()
@@ -0,0 +1,251 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    One create or update of a mission or robot.
+
+    Attributes:
+        seq (int): Position in the change feed; strictly increasing.
+        entity (str): `mission` or `robot`.
+        action (str): `created` or `updated`.
+        id (int): The ID of the changed entity.
+        data (dict): The entity's columns after the change.
+        ts (float): Publication time as a Unix timestamp.
+    """
+
+    seq: int
+    entity: str
+    action: str
+    id: int
+    data: dict
+    ts: float
+
+    def to_dict(self) -> dict:
+        """Return the event as a JSON-serialisable dict."""
+        return asdict(self)
+
+    @property
+    def robot_id(self) -> Optional[int]:
+        """The robot the change concerns, used for per-robot filtering."""
+        return self.id if self.entity == "robot" else self.data.get("robot_id")
+
+
+class SubscriptionLagged(Exception):
+    """
+    Raised to a subscriber whose queue overflowed.
+
+    Args:
+        last_seq (int): The sequence number of the last event delivered; the client
+            can resume from it while it is still in the replay buffer.
+    """
+
+    def __init__(self, last_seq: int):
+        super().__init__(f"Subscriber fell behind after event {last_seq}")
+        self.last_seq = last_seq
+
+
+class Subscription:
+    """
+    A consumer's view of the change feed, bound to the event loop it was created on.
+
+    Events are handed over with `call_soon_threadsafe`, so publishers on any thread
+    never wait for the consumer. The queue is bounded: when it is full the
+    subscription is marked as lagged instead of blocking the writer or growing
+    without limit, and the consumer gets `SubscriptionLagged` once it has drained
+    the events it already holds.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The loop the consumer runs on.
+        queue_size (int): The maximum number of undelivered events.
+        entity (Optional[str]): Only receive events of this entity.
+        robot_id (Optional[int]): Only receive events concerning this robot.
+        last_seq (int): The sequence number the consumer has already seen.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        queue_size: int,
+        entity: Optional[str] = None,
+        robot_id: Optional[int] = None,
+        last_seq: int = 0,
+    ):
+        self.loop = loop
+        self.entity = entity
+        self.robot_id = robot_id
+        self.last_seq = last_seq
+        self.gap = False
+        self.lagged = False
+        self._backlog = deque()
+        self._queue = asyncio.Queue(maxsize=queue_size)
+
+    def matches(self, event: ChangeEvent) -> bool:
+        """Check the event against the subscription's filters."""
+        if self.entity is not None and event.entity != self.entity:
+            return False
+        return self.robot_id is None or event.robot_id == self.robot_id
+
+    def offer(self, event: ChangeEvent):
+        """Schedule delivery of an event; safe to call from any thread."""
+        if self.matches(event) and not self.lagged:
+            try:
+                self.loop.call_soon_threadsafe(self._put, event)
+            except RuntimeError:  # the consumer's loop is closed
+                self.lagged = True
+
+    def _put(self, event: ChangeEvent):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+    async def get(self) -> ChangeEvent:
+        """
+        Wait for the next event.
+
+        Returns:
+            ChangeEvent: The next matching event, replayed events first.
+
+        Raises:
+            SubscriptionLagged: If events were dropped because the queue was full.
+        """
+        if self._backlog:
+            event = self._backlog.popleft()
+        else:
+            if self.lagged and self._queue.empty():
+                raise SubscriptionLagged(self.last_seq)
+            event = await self._queue.get()
+        self.last_seq = event.seq
+        return event
+
+
+class Broadcaster:
+    """
+    Fans change events out to every subscriber of this process.
+
+    The most recent events are kept in a ring buffer so that reconnecting clients can
+    resume from the last sequence number they saw. With an external backend, events
+    are published through it instead and delivered when they come back, so every
+    worker process sees the same feed with globally ordered sequence numbers.
+
+    Args:
+        buffer_size (int): The number of recent events kept for replay.
+        queue_size (int): The per-subscriber queue bound.
+        backend: Optional external pub/sub backend, e.g. `RedisEventBackend`.
+        clock (Callable[[], float]): Returns the current time; replaceable in tests.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 10_000,
+        queue_size: int = 1_000,
+        backend=None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.queue_size = queue_size
+        self.backend = backend
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._buffer = deque(maxlen=buffer_size)
+        self._subscribers = set()
+        self.published = 0
+        self.lagged = 0
+        if backend is not None:
+            backend.start(self.dispatch)
+            # The backend's listener thread may hold the lock when a preloading server forks a worker
+            os.register_at_fork(after_in_child=self._reset_lock)
+
+    def _reset_lock(self):
+        self._lock = threading.Lock()
+
+    def publish(self, entity: str, action: str, data: dict):
+        """
+        Publish a change; never blocks on subscribers.
+
+        Args:
+            entity (str): `mission` or `robot`.
+            action (str): `created` or `updated`.
+            data (dict): The entity's columns after the change; must include `id`.
+        """
+        if self.backend is not None:
+            self.backend.publish(entity, action, data, self.clock())
+            return
+        with self._lock:
+            self._seq += 1
+            self._record(ChangeEvent(self._seq, entity, action, data["id"], data, self.clock()))
+
+    def dispatch(self, event: ChangeEvent):
+        """
+        Record an event received from the backend and offer it to every subscriber.
+
+        Args:
+            event (ChangeEvent): The event, with its sequence number already assigned.
+        """
+        with self._lock:
+            self._seq = max(self._seq, event.seq)
+            self._record(event)
+
+    def _record(self, event: ChangeEvent):
+        # Called with the lock held, so every subscriber sees events in sequence order
+        self._buffer.append(event)
+        self.published += 1
+        for subscription in self._subscribers:
+            subscription.offer(event)
+
+    def subscribe(
+        self, entity: Optional[str] = None, robot_id: Optional[int] = None, since: Optional[int] = None
+    ) -> Subscription:
+        """
+        Start receiving events on the running event loop.
+
+        Args:
+            entity (Optional[str]): Only receive events of this entity.
+            robot_id (Optional[int]): Only receive events concerning this robot.
+            since (Optional[int]): Replay buffered events after this sequence number.
+                Without it, only events published from now on are received.
+
+        Returns:
+            Subscription: The subscription; `gap` is True if events after `since`
+            have already left the replay buffer, or if `since` is ahead of the feed.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            subscription = Subscription(loop, self.queue_size, entity, robot_id, last_seq=self._seq)
+            if since is not None and since > self._seq:
+                # A position this feed never reached, e.g. from before a restart: the client's
+                # view is stale, so it is told to reset and then follows the live feed
+                subscription.gap = True
+            elif since is not None:
+                subscription.last_seq = since
+                subscription.gap = since < self._seq and (not self._buffer or self._buffer[0].seq > since + 1)
+                subscription._backlog.extend(
+                    event for event in self._buffer if event.seq > since and subscription.matches(event)
+                )
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Stop delivering events to a subscription."""
+        with self._lock:
+            self._subscribers.discard(subscription)
+            self.lagged += subscription.lagged
+
+    def stats(self) -> dict:
+        """Return the current sequence number and subscriber counters."""
+        with self._lock:
+            return {
+                "seq": self._seq,
+                "published": self.published,
+                "subscribers": len(self._subscribers),
+                "buffered": len(self._buffer),
+                "lagged": self.lagged + sum(subscription.lagged for subscription in self._subscribers),
+            }
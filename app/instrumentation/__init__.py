@@ -0,0 +1,45 @@
+"""
+Request-level performance instrumentation.
+
+`RequestTimingMiddleware` records the latency, SQL statement count and database
+time of every HTTP request in `request_metrics`, per route template; the statements
+are counted by the cursor listeners of `app.db.statements`. `GET /metrics` serves
+them, together with the counters of the other components, in the Prometheus text
+format. Each worker process serves its own metrics.
+
+Requests slower than a threshold can be logged, with a profile for a sample of
+them, configured from the environment:
+
+- `SLOW_REQUEST_MS`: log requests slower than this (default 0, disabled).
+- `SLOW_REQUEST_PROFILE_RATE`: the share of requests run under `cProfile`, from 0
+  to 1 (default 0); a profiled request that turns out slow is logged with the
+  functions it spent the most time in. Profiling slows a request down several
+  times, so keep the rate low in production.
+- `SLOW_REQUEST_PROFILE_LINES`: functions listed per profile (default 30).
+"""
+
+import os
+
+from .metrics import Histogram, RequestMetrics
+from .middleware import RequestTimingMiddleware, SlowRequestLog
+from .prometheus import CONTENT_TYPE, Exposition, add_request_metrics
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Exposition",
+    "Histogram",
+    "RequestMetrics",
+    "RequestTimingMiddleware",
+    "SlowRequestLog",
+    "add_request_metrics",
+    "request_metrics",
+    "slow_request_log",
+]
+
+request_metrics = RequestMetrics()
+
+slow_request_log = SlowRequestLog(
+    threshold_ms=float(os.getenv("SLOW_REQUEST_MS", "0")),
+    profile_rate=float(os.getenv("SLOW_REQUEST_PROFILE_RATE", "0")),
+    profile_lines=int(os.getenv("SLOW_REQUEST_PROFILE_LINES", "30")),
+)
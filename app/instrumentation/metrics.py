@@ -0,0 +1,103 @@
+from bisect import bisect_left
+from collections import Counter
+from typing import Iterable, Iterator
+
+# Upper bounds of the request latency and database time buckets, in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds of the statements-per-request buckets
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """
+    Counts of observed values in fixed buckets, with their sum, as Prometheus histograms hold them.
+
+    Args:
+        bounds (Iterable[float]): The ascending upper bounds of the buckets; values above
+            the last bound fall in an implicit `+Inf` bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Iterable[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[tuple]:
+        """
+        Yield the cumulative count of every bucket, `+Inf` last.
+
+        Yields:
+            tuple: `(upper_bound, observations_at_or_below_it)` pairs.
+        """
+        total = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            yield bound, total
+
+
+class RouteMetrics:
+    """
+    What the requests of one method and route cost.
+
+    Attributes:
+        duration (Histogram): Seconds from receiving the request to sending the last byte.
+        statements (Histogram): SQL statements executed per request.
+        db_seconds (Histogram): Seconds per request spent executing them.
+        statuses (Counter): Requests per response status code.
+    """
+
+    __slots__ = ("duration", "statements", "db_seconds", "statuses")
+
+    def __init__(self):
+        self.duration = Histogram(LATENCY_BUCKETS)
+        self.statements = Histogram(STATEMENT_BUCKETS)
+        self.db_seconds = Histogram(LATENCY_BUCKETS)
+        self.statuses: Counter = Counter()
+
+
+class RequestMetrics:
+    """
+    Latency, SQL statement and status counts of the HTTP requests served, per route.
+
+    Requests are grouped by method and route template (`/api/v1/missions/{mission_id}`,
+    not the concrete path), so the number of series stays bounded however many
+    missions and robots are requested. Requests that matched no route share the
+    `UNMATCHED` route. The metrics are only updated and read from the event loop and
+    take no lock.
+    """
+
+    UNMATCHED = "<unmatched>"
+
+    def __init__(self):
+        self.routes: dict[tuple, RouteMetrics] = {}
+        self.slow_requests = 0
+        self.profiled_requests = 0
+
+    def observe(self, method: str, route: str, status: int, seconds: float, statements: int, db_seconds: float):
+        """
+        Record a served request.
+
+        Args:
+            method (str): The HTTP method.
+            route (str): The route template the request matched.
+            status (int): The response status code.
+            seconds (float): How long the request took.
+            statements (int): The SQL statements it executed.
+            db_seconds (float): How long they took.
+        """
+        metrics = self.routes.get((method, route))
+        if metrics is None:
+            metrics = self.routes[(method, route)] = RouteMetrics()
+        metrics.duration.observe(seconds)
+        metrics.statements.observe(statements)
+        metrics.db_seconds.observe(db_seconds)
+        metrics.statuses[status] += 1
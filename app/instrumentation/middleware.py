@@ -0,0 +1,157 @@
+import cProfile
+import io
+import logging
+import pstats
+import random
+import time
+from typing import Callable, Optional
+
+from app.db.statements import RequestStatements, current_request
+
+from .metrics import RequestMetrics
+
+logger = logging.getLogger("app.instrumentation")
+
+
+class SlowRequestLog:
+    """
+    Logs the requests that take longer than a threshold, with a profile for a sample of them.
+
+    Whether a request is slow is only known once it has finished, so a random
+    `profile_rate` share of all requests is run under `cProfile`, and the profile is
+    logged if the request turns out to be slow. One request is profiled at a time.
+    The profiler records the event loop's thread, so the profile of an `async`
+    endpoint also shows the requests that ran while it awaited, and the profile of a
+    threadpool (`def`) endpoint shows the wait for its worker thread.
+
+    Args:
+        threshold_ms (float): Requests slower than this are logged; 0 disables the log.
+        profile_rate (float): The share of requests to profile, from 0 to 1.
+        profile_lines (int): Functions listed per profile, by cumulative time.
+        sample (Callable[[], float]): Returns a random number in [0, 1).
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = 0.0,
+        profile_rate: float = 0.0,
+        profile_lines: int = 30,
+        sample: Callable[[], float] = random.random,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.profile_rate = profile_rate
+        self.profile_lines = profile_lines
+        self._sample = sample
+        self._profiling = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def start_profile(self) -> Optional[cProfile.Profile]:
+        """Start profiling a request if it is sampled and no other request is profiled."""
+        if not self.enabled or self._profiling or self._sample() >= self.profile_rate:
+            return None
+        self._profiling = True
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def finish(self, scope: dict, route: str, status: int, seconds: float, statements: RequestStatements, profile):
+        """
+        Stop a request's profile and log the request if it was slow.
+
+        Args:
+            scope (dict): The request's ASGI scope.
+            route (str): The route template it matched.
+            status (int): The response status code.
+            seconds (float): How long the request took.
+            statements (RequestStatements): The SQL statements it executed.
+            profile (Optional[cProfile.Profile]): Its profile, if it was sampled.
+
+        Returns:
+            bool: True if the request was slow and logged.
+        """
+        if profile is not None:
+            profile.disable()
+            self._profiling = False
+        if not self.enabled or seconds < self.threshold:
+            return False
+        message = "Slow request: %s %s (%s) answered %s in %.1f ms; %s SQL statements took %.1f ms"
+        args = [scope["method"], scope["path"], route, status]
+        args += [seconds * 1000, statements.statements, statements.seconds * 1000]
+        if profile is not None:
+            stream = io.StringIO()
+            pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(self.profile_lines)
+            message += "\n%s"
+            args.append(stream.getvalue())
+        logger.warning(message, *args)
+        return True
+
+
+class RequestTimingMiddleware:
+    """
+    ASGI middleware that times every HTTP request and counts the SQL statements it executes.
+
+    The request's duration, statements and database time are recorded in
+    `RequestMetrics` under its method and route template, and slow requests are
+    reported to the `SlowRequestLog`. Being pure ASGI rather than
+    `BaseHTTPMiddleware`, it adds no task or response copy per request, and streamed
+    responses are timed until their last chunk is sent. WebSocket connections pass
+    through untimed.
+
+    Args:
+        app (ASGIApp): The wrapped application.
+        metrics (RequestMetrics): Where requests are recorded.
+        slow_log (Optional[SlowRequestLog]): Reports slow requests, if given.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics, slow_log: Optional[SlowRequestLog] = None):
+        self.app = app
+        self.metrics = metrics
+        self.slow_log = slow_log
+        self._routes: dict = {}
+
+    def route_of(self, scope: dict) -> str:
+        """
+        Return the template of the route a request matched.
+
+        The router records the matched endpoint in the scope; its route is looked up
+        in a map from endpoints to paths, rebuilt when an unknown endpoint shows up.
+        """
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return RequestMetrics.UNMATCHED
+        if endpoint not in self._routes:
+            self._routes = {
+                route.endpoint: route.path for route in scope["app"].routes if getattr(route, "endpoint", None)
+            }
+        return self._routes.get(endpoint, RequestMetrics.UNMATCHED)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        statements = RequestStatements()
+        token = current_request.set(statements)
+        profile = self.slow_log.start_profile() if self.slow_log is not None else None
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            seconds = time.perf_counter() - start
+            current_request.reset(token)
+            route = self.route_of(scope)
+            self.metrics.observe(scope["method"], route, status, seconds, statements.statements, statements.seconds)
+            if self.slow_log is not None:
+                self.metrics.profiled_requests += profile is not None
+                self.metrics.slow_requests += self.slow_log.finish(scope, route, status, seconds, statements, profile)
@@ -0,0 +1,139 @@
+import math
+from typing import Iterable, Mapping
+
+from .metrics import RequestMetrics
+
+# Media type of the Prometheus text exposition format; Starlette appends the UTF-8 charset
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def format_value(value: float) -> str:
+    """Format a sample value; integers print without a fraction, infinities as `+Inf`/`-Inf`."""
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def escape_label(value: object) -> str:
+    """Escape a label value: backslashes, double quotes and newlines."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: Mapping[str, object]) -> str:
+    """Format a label set as `{name="value",...}`, or nothing if it is empty."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+class Exposition:
+    """
+    Builds a page of metrics in the Prometheus text exposition format.
+
+    Every metric family is written with its `# HELP` and `# TYPE` lines followed by
+    its samples, as scraped from `GET /metrics`.
+    """
+
+    def __init__(self):
+        self._lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str, samples: Iterable[tuple]):
+        """
+        Add a counter, gauge or untyped metric family.
+
+        Args:
+            name (str): The metric name.
+            kind (str): `counter`, `gauge` or `untyped`.
+            help_text (str): What the metric measures.
+            samples (Iterable[tuple]): `(labels, value)` pairs.
+        """
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        self._lines.extend(f"{name}{format_labels(labels)} {format_value(value)}" for labels, value in samples)
+
+    def histogram(self, name: str, help_text: str, series: Iterable[tuple]):
+        """
+        Add a histogram family.
+
+        Args:
+            name (str): The metric name; samples get the `_bucket`, `_sum` and `_count` suffixes.
+            help_text (str): What the histogram measures.
+            series (Iterable[tuple]): `(labels, Histogram)` pairs.
+        """
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in series:
+            for bound, count in histogram.cumulative():
+                bucket_labels = {**labels, "le": format_value(bound)}
+                self._lines.append(f"{name}_bucket{format_labels(bucket_labels)} {count}")
+            self._lines.append(f"{name}_sum{format_labels(labels)} {format_value(histogram.sum)}")
+            self._lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+
+    def stats(self, prefix: str, help_text: str, series: Iterable[tuple]):
+        """
+        Add one untyped family per numeric field of a component's stats dict.
+
+        Args:
+            prefix (str): Prepended to each field name, e.g. `missions_app_cache`.
+            help_text (str): Describes the component; the field name is appended.
+            series (Iterable[tuple]): `(labels, stats)` pairs, one per instance of the component.
+        """
+        families: dict[str, list[tuple]] = {}
+        for labels, stats in series:
+            for field, value in stats.items():
+                if isinstance(value, (int, float)):
+                    families.setdefault(field, []).append((labels, value))
+        for field, samples in families.items():
+            self.family(f"{prefix}_{field}", "untyped", f"{help_text}: {field}", samples)
+
+    def render(self) -> str:
+        """Return the page, one line per header and sample."""
+        return "\n".join(self._lines) + "\n"
+
+
+def add_request_metrics(exposition: Exposition, metrics: RequestMetrics):
+    """
+    Add the per-route request metrics to an exposition.
+
+    Args:
+        exposition (Exposition): The page being built.
+        metrics (RequestMetrics): The recorded requests.
+    """
+    routes = [
+        ({"method": method, "route": route}, route_metrics) for (method, route), route_metrics in metrics.routes.items()
+    ]
+    exposition.family(
+        "http_requests_total",
+        "counter",
+        "HTTP requests served, by method, route template and status code.",
+        (
+            ({**labels, "status": status}, count)
+            for labels, route_metrics in routes
+            for status, count in sorted(route_metrics.statuses.items())
+        ),
+    )
+    exposition.histogram(
+        "http_request_duration_seconds",
+        "Time from receiving a request to sending the last byte of its response.",
+        ((labels, route_metrics.duration) for labels, route_metrics in routes),
+    )
+    exposition.histogram(
+        "http_request_db_statements",
+        "SQL statements executed per request.",
+        ((labels, route_metrics.statements) for labels, route_metrics in routes),
+    )
+    exposition.histogram(
+        "http_request_db_seconds",
+        "Time per request spent executing SQL statements.",
+        ((labels, route_metrics.db_seconds) for labels, route_metrics in routes),
+    )
+    exposition.family(
+        "http_slow_requests_total", "counter", "Requests slower than SLOW_REQUEST_MS.", [({}, metrics.slow_requests)]
+    )
+    exposition.family(
+        "http_profiled_requests_total", "counter", "Requests run under the profiler.", [({}, metrics.profiled_requests)]
+    )
@@ -1,12 +1,58 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.api_v1.api_v1 import router as api_router
-from app.db.base import Base, engine
+from app.api.api_v1.endpoints.metrics import prometheus_router
+from app.db.schema import create_schema, schema_init_enabled
+from app.instrumentation import RequestTimingMiddleware, request_metrics, slow_request_log
+from app.scheduler import get_scheduler, load_dispatch_queue, schedule_archival, scheduler_enabled, scheduler_running
+from app.stats import reconcile_periodically, reconcile_stats
+from app.telemetry import load_robot_states, refresh_robot_states, telemetry_buffer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run the telemetry buffer's background flushes while the application serves.
+
+    Unless `DB_INIT_SCHEMA` is `0`, the database schema is created or upgraded
+    first (see `app.db.schema`); importing the application never touches the
+    database. The latest robot states are loaded before the first request and, if
+    `ROBOT_STATE_REFRESH_MS` is set, reloaded in the background. Unless
+    `SCHEDULER_ENABLED` is `0`, the dispatch queues are rebuilt and the mission
+    scheduler runs, archiving old missions if configured. The fleet statistics are
+    rebuilt from the tables, then every `STATS_RECONCILE_SECONDS`. Pending samples
+    are written before the application shuts down.
+    """
+    if schema_init_enabled():
+        await asyncio.to_thread(create_schema)
+    await load_robot_states()
+    refresh_interval = int(os.getenv("ROBOT_STATE_REFRESH_MS", "0")) / 1000
+    refresh = asyncio.ensure_future(refresh_robot_states(refresh_interval)) if refresh_interval > 0 else None
+    await reconcile_stats()
+    reconcile_interval = float(os.getenv("STATS_RECONCILE_SECONDS", "300"))
+    reconcile = asyncio.ensure_future(reconcile_periodically(reconcile_interval)) if reconcile_interval > 0 else None
+    if scheduler_enabled():
+        await load_dispatch_queue()
+        get_scheduler().start()
+        schedule_archival()
+    await telemetry_buffer.start()
+    try:
+        yield
+    finally:
+        await telemetry_buffer.stop()
+        if scheduler_running():
+            get_scheduler().shutdown(wait=False)
+            await asyncio.sleep(0)  # the asyncio scheduler shuts down in a loop callback
+        for task in (refresh, reconcile):
+            if task is not None:
+                task.cancel()
 
-app = FastAPI()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+app = FastAPI(lifespan=lifespan)
 
 # CORS configuration
 origins = [
@@ -19,11 +65,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
+# Time every request, outermost so that the other middleware is included
+app.add_middleware(RequestTimingMiddleware, metrics=request_metrics, slow_log=slow_request_log)
+
 # Include the API router
 app.include_router(api_router, prefix="/api/v1")
 
+# Prometheus metrics
+app.include_router(prometheus_router)
+
 
 @app.get("/")
 def read_root():
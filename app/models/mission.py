@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import BigInteger, Column, Index, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.db.search import register_fulltext_index
 
 
 class Mission(Base):
@@ -12,16 +13,85 @@ class Mission(Base):
         name (str): The name of the mission.
         description (str): A description of the mission.
         robot_id (int): The foreign key linking to the associated robot's ID.
+        version (int): Incremented on every update; used for ETags and optimistic locking.
+        priority (int): Dispatch priority among the robot's due missions; higher goes first.
+        status (str): Where the mission is in its lifecycle, one of `MISSION_STATUSES`.
+        queued_at (int): When the mission last became due and entered the dispatch queue.
+        assigned_at (int): When the dispatcher last handed the mission to its robot.
+        started_at (int): When the robot last started the mission.
+        finished_at (int): When the last run ended, as `done` or `failed`.
+
+    Timestamps are in milliseconds since the Unix epoch; those after the current
+    status are None, and queueing a mission again clears them.
 
     Relationships:
         robot (Robot): The robot associated with this mission.
     """
 
     __tablename__ = "missions"
+    __table_args__ = (
+        # Serves per-robot lookups and keyset pages within one robot (robot_id = ? AND id > ?)
+        Index("ix_missions_robot_id_id", "robot_id", "id"),
+        # Serves a robot's missions in one status, e.g. the running ones, without its finished history
+        Index("ix_missions_robot_id_status", "robot_id", "status"),
+        # Serve missions in one status by age: the dispatch queue, and finished runs due for archival
+        Index("ix_missions_status_queued_at", "status", "queued_at"),
+        Index("ix_missions_status_finished_at", "status", "finished_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     description = Column(String)
     robot_id = Column(Integer, ForeignKey("robots.id"))
+    version = Column(Integer, nullable=False, default=1)
+    priority = Column(Integer, nullable=False, default=0)
+    status = Column(String(16), nullable=False, default="pending")
+    queued_at = Column(BigInteger)
+    assigned_at = Column(BigInteger)
+    started_at = Column(BigInteger)
+    finished_at = Column(BigInteger)
 
     robot = relationship("Robot")
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+class MissionArchive(Base):
+    """
+    SQLAlchemy model representing a finished mission moved out of `missions`.
+
+    Archival keeps the hot table, and every index on it, proportional to the
+    missions still in flight plus recent history. The columns are those of
+    `Mission`, without the foreign key, plus the time the row was archived. The
+    archive has its own key: a database may hand out the ID of an archived mission
+    again.
+
+    Attributes:
+        archive_id (int): The unique identifier of the archived row.
+        archived_at (int): When the mission was archived, in milliseconds since the Unix epoch.
+    """
+
+    __tablename__ = "missions_archive"
+
+    archive_id = Column(Integer, primary_key=True)
+    id = Column(Integer, nullable=False, index=True)
+    name = Column(String)
+    description = Column(String)
+    robot_id = Column(Integer, index=True)
+    version = Column(Integer, nullable=False)
+    priority = Column(Integer, nullable=False)
+    status = Column(String(16), nullable=False)
+    queued_at = Column(BigInteger)
+    assigned_at = Column(BigInteger)
+    started_at = Column(BigInteger)
+    finished_at = Column(BigInteger)
+    archived_at = Column(BigInteger, nullable=False)
+
+
+# Lifecycle of a mission: pending until first due, then queued -> assigned -> running -> done or failed
+MISSION_STATUSES = ("pending", "queued", "assigned", "running", "done", "failed")
+
+# Columns covered by the full-text index behind GET /missions/search
+SEARCH_COLUMNS = ("name", "description")
+
+register_fulltext_index(Base.metadata, Mission.__table__, SEARCH_COLUMNS)
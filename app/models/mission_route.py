@@ -0,0 +1,24 @@
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary
+from app.db.base import Base
+
+
+class MissionRoute(Base):
+    """
+    SQLAlchemy model representing the planned route of a mission.
+
+    The waypoints are stored packed in one binary column, as consecutive
+    little-endian 64-bit `x, y` pairs (see `app.waypoints.geometry`), rather than as
+    one row per waypoint. A route of thousands of waypoints is therefore one row
+    read, and decoding it into an array is a zero-copy view of the column value.
+
+    Attributes:
+        mission_id (int): The ID of the mission the route belongs to.
+        points (bytes): The packed waypoints, 16 bytes each.
+        point_count (int): The number of waypoints, so listings need not read `points`.
+    """
+
+    __tablename__ = "mission_routes"
+
+    mission_id = Column(Integer, ForeignKey("missions.id"), primary_key=True, autoincrement=False)
+    points = Column(LargeBinary, nullable=False)
+    point_count = Column(Integer, nullable=False)
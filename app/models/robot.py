@@ -10,10 +10,14 @@ class Robot(Base):
         id (int): The unique identifier for the robot.
         name (str): The name of the robot.
         model_name (str): The model name of the robot.
+        version (int): Incremented on every update; used for ETags and optimistic locking.
     """
 
     __tablename__ = "robots"
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
-    model_name = Column(String)
+    model_name = Column(String, index=True)
+    version = Column(Integer, nullable=False, default=1)
+
+    __mapper_args__ = {"version_id_col": version}
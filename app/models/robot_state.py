@@ -0,0 +1,30 @@
+from sqlalchemy import BigInteger, Column, Float, Integer, String
+from app.db.base import Base
+
+
+class RobotState(Base):
+    """
+    SQLAlchemy model representing the latest reported state of one robot.
+
+    The table is a summary of `telemetry` holding one row per robot, the sample with
+    the highest timestamp. It is maintained in the same transaction as every
+    telemetry write and only read to restore `app.telemetry.robot_states` after a
+    restart, so the fleet's current state never needs a scan of the samples.
+
+    Attributes:
+        robot_id (int): The ID of the robot.
+        ts (int): The time of the latest sample in milliseconds since the Unix epoch.
+        x (float): The robot's x position.
+        y (float): The robot's y position.
+        battery (float): The battery charge in percent.
+        state (str): The robot's operating state, e.g. `idle` or `moving`.
+    """
+
+    __tablename__ = "robot_state"
+
+    robot_id = Column(Integer, primary_key=True, autoincrement=False)
+    ts = Column(BigInteger, nullable=False)
+    x = Column(Float, nullable=False)
+    y = Column(Float, nullable=False)
+    battery = Column(Float, nullable=False)
+    state = Column(String(16), nullable=False)
@@ -0,0 +1,33 @@
+from sqlalchemy import BigInteger, Column, Float, Integer, String
+from app.db.base import Base
+
+
+class Telemetry(Base):
+    """
+    SQLAlchemy model representing one telemetry sample reported by a robot.
+
+    Samples are keyed by `(robot_id, ts)`, so a time-range read for one robot is a
+    single range scan of the primary key. On SQLite the table is stored without a
+    rowid, clustering the samples by that key and saving a second index.
+
+    `robot_id` deliberately carries no foreign key: a sample from an unknown robot
+    must not fail the whole batch it is flushed with.
+
+    Attributes:
+        robot_id (int): The ID of the reporting robot.
+        ts (int): The sample time in milliseconds since the Unix epoch.
+        x (float): The robot's x position.
+        y (float): The robot's y position.
+        battery (float): The battery charge in percent.
+        state (str): The robot's operating state, e.g. `idle` or `moving`.
+    """
+
+    __tablename__ = "telemetry"
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    robot_id = Column(Integer, primary_key=True, autoincrement=False)
+    ts = Column(BigInteger, primary_key=True, autoincrement=False)
+    x = Column(Float, nullable=False)
+    y = Column(Float, nullable=False)
+    battery = Column(Float, nullable=False)
+    state = Column(String(16), nullable=False)
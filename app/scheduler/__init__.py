@@ -0,0 +1,247 @@
+"""
+Mission scheduling and dispatch.
+
+A mission's schedule is an APScheduler job stored in the `apscheduler_jobs` table of
+the application database, so schedules survive restarts. When a job fires, the
+mission is marked as queued and handed to `dispatcher`, which assigns it to its robot
+as soon as the robot asks for work at `POST /robots/{robot_id}/ready`. Queued
+missions are reloaded from the `missions` table on startup.
+
+The dispatch queues are held in memory, and APScheduler fires each job in every
+process that runs a scheduler, so scheduling and dispatch run in one process only:
+
+- `SCHEDULER_ENABLED`: `1` (default) to run the scheduler and dispatcher in this
+  process; set it to `0` in every other process. Scheduling endpoints answer 503
+  there. `app.serve` sets it for each of its workers.
+- `SCHEDULER_MISFIRE_GRACE_SECONDS`: how late a run may still start after downtime
+  (default 60). Runs missed while down are coalesced into one.
+- `MISSION_ARCHIVE_AFTER_HOURS`: move missions that finished this many hours ago to
+  the `missions_archive` table, checked hourly (default 0, never). Missions with a
+  schedule are kept.
+
+A run that becomes due while the previous run of the mission is still queued,
+assigned or running is skipped.
+
+APScheduler is only imported when the scheduler is first used, so processes that
+do not run it skip the import on startup.
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import async_mission as crud
+from app.crud.errors import InvalidTransitionError
+from app.db.async_base import AsyncSessionLocal
+from app.db.base import engine
+from app.schemas.schedule import MissionScheduleCreate
+
+from .dispatcher import Dispatcher
+
+logger = logging.getLogger(__name__)
+
+# Table holding the persisted APScheduler jobs
+JOBS_TABLE = "apscheduler_jobs"
+
+# Prefix of the IDs of mission jobs, followed by the mission ID
+JOB_PREFIX = "mission-"
+
+# ID of the job archiving finished missions
+ARCHIVE_JOB = "archive-missions"
+
+dispatcher = Dispatcher()
+
+# The scheduler of this process, created by `get_scheduler` on first use
+_scheduler = None
+
+
+def get_scheduler():
+    """
+    Return the scheduler of this process, creating it on first use.
+
+    Returns:
+        AsyncIOScheduler: The scheduler, storing its jobs in `JOBS_TABLE`.
+    """
+    global _scheduler
+    if _scheduler is None:
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        grace_seconds = int(os.getenv("SCHEDULER_MISFIRE_GRACE_SECONDS", "60"))
+        _scheduler = AsyncIOScheduler(
+            jobstores={"default": SQLAlchemyJobStore(engine=engine, tablename=JOBS_TABLE)},
+            job_defaults={"coalesce": True, "misfire_grace_time": grace_seconds},
+            timezone=timezone.utc,
+        )
+    return _scheduler
+
+
+def scheduler_enabled() -> bool:
+    """Return whether this process runs the scheduler, from `SCHEDULER_ENABLED`."""
+    return os.getenv("SCHEDULER_ENABLED", "1") == "1"
+
+
+def scheduler_running() -> bool:
+    """Return whether the scheduler of this process was started and is running."""
+    return _scheduler is not None and _scheduler.running
+
+
+def now_ms() -> int:
+    """Return the current time in milliseconds since the Unix epoch."""
+    return int(time.time() * 1000)
+
+
+def job_id(mission_id: int) -> str:
+    """Return the ID of a mission's scheduler job."""
+    return f"{JOB_PREFIX}{mission_id}"
+
+
+def build_trigger(schedule: MissionScheduleCreate):
+    """
+    Build the APScheduler trigger for a schedule.
+
+    Args:
+        schedule (MissionScheduleCreate): The requested schedule.
+
+    Returns:
+        BaseTrigger: A cron, interval or one-off date trigger, in UTC.
+    """
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.date import DateTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
+
+    if schedule.cron is not None:
+        return CronTrigger.from_crontab(schedule.cron, timezone=timezone.utc)
+    start_at = schedule.start_at or datetime.now(timezone.utc)
+    if schedule.interval_seconds is not None:
+        return IntervalTrigger(seconds=schedule.interval_seconds, start_date=start_at, timezone=timezone.utc)
+    return DateTrigger(run_date=start_at, timezone=timezone.utc)
+
+
+def schedule_mission(mission_id: int, schedule: MissionScheduleCreate):
+    """
+    Create or replace the schedule of a mission.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        schedule (MissionScheduleCreate): When and with which priority it runs.
+
+    Returns:
+        Job: The stored scheduler job.
+    """
+    return get_scheduler().add_job(
+        queue_due_mission,
+        build_trigger(schedule),
+        id=job_id(mission_id),
+        kwargs={"mission_id": mission_id, "priority": schedule.priority},
+        replace_existing=True,
+    )
+
+
+async def queue_due_mission(mission_id: int, priority: int = 0):
+    """
+    Scheduler job: queue a mission that became due, assigning it if its robot is idle.
+
+    Args:
+        mission_id (int): The ID of the mission.
+        priority (int): The dispatch priority of this run.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            row = await crud.queue_mission(db, mission_id=mission_id, priority=priority, queued_at=now_ms())
+        except InvalidTransitionError as exc:
+            logger.info("Skipping a run of mission %s, whose last run is still %s", mission_id, exc.status)
+            return
+        if row is None:
+            logger.warning("Scheduled mission %s no longer exists", mission_id)
+            return
+        if dispatcher.enqueue(mission_id, row["robot_id"], priority, row["queued_at"]):
+            await crud.assign_mission(db, mission_id=mission_id, assigned_at=now_ms())
+
+
+async def next_mission(db: AsyncSession, robot_id: int) -> Optional[dict]:
+    """
+    Assign a robot its most urgent queued mission, or register it as idle.
+
+    Args:
+        db (AsyncSession): The async database session.
+        robot_id (int): The ID of the robot asking for work.
+
+    Returns:
+        Optional[dict]: All columns of the assigned mission, or None if the robot now
+        waits idle and will be assigned the next mission queued for it.
+    """
+    while (mission_id := dispatcher.next_for(robot_id)) is not None:
+        try:
+            row = await crud.assign_mission(db, mission_id=mission_id, assigned_at=now_ms())
+        except InvalidTransitionError:
+            # No longer queued, e.g. failed by an operator while it waited
+            continue
+        if row is not None:
+            return row
+    return None
+
+
+async def load_dispatch_queue() -> int:
+    """
+    Rebuild the dispatch queues from the missions queued but not yet assigned.
+
+    Returns:
+        int: The number of queued missions.
+    """
+    async with AsyncSessionLocal() as db:
+        rows = await crud.get_queued_missions(db)
+        for row in rows:
+            if dispatcher.enqueue(row.id, row.robot_id, row.priority, row.queued_at):
+                await crud.assign_mission(db, mission_id=row.id, assigned_at=now_ms())
+    return len(rows)
+
+
+def scheduled_mission_ids() -> set[int]:
+    """Return the IDs of the missions that have a schedule."""
+    return {int(job.id[len(JOB_PREFIX) :]) for job in get_scheduler().get_jobs() if job.id.startswith(JOB_PREFIX)}
+
+
+async def archive_finished_missions(finished_before: int) -> int:
+    """
+    Archive the missions that finished before a cutoff and will not run again.
+
+    Args:
+        finished_before (int): The cutoff in epoch milliseconds.
+
+    Returns:
+        int: The number of missions archived.
+    """
+    async with AsyncSessionLocal() as db:
+        return await crud.archive_missions(
+            db, finished_before=finished_before, archived_at=now_ms(), keep_ids=scheduled_mission_ids()
+        )
+
+
+async def archive_old_missions(after_hours: float):
+    """Scheduler job: archive the missions that finished more than `after_hours` ago."""
+    archived = await archive_finished_missions(now_ms() - int(after_hours * 3_600_000))
+    if archived:
+        logger.info("Archived %s finished missions", archived)
+
+
+def schedule_archival():
+    """Schedule hourly archival if `MISSION_ARCHIVE_AFTER_HOURS` is set; call after starting the scheduler."""
+    from apscheduler.triggers.interval import IntervalTrigger
+
+    scheduler = get_scheduler()
+    after_hours = float(os.getenv("MISSION_ARCHIVE_AFTER_HOURS", "0"))
+    if after_hours > 0:
+        scheduler.add_job(
+            archive_old_missions,
+            IntervalTrigger(hours=1, timezone=timezone.utc),
+            id=ARCHIVE_JOB,
+            kwargs={"after_hours": after_hours},
+            replace_existing=True,
+        )
+    elif scheduler.get_job(ARCHIVE_JOB) is not None:
+        scheduler.remove_job(ARCHIVE_JOB)
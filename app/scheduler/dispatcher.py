@@ -0,0 +1,107 @@
+import heapq
+import itertools
+from typing import Optional
+
+
+class Dispatcher:
+    """
+    Hands due missions to their robots when the robots are idle.
+
+    Every mission belongs to one robot, so each robot has its own heap of due
+    missions, ordered by priority (highest first) and then by the time they became
+    due. A robot that asks for work while its heap is empty is remembered as idle,
+    and the next mission queued for it is assigned on the spot. Every decision is a
+    heap push or pop, O(log n) in the robot's queue length, and never a table scan.
+
+    Removing a queued mission only forgets its entry; the stale heap item is skipped
+    when it reaches the top. The dispatcher lives in memory and is only used from the
+    event loop, so it takes no lock; the database records each mission's status
+    and `queued_at` so that the queues can be rebuilt with `enqueue` after a restart.
+    """
+
+    def __init__(self):
+        self._queues: dict[int, list[tuple]] = {}
+        self._entries: dict[int, int] = {}
+        self._idle: set[int] = set()
+        self._tickets = itertools.count()
+        self.queued = 0
+        self.assigned = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, mission_id: int) -> bool:
+        return mission_id in self._entries
+
+    def enqueue(self, mission_id: int, robot_id: int, priority: int = 0, queued_at: int = 0) -> bool:
+        """
+        Queue a due mission, or assign it right away if its robot is idle.
+
+        Queueing a mission again replaces its previous entry.
+
+        Args:
+            mission_id (int): The ID of the mission.
+            robot_id (int): The ID of the robot the mission belongs to.
+            priority (int): Higher priorities are dispatched first.
+            queued_at (int): When the mission became due, in epoch milliseconds; breaks
+                ties between equal priorities, oldest first.
+
+        Returns:
+            bool: True if the mission was assigned to its idle robot, False if it waits.
+        """
+        self._entries.pop(mission_id, None)
+        if robot_id in self._idle:
+            self._idle.discard(robot_id)
+            self.assigned += 1
+            return True
+        ticket = next(self._tickets)
+        self._entries[mission_id] = ticket
+        heapq.heappush(self._queues.setdefault(robot_id, []), (-priority, queued_at, ticket, mission_id))
+        self.queued += 1
+        return False
+
+    def next_for(self, robot_id: int) -> Optional[int]:
+        """
+        Assign the robot its most urgent queued mission, or mark it idle if there is none.
+
+        Args:
+            robot_id (int): The ID of the robot asking for work.
+
+        Returns:
+            Optional[int]: The ID of the assigned mission, or None if the robot now waits idle.
+        """
+        queue = self._queues.get(robot_id)
+        while queue:
+            _, _, ticket, mission_id = heapq.heappop(queue)
+            if self._entries.get(mission_id) == ticket:
+                del self._entries[mission_id]
+                self.assigned += 1
+                return mission_id
+        self._queues.pop(robot_id, None)
+        self._idle.add(robot_id)
+        return None
+
+    def remove(self, mission_id: int) -> bool:
+        """
+        Take a mission out of its robot's queue.
+
+        Args:
+            mission_id (int): The ID of the mission.
+
+        Returns:
+            bool: True if the mission was queued.
+        """
+        return self._entries.pop(mission_id, None) is not None
+
+    def busy(self, robot_id: int):
+        """Forget that a robot is idle, e.g. after it was given work elsewhere."""
+        self._idle.discard(robot_id)
+
+    def stats(self) -> dict:
+        """Return the queue length, idle robots and decision counters."""
+        return {
+            "queued_missions": len(self._entries),
+            "idle_robots": len(self._idle),
+            "queued": self.queued,
+            "assigned": self.assigned,
+        }
@@ -0,0 +1,51 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BulkItemError(BaseModel):
+    """
+    Pydantic model describing why one item of a bulk request was rejected.
+
+    Attributes:
+        index (int): The position of the item in the request body.
+        detail (str): A human-readable description of the error.
+    """
+
+    index: int
+    detail: str
+
+
+class BulkResult(BaseModel):
+    """
+    Pydantic model for the outcome of a bulk create or update.
+
+    Attributes:
+        ids (list[Optional[int]]): The ID written for each item, aligned with the request
+            body; None for items that were rejected.
+        errors (list[BulkItemError]): The rejected items and the reason for each.
+    """
+
+    ids: list[Optional[int]]
+    errors: list[BulkItemError]
+
+
+class ImportReport(BaseModel):
+    """
+    Pydantic model summarising a streaming import.
+
+    Attributes:
+        rows (int): The number of data rows read from the upload.
+        created (int): The number of rows written to the database.
+        failed (int): The number of rows that could not be parsed, validated or written.
+        errors (list[BulkItemError]): Details for the first failed rows, indexed by data row.
+        seconds (float): The wall time spent on the import.
+        rows_per_sec (float): The import throughput.
+    """
+
+    rows: int
+    created: int
+    failed: int
+    errors: list[BulkItemError]
+    seconds: float
+    rows_per_sec: float
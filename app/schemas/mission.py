@@ -1,4 +1,14 @@
-from pydantic import BaseModel
+from typing import Literal, Optional
+
+from pydantic import BaseModel, field_validator
+
+from app.schemas.robot import Robot
+
+# Sort keys accepted by the mission listings; a leading "-" sorts descending.
+MissionSort = Literal["id", "-id", "name", "-name", "robot_id", "-robot_id", "queued_at", "-queued_at"]
+
+# Lifecycle statuses of a mission, matching `app.models.mission.MISSION_STATUSES`
+MissionStatusName = Literal["pending", "queued", "assigned", "running", "done", "failed"]
 
 
 class MissionBase(BaseModel):
@@ -36,6 +46,42 @@ class MissionUpdate(MissionBase):
     pass
 
 
+class MissionPatch(BaseModel):
+    """
+    Pydantic model for partially updating a mission.
+
+    Only the fields present in the request are written; they may be omitted but not null.
+
+    Attributes:
+        name (Optional[str]): The new name of the mission.
+        description (Optional[str]): The new description of the mission.
+        robot_id (Optional[int]): The ID of the robot to assign the mission to.
+    """
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    robot_id: Optional[int] = None
+
+    @field_validator("name", "description", "robot_id")
+    @classmethod
+    def not_null(cls, value):
+        """Reject explicit nulls; omitted fields keep their defaults without validation."""
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
+class MissionBulkUpdate(MissionUpdate):
+    """
+    Pydantic model for one item of a bulk mission update.
+
+    Attributes:
+        id (int): The unique identifier of the mission to update.
+    """
+
+    id: int
+
+
 class Mission(MissionBase):
     """
     Pydantic model representing a mission with its database ID.
@@ -54,3 +100,52 @@ class Mission(MissionBase):
         """
 
         from_attributes = True
+
+
+class MissionWithRobot(Mission):
+    """
+    Pydantic model representing a mission with its robot embedded.
+
+    Attributes:
+        robot (Optional[Robot]): The robot associated with the mission. Only included
+            when the robot is expanded; None if the robot does not exist.
+    """
+
+    robot: Optional[Robot] = None
+
+
+class MissionStatus(BaseModel):
+    """
+    Pydantic model representing where a mission is in its lifecycle.
+
+    Timestamps are in milliseconds since the Unix epoch, and None until the mission
+    reaches that step of its current run.
+
+    Attributes:
+        id (int): The unique identifier of the mission.
+        status (MissionStatusName): The mission's current status.
+        priority (int): The dispatch priority of the current run.
+        queued_at (Optional[int]): When the run became due.
+        assigned_at (Optional[int]): When the run was handed to the robot.
+        started_at (Optional[int]): When the robot started the run.
+        finished_at (Optional[int]): When the run ended.
+    """
+
+    id: int
+    status: MissionStatusName
+    priority: int
+    queued_at: Optional[int] = None
+    assigned_at: Optional[int] = None
+    started_at: Optional[int] = None
+    finished_at: Optional[int] = None
+
+
+class ArchiveResult(BaseModel):
+    """
+    Pydantic model for the outcome of archiving finished missions.
+
+    Attributes:
+        archived (int): The number of missions moved to the archive.
+    """
+
+    archived: int
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Optional
+
+from pydantic import BaseModel, field_validator
 
 
 class RobotBase(BaseModel):
@@ -34,6 +36,40 @@ class RobotUpdate(RobotBase):
     pass
 
 
+class RobotPatch(BaseModel):
+    """
+    Pydantic model for partially updating a robot.
+
+    Only the fields present in the request are written; they may be omitted but not null.
+
+    Attributes:
+        name (Optional[str]): The new name of the robot.
+        model_name (Optional[str]): The new model name of the robot.
+    """
+
+    name: Optional[str] = None
+    model_name: Optional[str] = None
+
+    @field_validator("name", "model_name")
+    @classmethod
+    def not_null(cls, value):
+        """Reject explicit nulls; omitted fields keep their defaults without validation."""
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
+class RobotBulkUpdate(RobotUpdate):
+    """
+    Pydantic model for one item of a bulk robot update.
+
+    Attributes:
+        id (int): The unique identifier of the robot to update.
+    """
+
+    id: int
+
+
 class Robot(RobotBase):
     """
     Pydantic model representing a robot with its database ID.
@@ -0,0 +1,98 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, FiniteFloat
+
+# Most waypoints accepted in one route
+MAX_WAYPOINTS = 100_000
+
+# Most missions whose metrics are computed in one request
+MAX_METRICS_MISSIONS = 10_000
+
+# An `(x, y)` waypoint, in the coordinates robots report their telemetry in
+Waypoint = tuple[FiniteFloat, FiniteFloat]
+
+
+class RouteUpload(BaseModel):
+    """
+    Pydantic model for uploading the route of one mission.
+
+    Attributes:
+        waypoints (list[Waypoint]): The `(x, y)` waypoints in travel order, at least one.
+    """
+
+    waypoints: list[Waypoint] = Field(min_length=1, max_length=MAX_WAYPOINTS)
+
+
+class RouteBatchItem(RouteUpload):
+    """
+    Pydantic model for one route of a batch upload.
+
+    Attributes:
+        mission_id (int): The ID of the mission the route belongs to.
+    """
+
+    mission_id: int
+
+
+class BoundingBox(BaseModel):
+    """
+    Pydantic model for the smallest axis-aligned box enclosing a route.
+
+    Attributes:
+        min_x (float): The smallest x coordinate.
+        min_y (float): The smallest y coordinate.
+        max_x (float): The largest x coordinate.
+        max_y (float): The largest y coordinate.
+    """
+
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
+
+
+class RouteSummary(BaseModel):
+    """
+    Pydantic model for the metrics of a stored route.
+
+    Attributes:
+        mission_id (int): The ID of the mission.
+        point_count (int): The number of stored waypoints.
+        length (float): The distance along the route, in coordinate units.
+        bbox (BoundingBox): The box enclosing the route.
+        eta_seconds (Optional[float]): The time to travel the route at the requested
+            speed; None when no speed was given.
+    """
+
+    mission_id: int
+    point_count: int
+    length: float
+    bbox: BoundingBox
+    eta_seconds: Optional[float] = None
+
+
+class Route(RouteSummary):
+    """
+    Pydantic model for a stored route with its waypoints.
+
+    The metrics always describe the stored route; with simplification only the
+    returned `waypoints` are reduced.
+
+    Attributes:
+        waypoints (list[Waypoint]): The `(x, y)` waypoints in travel order.
+    """
+
+    waypoints: list[tuple[float, float]]
+
+
+class RouteMetricsRequest(BaseModel):
+    """
+    Pydantic model for requesting the route metrics of many missions.
+
+    Attributes:
+        mission_ids (list[int]): The IDs of the missions, at most `MAX_METRICS_MISSIONS`.
+        speed (Optional[float]): A robot speed in coordinate units per second, to estimate travel times.
+    """
+
+    mission_ids: list[int] = Field(max_length=MAX_METRICS_MISSIONS)
+    speed: Optional[float] = Field(None, gt=0)
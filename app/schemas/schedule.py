@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+class MissionScheduleCreate(BaseModel):
+    """
+    Pydantic model for scheduling a mission.
+
+    Without `interval_seconds` or `cron` the mission runs once, at `start_at`. Times
+    without a timezone are taken as UTC.
+
+    Attributes:
+        start_at (Optional[datetime]): The first run; defaults to now. Not allowed with `cron`.
+        interval_seconds (Optional[int]): Run again every this many seconds.
+        cron (Optional[str]): Run at the times matched by this crontab expression, in UTC.
+        priority (int): Dispatch priority among the robot's due missions; higher goes first.
+    """
+
+    start_at: Optional[datetime] = None
+    interval_seconds: Optional[int] = Field(None, ge=1)
+    cron: Optional[str] = None
+    priority: int = 0
+
+    @field_validator("cron")
+    @classmethod
+    def valid_crontab(cls, value):
+        """Reject expressions that are not five crontab fields."""
+        if value is not None:
+            from apscheduler.triggers.cron import CronTrigger
+
+            CronTrigger.from_crontab(value)
+        return value
+
+    @model_validator(mode="after")
+    def one_recurrence(self):
+        """Allow at most one kind of recurrence, and no start time with `cron`."""
+        if self.cron is not None and (self.interval_seconds is not None or self.start_at is not None):
+            raise ValueError("cron cannot be combined with interval_seconds or start_at")
+        return self
+
+
+class MissionSchedule(BaseModel):
+    """
+    Pydantic model for the schedule of a mission.
+
+    Attributes:
+        mission_id (int): The ID of the scheduled mission.
+        priority (int): The dispatch priority of each run.
+        trigger (str): A description of when the mission runs.
+        next_run_time (Optional[datetime]): The next run; None once a one-off run is over.
+    """
+
+    mission_id: int
+    priority: int
+    trigger: str
+    next_run_time: Optional[datetime] = None
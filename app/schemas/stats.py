@@ -0,0 +1,63 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ModelCount(BaseModel):
+    """
+    Pydantic model for the number of missions of the robots of one model.
+
+    Attributes:
+        model_name (Optional[str]): The robot model.
+        missions (int): The number of missions of robots of that model.
+    """
+
+    model_name: Optional[str] = None
+    missions: int
+
+
+class RobotCount(BaseModel):
+    """
+    Pydantic model for the number of missions of one robot.
+
+    Attributes:
+        robot_id (int): The ID of the robot.
+        missions (int): The number of missions of the robot.
+    """
+
+    robot_id: int
+    missions: int
+
+
+class StatusPoint(BaseModel):
+    """
+    Pydantic model for the mission counts per status at one point in time.
+
+    Attributes:
+        at (int): The start of the bucket, in milliseconds since the Unix epoch.
+        by_status (dict[str, int]): The number of missions in each status at the end of the bucket.
+    """
+
+    at: int
+    by_status: dict[str, int]
+
+
+class FleetStatistics(BaseModel):
+    """
+    Pydantic model for the fleet dashboard statistics.
+
+    Attributes:
+        missions (int): The number of missions.
+        by_status (dict[str, int]): The number of missions in each status.
+        by_model (list[ModelCount]): The number of missions per robot model.
+        by_robot (list[RobotCount]): The number of missions of each robot that has any.
+        status_history (list[StatusPoint]): The counts per status over time, oldest first.
+        reconciled_at (Optional[int]): When the counts were last rebuilt from the tables.
+    """
+
+    missions: int
+    by_status: dict[str, int]
+    by_model: list[ModelCount]
+    by_robot: list[RobotCount]
+    status_history: list[StatusPoint]
+    reconciled_at: Optional[int] = None
@@ -0,0 +1,103 @@
+from pydantic import BaseModel, Field
+
+
+class TelemetryPoint(BaseModel):
+    """
+    Pydantic model for one telemetry sample sent by a robot.
+
+    Attributes:
+        robot_id (int): The ID of the reporting robot.
+        ts (int): The sample time in milliseconds since the Unix epoch.
+        x (float): The robot's x position.
+        y (float): The robot's y position.
+        battery (float): The battery charge in percent, between 0 and 100.
+        state (str): The robot's operating state, at most 16 characters.
+    """
+
+    robot_id: int
+    ts: int = Field(ge=0)
+    x: float
+    y: float
+    battery: float = Field(ge=0, le=100)
+    state: str = Field(min_length=1, max_length=16)
+
+
+class TelemetrySample(BaseModel):
+    """
+    Pydantic model for a stored telemetry sample of one robot.
+
+    Attributes:
+        ts (int): The sample time in milliseconds since the Unix epoch.
+        x (float): The robot's x position.
+        y (float): The robot's y position.
+        battery (float): The battery charge in percent.
+        state (str): The robot's operating state.
+    """
+
+    ts: int
+    x: float
+    y: float
+    battery: float
+    state: str
+
+
+class TelemetryBucket(BaseModel):
+    """
+    Pydantic model for the samples of one robot averaged over a time bucket.
+
+    Attributes:
+        ts (int): The start of the bucket in milliseconds since the Unix epoch.
+        x (float): The average x position.
+        y (float): The average y position.
+        battery (float): The average battery charge in percent.
+        samples (int): The number of samples in the bucket.
+    """
+
+    ts: int
+    x: float
+    y: float
+    battery: float
+    samples: int
+
+
+class RobotState(BaseModel):
+    """
+    Pydantic model for the latest reported state of one robot.
+
+    Attributes:
+        robot_id (int): The ID of the robot.
+        ts (int): The time of the latest sample in milliseconds since the Unix epoch.
+        x (float): The robot's x position.
+        y (float): The robot's y position.
+        battery (float): The battery charge in percent.
+        state (str): The robot's operating state.
+    """
+
+    robot_id: int
+    ts: int
+    x: float
+    y: float
+    battery: float
+    state: str
+
+
+class NearbyRobot(RobotState):
+    """
+    Pydantic model for the latest state of a robot near a requested location.
+
+    Attributes:
+        distance (float): The robot's distance from the location.
+    """
+
+    distance: float
+
+
+class TelemetryAccepted(BaseModel):
+    """
+    Pydantic model for the response to a telemetry batch.
+
+    Attributes:
+        accepted (int): The number of samples queued for writing.
+    """
+
+    accepted: int
@@ -0,0 +1,171 @@
+"""
+Serve the application in production with one worker process per core.
+
+    python -m app.serve [--bind 0.0.0.0:8000] [--workers 4]
+
+Gunicorn runs as the master process and forks uvicorn workers. Before forking, the
+master creates or upgrades the database schema once, so workers skip that step,
+and imports the application once (`preload_app`): every worker starts from a copy
+of the imported modules, compiled routes and schemas instead of importing them
+again, and the pages they share are not copied until written. The master's
+objects are frozen out of the garbage collector before each fork, so collections
+in the workers do not write to those shared pages either.
+
+Workers are recycled gracefully after serving a number of requests, bounding
+the memory a slow leak can take: a recycled worker stops accepting connections,
+finishes its requests, flushes its pending telemetry, and is replaced by a fresh
+fork of the master.
+
+The dispatch queues are held in memory (see `app.scheduler`), so exactly one
+worker runs the scheduler; when it exits, its replacement takes over. With
+several workers, `ROBOT_STATE_REFRESH_MS` defaults to 1000 so that each worker
+picks up the robot states flushed by the others.
+
+- `WEB_CONCURRENCY`: the number of workers (default: the number of cores).
+- `WORKER_MAX_REQUESTS`: requests after which a worker is recycled (default
+  10000, 0 never).
+- `WORKER_MAX_REQUESTS_JITTER`: up to this many more requests, drawn per worker,
+  so that workers are not all recycled at once (default 1000).
+- `WORKER_GRACEFUL_TIMEOUT`: seconds a stopping worker may take to finish its
+  requests before it is killed (default 30).
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+
+from gunicorn.app.base import BaseApplication
+
+from app.db.async_base import async_engine
+from app.db.base import engine
+from app.db.schema import create_schema, schema_init_enabled
+from app.scheduler import scheduler_enabled
+
+logger = logging.getLogger(__name__)
+
+# Worker class running the ASGI application on uvicorn's event loop
+WORKER_CLASS = "uvicorn.workers.UvicornWorker"
+
+
+def default_workers() -> int:
+    """Return the number of workers: `WEB_CONCURRENCY`, or one per core."""
+    return int(os.getenv("WEB_CONCURRENCY", "0")) or os.cpu_count() or 1
+
+
+def pre_fork(server, worker):
+    """
+    Gunicorn hook, in the master before a worker is forked: choose whether it runs the scheduler.
+
+    The worker runs it unless the scheduler is disabled or another live worker runs it.
+    """
+    worker.runs_scheduler = scheduler_enabled() and not any(
+        getattr(other, "runs_scheduler", False) for other in server.WORKERS.values()
+    )
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """
+    Gunicorn hook, in a new worker: apply the master's choice and drop inherited connections.
+
+    Connections pooled by the master must not be shared with it, so the worker's
+    engines start with empty pools without closing the master's connections.
+    """
+    gc.enable()
+    os.environ["SCHEDULER_ENABLED"] = "1" if worker.runs_scheduler else "0"
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    if worker.runs_scheduler:
+        logger.info("Worker %s runs the scheduler", worker.pid)
+
+
+def child_exit(server, worker):
+    """
+    Gunicorn hook, in the master after a worker exited: keep the scheduler running.
+
+    A worker that exits is normally replaced by a fork, which takes over its
+    scheduler in `pre_fork`. When none will be forked, because the master is
+    reloading or was asked for fewer workers, the newest remaining worker is
+    recycled so that its replacement runs the scheduler instead.
+    """
+    if not getattr(worker, "runs_scheduler", False) or len(server.WORKERS) < server.num_workers:
+        return
+    if server.WORKERS and not any(getattr(other, "runs_scheduler", False) for other in server.WORKERS.values()):
+        newest = max(server.WORKERS, key=lambda pid: server.WORKERS[pid].age)
+        server.kill_worker(newest, signal.SIGTERM)
+
+
+def gunicorn_options(bind: str, workers: int) -> dict:
+    """
+    Build the Gunicorn settings of the production server.
+
+    Args:
+        bind (str): The `host:port` to listen on.
+        workers (int): The number of worker processes.
+
+    Returns:
+        dict: Gunicorn settings, by name.
+    """
+    return {
+        "bind": bind,
+        "workers": workers,
+        "worker_class": WORKER_CLASS,
+        "preload_app": True,
+        "max_requests": int(os.getenv("WORKER_MAX_REQUESTS", "10000")),
+        "max_requests_jitter": int(os.getenv("WORKER_MAX_REQUESTS_JITTER", "1000")),
+        "graceful_timeout": int(os.getenv("WORKER_GRACEFUL_TIMEOUT", "30")),
+        # uvicorn's default; Gunicorn's 2 seconds closes idle client connections too eagerly behind a proxy
+        "keepalive": 5,
+        "pre_fork": pre_fork,
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+    }
+
+
+class ProductionServer(BaseApplication):
+    """
+    Gunicorn application loading `app.main.app` with the given settings.
+
+    Args:
+        options (dict): Gunicorn settings, by name.
+    """
+
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for name, value in self.options.items():
+            self.cfg.set(name, value)
+
+    def load(self):
+        from app.main import app
+
+        return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--bind", default=f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}", help="host:port to listen on"
+    )
+    parser.add_argument("--workers", type=int, default=default_workers())
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if schema_init_enabled():
+        logger.info("Database schema is up to date (%.0f ms)", create_schema() * 1000)
+        engine.dispose()
+    # The environment is inherited by the workers, which skip the schema step
+    os.environ["DB_INIT_SCHEMA"] = "0"
+    if args.workers > 1:
+        os.environ.setdefault("ROBOT_STATE_REFRESH_MS", "1000")
+    # Collections in the master would free holes in the pages the workers share; workers re-enable them
+    gc.disable()
+    ProductionServer(gunicorn_options(args.bind, args.workers)).run()
+
+
+if __name__ == "__main__":
+    main()
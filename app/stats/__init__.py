@@ -0,0 +1,74 @@
+"""
+Fleet statistics served by `GET /stats`, maintained incrementally.
+
+`fleet_stats` counts missions per robot, per robot model and per status. The
+crud write paths adjust the counters after every commit, so serving the
+statistics costs no query. The counters are rebuilt from the base tables on
+startup and then periodically, which corrects any drift; with several worker
+processes each worker counts its own writes immediately and the others' at the
+next reconciliation. Configured from the environment:
+
+- `STATS_RECONCILE_SECONDS`: seconds between reconciliations (default 300; 0
+  reconciles on startup only).
+- `STATS_HISTORY_BUCKET_SECONDS`: resolution of the status history (default 60).
+- `STATS_HISTORY_SIZE`: points kept in the status history (default 1440, a day
+  at the default resolution).
+"""
+
+import asyncio
+import logging
+import os
+
+from app.crud import async_stats as crud
+from app.db.async_base import AsyncSessionLocal
+
+from .counters import FleetStats
+
+__all__ = ["FleetStats", "fleet_stats", "get_fleet_stats", "reconcile_periodically", "reconcile_stats"]
+
+logger = logging.getLogger(__name__)
+
+fleet_stats = FleetStats(
+    history_bucket=float(os.getenv("STATS_HISTORY_BUCKET_SECONDS", "60")),
+    history_size=int(os.getenv("STATS_HISTORY_SIZE", "1440")),
+)
+
+
+async def reconcile_stats() -> int:
+    """
+    Rebuild `fleet_stats` from the `missions` and `robots` tables.
+
+    Returns:
+        int: The number of counts that had drifted.
+    """
+    async with AsyncSessionLocal() as db:
+        counts = await crud.get_mission_counts(db)
+    corrected = fleet_stats.replace(*counts)
+    if corrected and fleet_stats.reconciliations > 1:
+        logger.info("Reconciliation corrected %s fleet statistics", corrected)
+    return corrected
+
+
+async def reconcile_periodically(interval: float):
+    """
+    Reconcile the statistics every `interval` seconds until cancelled.
+
+    Args:
+        interval (float): Seconds between reconciliations.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await reconcile_stats()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Reconciling the fleet statistics failed")
+
+
+def get_fleet_stats() -> FleetStats:
+    """
+    Dependency that provides the fleet statistics to FastAPI routes.
+
+    Returns:
+        FleetStats: The process-wide counters reconciled by the application's lifespan.
+    """
+    return fleet_stats
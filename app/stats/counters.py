@@ -0,0 +1,252 @@
+import threading
+import time
+from collections import Counter, deque
+from typing import Callable, Iterable, Mapping, Optional
+
+from app.models.mission import MISSION_STATUSES
+
+
+class FleetStats:
+    """
+    Mission counts per robot, per robot model and per status, maintained incrementally.
+
+    The crud write paths report every change they commit: missions created,
+    reassigned to another robot, moved to another status or archived, and robots
+    created or given another model. Each report adjusts a few counters, so reading
+    the statistics never aggregates the `missions` table. The per-model counts are
+    kept equal to the sum of the per-robot counts over the robots of each model,
+    which is why the store also remembers every robot's model.
+
+    `replace` swaps in counts aggregated from the base tables. It corrects any
+    drift, e.g. writes committed by other worker processes, and reports how many
+    counters it had to change.
+
+    The status counts are also recorded over time, one point per `history_bucket`
+    seconds for the last `history_size` buckets; a point holds the counts at the end
+    of its bucket. The store is shared with threadpool endpoints, so changes take a
+    lock.
+
+    Args:
+        history_bucket (float): Seconds per point of the status history.
+        history_size (int): The number of points kept.
+        clock (Callable[[], float]): Returns the current time in seconds since the epoch.
+    """
+
+    def __init__(self, history_bucket: float = 60.0, history_size: int = 1440, clock: Callable[[], float] = time.time):
+        self._lock = threading.Lock()
+        self._robot_counts: Counter = Counter()
+        self._robot_models: dict[int, Optional[str]] = {}
+        self._model_counts: Counter = Counter()
+        self._status_counts: Counter = Counter()
+        self._history: deque = deque(maxlen=history_size)
+        self._history_bucket = history_bucket
+        self._clock = clock
+        self._robot_rows: Optional[list[dict]] = None
+        self._model_rows: Optional[list[dict]] = None
+        self.reconciled_at: Optional[int] = None
+        self.reconciliations = 0
+        self.corrections = 0
+
+    def _count_robot(self, robot_id: Optional[int], delta: int):
+        """Adjust the mission count of a robot and of its model."""
+        if robot_id is None:
+            return
+        self._robot_counts[robot_id] += delta
+        if self._robot_counts[robot_id] == 0:
+            del self._robot_counts[robot_id]
+        if robot_id in self._robot_models:
+            model_name = self._robot_models[robot_id]
+            self._model_counts[model_name] += delta
+            if self._model_counts[model_name] == 0:
+                del self._model_counts[model_name]
+            self._model_rows = None
+        self._robot_rows = None
+
+    def _count_status(self, status: str, delta: int):
+        """Adjust the mission count of a status; the history is recorded by the caller."""
+        self._status_counts[status] += delta
+
+    def _record_history(self):
+        """Record the current status counts as the point of the current bucket."""
+        bucket = int(self._clock() // self._history_bucket * self._history_bucket * 1000)
+        counts = {status: self._status_counts[status] for status in MISSION_STATUSES}
+        if self._history and self._history[-1][0] == bucket:
+            self._history[-1] = (bucket, counts)
+        else:
+            self._history.append((bucket, counts))
+
+    def missions_added(self, missions: Iterable[tuple]):
+        """
+        Count created missions.
+
+        Args:
+            missions (Iterable[tuple]): One `(robot_id, status)` pair per mission.
+        """
+        with self._lock:
+            for robot_id, status in missions:
+                self._count_robot(robot_id, 1)
+                self._count_status(status, 1)
+            self._record_history()
+
+    def missions_removed(self, missions: Iterable[tuple]):
+        """
+        Stop counting missions, e.g. after they were archived.
+
+        Args:
+            missions (Iterable[tuple]): One `(robot_id, status)` pair per mission.
+        """
+        with self._lock:
+            for robot_id, status in missions:
+                self._count_robot(robot_id, -1)
+                self._count_status(status, -1)
+            self._record_history()
+
+    def missions_moved(self, moves: Iterable[tuple]):
+        """
+        Count missions that were assigned to another robot.
+
+        Args:
+            moves (Iterable[tuple]): One `(old_robot_id, new_robot_id)` pair per mission.
+        """
+        with self._lock:
+            for old_robot_id, new_robot_id in moves:
+                if old_robot_id != new_robot_id:
+                    self._count_robot(old_robot_id, -1)
+                    self._count_robot(new_robot_id, 1)
+
+    def status_changed(self, old_status: str, new_status: str):
+        """
+        Count a mission that moved to another status.
+
+        Args:
+            old_status (str): The status the mission left.
+            new_status (str): The status the mission entered.
+        """
+        with self._lock:
+            self._count_status(old_status, -1)
+            self._count_status(new_status, 1)
+            self._record_history()
+
+    def robots_changed(self, robots: Iterable[tuple]):
+        """
+        Record the model of created robots, or the new model of existing ones.
+
+        The robot's missions are counted under the new model from then on.
+
+        Args:
+            robots (Iterable[tuple]): One `(robot_id, model_name)` pair per robot.
+        """
+        with self._lock:
+            for robot_id, model_name in robots:
+                count = self._robot_counts.get(robot_id, 0)
+                self._count_robot(robot_id, -count)
+                self._robot_models[robot_id] = model_name
+                self._count_robot(robot_id, count)
+            self._model_rows = None
+
+    def replace(
+        self,
+        robot_counts: Mapping[int, int],
+        robot_models: Mapping[int, Optional[str]],
+        status_counts: Mapping[str, int],
+    ) -> int:
+        """
+        Replace every counter with counts aggregated from the base tables.
+
+        Args:
+            robot_counts (Mapping[int, int]): The number of missions of each robot that has any.
+            robot_models (Mapping[int, Optional[str]]): The model of every robot.
+            status_counts (Mapping[str, int]): The number of missions in each status.
+
+        Returns:
+            int: The number of per-robot, per-model and per-status counts that differed.
+        """
+        model_counts = Counter()
+        for robot_id, count in robot_counts.items():
+            if robot_id in robot_models:
+                model_counts[robot_models[robot_id]] += count
+        robot_counts = Counter({robot_id: count for robot_id, count in robot_counts.items() if count})
+        model_counts = Counter({model_name: count for model_name, count in model_counts.items() if count})
+        status_counts = Counter({status: count for status, count in status_counts.items() if count})
+        with self._lock:
+            corrected = sum(
+                sum(old.get(key, 0) != new.get(key, 0) for key in old.keys() | new.keys())
+                for old, new in (
+                    (self._robot_counts, robot_counts),
+                    (self._model_counts, model_counts),
+                    (self._status_counts, status_counts),
+                )
+            )
+            self._robot_counts = robot_counts
+            self._robot_models = dict(robot_models)
+            self._model_counts = model_counts
+            self._status_counts = status_counts
+            self._robot_rows = self._model_rows = None
+            self._record_history()
+            self.reconciled_at = int(self._clock() * 1000)
+            self.reconciliations += 1
+            self.corrections += corrected
+        return corrected
+
+    def history(self) -> list[dict]:
+        """
+        Return the status counts over time, oldest first, one point per bucket.
+
+        Buckets without changes repeat the counts of the bucket before them.
+
+        Returns:
+            list[dict]: One `{"at": <bucket start in epoch ms>, "by_status": {...}}` per bucket.
+        """
+        with self._lock:
+            points = list(self._history)
+            current = {status: self._status_counts[status] for status in MISSION_STATUSES}
+        step = int(self._history_bucket * 1000)
+        now = int(self._clock() // self._history_bucket * self._history_bucket * 1000)
+        earliest = now - (self._history.maxlen - 1) * step
+        series = []
+        for (at, counts), next_at in zip(points, [point[0] for point in points[1:]] + [now + step]):
+            series.extend({"at": bucket, "by_status": counts} for bucket in range(max(at, earliest), next_at, step))
+        if not series:
+            series.append({"at": now, "by_status": current})
+        return series
+
+    def snapshot(self) -> dict:
+        """
+        Return every count, as served by `GET /stats`.
+
+        The per-robot and per-model lists are built once after they change and
+        reused until the next change.
+
+        Returns:
+            dict: The total, the counts by status, by model and by robot, the status
+            history and when the counters were last reconciled.
+        """
+        with self._lock:
+            if self._robot_rows is None:
+                self._robot_rows = [
+                    {"robot_id": robot_id, "missions": self._robot_counts[robot_id]}
+                    for robot_id in sorted(self._robot_counts)
+                ]
+            if self._model_rows is None:
+                self._model_rows = [
+                    {"model_name": model_name, "missions": self._model_counts[model_name]}
+                    for model_name in sorted(self._model_counts, key=lambda name: (name is not None, name or ""))
+                ]
+            by_status = {status: self._status_counts[status] for status in MISSION_STATUSES}
+            body = {
+                "missions": sum(by_status.values()),
+                "by_status": by_status,
+                "by_model": self._model_rows,
+                "by_robot": self._robot_rows,
+                "reconciled_at": self.reconciled_at,
+            }
+        body["status_history"] = self.history()
+        return body
+
+    def stats(self) -> dict:
+        """Return the reconciliation counters."""
+        return {
+            "reconciliations": self.reconciliations,
+            "corrections": self.corrections,
+            "reconciled_at": self.reconciled_at,
+        }
@@ -0,0 +1,119 @@
+"""
+Write-behind ingestion of robot telemetry.
+
+Batches posted to the telemetry endpoint are queued in `telemetry_buffer` and
+written to the `telemetry` table in large batched INSERTs by a background task
+that runs for the application's lifespan. The buffer is configured from the
+environment:
+
+- `TELEMETRY_FLUSH_ROWS`: pending samples that trigger a flush (default 5000).
+- `TELEMETRY_FLUSH_INTERVAL_MS`: maximum time a sample waits to be written
+  (default 250). Reads lag ingestion by up to this long.
+- `TELEMETRY_MAX_PENDING`: pending samples beyond which batches are refused with
+  503 (default 100000).
+
+Every flush also updates `robot_states`, the latest state of each robot, and its
+`robot_state` summary table. The store is loaded from the table on startup; with
+several worker processes, each worker only merges its own flushes, so
+`ROBOT_STATE_REFRESH_MS` (default 0, disabled) makes it reload the table
+periodically to pick up the others. The store indexes the robots' positions in
+a uniform grid of `ROBOT_GRID_CELL_SIZE` coordinate units (default 25) for the
+nearby and within-bbox queries.
+"""
+
+import asyncio
+import logging
+import os
+
+from app.crud import async_telemetry as crud
+from app.db.async_base import AsyncSessionLocal
+
+from .buffer import BufferFull, TelemetryBuffer
+from .state import RobotState, RobotStateStore
+
+logger = logging.getLogger(__name__)
+
+robot_states = RobotStateStore(cell_size=float(os.getenv("ROBOT_GRID_CELL_SIZE", "25")))
+
+
+async def write_telemetry(rows: list[dict]) -> int:
+    """
+    Write a batch of samples in one transaction on a fresh async session.
+
+    The latest state of every robot in the batch is merged into `robot_states`
+    once the transaction has committed.
+
+    Args:
+        rows (list[dict]): The samples to write.
+
+    Returns:
+        int: The number of samples stored.
+    """
+    async with AsyncSessionLocal() as db:
+        written = await crud.insert_telemetry(db, rows)
+    robot_states.apply_samples(rows)
+    return written
+
+
+async def load_robot_states() -> int:
+    """
+    Merge the `robot_state` summary table into `robot_states`.
+
+    Returns:
+        int: The number of states added or replaced.
+    """
+    async with AsyncSessionLocal() as db:
+        return robot_states.merge(await crud.get_robot_states(db))
+
+
+async def refresh_robot_states(interval: float):
+    """
+    Reload the summary table every `interval` seconds until cancelled.
+
+    Args:
+        interval (float): Seconds between reloads.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await load_robot_states()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Reloading the robot state summary failed")
+
+
+def buffer_from_env() -> TelemetryBuffer:
+    """
+    Build the telemetry buffer configured by the `TELEMETRY_*` environment variables.
+
+    Returns:
+        TelemetryBuffer: The configured buffer, writing with `write_telemetry`.
+    """
+    return TelemetryBuffer(
+        write_telemetry,
+        flush_rows=int(os.getenv("TELEMETRY_FLUSH_ROWS", "5000")),
+        flush_interval=int(os.getenv("TELEMETRY_FLUSH_INTERVAL_MS", "250")) / 1000,
+        max_pending=int(os.getenv("TELEMETRY_MAX_PENDING", "100000")),
+    )
+
+
+telemetry_buffer = buffer_from_env()
+
+
+def get_telemetry_buffer() -> TelemetryBuffer:
+    """
+    Dependency that provides the telemetry buffer to FastAPI routes.
+
+    Returns:
+        TelemetryBuffer: The process-wide buffer started by the application's lifespan.
+    """
+    return telemetry_buffer
+
+
+def get_robot_state_store() -> RobotStateStore:
+    """
+    Dependency that provides the latest-state store to FastAPI routes.
+
+    Returns:
+        RobotStateStore: The process-wide store loaded by the application's lifespan.
+    """
+    return robot_states
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BufferFull(Exception):
+    """
+    Raised when accepting a batch would exceed the buffer's bound.
+
+    Args:
+        pending (int): The number of samples waiting to be written.
+    """
+
+    def __init__(self, pending: int):
+        super().__init__(f"Telemetry buffer is full ({pending} samples pending)")
+        self.pending = pending
+
+
+class TelemetryBuffer:
+    """
+    Write-behind buffer that batches telemetry samples into large inserts.
+
+    Samples are appended to an in-memory list and acknowledged immediately. A
+    background task on the event loop hands them to `writer` whenever `flush_rows`
+    samples are pending or `flush_interval` seconds have passed, so the database sees
+    a few large batched INSERTs instead of one small transaction per request.
+
+    The buffer is bounded: once `max_pending` samples are waiting, new batches are
+    refused with `BufferFull` so a slow database pushes back on clients instead of
+    exhausting memory. A failed write is put back in front of the queue and retried
+    on the next flush while it fits within the bound; otherwise it is dropped and
+    counted. Samples still pending when the process dies are lost, which is the
+    price of write-behind; `stop` flushes them on an orderly shutdown.
+
+    Args:
+        writer (Callable[[list[dict]], Awaitable[int]]): Writes a batch of samples and
+            returns the number actually stored.
+        flush_rows (int): Pending samples that trigger an immediate flush.
+        flush_interval (float): Maximum seconds a sample waits before being flushed.
+        max_pending (int): Pending samples beyond which batches are refused.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[list[dict]], Awaitable[int]],
+        flush_rows: int = 5_000,
+        flush_interval: float = 0.25,
+        max_pending: int = 100_000,
+    ):
+        self.writer = writer
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending = []
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.received = 0
+        self.written = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.last_flush_rows = 0
+        self.last_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flush task is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        """The number of samples waiting to be written."""
+        return len(self._pending)
+
+    async def start(self):
+        """Start flushing in the background on the running event loop."""
+        if self.running:
+            return
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the background task and write every pending sample.
+
+        The task is not cancelled: it is asked to exit and finishes the flush it may be
+        in the middle of, so no batch is abandoned half-written.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def submit(self, rows: list[dict]) -> int:
+        """
+        Queue samples for writing.
+
+        Without a running background task, e.g. outside the application's lifespan,
+        the samples are written before returning.
+
+        Args:
+            rows (list[dict]): The samples, each with every column of the telemetry table.
+
+        Returns:
+            int: The number of samples accepted.
+
+        Raises:
+            BufferFull: If the samples do not fit within `max_pending`.
+        """
+        if len(self._pending) + len(rows) > self.max_pending:
+            self.rejected += len(rows)
+            raise BufferFull(len(self._pending))
+        self._pending.extend(rows)
+        self.received += len(rows)
+        if not self.running:
+            await self.flush()
+        elif len(self._pending) >= self.flush_rows:
+            self._wake.set()
+        return len(rows)
+
+    async def flush(self) -> int:
+        """
+        Write every pending sample now.
+
+        Returns:
+            int: The number of samples stored; duplicates are not counted.
+        """
+        if not self._pending:
+            return 0
+        # Swap the list before awaiting so samples arriving meanwhile go to the next flush
+        batch, self._pending = self._pending, []
+        start = time.perf_counter()
+        try:
+            written = await self.writer(batch)
+        except asyncio.CancelledError:
+            self._requeue(batch)
+            raise
+        except Exception:
+            logger.exception("Writing %d telemetry samples failed", len(batch))
+            self._requeue(batch)
+            return 0
+        self.written += written
+        self.flushes += 1
+        self.last_flush_rows = len(batch)
+        self.last_flush_ms = (time.perf_counter() - start) * 1000
+        return written
+
+    def _requeue(self, batch: list[dict]):
+        # Put an unwritten batch back in front of newer samples, or count it as lost
+        if len(batch) + len(self._pending) <= self.max_pending:
+            self._pending[:0] = batch
+        else:
+            self.dropped += len(batch)
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._stopping:
+                await self.flush()
+
+    def stats(self) -> dict:
+        """Return the buffer's queue length and throughput counters."""
+        return {
+            "pending": len(self._pending),
+            "received": self.received,
+            "written": self.written,
+            "rejected": self.rejected,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "last_flush_rows": self.last_flush_rows,
+            "last_flush_ms": self.last_flush_ms,
+        }
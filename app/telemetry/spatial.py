@@ -0,0 +1,196 @@
+import heapq
+import math
+from typing import Callable, Iterator, Optional
+
+
+class SpatialGrid:
+    """
+    Uniform grid index of points, updated incrementally as they move.
+
+    The plane is cut into square cells of `cell_size`; only occupied cells are
+    stored, each mapping the IDs of its points to their coordinates. Moving a point
+    within its cell rewrites one entry, and crossing into another cell moves it
+    between two dicts, so updates cost the same whatever the number of points.
+
+    Area queries visit the cells overlapping the area and test only the points of
+    its edge cells. Nearest-neighbour queries visit rings of cells around the query
+    point, closest first, and stop once no point in the next ring could be closer
+    than the ones found. Either falls back to visiting every occupied cell when
+    that is fewer cells, so sparse fleets and far-away queries stay cheap.
+
+    A cell size near the typical query radius works best. The grid is only used
+    from the event loop and takes no lock.
+
+    Args:
+        cell_size (float): The side of a cell, in coordinate units.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[int, tuple[float, float]]] = {}
+        self._cell_of: dict[int, tuple[int, int]] = {}
+        # The range of occupied cells, recomputed after a cell is created or emptied
+        self._extent: Optional[tuple[int, int, int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+    def _key(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def move(self, point_id: int, x: float, y: float):
+        """
+        Add a point, or move it to new coordinates.
+
+        Args:
+            point_id (int): The ID of the point.
+            x (float): Its x coordinate.
+            y (float): Its y coordinate.
+        """
+        key = self._key(x, y)
+        old = self._cell_of.get(point_id)
+        if old != key:
+            if old is not None:
+                self._discard(point_id, old)
+            if key not in self._cells:
+                self._cells[key] = {}
+                self._extent = None
+            self._cell_of[point_id] = key
+        self._cells[key][point_id] = (x, y)
+
+    def remove(self, point_id: int):
+        """Remove a point, if present."""
+        key = self._cell_of.pop(point_id, None)
+        if key is not None:
+            self._discard(point_id, key)
+
+    def _discard(self, point_id: int, key: tuple[int, int]):
+        cell = self._cells[key]
+        del cell[point_id]
+        if not cell:
+            del self._cells[key]
+            self._extent = None
+
+    def extent(self) -> Optional[tuple[int, int, int, int]]:
+        """Return the `(min_cx, min_cy, max_cx, max_cy)` range of occupied cells, or None if empty."""
+        if self._extent is None and self._cells:
+            xs = [key[0] for key in self._cells]
+            ys = [key[1] for key in self._cells]
+            self._extent = (min(xs), min(ys), max(xs), max(ys))
+        return self._extent
+
+    def within_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterator[tuple[int, float, float]]:
+        """
+        Find the points inside a box, edges included.
+
+        Args:
+            min_x (float): The smallest x coordinate of the box.
+            min_y (float): The smallest y coordinate of the box.
+            max_x (float): The largest x coordinate of the box.
+            max_y (float): The largest y coordinate of the box.
+
+        Yields:
+            tuple: `(point_id, x, y)` of every point inside, in no particular order.
+        """
+        if min_x > max_x or min_y > max_y or not self._cells:
+            return
+        cx0, cy0 = self._key(min_x, min_y)
+        cx1, cy1 = self._key(max_x, max_y)
+        extent = self.extent()
+        cx0, cy0, cx1, cy1 = max(cx0, extent[0]), max(cy0, extent[1]), min(cx1, extent[2]), min(cy1, extent[3])
+        if cx0 > cx1 or cy0 > cy1:
+            return
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) <= len(self._cells):
+            keys = ((cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1))
+        else:
+            keys = (key for key in self._cells if cx0 <= key[0] <= cx1 and cy0 <= key[1] <= cy1)
+        for key in keys:
+            cell = self._cells.get(key)
+            if cell is None:
+                continue
+            if cx0 < key[0] < cx1 and cy0 < key[1] < cy1:
+                # Interior cells lie wholly inside the box
+                for point_id, (x, y) in cell.items():
+                    yield point_id, x, y
+            else:
+                for point_id, (x, y) in cell.items():
+                    if min_x <= x <= max_x and min_y <= y <= max_y:
+                        yield point_id, x, y
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        accept: Optional[Callable[[int], bool]] = None,
+        max_distance: Optional[float] = None,
+    ) -> list[tuple[float, int, float, float]]:
+        """
+        Find the points closest to a location.
+
+        Args:
+            x (float): The x coordinate of the location.
+            y (float): The y coordinate of the location.
+            k (int): The most points to return.
+            accept (Optional[Callable[[int], bool]]): Only points whose ID it accepts are returned.
+            max_distance (Optional[float]): Only points at most this far are returned.
+
+        Returns:
+            list[tuple]: `(distance, point_id, x, y)` of up to `k` points, nearest first
+            and ties by ID.
+        """
+        if k < 1 or not self._cells:
+            return []
+        limit = math.inf if max_distance is None else max_distance * max_distance
+        # A max-heap of the k best candidates, as (-squared distance, -ID, x, y)
+        best: list[tuple[float, int, float, float]] = []
+
+        def consider(cell: dict):
+            for point_id, (px, py) in cell.items():
+                squared = (px - x) ** 2 + (py - y) ** 2
+                if squared > limit or (accept is not None and not accept(point_id)):
+                    continue
+                entry = (-squared, -point_id, px, py)
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+
+        cx, cy = self._key(x, y)
+        min_cx, min_cy, max_cx, max_cy = self.extent()
+        last_ring = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy)
+        ring = max(0, cx - max_cx, min_cx - cx, cy - max_cy, min_cy - cy)
+        while ring <= last_ring:
+            # Every point of this ring and beyond is at least (ring - 1) cells away
+            worst = -best[0][0] if len(best) == k else limit
+            if ring > 1 and ((ring - 1) * self.cell_size) ** 2 > worst:
+                break
+            if 8 * ring > len(self._cells):
+                # A ring of more cells than are occupied: visit the occupied ones left instead
+                for key, cell in self._cells.items():
+                    if max(abs(key[0] - cx), abs(key[1] - cy)) >= ring:
+                        consider(cell)
+                break
+            for key in _ring(cx, cy, ring):
+                cell = self._cells.get(key)
+                if cell is not None:
+                    consider(cell)
+            ring += 1
+        return [
+            (math.sqrt(-squared), -negative_id, px, py) for squared, negative_id, px, py in sorted(best, reverse=True)
+        ]
+
+
+def _ring(cx: int, cy: int, ring: int) -> Iterator[tuple[int, int]]:
+    """Yield the cells at Chebyshev distance `ring` from a cell."""
+    if ring == 0:
+        yield cx, cy
+        return
+    for dx in range(-ring, ring + 1):
+        yield cx + dx, cy - ring
+        yield cx + dx, cy + ring
+    for dy in range(-ring + 1, ring):
+        yield cx - ring, cy + dy
+        yield cx + ring, cy + dy
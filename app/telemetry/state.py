@@ -0,0 +1,151 @@
+from operator import itemgetter
+from typing import Iterable, Optional, Sequence
+
+from app.crud.telemetry import ROBOT_STATE_FIELDS
+
+from .spatial import SpatialGrid
+
+# Picks the latest-state columns out of a telemetry sample dict
+_state_columns = itemgetter(*ROBOT_STATE_FIELDS)
+
+
+class RobotState:
+    """
+    The latest reported state of one robot.
+
+    Uses `__slots__`: a fleet of a hundred thousand robots costs one small fixed-size
+    object each, and an update rewrites the fields in place.
+    """
+
+    __slots__ = ROBOT_STATE_FIELDS
+
+    def __init__(self, robot_id: int, ts: int, x: float, y: float, battery: float, state: str):
+        self.robot_id = robot_id
+        self.ts = ts
+        self.x = x
+        self.y = y
+        self.battery = battery
+        self.state = state
+
+    def as_row(self) -> tuple:
+        """Return the state as a tuple in `ROBOT_STATE_FIELDS` order."""
+        return (self.robot_id, self.ts, self.x, self.y, self.battery, self.state)
+
+
+class RobotStateStore:
+    """
+    In-memory view of the latest state of every robot, maintained incrementally.
+
+    Every telemetry flush merges the most recent sample of each robot it wrote, and
+    the `robot_state` summary table restores the view after a restart, so reading
+    the fleet's state never touches the database. A sample only replaces a robot's
+    state if it is more recent, which makes merging idempotent and independent of
+    the order flushes and reloads complete in.
+
+    The rows served are built once after a change and reused until the next one.
+    Every robot's position is also indexed in a `SpatialGrid`, moved along with
+    each merged state, which serves the area and nearest-robot queries. The store
+    is only used from the event loop and takes no lock.
+
+    Args:
+        cell_size (float): The cell size of the spatial index, in coordinate units.
+    """
+
+    def __init__(self, cell_size: float = 25.0):
+        self._states: dict[int, RobotState] = {}
+        self._rows: Optional[list[tuple]] = None
+        self._grid = SpatialGrid(cell_size)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def merge(self, rows: Iterable[Sequence]) -> int:
+        """
+        Merge states that are more recent than the ones held.
+
+        Args:
+            rows (Iterable[Sequence]): `(robot_id, ts, x, y, battery, state)` rows.
+
+        Returns:
+            int: The number of states added or replaced.
+        """
+        changed = 0
+        for robot_id, ts, x, y, battery, state in rows:
+            current = self._states.get(robot_id)
+            if current is None:
+                self._states[robot_id] = RobotState(robot_id, ts, x, y, battery, state)
+            elif ts > current.ts:
+                current.ts, current.x, current.y, current.battery, current.state = ts, x, y, battery, state
+            else:
+                continue
+            self._grid.move(robot_id, x, y)
+            changed += 1
+        if changed:
+            self._rows = None
+        return changed
+
+    def apply_samples(self, samples: Iterable[dict]) -> int:
+        """
+        Merge the telemetry samples of a flush.
+
+        Args:
+            samples (Iterable[dict]): Samples with every column of `TelemetryModel`.
+
+        Returns:
+            int: The number of states added or replaced.
+        """
+        return self.merge(map(_state_columns, samples))
+
+    def rows(self) -> list[tuple]:
+        """
+        Return the state of every robot, ordered by robot ID.
+
+        Returns:
+            list[tuple]: One `(robot_id, ts, x, y, battery, state)` row per robot.
+        """
+        if self._rows is None:
+            self._rows = [self._states[robot_id].as_row() for robot_id in sorted(self._states)]
+        return self._rows
+
+    def within_bbox(
+        self, min_x: float, min_y: float, max_x: float, max_y: float, state: Optional[str] = None
+    ) -> list[tuple]:
+        """
+        Return the robots inside a box, edges included, ordered by robot ID.
+
+        Args:
+            min_x (float): The smallest x coordinate of the box.
+            min_y (float): The smallest y coordinate of the box.
+            max_x (float): The largest x coordinate of the box.
+            max_y (float): The largest y coordinate of the box.
+            state (Optional[str]): Only robots in this operating state, e.g. `idle`.
+
+        Returns:
+            list[tuple]: One `(robot_id, ts, x, y, battery, state)` row per robot.
+        """
+        robot_ids = sorted(robot_id for robot_id, _, _ in self._grid.within_bbox(min_x, min_y, max_x, max_y))
+        robots = (self._states[robot_id] for robot_id in robot_ids)
+        return [robot.as_row() for robot in robots if state is None or robot.state == state]
+
+    def nearest(
+        self, x: float, y: float, limit: int, radius: Optional[float] = None, state: Optional[str] = None
+    ) -> list[tuple]:
+        """
+        Return the robots closest to a location, nearest first.
+
+        Args:
+            x (float): The x coordinate of the location.
+            y (float): The y coordinate of the location.
+            limit (int): The most robots to return.
+            radius (Optional[float]): Only robots at most this far away.
+            state (Optional[str]): Only robots in this operating state, e.g. `idle`.
+
+        Returns:
+            list[tuple]: One `(robot_id, ts, x, y, battery, state, distance)` row per robot.
+        """
+        states = self._states
+        accept = None if state is None else (lambda robot_id: states[robot_id].state == state)
+        return [
+            (*states[robot_id].as_row(), distance)
+            for distance, robot_id, _, _ in self._grid.nearest(x, y, limit, accept, radius)
+        ]
@@ -0,0 +1,36 @@
+"""
+Mission routes and their geometry.
+
+A route is the ordered list of `(x, y)` waypoints a robot follows to carry out a
+mission, in the same coordinates as its telemetry. Routes are stored packed into
+one binary column, and `geometry` computes their length, bounding box,
+simplification and travel time with NumPy, one vectorized pass per route or per
+batch of routes rather than a Python loop over the waypoints.
+
+NumPy takes a noticeable share of the application's import time, so `geometry`
+is only imported when one of its functions is first looked up here.
+"""
+
+import importlib
+
+__all__ = [
+    "BYTES_PER_WAYPOINT",
+    "all_finite",
+    "batch_metrics",
+    "bounding_box",
+    "eta_seconds",
+    "pack",
+    "path_length",
+    "simplify",
+    "unpack",
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return getattr(importlib.import_module(".geometry", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,196 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Storage format of a route: x, y pairs of little-endian 64-bit floats
+WAYPOINT_DTYPE = np.dtype("<f8")
+
+# Bytes one waypoint takes in a packed route
+BYTES_PER_WAYPOINT = 2 * WAYPOINT_DTYPE.itemsize
+
+# Waypoints in a range below which simplification batches the range with others
+SMALL_RANGE = 256
+
+
+def pack(waypoints) -> bytes:
+    """
+    Pack waypoints into the binary route format.
+
+    Args:
+        waypoints (Sequence | np.ndarray): `(x, y)` pairs.
+
+    Returns:
+        bytes: The pairs as consecutive little-endian doubles, 16 bytes per waypoint.
+    """
+    return np.asarray(waypoints, dtype=WAYPOINT_DTYPE).reshape(-1, 2).tobytes()
+
+
+def unpack(blob: bytes) -> np.ndarray:
+    """
+    View a packed route as an array without copying it.
+
+    Args:
+        blob (bytes): A packed route.
+
+    Returns:
+        np.ndarray: A read-only `(n, 2)` array of x, y pairs.
+
+    Raises:
+        ValueError: If the blob is not a whole number of waypoints.
+    """
+    if len(blob) % BYTES_PER_WAYPOINT:
+        raise ValueError(f"A packed route is a multiple of {BYTES_PER_WAYPOINT} bytes, not {len(blob)}")
+    return np.frombuffer(blob, dtype=WAYPOINT_DTYPE).reshape(-1, 2)
+
+
+def all_finite(points: np.ndarray) -> bool:
+    """Return whether every coordinate of a path is finite, neither NaN nor infinite."""
+    return bool(np.isfinite(points).all())
+
+
+def _norms(vectors: np.ndarray) -> np.ndarray:
+    """Return the length of every row of a `(n, 2)` array."""
+    # Several times faster than np.hypot, whose overflow guard coordinates never need
+    return np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+
+
+def path_length(points: np.ndarray) -> float:
+    """Return the length of a path: the sum of the distances between consecutive waypoints."""
+    if len(points) < 2:
+        return 0.0
+    return float(_norms(np.diff(points, axis=0)).sum())
+
+
+def bounding_box(points: np.ndarray) -> tuple[float, float, float, float]:
+    """Return the `(min_x, min_y, max_x, max_y)` box enclosing a non-empty path."""
+    low, high = points.min(axis=0), points.max(axis=0)
+    return float(low[0]), float(low[1]), float(high[0]), float(high[1])
+
+
+def eta_seconds(length: float, speed: Optional[float]) -> Optional[float]:
+    """Return the time a robot moving at `speed` units per second takes to travel `length`, if a speed is given."""
+    return length / speed if speed else None
+
+
+def _segment_distances(points: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Return the distance of every point to the segment from `start` to `end`."""
+    direction = end - start
+    squared = float(direction @ direction)
+    offsets = points - start
+    if squared == 0.0:
+        return _norms(offsets)
+    # Project onto the segment, clamped to its ends
+    t = np.clip(offsets @ direction / squared, 0.0, 1.0)
+    return _norms(offsets - t[:, None] * direction)
+
+
+def _split_ranges(points: np.ndarray, firsts: np.ndarray, lasts: np.ndarray, tolerance: float, keep: np.ndarray):
+    """
+    Run Douglas–Peucker on many ranges at once, one level of splits per pass.
+
+    Every pass computes the distances of the interior waypoints of all pending
+    ranges in one vectorized step, finds each range's farthest waypoint with
+    `reduceat`, and replaces the ranges that must be split by their two halves.
+
+    Args:
+        points (np.ndarray): The `(n, 2)` path.
+        firsts (np.ndarray): The first waypoint of each range.
+        lasts (np.ndarray): The last waypoint of each range.
+        tolerance (float): The simplification tolerance.
+        keep (np.ndarray): Flags of the kept waypoints, set in place.
+    """
+    while len(firsts):
+        inner = lasts - firsts - 1
+        firsts, lasts, inner = firsts[inner > 0], lasts[inner > 0], inner[inner > 0]
+        if not len(firsts):
+            return
+        # The range of every interior waypoint, and the waypoint's index in the path
+        owner = np.repeat(np.arange(len(firsts)), inner)
+        group_starts = np.cumsum(inner) - inner
+        index = np.arange(len(owner)) - group_starts[owner] + firsts[owner] + 1
+        start = points[firsts][owner]
+        direction = points[lasts][owner] - start
+        squared = np.einsum("ij,ij->i", direction, direction)
+        offsets = points[index] - start
+        t = np.clip(np.einsum("ij,ij->i", offsets, direction) / np.where(squared > 0, squared, 1.0), 0.0, 1.0)
+        distances = _norms(offsets - t[:, None] * direction)
+        maxima = np.maximum.reduceat(distances, group_starts)
+        # The first waypoint at the maximum distance of each range, as argmax would pick
+        hits = np.flatnonzero(distances == maxima[owner])
+        hits = hits[np.r_[True, owner[hits][1:] != owner[hits][:-1]]]
+        split = maxima > tolerance
+        splits = index[hits][split]
+        keep[splits] = True
+        firsts, lasts = np.concatenate((firsts[split], splits)), np.concatenate((splits, lasts[split]))
+
+
+def simplify(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplify a path with the Douglas–Peucker algorithm.
+
+    A range of waypoints is replaced by the segment between its ends when no
+    waypoint in it is farther than `tolerance` from that segment; otherwise it is
+    split at the farthest waypoint. Ranges longer than `SMALL_RANGE` are split one
+    at a time from a stack, each in one vectorized step over a contiguous slice.
+    The many short ranges a detailed path ends up in would each cost more in NumPy
+    call overhead than in arithmetic, so they are collected and split together by
+    `_split_ranges`.
+
+    Args:
+        points (np.ndarray): A `(n, 2)` path.
+        tolerance (float): The largest distance a removed waypoint may have from the simplified path.
+
+    Returns:
+        np.ndarray: The kept waypoints, in order; always the first and the last.
+    """
+    if len(points) < 3:
+        return points
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    ranges, small = [(0, len(points) - 1)], []
+    while ranges:
+        first, last = ranges.pop()
+        if last - first < 2:
+            continue
+        if last - first <= SMALL_RANGE:
+            small.append((first, last))
+            continue
+        distances = _segment_distances(points[first + 1 : last], points[first], points[last])
+        farthest = int(distances.argmax())
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            ranges.append((first, split))
+            ranges.append((split, last))
+    if small:
+        firsts, lasts = np.array(small).T
+        _split_ranges(points, firsts, lasts, tolerance, keep)
+    return points[keep]
+
+
+def batch_metrics(blobs: Sequence[bytes]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the waypoint count, length and bounding box of many packed routes at once.
+
+    The routes are concatenated into one array, so the distances between
+    consecutive waypoints of every route are computed in a single vectorized pass.
+    A route's length is then the difference of two running totals, which skips the
+    step from one route's last waypoint to the next route's first, and the bounding
+    boxes are reduced per route with `reduceat`.
+
+    Args:
+        blobs (Sequence[bytes]): Packed routes of at least one waypoint each.
+
+    Returns:
+        tuple: The waypoint count of each route, its length, and its
+        `(min_x, min_y, max_x, max_y)` box as a `(len(blobs), 4)` array.
+    """
+    counts = np.fromiter((len(blob) // BYTES_PER_WAYPOINT for blob in blobs), dtype=np.int64, count=len(blobs))
+    if not len(blobs):
+        return counts, np.zeros(0), np.zeros((0, 4))
+    points = unpack(b"".join(blobs))
+    totals = np.concatenate(([0.0], np.cumsum(_norms(np.diff(points, axis=0)))))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    lengths = totals[starts + counts - 1] - totals[starts]
+    boxes = np.hstack((np.minimum.reduceat(points, starts, axis=0), np.maximum.reduceat(points, starts, axis=0)))
+    return counts, lengths, boxes
@@ -0,0 +1,81 @@
+"""
+Compare the async endpoints with the previous sync (threadpool) endpoints under load.
+
+Both variants serve GET /api/v1/missions/{id} from the same seeded database; the
+sync one runs the original `def` route with a `Session` on the threadpool.
+
+Usage:
+    python -m benchmarks.bench_async_load --concurrency 50,100,250,500 --requests 5000
+"""
+import argparse
+import asyncio
+import random
+
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy.orm import Session
+
+from app.cache import mission_cache
+from app.cache.backends import NullCache
+from app.crud import mission as crud
+from app.main import app as async_app
+from app.schemas import mission as schemas
+from benchmarks.common import bind_async_app, make_session_factory, run_load, seed
+
+
+def build_sync_app(SessionLocal):
+    """Build an app exposing the original threadpool-bound mission read route."""
+    sync_app = FastAPI()
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @sync_app.get("/api/v1/missions/{mission_id}", response_model=schemas.Mission)
+    def read_mission(mission_id: int, db: Session = Depends(get_db)):
+        mission = crud.get_mission(db, mission_id=mission_id)
+        if mission is None:
+            raise HTTPException(status_code=404, detail="Mission not found")
+        return mission
+
+    return sync_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missions", type=int, default=100_000)
+    parser.add_argument("--concurrency", default="50,100,250,500")
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    # The sync arm has no cache; disable it so both arms measure database reads
+    mission_cache.backend = NullCache()
+
+    engine, SessionLocal = make_session_factory()
+    seed(engine, robots=1_000, missions=args.missions)
+    sync_app = build_sync_app(SessionLocal)
+
+    def paths(_):
+        return f"/api/v1/missions/{random.randint(1, args.missions)}"
+
+    async def run_async(concurrency):
+        async with bind_async_app(async_app, engine) as app:
+            return await run_load(app, paths, concurrency, args.requests)
+
+    print(f"{'clients':>8} {'mode':>6} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for concurrency in (int(value) for value in args.concurrency.split(",")):
+        for mode in ("sync", "async"):
+            if mode == "sync":
+                result = asyncio.run(run_load(sync_app, paths, concurrency, args.requests))
+            else:
+                result = asyncio.run(run_async(concurrency))
+            print(
+                f"{concurrency:>8} {mode:>6} {result['rps']:>9.0f} {result['p50_ms']:>8.1f} "
+                f"{result['p99_ms']:>8.1f} {result['errors']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
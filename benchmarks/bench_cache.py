@@ -0,0 +1,49 @@
+"""
+Measure GET /api/v1/missions/{id} latency on a hot-key workload with and without the cache.
+
+Requests pick uniformly among a small set of hot mission IDs, as dashboards polling
+the same missions do.
+
+Usage:
+    python -m benchmarks.bench_cache --hot-keys 300 --requests 20000 --concurrency 50
+"""
+import argparse
+import asyncio
+import random
+
+from app.cache import mission_cache
+from app.cache.backends import MemoryCache, NullCache
+from app.main import app
+from benchmarks.common import bind_async_app, make_session_factory, run_load, seed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missions", type=int, default=100_000)
+    parser.add_argument("--hot-keys", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    engine, _ = make_session_factory()
+    seed(engine, robots=1_000, missions=args.missions)
+    hot = random.sample(range(1, args.missions + 1), args.hot_keys)
+
+    def paths(_):
+        return f"/api/v1/missions/{random.choice(hot)}"
+
+    async def run(backend):
+        mission_cache.backend = backend
+        async with bind_async_app(app, engine):
+            return await run_load(app, paths, args.concurrency, args.requests)
+
+    print(f"{'cache':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'hit rate':>9}")
+    for name, backend in (("none", NullCache()), ("memory", MemoryCache(ttl=60))):
+        result = asyncio.run(run(backend))
+        stats = backend.stats()
+        hit_rate = stats["hits"] / max(1, stats["hits"] + stats["misses"])
+        print(f"{name:>7} {result['rps']:>9.0f} {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {hit_rate:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Microbenchmarks of the `app.crud` functions on a synthetic fleet.
+
+Reads pick random robots and missions of the generated fleet. Writes only touch
+missions the run creates itself, which are then taken through their whole
+lifecycle, so a fleet database can be reused between runs and every run measures
+the same operations.
+
+Usage:
+    python -m benchmarks.bench_crud --robots 10000 --missions 1000000 --output crud.json
+"""
+
+import argparse
+import random
+import time
+
+from app.crud import mission as mission_crud
+from app.crud import robot as robot_crud
+from app.crud.stats import get_mission_counts
+from app.schemas.mission import MissionCreate, MissionPatch
+from benchmarks.common import make_session_factory, measure
+from benchmarks.fleet import generate_fleet
+from benchmarks.results import write_results
+
+
+def run(Session, robots: int, missions: int, repeat: int = 200, seed: int = 42) -> dict:
+    """
+    Time the crud functions.
+
+    Args:
+        Session (sessionmaker): Sessions on the fleet database.
+        robots (int): Robot IDs 1..robots are read.
+        missions (int): Mission IDs 1..missions are read.
+        repeat (int): Timed calls per function.
+        seed (int): Seeds the choice of robots and missions.
+
+    Returns:
+        dict: The median and p95 milliseconds of each function, by benchmark name.
+    """
+    rng = random.Random(seed)
+
+    def robot_id():
+        return rng.randint(1, robots)
+
+    def mission_id():
+        return rng.randint(1, missions)
+
+    results = {}
+    with Session() as db:
+        reads = {
+            "get_mission": lambda: mission_crud.get_mission(db, mission_id()),
+            "get_mission_row": lambda: mission_crud.get_mission_row(db, mission_id()),
+            "get_mission_status": lambda: mission_crud.get_mission_status(db, mission_id()),
+            "get_missions.page": lambda: mission_crud.get_missions(db, limit=100, after_id=mission_id()),
+            "get_missions.robot": lambda: mission_crud.get_missions(db, limit=100, robot_id=robot_id()),
+            "get_mission_rows.robot": lambda: mission_crud.get_mission_rows(db, limit=100, robot_id=robot_id()),
+            "get_mission_rows.queued": lambda: mission_crud.get_mission_rows(
+                db, limit=100, status="queued", sort="queued_at"
+            ),
+            "search_missions": lambda: mission_crud.search_missions(db, f"mission {mission_id()}"),
+            "get_robot": lambda: robot_crud.get_robot(db, robot_id()),
+            "get_robots.page": lambda: robot_crud.get_robots(db, limit=100, after_id=robot_id()),
+        }
+        for name, fn in reads.items():
+            results[name] = measure(fn, repeat)
+        results["get_mission_counts"] = measure(lambda: get_mission_counts(db), repeat=10)
+
+        created = []
+
+        def create():
+            mission = MissionCreate(name=f"bench-{rng.random()}", description="benchmark", robot_id=robot_id())
+            created.append(mission_crud.create_mission(db, mission).id)
+
+        results["create_mission"] = measure(create, repeat)
+        batch = [MissionCreate(name="bench-batch", description="benchmark", robot_id=robot_id()) for _ in range(100)]
+        results["create_missions.100"] = measure(lambda: mission_crud.create_missions(db, batch), repeat=20)
+
+        ids = iter(created)
+        patch = MissionPatch(description="updated")
+        results["update_mission"] = measure(lambda: mission_crud.update_mission(db, patch, next(ids)), repeat)
+
+        now = int(time.time() * 1000)
+        steps = {
+            "queue_mission": lambda mission: mission_crud.queue_mission(db, mission, priority=1, queued_at=now),
+            "assign_mission": lambda mission: mission_crud.assign_mission(db, mission, assigned_at=now),
+            "transition_mission.start": lambda mission: mission_crud.transition_mission(db, mission, "running", now),
+            "transition_mission.complete": lambda mission: mission_crud.transition_mission(db, mission, "done", now),
+        }
+        for name, step in steps.items():
+            results[name] = measure(lambda step=step, ids=iter(created): step(next(ids)), repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=10_000)
+    parser.add_argument("--missions", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    engine, Session = make_session_factory()
+    generate_fleet(engine, robots=args.robots, missions=args.missions)
+    results = run(Session, args.robots, args.missions, repeat=args.repeat)
+    print(f"{'function':>28} {'median ms':>10} {'p95 ms':>8}")
+    for name, metrics in results.items():
+        print(f"{name:>28} {metrics['median_ms']:>10.3f} {metrics['p95_ms']:>8.3f}")
+    if args.output:
+        write_results(args.output, {f"crud.{name}": metrics for name, metrics in results.items()}, vars(args))
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
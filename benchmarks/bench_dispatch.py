@@ -0,0 +1,120 @@
+"""
+Measure dispatch decisions per second.
+
+Queues scheduled missions with random priorities for a fleet of robots, then lets
+the robots ask for work in turn until every mission is handed out. The in-memory
+heap dispatcher is compared with answering every request with a query for the
+robot's most urgent queued mission followed by an UPDATE taking it off the queue,
+which is what a stateless dispatcher has to do. Committing the assignment costs
+the same either way, so decisions run inside one transaction and the cost of a
+committed UPDATE is reported separately.
+
+Usage:
+    python -m benchmarks.bench_dispatch --robots 1000 --missions 100000
+"""
+
+import argparse
+import random
+import time
+
+from sqlalchemy import bindparam, select, update
+
+from app.models.mission import Mission as MissionModel
+from app.scheduler import Dispatcher
+from benchmarks.common import make_session_factory, percentile, seed
+
+
+def queue_all(engine, missions, robots, rng):
+    """Mark every mission as queued with a random priority; return (id, robot_id, priority, queued_at) tuples."""
+    rows = [
+        (mission_id, (mission_id - 1) % robots + 1, rng.randrange(10), mission_id)
+        for mission_id in range(1, missions + 1)
+    ]
+    with engine.begin() as conn:
+        conn.execute(
+            update(MissionModel.__table__)
+            .where(MissionModel.__table__.c.id == bindparam("mission_id"))
+            .values(status="queued", priority=bindparam("p"), queued_at=bindparam("q"), assigned_at=None),
+            [{"mission_id": mission_id, "p": priority, "q": queued_at} for mission_id, _, priority, queued_at in rows],
+        )
+    return rows
+
+
+def run_heap(rows, robots):
+    """Queue every mission in a dispatcher and drain it robot by robot."""
+    dispatcher = Dispatcher()
+    latencies = []
+    start = time.perf_counter()
+    for mission_id, robot_id, priority, queued_at in rows:
+        dispatcher.enqueue(mission_id, robot_id, priority, queued_at)
+    assigned = 0
+    while assigned < len(rows):
+        for robot_id in range(1, robots + 1):
+            began = time.perf_counter()
+            if dispatcher.next_for(robot_id) is not None:
+                assigned += 1
+            latencies.append((time.perf_counter() - began) * 1e6)
+    return len(rows), time.perf_counter() - start, latencies
+
+
+def run_query(Session, robots, decisions):
+    """Answer `decisions` work requests with a query and an UPDATE each, in one transaction."""
+    table = MissionModel.__table__
+    next_query = (
+        select(table.c.id)
+        .where(table.c.robot_id == bindparam("robot_id"), table.c.status == "queued")
+        .order_by(table.c.priority.desc(), table.c.queued_at)
+        .limit(1)
+    )
+    assign = update(table).where(table.c.id == bindparam("mission_id")).values(status="assigned", assigned_at=1)
+    latencies = []
+    start = time.perf_counter()
+    with Session() as db:
+        for number in range(decisions):
+            began = time.perf_counter()
+            mission_id = db.execute(next_query, {"robot_id": number % robots + 1}).scalar()
+            if mission_id is not None:
+                db.execute(assign, {"mission_id": mission_id})
+            latencies.append((time.perf_counter() - began) * 1e6)
+        db.commit()
+    return decisions, time.perf_counter() - start, latencies
+
+
+def run_record(Session, rows, decisions):
+    """Time committing one assignment, which the application does after every decision."""
+    assign = update(MissionModel.__table__).where(MissionModel.__table__.c.id == bindparam("mission_id"))
+    start = time.perf_counter()
+    with Session() as db:
+        for mission_id, *_ in rows[:decisions]:
+            db.execute(assign.values(status="assigned", assigned_at=2), {"mission_id": mission_id})
+            db.commit()
+    return decisions, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=1_000)
+    parser.add_argument("--missions", type=int, default=100_000)
+    parser.add_argument("--query-decisions", type=int, default=5_000)
+    args = parser.parse_args()
+
+    engine, Session = make_session_factory()
+    seed(engine, robots=args.robots, missions=args.missions)
+    rows = queue_all(engine, args.missions, args.robots, random.Random(42))
+
+    print(f"{'dispatcher':>12} {'decisions':>10} {'decisions/s':>12} {'p50 us':>8} {'p99 us':>8}")
+    for name, (decisions, elapsed, latencies) in (
+        ("heap", run_heap(rows, args.robots)),
+        ("query", run_query(Session, args.robots, args.query_decisions)),
+    ):
+        print(
+            f"{name:>12} {decisions:>10} {decisions / elapsed:>12.0f} "
+            f"{percentile(latencies, 0.50):>8.1f} {percentile(latencies, 0.99):>8.1f}"
+        )
+    decisions, elapsed = run_record(Session, rows, args.query_decisions)
+    print(f"committing an assignment (one UPDATE and commit, either dispatcher): {elapsed / decisions * 1e6:.0f} us")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Show that the NDJSON export runs in constant memory.
+
+For each table size the database is grown to that many missions, then a fresh
+subprocess streams the full export to /dev/null and reports its peak RSS.
+
+Usage:
+    python -m benchmarks.bench_export --sizes 10000,100000,1000000,5000000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from sqlalchemy import func, select
+
+from app.models.mission import Mission as MissionModel
+from benchmarks.common import make_session_factory, seed
+
+
+def run_export(path, gzip):
+    """Stream the export of the database at `path` and print peak RSS as JSON."""
+    from app.api.api_v1.ndjson import encode_rows, gzip_chunks
+    from app.crud import mission as crud
+
+    _, SessionLocal = make_session_factory(path)
+    db = SessionLocal()
+    start = time.perf_counter()
+    written = 0
+    chunks = encode_rows(crud.iter_missions(db))
+    with open(os.devnull, "wb") as sink:
+        for chunk in gzip_chunks(chunks) if gzip else chunks:
+            written += sink.write(chunk)
+    elapsed = time.perf_counter() - start
+    db.close()
+    # ru_maxrss is reported in kilobytes on Linux.
+    print(json.dumps({"bytes": written, "seconds": elapsed, "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000,5000000")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_export(args.child, args.gzip)
+        return
+
+    engine, _ = make_session_factory()
+    path = engine.url.database
+    print(f"{'rows':>10} {'MB written':>11} {'seconds':>8} {'peak RSS MB':>12}")
+    for size in sorted(int(value) for value in args.sizes.split(",")):
+        with engine.connect() as conn:
+            current = conn.execute(select(func.count(MissionModel.id))).scalar()
+        seed(engine, robots=0, missions=size - current)
+        command = [sys.executable, "-m", "benchmarks.bench_export", "--child", path] + (["--gzip"] if args.gzip else [])
+        result = json.loads(subprocess.run(command, check=True, capture_output=True, text=True).stdout)
+        print(f"{size:>10} {result['bytes'] / 2**20:>11.1f} {result['seconds']:>8.2f} {result['peak_rss_mb']:>12.1f}")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Load-test `app.main.app` in-process with a weighted mix of requests.
+
+Concurrent clients drive the ASGI application through `httpx.ASGITransport`, so
+no server or network is involved and the numbers measure the application alone.
+Each client draws its next request from `ROUTES` by weight; the mix is mostly
+reads of single missions and pages, with creates and partial updates. Throughput
+and p50/p95/p99 latency are reported per route template and overall.
+
+Usage:
+    python -m benchmarks.bench_load --robots 10000 --missions 1000000 --concurrency 50 --requests 20000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import httpx
+
+from app.cache import mission_cache, robot_cache
+from app.main import app
+from benchmarks.common import bind_async_app, make_session_factory, percentile
+from benchmarks.fleet import generate_fleet
+from benchmarks.results import write_results
+
+
+class Picker:
+    """Draws random robots and missions of the fleet for the request builders."""
+
+    def __init__(self, robots: int, missions: int, seed: int):
+        self.rng = random.Random(seed)
+        self.robots = robots
+        self.missions = missions
+
+    def robot(self) -> int:
+        return self.rng.randint(1, self.robots)
+
+    def mission(self) -> int:
+        return self.rng.randint(1, self.missions)
+
+
+# Route template, relative weight, and a builder returning (method, path, JSON body) of a request
+ROUTES = (
+    ("GET /api/v1/missions/{mission_id}", 30, lambda pick: ("GET", f"/api/v1/missions/{pick.mission()}", None)),
+    (
+        "GET /api/v1/missions/{mission_id}/status",
+        10,
+        lambda pick: ("GET", f"/api/v1/missions/{pick.mission()}/status", None),
+    ),
+    ("GET /api/v1/missions/", 10, lambda pick: ("GET", f"/api/v1/missions/?limit=50&robot_id={pick.robot()}", None)),
+    ("GET /api/v1/robots/{robot_id}", 10, lambda pick: ("GET", f"/api/v1/robots/{pick.robot()}", None)),
+    (
+        "GET /api/v1/robots/{robot_id}/missions",
+        10,
+        lambda pick: ("GET", f"/api/v1/robots/{pick.robot()}/missions?limit=50", None),
+    ),
+    ("GET /api/v1/stats/", 5, lambda pick: ("GET", "/api/v1/stats/", None)),
+    (
+        "POST /api/v1/missions/",
+        10,
+        lambda pick: (
+            "POST",
+            "/api/v1/missions/",
+            {"name": "load", "description": "load test", "robot_id": pick.robot()},
+        ),
+    ),
+    (
+        "PATCH /api/v1/missions/{mission_id}",
+        10,
+        lambda pick: ("PATCH", f"/api/v1/missions/{pick.mission()}", {"description": "load test"}),
+    ),
+    (
+        "GET /api/v1/missions/search",
+        5,
+        lambda pick: ("GET", f"/api/v1/missions/search?q=mission+{pick.mission()}", None),
+    ),
+)
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    """Return the throughput, latency percentiles and error count of a set of requests."""
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+async def run_mix(app, picker: Picker, concurrency: int, requests: int, warmup: int = 0, routes=ROUTES) -> dict:
+    """
+    Drive an ASGI app with concurrent clients sending a weighted mix of requests.
+
+    Args:
+        app: The ASGI application.
+        picker (Picker): Draws the routes, robots and missions requested.
+        concurrency (int): The number of concurrent clients.
+        requests (int): The number of timed requests.
+        warmup (int): Requests sent first and left out of the results.
+        routes (Sequence[tuple]): `(name, weight, builder)` triples.
+
+    Returns:
+        dict: Per route name, and for `all` routes, the requests, errors, requests
+        per second and p50/p95/p99 latency in milliseconds.
+    """
+    names = [name for name, _, _ in routes]
+    builders = {name: builder for name, _, builder in routes}
+    weights = [weight for _, weight, _ in routes]
+    latencies = {name: [] for name in names}
+    errors = dict.fromkeys(names, 0)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def send(name):
+            method, path, body = builders[name](picker)
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            return (time.perf_counter() - start) * 1000, response.status_code >= 400
+
+        async def worker(count, record):
+            for _ in range(count):
+                name = picker.rng.choices(names, weights)[0]
+                latency, failed = await send(name)
+                if record:
+                    latencies[name].append(latency)
+                    errors[name] += failed
+
+        await asyncio.gather(*(worker(warmup // concurrency, False) for _ in range(concurrency)))
+        shares = [requests // concurrency + (number < requests % concurrency) for number in range(concurrency)]
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(share, True) for share in shares))
+        elapsed = time.perf_counter() - start
+
+    results = {name: summarize(latencies[name], errors[name], elapsed) for name in names if latencies[name]}
+    everything = [latency for name in names for latency in latencies[name]]
+    results["all"] = summarize(everything, sum(errors.values()), elapsed)
+    return results
+
+
+async def run(engine, robots: int, missions: int, concurrency: int, requests: int, seed: int = 42) -> dict:
+    """
+    Load-test the application against a fleet database.
+
+    The entity caches start empty, and a tenth of the requests warm them up first.
+
+    Args:
+        engine (Engine): An engine on the fleet database.
+        robots (int): Robot IDs 1..robots are requested.
+        missions (int): Mission IDs 1..missions are requested.
+        concurrency (int): The number of concurrent clients.
+        requests (int): The number of timed requests.
+        seed (int): Seeds the request mix.
+
+    Returns:
+        dict: The results of `run_mix`.
+    """
+    mission_cache.backend.clear()
+    robot_cache.backend.clear()
+    async with bind_async_app(app, engine) as bound:
+        return await run_mix(bound, Picker(robots, missions, seed), concurrency, requests, warmup=requests // 10)
+
+
+def print_results(results: dict):
+    """Print the results of `run_mix` as a table."""
+    width = max(len(name) for name in results)
+    print(f"{'route':<{width}} {'requests':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for name, metrics in results.items():
+        print(
+            f"{name:<{width}} {metrics['requests']:>8} {metrics['rps']:>8.0f} {metrics['p50_ms']:>8.1f} "
+            f"{metrics['p95_ms']:>8.1f} {metrics['p99_ms']:>8.1f} {metrics['errors']:>7}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=10_000)
+    parser.add_argument("--missions", type=int, default=1_000_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    engine, _ = make_session_factory()
+    generate_fleet(engine, robots=args.robots, missions=args.missions)
+    results = asyncio.run(run(engine, args.robots, args.missions, args.concurrency, args.requests))
+    print_results(results)
+    if args.output:
+        write_results(args.output, {f"load.{name}": metrics for name, metrics in results.items()}, vars(args))
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
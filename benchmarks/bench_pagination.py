@@ -0,0 +1,40 @@
+"""
+Compare page-N latency of offset pagination against keyset (cursor) pagination.
+
+Usage:
+    python -m benchmarks.bench_pagination --missions 1000000 --limit 100
+"""
+import argparse
+
+from app.crud import mission as crud
+from benchmarks.common import make_session_factory, measure, seed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missions", type=int, default=1_000_000)
+    parser.add_argument("--robots", type=int, default=1_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine, SessionLocal = make_session_factory()
+    seed(engine, args.robots, args.missions)
+    db = SessionLocal()
+
+    print(f"{'depth':>10} {'offset median':>14} {'keyset median':>14} {'speedup':>8}")
+    depth = args.limit
+    while depth < args.missions:
+        # With ids assigned from 1 upwards, the row before page `depth` has id == depth.
+        offset = measure(lambda: crud.get_missions(db, skip=depth, limit=args.limit), args.repeat)
+        keyset = measure(lambda: crud.get_missions(db, limit=args.limit, after_id=depth), args.repeat)
+        print(
+            f"{depth:>10} {offset['median_ms']:>12.2f}ms {keyset['median_ms']:>12.2f}ms "
+            f"{offset['median_ms'] / keyset['median_ms']:>7.1f}x"
+        )
+        depth *= 10
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
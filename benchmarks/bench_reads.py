@@ -0,0 +1,81 @@
+"""
+Compare ORM entity reads with the read-only column-row layer.
+
+Each simulated request opens a session, loads either one mission or a page of
+missions and closes the session. Reported per request type and loader: loaded
+objects per second and the peak memory allocated while serving one request.
+
+Usage:
+    python -m benchmarks.bench_reads --missions 100000 --page-size 100
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from app.crud import mission as crud
+from benchmarks.common import make_session_factory, seed
+
+
+def peak_allocated(fn):
+    """Return the peak number of bytes allocated by one call of `fn`."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missions", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    engine, Session = make_session_factory()
+    seed(engine, robots=1_000, missions=args.missions)
+
+    def request(load):
+        db = Session()
+        try:
+            return load(db)
+        finally:
+            db.close()
+
+    def random_id():
+        return random.randint(1, args.missions)
+
+    def random_after():
+        return random.randint(0, args.missions - args.page_size)
+
+    cases = {
+        ("single", "orm"): lambda db: [crud.get_mission(db, random_id())],
+        ("single", "rows"): lambda db: [crud.get_mission_row(db, random_id())],
+        ("page", "orm"): lambda db: crud.get_missions(db, limit=args.page_size, after_id=random_after()),
+        ("page", "rows"): lambda db: crud.get_mission_rows(db, limit=args.page_size, after_id=random_after()),
+        ("page+robot", "orm"): lambda db: crud.get_missions(
+            db, limit=args.page_size, after_id=random_after(), expand_robot=True
+        ),
+        ("page+robot", "rows"): lambda db: crud.get_mission_rows(
+            db, limit=args.page_size, after_id=random_after(), expand_robot=True
+        ),
+    }
+
+    print(f"{'request':>11} {'loader':>6} {'req/s':>8} {'objects/s':>11} {'peak KiB/req':>13}")
+    for (kind, loader), load in cases.items():
+        request(load)  # warm up
+        objects = 0
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            objects += len(request(load))
+        elapsed = time.perf_counter() - start
+        peak = peak_allocated(lambda: request(load))
+        print(
+            f"{kind:>11} {loader:>6} {args.requests / elapsed:>8.0f} {objects / elapsed:>11.0f} {peak / 1024:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
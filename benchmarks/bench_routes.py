@@ -0,0 +1,122 @@
+"""
+Measure the route metrics of `app.waypoints` against a pure-Python per-point loop.
+
+Random-walk routes are packed into the stored format, then measured the way
+`POST /missions/routes/metrics` does, with one vectorized pass over the whole
+batch, and with a loop decoding and visiting every waypoint in Python. The
+Douglas–Peucker simplification of one long route is compared the same way, and
+reading the routes of a batch from the database is timed for reference.
+
+Usage:
+    python -m benchmarks.bench_routes --routes 5000 --waypoints 500
+"""
+
+import argparse
+import math
+import random
+import struct
+
+from app.crud.route import get_routes, upsert_routes
+from app.waypoints import batch_metrics, pack, simplify, unpack
+from benchmarks.common import make_session_factory, measure, seed
+
+
+def random_walk(rng: random.Random, waypoints: int) -> list[tuple[float, float]]:
+    """Return a route of `waypoints` unit steps in random directions."""
+    x = y = 0.0
+    route = []
+    for _ in range(waypoints):
+        angle = rng.uniform(0, 2 * math.pi)
+        x, y = x + math.cos(angle), y + math.sin(angle)
+        route.append((x, y))
+    return route
+
+
+def python_metrics(blobs: list[bytes]) -> list[tuple[int, float, tuple]]:
+    """Measure packed routes one waypoint at a time: the count, length and bounding box of each."""
+    results = []
+    for blob in blobs:
+        points = list(struct.iter_unpack("<dd", blob))
+        length = 0.0
+        min_x = max_x = points[0][0]
+        min_y = max_y = points[0][1]
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            length += math.hypot(x1 - x0, y1 - y0)
+            min_x, max_x = min(min_x, x1), max(max_x, x1)
+            min_y, max_y = min(min_y, y1), max(max_y, y1)
+        results.append((len(points), length, (min_x, min_y, max_x, max_y)))
+    return results
+
+
+def python_simplify(points: list[tuple[float, float]], tolerance: float) -> list[tuple[float, float]]:
+    """Douglas–Peucker simplification computing the distance of every waypoint in Python."""
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    ranges = [(0, len(points) - 1)]
+    while ranges:
+        first, last = ranges.pop()
+        (x0, y0), (x1, y1) = points[first], points[last]
+        dx, dy = x1 - x0, y1 - y0
+        squared = dx * dx + dy * dy
+        farthest, distance = None, tolerance
+        for index in range(first + 1, last):
+            px, py = points[index][0] - x0, points[index][1] - y0
+            t = min(1.0, max(0.0, (px * dx + py * dy) / squared)) if squared else 0.0
+            candidate = math.hypot(px - t * dx, py - t * dy)
+            if candidate > distance:
+                farthest, distance = index, candidate
+        if farthest is not None:
+            keep[farthest] = True
+            ranges.append((first, farthest))
+            ranges.append((farthest, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--routes", type=int, default=5_000)
+    parser.add_argument("--waypoints", type=int, default=500, help="waypoints per route")
+    parser.add_argument("--long-route", type=int, default=100_000, help="waypoints of the simplified route")
+    parser.add_argument("--tolerance", type=float, default=2.0)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    blobs = [pack(random_walk(rng, args.waypoints)) for _ in range(args.routes)]
+    vectorized = measure(lambda: batch_metrics(blobs), repeat=10)
+    python = measure(lambda: python_metrics(blobs), repeat=3)
+
+    long_route = random_walk(rng, args.long_route)
+    points = unpack(pack(long_route))
+    simplified = len(simplify(points, args.tolerance))
+    assert simplified == len(python_simplify(long_route, args.tolerance))
+    vectorized_simplify = measure(lambda: simplify(points, args.tolerance), repeat=5)
+    python_simplify_ = measure(lambda: python_simplify(long_route, args.tolerance), repeat=2)
+
+    engine, Session = make_session_factory()
+    seed(engine, robots=100, missions=args.routes)
+    ids = list(range(1, args.routes + 1))
+    with Session() as db:
+        upsert_routes(
+            db, [{"mission_id": i, "points": blob, "point_count": args.waypoints} for i, blob in zip(ids, blobs)]
+        )
+        read = measure(lambda: get_routes(db, ids), repeat=5)
+    engine.dispose()
+
+    print(
+        f"{args.routes} routes of {args.waypoints} waypoints; one route of {args.long_route} simplified to {simplified}"
+    )
+    print(f"{'operation':>36} {'median ms':>10} {'p95 ms':>8}")
+    for name, timing in (
+        ("batch metrics, vectorized", vectorized),
+        ("batch metrics, per-point loop", python),
+        ("Douglas-Peucker, vectorized", vectorized_simplify),
+        ("Douglas-Peucker, per-point loop", python_simplify_),
+        ("read the batch from SQLite", read),
+    ):
+        print(f"{name:>36} {timing['median_ms']:>10.1f} {timing['p95_ms']:>8.1f}")
+    print(f"batch metrics speedup: {python['median_ms'] / vectorized['median_ms']:.0f}x")
+    print(f"simplification speedup: {python_simplify_['median_ms'] / vectorized_simplify['median_ms']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare mission search through the FTS5 index with a naive LIKE '%q%' scan.
+
+Descriptions are drawn from a Zipf-distributed vocabulary so that terms range from
+rare to common; each query is timed for the first page of 20 results. Ranking has to
+score every match, so FTS wins most on selective terms, while an unranked LIKE scan
+can stop early when a term is so common that the first rows already match.
+
+Usage:
+    python -m benchmarks.bench_search --missions 1000000
+"""
+import argparse
+import random
+
+from sqlalchemy import text
+
+from app.crud.mission import search_missions
+from app.models.mission import Mission as MissionModel
+from benchmarks.common import make_session_factory, measure
+
+VOCABULARY = [f"term{i}" for i in range(5_000)]
+
+
+def seed_descriptions(engine, missions, batch_size=50_000):
+    """Insert missions with random multi-word names and descriptions; the FTS triggers index them."""
+    rng = random.Random(42)
+    # Zipf-like weights: low-numbered terms are common, high-numbered ones rare
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+    with engine.begin() as conn:
+        for start in range(0, missions, batch_size):
+            rows = [
+                {
+                    "name": " ".join(rng.choices(VOCABULARY, weights, k=2)),
+                    "description": " ".join(rng.choices(VOCABULARY, weights, k=12)),
+                    "robot_id": 1,
+                }
+                for _ in range(start, min(start + batch_size, missions))
+            ]
+            conn.execute(MissionModel.__table__.insert(), rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missions", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    engine, Session = make_session_factory()
+    seed_descriptions(engine, args.missions)
+    db = Session()
+
+    def like_scan(q):
+        pattern = f"%{q}%"
+        return (
+            db.query(MissionModel)
+            .filter(MissionModel.name.like(pattern) | MissionModel.description.like(pattern))
+            .order_by(MissionModel.id)
+            .limit(20)
+            .all()
+        )
+
+    fts_table = f"{MissionModel.__tablename__}_fts"
+    print(f"{'query':>16} {'matches':>9} {'fts median ms':>14} {'like median ms':>15} {'speedup':>8}")
+    for q in ("term1", "term50", "term4999", "term7 term20"):
+        fts = measure(lambda: search_missions(db, q, limit=20), args.repeat)
+        # LIKE only supports a single substring; multi-word queries match the first word
+        like = measure(lambda: like_scan(q.split()[0]), args.repeat)
+        matches = db.execute(
+            text(f"SELECT count(*) FROM {fts_table} WHERE {fts_table} MATCH :q"), {"q": q}
+        ).scalar()
+        speedup = like["median_ms"] / fts["median_ms"]
+        print(f"{q:>16} {matches:>9} {fts['median_ms']:>14.2f} {like['median_ms']:>15.2f} {speedup:>7.2f}x")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
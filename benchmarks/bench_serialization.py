@@ -0,0 +1,66 @@
+"""
+Measure the per-row cost of building a mission list response.
+
+Compares the generic path (ORM entities validated into `schemas.Mission` and encoded
+the way FastAPI does for a `response_model`) with the fast path (column tuples
+encoded directly with orjson), both for serialization alone and including the query.
+
+Usage:
+    python -m benchmarks.bench_serialization --page-size 1000
+"""
+import argparse
+import json
+
+from pydantic import TypeAdapter
+
+from app.api.api_v1.rows import rows_response
+from app.crud.mission import MISSION_ROW_FIELDS, get_mission_rows, get_missions
+from app.schemas.mission import Mission
+from benchmarks.common import make_session_factory, measure, seed
+
+
+def model_response_body(missions, adapter):
+    """Validate and encode ORM objects as FastAPI does for `response_model=list[Mission]`."""
+    value = adapter.validate_python(missions, from_attributes=True)
+    content = adapter.dump_python(value, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    engine, Session = make_session_factory()
+    seed(engine, robots=100, missions=args.page_size)
+    adapter = TypeAdapter(list[Mission])
+    db = Session()
+
+    def orm_page():
+        missions = get_missions(db, limit=args.page_size)
+        db.expunge_all()  # a request starts with an empty identity map
+        return missions
+
+    missions, rows = orm_page(), get_mission_rows(db, limit=args.page_size)
+    assert json.loads(model_response_body(missions, adapter)) == json.loads(
+        rows_response(rows, MISSION_ROW_FIELDS).body
+    )
+
+    cases = {
+        "serialize, model": lambda: model_response_body(missions, adapter),
+        "serialize, orjson": lambda: rows_response(rows, MISSION_ROW_FIELDS).body,
+        "query+serialize, model": lambda: model_response_body(orm_page(), adapter),
+        "query+serialize, orjson": lambda: rows_response(
+            get_mission_rows(db, limit=args.page_size), MISSION_ROW_FIELDS
+        ).body,
+    }
+    print(f"{'case':>24} {'median ms':>10} {'us/row':>8}")
+    for name, fn in cases.items():
+        result = measure(fn, args.repeat)
+        print(f"{name:>24} {result['median_ms']:>10.2f} {result['median_ms'] * 1000 / args.page_size:>8.2f}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
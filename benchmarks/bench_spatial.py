@@ -0,0 +1,96 @@
+"""
+Measure the robot position queries of GET /robots/nearby and /robots/within-bbox.
+
+Fleets of random robots spread over a square site are loaded into the latest-state
+store, and each query is answered both by its spatial grid and by a linear scan of
+every robot's state, which is what a client pulling the whole fleet has to do.
+The cost the index adds to merging a flush of moved robots is reported as well.
+
+Usage:
+    python -m benchmarks.bench_spatial --robots 1000 10000 100000 --site 5000
+"""
+
+import argparse
+import heapq
+import math
+import random
+import time
+
+from app.telemetry import RobotStateStore
+from benchmarks.common import measure
+
+
+def scan_nearest(store: RobotStateStore, x: float, y: float, limit: int, radius=None, state=None) -> list:
+    """Answer a nearby query by computing the distance of every robot."""
+    candidates = ((math.hypot(row[2] - x, row[3] - y), row) for row in store.rows() if state is None or row[5] == state)
+    if radius is not None:
+        candidates = ((distance, row) for distance, row in candidates if distance <= radius)
+    return heapq.nsmallest(limit, candidates, key=lambda candidate: (candidate[0], candidate[1][0]))
+
+
+def scan_bbox(store: RobotStateStore, min_x: float, min_y: float, max_x: float, max_y: float) -> list:
+    """Answer a box query by testing every robot."""
+    return [row for row in store.rows() if min_x <= row[2] <= max_x and min_y <= row[3] <= max_y]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--site", type=float, default=5_000.0, help="side of the square site, in meters")
+    parser.add_argument("--cell-size", type=float, default=25.0)
+    parser.add_argument("--radius", type=float, default=100.0)
+    parser.add_argument("--box", type=float, default=250.0, help="side of the queried boxes")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'robots':>8} {'query':>22} {'grid ms':>9} {'scan ms':>9} {'speedup':>8}")
+    for robots in args.robots:
+        rng = random.Random(robots)
+        store = RobotStateStore(cell_size=args.cell_size)
+        store.merge(
+            (robot_id, 0, rng.uniform(0, args.site), rng.uniform(0, args.site), 100.0, rng.choice(("idle", "moving")))
+            for robot_id in range(1, robots + 1)
+        )
+        store.rows()  # the scan reads the cached rows, as GET /robots/state does
+
+        def location():
+            return rng.uniform(0, args.site), rng.uniform(0, args.site)
+
+        def box():
+            x, y = rng.uniform(0, args.site - args.box), rng.uniform(0, args.site - args.box)
+            return x, y, x + args.box, y + args.box
+
+        queries = {
+            "nearest 10": (
+                lambda: store.nearest(*location(), 10),
+                lambda: scan_nearest(store, *location(), 10),
+            ),
+            "nearest idle": (
+                lambda: store.nearest(*location(), 1, state="idle"),
+                lambda: scan_nearest(store, *location(), 1, state="idle"),
+            ),
+            f"within {args.radius:g} m": (
+                lambda: store.nearest(*location(), 1_000, radius=args.radius),
+                lambda: scan_nearest(store, *location(), 1_000, radius=args.radius),
+            ),
+            f"bbox {args.box:g} m": (lambda: store.within_bbox(*box()), lambda: scan_bbox(store, *box())),
+        }
+        for name, (grid_query, scan_query) in queries.items():
+            grid = measure(grid_query, args.repeat)
+            scan = measure(scan_query, max(5, args.repeat // 20))
+            speedup = scan["median_ms"] / grid["median_ms"]
+            print(f"{robots:>8} {name:>22} {grid['median_ms']:>9.3f} {scan['median_ms']:>9.3f} {speedup:>7.0f}x")
+
+        # A flush moving every robot a few meters, as telemetry does
+        flush = [
+            (robot_id, 1, x + rng.uniform(-5, 5), y + rng.uniform(-5, 5), 99.0, "moving")
+            for robot_id, _, x, y, _, _ in store.rows()
+        ]
+        start = time.perf_counter()
+        store.merge(flush)
+        per_robot = (time.perf_counter() - start) / robots * 1e6
+        print(f"{robots:>8} {'merge (with index)':>22} {per_robot:>8.2f} us per moved robot")
+
+
+if __name__ == "__main__":
+    main()
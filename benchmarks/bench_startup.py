@@ -0,0 +1,206 @@
+"""
+Measure the startup time and the throughput per core of the production server.
+
+Startup is measured three ways, each a median over fresh interpreters: importing
+`app.main` as it is now, importing it together with the NumPy and APScheduler
+modules it defers until they are used (the cost of the import before it went
+lazy), and the time from launching a server to its first answered request, for
+a single uvicorn process and for `python -m app.serve`.
+
+Throughput runs `python -m app.serve` with 1, 2, 4... workers on a synthetic
+fleet and drives it over HTTP with client processes sending the read requests
+of `benchmarks.bench_load.ROUTES` for a fixed time. Requests per second per
+worker stay flat as long as each worker has a core of its own; the client
+processes need cores as well, so leave some free or run them on another machine.
+
+Usage:
+    python -m benchmarks.bench_startup --workers 1 2 4 --clients 2 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+
+from benchmarks.bench_load import ROUTES, Picker, summarize
+from benchmarks.common import make_session_factory
+from benchmarks.fleet import generate_fleet
+
+# Prints the time one import takes in a fresh interpreter
+IMPORT_SCRIPT = "import time; start = time.perf_counter(); {imports}; print(time.perf_counter() - start)"
+
+# Modules that importing `app.main` no longer loads until they are used
+DEFERRED_IMPORTS = "import numpy, apscheduler.schedulers.asyncio, apscheduler.jobstores.sqlalchemy"
+
+# The read requests of the load-test mix: writes would measure SQLite's single writer, not the workers
+READ_ROUTES = tuple(route for route in ROUTES if route[0].startswith("GET "))
+
+
+def free_port() -> int:
+    """Return a TCP port that is free on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def import_seconds(imports: str, env: dict, repeat: int) -> float:
+    """Return the median time fresh interpreters take to run `imports`."""
+    samples = []
+    for _ in range(repeat):
+        script = IMPORT_SCRIPT.format(imports=imports)
+        output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+        samples.append(float(output.stdout))
+    return statistics.median(samples)
+
+
+def start_server(command: list[str], env: dict, port: int, timeout: float = 60.0) -> tuple[subprocess.Popen, float]:
+    """
+    Launch a server and wait until it answers.
+
+    Args:
+        command (list[str]): The server command line.
+        env (dict): Its environment.
+        port (int): The port it listens on.
+        timeout (float): Seconds to wait before giving up.
+
+    Returns:
+        tuple: The server process and the seconds until it answered its first request.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    while time.perf_counter() - start < timeout:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/", timeout=1.0).status_code == 200:
+                return process, time.perf_counter() - start
+        except httpx.TransportError:
+            time.sleep(0.01)
+    process.kill()
+    raise RuntimeError(f"{' '.join(command)} did not answer within {timeout} s")
+
+
+def stop_server(process: subprocess.Popen):
+    """Stop a server gracefully, as a deployment does."""
+    process.terminate()
+    process.wait(timeout=60)
+
+
+def serve_command(port: int, workers: int) -> list[str]:
+    """Return the command line of the production server."""
+    return [sys.executable, "-m", "app.serve", "--bind", f"127.0.0.1:{port}", "--workers", str(workers)]
+
+
+def drive(base_url: str, robots: int, missions: int, concurrency: int, duration: float, seed: int) -> tuple:
+    """
+    Client process: send read requests for `duration` seconds over `concurrency` connections.
+
+    Returns:
+        tuple: The latency of every request in milliseconds, and the number of errors.
+    """
+    picker = Picker(robots, missions, seed)
+    names = [name for name, _, _ in READ_ROUTES]
+    builders = {name: builder for name, _, builder in READ_ROUTES}
+    weights = [weight for _, weight, _ in READ_ROUTES]
+    latencies, errors = [], 0
+
+    async def connection(client: httpx.AsyncClient, deadline: float):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            _, path, _ = builders[picker.rng.choices(names, weights)[0]](picker)
+            start = time.perf_counter()
+            try:
+                failed = (await client.get(path)).status_code >= 400
+            except httpx.TransportError:
+                failed = True
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += failed
+
+    async def run():
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+            deadline = time.perf_counter() + duration
+            await asyncio.gather(*(connection(client, deadline) for _ in range(concurrency)))
+
+    asyncio.run(run())
+    return latencies, errors
+
+
+def throughput(args, env: dict, workers: int) -> dict:
+    """Serve the fleet with `workers` workers and return the throughput and latency of the read mix."""
+    port = free_port()
+    process, _ = start_server(serve_command(port, workers), env, port)
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        with ProcessPoolExecutor(args.clients) as pool:
+            # Warm every worker's caches and connections first
+            warmups = [pool.submit(drive, base_url, args.robots, args.missions, 4, 2.0, n) for n in range(args.clients)]
+            for warmup in warmups:
+                warmup.result()
+            start = time.perf_counter()
+            runs = [
+                pool.submit(drive, base_url, args.robots, args.missions, args.concurrency, args.duration, 100 + n)
+                for n in range(args.clients)
+            ]
+            results = [run.result() for run in runs]
+            elapsed = time.perf_counter() - start
+    finally:
+        stop_server(process)
+    latencies = [latency for run_latencies, _ in results for latency in run_latencies]
+    return summarize(latencies, sum(errors for _, errors in results), elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=1_000)
+    parser.add_argument("--missions", type=int, default=100_000)
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, *(2**n for n in range(1, cores.bit_length()) if 2**n <= cores), cores})
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--clients", type=int, default=2, help="load-generating processes")
+    parser.add_argument("--concurrency", type=int, default=32, help="connections per client process")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per worker count")
+    parser.add_argument("--repeat", type=int, default=5, help="launches per startup measurement")
+    args = parser.parse_args()
+
+    engine, _ = make_session_factory()
+    generate_fleet(engine, robots=args.robots, missions=args.missions)
+    env = {**os.environ, "DATABASE_URL": str(engine.url), "PYTHONPATH": os.getcwd()}
+    engine.dispose()
+
+    lazy = import_seconds("import app.main", env, args.repeat)
+    eager = import_seconds(f"import app.main; {DEFERRED_IMPORTS}", env, args.repeat)
+    print(f"import app.main: {lazy * 1000:.0f} ms; with the deferred imports: {eager * 1000:.0f} ms")
+
+    launches = [
+        ("uvicorn, one process", lambda port: [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)]),
+        ("app.serve, one worker", lambda port: serve_command(port, 1)),
+    ]
+    if cores > 1:
+        launches.append((f"app.serve, {cores} workers", lambda port: serve_command(port, cores)))
+    for name, command in launches:
+        samples = []
+        for _ in range(args.repeat):
+            port = free_port()
+            process, seconds = start_server(command(port), env, port)
+            stop_server(process)
+            samples.append(seconds)
+        print(f"first response, {name}: {statistics.median(samples) * 1000:.0f} ms")
+
+    print(f"\n{cores} cores; {args.clients} client processes of {args.concurrency} connections")
+    print(f"{'workers':>7} {'req/s':>8} {'req/s/worker':>12} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for workers in args.workers:
+        result = throughput(args, env, workers)
+        print(
+            f"{workers:>7} {result['rps']:>8.0f} {result['rps'] / workers:>12.0f} "
+            f"{result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Measure serving the fleet statistics of GET /stats.
+
+The incremental counters of `app.stats.FleetStats` are compared with computing the
+same counts with GROUP BY queries over the whole `missions` table on every request.
+The cost the counters add to each write and the cost of one reconciliation are
+reported as well.
+
+Usage:
+    python -m benchmarks.bench_stats --robots 1000 --missions 1000000
+"""
+
+import argparse
+import time
+
+from app.crud.stats import aggregate_mission_stats, get_mission_counts
+from app.stats import FleetStats
+from benchmarks.common import make_session_factory, measure, seed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=1_000)
+    parser.add_argument("--missions", type=int, default=1_000_000)
+    parser.add_argument("--writes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine, Session = make_session_factory()
+    seed(engine, robots=args.robots, missions=args.missions)
+    stats = FleetStats()
+
+    with Session() as db:
+        reconcile = measure(lambda: stats.replace(*get_mission_counts(db)), repeat=3)
+        incremental = measure(stats.snapshot, repeat=50)
+        # A reassignment invalidates the per-robot and per-model lists, which are then rebuilt
+        rebuilt = measure(lambda: (stats.missions_moved([(1, 2)]), stats.snapshot()), repeat=50)
+        aggregate = measure(lambda: aggregate_mission_stats(db), repeat=5)
+
+    start = time.perf_counter()
+    for number in range(args.writes):
+        stats.status_changed("pending", "queued")
+        stats.missions_moved([(number % args.robots + 1, (number + 1) % args.robots + 1)])
+    per_write = (time.perf_counter() - start) / (2 * args.writes) * 1e6
+
+    print(f"{args.missions} missions on {args.robots} robots")
+    print(f"{'GET /stats source':>24} {'median ms':>10} {'p95 ms':>8}")
+    for name, timing in (
+        ("incremental counters", incremental),
+        ("counters after a write", rebuilt),
+        ("GROUP BY per request", aggregate),
+    ):
+        print(f"{name:>24} {timing['median_ms']:>10.3f} {timing['p95_ms']:>8.3f}")
+    print(f"reconciliation (aggregate and swap): {reconcile['median_ms']:.1f} ms")
+    print(f"counter update added to a write: {per_write:.2f} us")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
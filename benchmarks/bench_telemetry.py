@@ -0,0 +1,132 @@
+"""
+Measure sustained telemetry ingest through POST /api/v1/telemetry/.
+
+Concurrent clients post batches of samples from a fleet of robots for a fixed
+time. The write-behind buffer is compared with writing every batch inside its own
+request, which is what the buffer does when its background task is not running.
+Stored rows/sec counts only samples committed to the database, including the
+final flush on shutdown.
+
+Usage:
+    python -m benchmarks.bench_telemetry --robots 500 --batch 50 --concurrency 50 --seconds 10
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+
+import httpx
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.crud import async_telemetry as crud
+from app.db.async_base import to_async_url
+from app.main import app
+from app.models.telemetry import Telemetry as TelemetryModel
+from app.telemetry import TelemetryBuffer, get_telemetry_buffer
+from benchmarks.common import make_session_factory, percentile
+
+
+async def ingest(buffered, robots, batch, concurrency, seconds, flush_rows, flush_interval):
+    """Drive the ingest endpoint for `seconds` and return throughput figures."""
+    engine, _ = make_session_factory()
+    async_engine = create_async_engine(to_async_url(str(engine.url)))
+    AsyncSessionLocal = sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False)
+
+    async def writer(rows):
+        async with AsyncSessionLocal() as db:
+            return await crud.insert_telemetry(db, rows)
+
+    buffer = TelemetryBuffer(writer, flush_rows=flush_rows, flush_interval=flush_interval, max_pending=1_000_000)
+    app.dependency_overrides[get_telemetry_buffer] = lambda: buffer
+    if buffered:
+        await buffer.start()
+
+    samples = itertools.count()
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + seconds
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def worker():
+                nonlocal errors
+                while time.perf_counter() < deadline:
+                    points = []
+                    for _ in range(batch):
+                        n = next(samples)
+                        robot_id = n % robots + 1
+                        points.append(
+                            {
+                                "robot_id": robot_id,
+                                "ts": n // robots * 100,
+                                "x": n * 0.1,
+                                "y": n * 0.2,
+                                "battery": 80.0,
+                                "state": "moving",
+                            }
+                        )
+                    start = time.perf_counter()
+                    response = await client.post("/api/v1/telemetry/", json=points)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    errors += response.status_code >= 400
+                    # In-process requests never block on a socket; yield as a network client would
+                    await asyncio.sleep(0)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            accepted_elapsed = time.perf_counter() - start
+            await buffer.stop()
+            stored_elapsed = time.perf_counter() - start
+        async with async_engine.connect() as conn:
+            stored = (await conn.execute(select(func.count()).select_from(TelemetryModel.__table__))).scalar()
+        return {
+            "accepted_rps": buffer.received / accepted_elapsed,
+            "stored_rps": stored / stored_elapsed,
+            "stored": stored,
+            "flushes": buffer.flushes,
+            "p50_ms": percentile(latencies, 0.50),
+            "p99_ms": percentile(latencies, 0.99),
+            "errors": errors,
+        }
+    finally:
+        app.dependency_overrides.pop(get_telemetry_buffer, None)
+        await async_engine.dispose()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--flush-rows", type=int, default=5_000)
+    parser.add_argument("--flush-interval-ms", type=int, default=250)
+    args = parser.parse_args()
+
+    print(f"{'mode':>13} {'accepted/s':>11} {'stored/s':>9} {'stored':>9} {'flushes':>8} {'p50 ms':>7} {'p99 ms':>7}")
+    for name, buffered in (("per-request", False), ("write-behind", True)):
+        result = asyncio.run(
+            ingest(
+                buffered,
+                args.robots,
+                args.batch,
+                args.concurrency,
+                args.seconds,
+                args.flush_rows,
+                args.flush_interval_ms / 1000,
+            )
+        )
+        print(
+            f"{name:>13} {result['accepted_rps']:>11.0f} {result['stored_rps']:>9.0f} {result['stored']:>9} "
+            f"{result['flushes']:>8} {result['p50_ms']:>7.1f} {result['p99_ms']:>7.1f}"
+        )
+        if result["errors"]:
+            print(f"{'':>13} {result['errors']} failed requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway SQLite database so they never touch the
+application's own `mission-app.db`.
+"""
+import contextlib
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.schema import create_schema
+from app.models.mission import Mission as MissionModel
+from app.models.robot import Robot as RobotModel
+
+
+def make_session_factory(path=None):
+    """
+    Create an engine and session factory bound to a fresh SQLite file.
+
+    Args:
+        path (str): Optional database file path; a temporary file is used by default.
+
+    Returns:
+        tuple: The engine and a configured `sessionmaker`.
+    """
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix=".db", prefix="bench-")
+        os.close(fd)
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    create_schema(engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def seed(engine, robots, missions, batch_size=50_000):
+    """
+    Fill the database with synthetic robots and missions using executemany inserts.
+
+    Args:
+        engine: The SQLAlchemy engine to write to.
+        robots (int): The number of robots to create.
+        missions (int): The number of missions to create, spread evenly over the first
+            `robots` robot IDs (all on robot 1 when `robots` is 0).
+        batch_size (int): The number of rows sent per executemany call.
+    """
+    with engine.begin() as conn:
+        for start in range(0, robots, batch_size):
+            rows = [
+                {"name": f"robot-{i}", "model_name": f"model-{i % 7}"}
+                for i in range(start, min(start + batch_size, robots))
+            ]
+            conn.execute(RobotModel.__table__.insert(), rows)
+        for start in range(0, missions, batch_size):
+            rows = [
+                {"name": f"mission-{i}", "description": f"synthetic mission {i}", "robot_id": i % max(robots, 1) + 1}
+                for i in range(start, min(start + batch_size, missions))
+            ]
+            conn.execute(MissionModel.__table__.insert(), rows)
+
+
+def measure(fn, repeat=20):
+    """
+    Time repeated calls of `fn`.
+
+    Args:
+        fn (callable): The zero-argument function to time.
+        repeat (int): The number of timed calls.
+
+    Returns:
+        dict: The median and p95 wall time in milliseconds.
+    """
+    fn()  # warm up caches and the connection
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": statistics.median(samples),
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+def percentile(samples, fraction):
+    """
+    Return the nearest-rank percentile of a list of samples.
+
+    Args:
+        samples (list[float]): The samples; they are sorted in place.
+        fraction (float): The percentile as a fraction, e.g. 0.99.
+
+    Returns:
+        float: The sample at that rank, or 0.0 for an empty list.
+    """
+    if not samples:
+        return 0.0
+    samples.sort()
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+async def run_load(app, paths, concurrency, requests):
+    """
+    Drive an ASGI app in-process with concurrent clients and collect latencies.
+
+    Args:
+        app: The ASGI application.
+        paths (callable): Called with the request number; returns the path to GET.
+        concurrency (int): The number of concurrent clients.
+        requests (int): The total number of requests to send.
+
+    Returns:
+        dict: Requests per second, p50/p99 latency in milliseconds and the error count.
+    """
+    import asyncio
+
+    import httpx
+
+    latencies, errors = [], 0
+    counter = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            nonlocal errors
+            for number in counter:
+                start = time.perf_counter()
+                response = await client.get(paths(number))
+                latencies.append((time.perf_counter() - start) * 1000)
+                errors += response.status_code >= 400
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.50),
+        "p99_ms": percentile(latencies, 0.99),
+        "errors": errors,
+    }
+
+
+@contextlib.asynccontextmanager
+async def bind_async_app(app, engine):
+    """
+    Point the app's async session dependency at the benchmark database.
+
+    The async engine's pool is bound to the running event loop, so it is built and
+    disposed inside the caller's loop. It is configured like the application's
+    engine: SQLite connections use WAL journaling and wait on locks, so concurrent
+    writes queue up instead of failing.
+
+    Args:
+        app: The FastAPI application.
+        engine: The synchronous benchmark engine whose database should be used.
+
+    Yields:
+        The app, with `get_async_db` overridden.
+    """
+    from dataclasses import replace
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.db.async_base import to_async_url
+    from app.db.base import configure_engine, settings
+    from app.db.session import get_async_db
+
+    async_engine = create_async_engine(to_async_url(str(engine.url)))
+    configure_engine(async_engine.sync_engine, replace(settings, url=str(engine.url)))
+    AsyncSessionLocal = sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False)
+
+    async def get_bench_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = get_bench_async_db
+    try:
+        yield app
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+        await async_engine.dispose()
@@ -0,0 +1,148 @@
+"""
+Generate a synthetic fleet of robots and missions, fast and reproducibly.
+
+The rows are produced inside SQLite by `INSERT ... SELECT` over a recursive
+sequence, so no row crosses into Python. The indexes and triggers of both tables,
+the full-text index's included, are dropped during the load and rebuilt once at
+the end, which takes half as long as maintaining them row by row: ten thousand
+robots and five million missions take about 75 seconds, a million missions 13.
+Generate a large fleet once with `--path` and reuse the file.
+
+Every value is derived from the row number, so two databases generated with the
+same arguments are identical:
+
+- robots are named `robot-<n>` and spread over `--models` models;
+- missions are spread evenly over the robots by a multiplicative hash, with a
+  status mix of 60% done, 5% failed, 15% pending, 10% queued, 5% assigned and 5%
+  running, priorities from 0 to 9, and the timestamps of every step they reached.
+
+Usage:
+    python -m benchmarks.fleet --robots 10000 --missions 5000000 --path fleet.db
+"""
+
+import argparse
+import time
+
+from sqlalchemy import text
+
+from benchmarks.common import make_session_factory
+
+# Timestamp of the first generated mission, in milliseconds since the Unix epoch
+START_MS = 1_700_000_000_000
+
+# Rows inserted per statement
+CHUNK_SIZE = 1_000_000
+
+ROBOTS_SQL = """
+WITH RECURSIVE seq(n) AS (SELECT :first UNION ALL SELECT n + 1 FROM seq WHERE n < :last)
+INSERT INTO robots (id, name, model_name, version)
+SELECT n, 'robot-' || n, 'model-' || (n % :models), 1 FROM seq
+"""
+
+MISSIONS_SQL = """
+WITH RECURSIVE seq(n) AS (SELECT :first UNION ALL SELECT n + 1 FROM seq WHERE n < :last),
+hashed(n, h) AS (SELECT n, (n * 2654435761) >> 16 & 1023 FROM seq),
+statuses(n, h, status) AS (
+    SELECT n, h,
+        CASE
+            WHEN h % 100 < 60 THEN 'done'
+            WHEN h % 100 < 65 THEN 'failed'
+            WHEN h % 100 < 80 THEN 'pending'
+            WHEN h % 100 < 90 THEN 'queued'
+            WHEN h % 100 < 95 THEN 'assigned'
+            ELSE 'running'
+        END
+    FROM hashed
+)
+INSERT INTO missions (
+    id, name, description, robot_id, version, priority, status, queued_at, assigned_at, started_at, finished_at
+)
+SELECT
+    n,
+    'mission-' || n,
+    'synthetic mission ' || n,
+    n * 40503 % :robots + 1,
+    1,
+    h / 100 % 10,
+    status,
+    CASE WHEN status <> 'pending' THEN :start + n * 1000 END,
+    CASE WHEN status IN ('assigned', 'running', 'done', 'failed') THEN :start + n * 1000 + 5000 END,
+    CASE WHEN status IN ('running', 'done', 'failed') THEN :start + n * 1000 + 10000 END,
+    CASE WHEN status IN ('done', 'failed') THEN :start + n * 1000 + 60000 END
+FROM statuses
+"""
+
+
+def _insert_sequence(conn, statement: str, count: int, **params):
+    """Run a sequence-generating INSERT over row numbers 1..count, one chunk per statement."""
+    for first in range(1, count + 1, CHUNK_SIZE):
+        conn.execute(text(statement), {"first": first, "last": min(first + CHUNK_SIZE - 1, count), **params})
+
+
+def generate_fleet(engine, robots: int, missions: int, models: int = 7, start_ms: int = START_MS) -> dict:
+    """
+    Fill an empty SQLite database with a synthetic fleet.
+
+    Args:
+        engine (Engine): An engine on a SQLite database whose schema was created
+            with `Base.metadata.create_all` and whose robots and missions tables are empty.
+        robots (int): The number of robots.
+        missions (int): The number of missions.
+        models (int): The number of robot models.
+        start_ms (int): The queue time of mission 1; mission n was queued n seconds later.
+
+    Returns:
+        dict: Seconds spent inserting the rows and rebuilding the indexes.
+
+    Raises:
+        ValueError: If the engine is not on SQLite.
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError("The fleet generator writes its rows with SQLite SQL")
+    timings = {}
+    with engine.begin() as conn:
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        deferred = conn.execute(
+            text(
+                "SELECT type, name, sql FROM sqlite_master "
+                "WHERE type IN ('index', 'trigger') AND tbl_name IN ('robots', 'missions') AND sql IS NOT NULL"
+            )
+        ).all()
+        for kind, name, _ in deferred:
+            conn.exec_driver_sql(f"DROP {kind.upper()} {name}")
+
+        start = time.perf_counter()
+        _insert_sequence(conn, ROBOTS_SQL, robots, models=models)
+        _insert_sequence(conn, MISSIONS_SQL, missions, robots=max(robots, 1), start=start_ms)
+        timings["insert_seconds"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _, _, sql in deferred:
+            conn.exec_driver_sql(sql)
+        if conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'missions_fts'")).first():
+            conn.exec_driver_sql("INSERT INTO missions_fts(missions_fts) VALUES ('rebuild')")
+        timings["index_seconds"] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=10_000)
+    parser.add_argument("--missions", type=int, default=5_000_000)
+    parser.add_argument("--models", type=int, default=7)
+    parser.add_argument("--path", help="database file to create (default: a temporary file)")
+    args = parser.parse_args()
+
+    engine, _ = make_session_factory(args.path)
+    timings = generate_fleet(engine, args.robots, args.missions, models=args.models)
+    total = timings["insert_seconds"] + timings["index_seconds"]
+    print(
+        f"{args.robots} robots and {args.missions} missions in {engine.url.database}: "
+        f"{timings['insert_seconds']:.1f} s inserting, {timings['index_seconds']:.1f} s indexing, "
+        f"{(args.robots + args.missions) / total:,.0f} rows/s"
+    )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
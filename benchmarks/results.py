@@ -0,0 +1,169 @@
+"""
+Machine-readable benchmark results, and their comparison with a baseline.
+
+A results file is JSON with the environment the benchmarks ran in and one entry
+per benchmark, each a flat mapping of metric names to numbers:
+
+    {
+      "meta": {"created_at": "...", "git_commit": "...", "python": "...", "params": {...}},
+      "benchmarks": {
+        "crud.get_mission": {"median_ms": 0.21, "p95_ms": 0.35},
+        "load.GET /api/v1/missions/{mission_id}": {"rps": 812.0, "p50_ms": 9.1, "p95_ms": 14.2, ...}
+      }
+    }
+
+The metrics in `COMPARED_METRICS` are compared with the baseline. Tail latencies
+(p99) are recorded but not compared: a few hundred samples per route make them
+too noisy to flag regressions on.
+
+Usage:
+    python -m benchmarks.results bench-results.json baseline.json --tolerance 0.2
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sqlite3
+import subprocess
+import sys
+
+import sqlalchemy
+
+# Metrics compared with the baseline, and whether higher values are better
+COMPARED_METRICS = {"median_ms": False, "p50_ms": False, "p95_ms": False, "rps": True}
+
+
+def environment(params: dict) -> dict:
+    """
+    Describe the environment a benchmark run happened in.
+
+    Args:
+        params (dict): The parameters of the run, e.g. the fleet size.
+
+    Returns:
+        dict: The time, git commit, interpreter, SQLAlchemy and SQLite versions,
+        platform and parameters.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "params": params,
+    }
+
+
+def write_results(path: str, benchmarks: dict, params: dict):
+    """
+    Write a results file.
+
+    Args:
+        path (str): The file to write.
+        benchmarks (dict): Metrics per benchmark name.
+        params (dict): The parameters of the run.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"meta": environment(params), "benchmarks": benchmarks}, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def load_results(path: str) -> dict:
+    """Read a results file."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.2, noise_ms: float = 0.05) -> list[dict]:
+    """
+    Compare every metric measured in both runs.
+
+    A metric regressed if it got worse by more than `tolerance`, relative to the
+    baseline; latencies must also have grown by more than `noise_ms`, so that
+    sub-millisecond jitter is not reported.
+
+    Args:
+        current (dict): The results of the run being checked.
+        baseline (dict): The results it is compared with.
+        tolerance (float): The relative change allowed, e.g. 0.2 for 20%.
+        noise_ms (float): Latency changes ignored regardless of their relative size.
+
+    Returns:
+        list[dict]: One row per compared metric, with the benchmark, metric,
+        baseline and current values, relative change and whether it regressed.
+    """
+    rows = []
+    for name, metrics in sorted(current["benchmarks"].items()):
+        base_metrics = baseline["benchmarks"].get(name, {})
+        for metric, value in sorted(metrics.items()):
+            base = base_metrics.get(metric)
+            if not base or metric not in COMPARED_METRICS:
+                continue
+            change = (value - base) / base
+            if COMPARED_METRICS[metric]:
+                regressed = change < -tolerance
+            else:
+                regressed = change > tolerance and value - base > noise_ms
+            rows.append(
+                {
+                    "benchmark": name,
+                    "metric": metric,
+                    "baseline": base,
+                    "current": value,
+                    "change": change,
+                    "regressed": regressed,
+                }
+            )
+    return rows
+
+
+def format_comparison(rows: list[dict]) -> str:
+    """Format compared metrics as a table, regressions marked."""
+    width = max((len(row["benchmark"]) for row in rows), default=9)
+    lines = [f"{'benchmark':<{width}} {'metric':>8} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for row in rows:
+        lines.append(
+            f"{row['benchmark']:<{width}} {row['metric']:>8} {row['baseline']:>10.3f} {row['current']:>10.3f} "
+            f"{row['change']:>+8.1%}{'  REGRESSED' if row['regressed'] else ''}"
+        )
+    return "\n".join(lines)
+
+
+def check_baseline(current: dict, baseline_path: str, tolerance: float) -> bool:
+    """
+    Print the comparison of a run with a baseline file.
+
+    Args:
+        current (dict): The results of the run.
+        baseline_path (str): The baseline results file.
+        tolerance (float): The relative change allowed.
+
+    Returns:
+        bool: True if no metric regressed.
+    """
+    rows = compare(current, load_results(baseline_path), tolerance)
+    print(format_comparison(rows))
+    regressions = sum(row["regressed"] for row in rows)
+    print(f"{regressions} of {len(rows)} metrics regressed by more than {tolerance:.0%}")
+    return not regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("results")
+    parser.add_argument("baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+    sys.exit(0 if check_baseline(load_results(args.results), args.baseline, args.tolerance) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Run the benchmark suite and check it against a baseline.
+
+Generates a synthetic fleet (or reuses one), times the `app.crud` functions, load
+tests the application with a weighted request mix, and writes every metric to a
+JSON results file. Given a baseline results file, e.g. one written on the main
+branch, it prints the change of every latency and throughput and exits with
+status 1 if any regressed by more than the tolerance.
+
+Usage:
+    python -m benchmarks.suite --fleet fleet.db --output bench-results.json
+    python -m benchmarks.suite --fleet fleet.db --baseline baseline.json
+
+The fleet file is generated on the first run and reused afterwards, so keep the
+same `--robots` and `--missions` for runs that are compared. Results are only
+comparable between runs on the same machine.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from benchmarks import bench_crud, bench_load
+from benchmarks.common import make_session_factory
+from benchmarks.fleet import generate_fleet
+from benchmarks.results import check_baseline, load_results, write_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=10_000)
+    parser.add_argument("--missions", type=int, default=5_000_000)
+    parser.add_argument("--fleet", help="fleet database file, generated if it does not exist (default: temporary)")
+    parser.add_argument("--repeat", type=int, default=200, help="timed calls per crud function")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--baseline", help="results file to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    generate = args.fleet is None or not os.path.exists(args.fleet)
+    engine, Session = make_session_factory(args.fleet)
+    if generate:
+        timings = generate_fleet(engine, robots=args.robots, missions=args.missions)
+        print(f"Generated the fleet in {timings['insert_seconds'] + timings['index_seconds']:.1f} s")
+
+    benchmarks = {}
+    crud_results = bench_crud.run(Session, args.robots, args.missions, repeat=args.repeat)
+    benchmarks.update((f"crud.{name}", metrics) for name, metrics in crud_results.items())
+    load_results_ = asyncio.run(bench_load.run(engine, args.robots, args.missions, args.concurrency, args.requests))
+    bench_load.print_results(load_results_)
+    benchmarks.update((f"load.{name}", metrics) for name, metrics in load_results_.items())
+    engine.dispose()
+
+    params = {key: value for key, value in vars(args).items() if key not in ("output", "baseline", "fleet")}
+    write_results(args.output, benchmarks, params)
+    print(f"Wrote {len(benchmarks)} benchmarks to {args.output}")
+    if args.baseline and not check_baseline(load_results(args.output), args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+import pytest
+
+from app.db.schema import create_schema
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database_schema():
+    """Create the schema once per run, as the application's startup does; most tests use TestClient without it."""
+    create_schema()
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app  # Import the FastAPI app
+from app.cache import mission_cache
+from app.cache.backends import MemoryCache, RedisCache
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """In-memory stand-in for the `redis.Redis` calls made by `RedisCache`, recording calling threads."""
+
+    def __init__(self):
+        self.data = {}
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self.threads.append(threading.get_ident())
+        self.data[key] = value.encode()
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in self.data if key.startswith(match.rstrip("*"))]
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Fixture for setting up the FastAPI test client.
+
+    Creates a new `TestClient` instance for making HTTP requests to
+    the FastAPI application.
+    """
+    return TestClient(app)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """
+    Test case for the LRU bound of the in-process cache.
+
+    Fills a two-entry cache, touches the oldest entry and adds a third one. Verifies
+    that the untouched entry is evicted and counted.
+    """
+    cache = MemoryCache(max_entries=2, ttl=60)
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+    assert cache.get("a") == {"id": 1}
+    cache.set("c", {"id": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"id": 1}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_cache_expires_entries():
+    """
+    Test case for the TTL of the in-process cache.
+
+    Verifies that an entry is served before its TTL elapses and treated as a miss
+    afterwards.
+    """
+    clock = FakeClock()
+    cache = MemoryCache(max_entries=10, ttl=5, clock=clock)
+    cache.set("a", {"id": 1})
+    clock.now = 4.9
+    assert cache.get("a") == {"id": 1}
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_read_mission_served_from_cache_and_refreshed_on_update(client):
+    """
+    Test case for the read-through mission cache.
+
+    Reads a mission twice and verifies the second read is a cache hit, then updates
+    it and verifies the next read returns the new data.
+    """
+    mission_id = client.post("/api/v1/missions/", json={"name": "Cached", "description": "C", "robot_id": 1}).json()["id"]
+    mission_cache.invalidate([mission_id])
+    client.get(f"/api/v1/missions/{mission_id}")
+    hits = mission_cache.stats()["hits"]
+    assert client.get(f"/api/v1/missions/{mission_id}").json()["name"] == "Cached"
+    assert mission_cache.stats()["hits"] == hits + 1
+
+    client.put(f"/api/v1/missions/{mission_id}", json={"name": "Recached", "description": "C", "robot_id": 1})
+    assert client.get(f"/api/v1/missions/{mission_id}").json()["name"] == "Recached"
+
+    response = client.get("/api/v1/metrics/cache")
+    assert response.status_code == 200
+    assert response.json()["mission"]["hits"] >= hits + 2
+
+
+def test_redis_cache_keeps_network_calls_off_the_event_loop():
+    """
+    Test case for the Redis cache backend with a fake client.
+
+    Verifies that writes are applied by the background writer, that `aget` runs the
+    lookup in a worker thread rather than on the event loop's thread, and that hits,
+    misses and deletes behave like the in-process backend.
+    """
+    client = FakeRedis()
+    cache = RedisCache(client=client, ttl=5)
+    cache.set("mission:1", {"id": 1})
+    cache.drain()
+    assert client.threads[-1] != threading.get_ident()
+
+    async def read(key):
+        return threading.get_ident(), await cache.aget(key)
+
+    loop_thread, value = asyncio.run(read("mission:1"))
+    assert value == {"id": 1}
+    assert client.threads[-1] != loop_thread
+
+    cache.delete("mission:1")
+    cache.drain()
+    assert asyncio.run(read("mission:1"))[1] is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
@@ -0,0 +1,188 @@
+import asyncio
+import queue
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app  # Import the FastAPI app
+from app.api.api_v1.endpoints.changes import feed_messages, sse_frame
+from app.events import Broadcaster, RedisEventBackend, SubscriptionLagged, broadcaster
+
+
+class FakeRedis:
+    """In-memory stand-in for the `redis.Redis` calls made by `RedisEventBackend`, recording calling threads."""
+
+    def __init__(self):
+        self.counters = {}
+        self.messages = queue.SimpleQueue()
+        self.threads = []
+
+    def register_script(self, script):
+        assert "INCR" in script and "PUBLISH" in script
+
+        def run(keys, args):
+            # Mirrors PUBLISH_SCRIPT; runs atomically like the script does on the server
+            self.threads.append(threading.get_ident())
+            seq = self.counters[keys[0]] = self.counters.get(keys[0], 0) + 1
+            self.messages.put({"type": "message", "channel": keys[1], "data": f'{{"seq":{seq},{args[0]}'})
+            return seq
+
+        return run
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        fake = self
+
+        class PubSub:
+            def subscribe(self, channel):
+                pass
+
+            def listen(self):
+                while True:
+                    yield fake.messages.get()
+
+        return PubSub()
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Fixture to provide a TestClient instance for testing."""
+    return TestClient(app)
+
+
+def test_subscription_filters_and_replay():
+    """Test per-robot filtering and resuming from a sequence number.
+
+    Publishes changes for two robots, then subscribes for one robot since the first
+    event. Verifies only that robot's buffered changes are replayed, followed by live ones.
+    """
+    feed = Broadcaster(buffer_size=10)
+    feed.publish("robot", "created", {"id": 1, "name": "R1"})
+    feed.publish("mission", "created", {"id": 10, "robot_id": 2})
+    feed.publish("mission", "created", {"id": 11, "robot_id": 1})
+
+    async def scenario():
+        subscription = feed.subscribe(robot_id=1, since=1)
+        feed.publish("mission", "updated", {"id": 12, "robot_id": 1})
+        return [(await subscription.get()).seq for _ in range(2)], subscription.gap
+
+    assert asyncio.run(scenario()) == ([3, 4], False)
+
+
+def test_subscription_gap_after_buffer_overrun():
+    """Test that resuming from an evicted sequence number is flagged as a gap."""
+    feed = Broadcaster(buffer_size=2)
+    for mission_id in range(5):
+        feed.publish("mission", "created", {"id": mission_id, "robot_id": 1})
+
+    async def scenario():
+        subscription = feed.subscribe(since=1)
+        return subscription.gap, (await subscription.get()).seq
+
+    assert asyncio.run(scenario()) == (True, 4)
+
+
+def test_subscription_ahead_of_feed_is_a_gap():
+    """Test that resuming from a sequence number the feed never reached asks the client to reset."""
+    feed = Broadcaster()
+    feed.publish("mission", "created", {"id": 1, "robot_id": 1})
+
+    async def scenario():
+        subscription = feed.subscribe(since=50)
+        feed.publish("mission", "created", {"id": 2, "robot_id": 1})
+        return subscription.gap, (await subscription.get()).seq
+
+    assert asyncio.run(scenario()) == (True, 2)
+
+
+def test_slow_subscriber_is_dropped_not_blocking():
+    """Test that a full subscriber queue marks the consumer lagged instead of blocking writers."""
+    feed = Broadcaster(queue_size=2)
+
+    async def scenario():
+        subscription = feed.subscribe()
+        for mission_id in range(5):
+            feed.publish("mission", "created", {"id": mission_id, "robot_id": 1})
+        await asyncio.sleep(0)  # let the loop deliver the handed-over events
+        received = [(await subscription.get()).seq for _ in range(2)]
+        with pytest.raises(SubscriptionLagged) as lagged:
+            await subscription.get()
+        feed.unsubscribe(subscription)
+        return received, lagged.value.last_seq
+
+    assert asyncio.run(scenario()) == ([1, 2], 2)
+    assert feed.stats()["lagged"] == 1
+
+
+def test_sse_frames():
+    """Test the Server-Sent Events encoding of change, reset and ping messages."""
+    feed = Broadcaster(buffer_size=1)
+    feed.publish("robot", "created", {"id": 1, "name": "R1"})
+    feed.publish("robot", "updated", {"id": 1, "name": "R2"})
+
+    async def scenario():
+        messages = feed_messages(feed.subscribe(since=0), heartbeat=0.01)
+        return [sse_frame(await messages.__anext__()) for _ in range(3)]
+
+    reset, change, ping = asyncio.run(scenario())
+    assert reset == b'event: reset\ndata: {"type":"reset"}\n\n'
+    assert change.startswith(b'id: 2\ndata: {"type":"change","seq":2,"entity":"robot","action":"updated"')
+    assert ping == b": ping\n\n"
+
+
+def test_websocket_receives_robot_changes(client):
+    """Test that WebSocket clients receive changes made through the API, filtered by robot."""
+    robot_id = client.post("/api/v1/robots/", json={"name": "Watched", "model_name": "Model W"}).json()["id"]
+    with client.websocket_connect(f"/api/v1/changes/ws?robot_id={robot_id}") as websocket:
+        client.post("/api/v1/missions/", json={"name": "Elsewhere", "description": "E", "robot_id": robot_id + 1})
+        mission = client.post(
+            "/api/v1/missions/", json={"name": "Watched mission", "description": "W", "robot_id": robot_id}
+        ).json()
+        client.patch(f"/api/v1/robots/{robot_id}", json={"model_name": "Model W2"})
+
+        created = websocket.receive_json()
+        assert (created["type"], created["entity"], created["action"]) == ("change", "mission", "created")
+        assert created["data"]["id"] == mission["id"]
+        updated = websocket.receive_json()
+        assert (updated["entity"], updated["action"], updated["data"]["model_name"]) == ("robot", "updated", "Model W2")
+        assert updated["seq"] > created["seq"]
+
+    with client.websocket_connect(f"/api/v1/changes/ws?robot_id={robot_id}&since={created['seq'] - 1}") as websocket:
+        assert websocket.receive_json()["seq"] == created["seq"]
+
+    assert broadcaster.stats()["subscribers"] == 0
+
+
+def test_empty_patch_publishes_nothing(client):
+    """Test that a PATCH without fields neither bumps the version nor emits an `updated` change."""
+    mission = client.post("/api/v1/missions/", json={"name": "Idle", "description": "I", "robot_id": 1})
+    before = broadcaster.stats()["seq"]
+    response = client.patch(f"/api/v1/missions/{mission.json()['id']}", json={})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == mission.headers["ETag"]
+    assert broadcaster.stats()["seq"] == before
+
+
+def test_redis_backend_numbers_and_publishes_off_the_caller_thread():
+    """Test the Redis backend against a fake client.
+
+    Publishes through a broadcaster backed by the fake. Verifies that the writer's
+    thread never talks to Redis, that events come back over the channel numbered
+    by the script, and that the broadcaster delivers them in order.
+    """
+    redis_client = FakeRedis()
+    backend = RedisEventBackend(client=redis_client)
+    feed = Broadcaster(backend=backend)
+
+    async def scenario():
+        subscription = feed.subscribe()
+        feed.publish("robot", "created", {"id": 7, "name": "R7"})
+        feed.publish("mission", "created", {"id": 3, "robot_id": 7})
+        backend.drain()
+        return [await asyncio.wait_for(subscription.get(), 5) for _ in range(2)]
+
+    robot, mission = asyncio.run(scenario())
+    assert (robot.seq, robot.entity, robot.data) == (1, "robot", {"id": 7, "name": "R7"})
+    assert (mission.seq, mission.id, mission.robot_id) == (2, 3, 7)
+    assert redis_client.counters == {"missions-app:changes:seq": 2}
+    assert threading.get_ident() not in redis_client.threads
+    assert feed.stats()["seq"] == 2
@@ -0,0 +1,228 @@
+import time
+
+from fastapi.testclient import TestClient
+from app.main import app  # Import the FastAPI app
+from app.scheduler import Dispatcher
+
+
+def test_dispatcher_orders_by_priority_then_age():
+    """
+    Test case for the order in which a robot's due missions are handed out.
+
+    Verifies that higher priorities go first, that equal priorities go oldest first,
+    that removed missions are skipped and that other robots' queues are untouched.
+    """
+    dispatcher = Dispatcher()
+    assert not dispatcher.enqueue(1, robot_id=7, priority=0, queued_at=100)
+    assert not dispatcher.enqueue(2, robot_id=7, priority=5, queued_at=300)
+    assert not dispatcher.enqueue(3, robot_id=7, priority=5, queued_at=200)
+    assert not dispatcher.enqueue(4, robot_id=7, priority=9, queued_at=400)
+    assert not dispatcher.enqueue(5, robot_id=8, priority=9, queued_at=50)
+    assert dispatcher.remove(4)
+
+    assert [dispatcher.next_for(7) for _ in range(4)] == [3, 2, 1, None]
+    assert 5 in dispatcher and len(dispatcher) == 1
+
+
+def test_dispatcher_assigns_idle_robot_immediately():
+    """
+    Test case for a mission becoming due while its robot waits idle.
+
+    Verifies that the mission is assigned on enqueue, and that the robot is busy
+    afterwards so the next mission waits until it asks again.
+    """
+    dispatcher = Dispatcher()
+    assert dispatcher.next_for(3) is None
+    assert dispatcher.enqueue(10, robot_id=3)
+    assert not dispatcher.enqueue(11, robot_id=3)
+    assert dispatcher.next_for(3) == 11
+    assert dispatcher.stats() == {"queued_missions": 0, "idle_robots": 0, "queued": 1, "assigned": 2}
+
+
+def test_dispatcher_requeue_replaces_entry():
+    """Test case for queueing a mission again, e.g. on the next run of a recurring schedule."""
+    dispatcher = Dispatcher()
+    dispatcher.enqueue(1, robot_id=1, priority=0, queued_at=100)
+    dispatcher.enqueue(2, robot_id=1, priority=1, queued_at=200)
+    dispatcher.enqueue(1, robot_id=1, priority=2, queued_at=300)
+    assert [dispatcher.next_for(1) for _ in range(3)] == [1, 2, None]
+
+
+def wait_for_mission(client, robot_id, timeout=5.0):
+    """Ask for work as the robot until a mission is assigned or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.post(f"/api/v1/robots/{robot_id}/ready")
+        if response.status_code == 200:
+            return response.json()
+        assert response.status_code == 204
+        time.sleep(0.05)
+    return None
+
+
+def test_schedule_and_dispatch_missions():
+    """
+    Test case for scheduling missions and dispatching them to their robot.
+
+    Schedules two missions of a fresh robot to run now, with different priorities,
+    and verifies that the robot receives the higher-priority one first, that the
+    assignment is recorded and that one-off schedules are gone once they ran.
+    """
+    with TestClient(app) as client:
+        robot_id = client.post("/api/v1/robots/", json={"name": "Dispatched", "model_name": "Model D"}).json()["id"]
+        low, high = (
+            client.post(
+                "/api/v1/missions/", json={"name": name, "description": "Scheduled", "robot_id": robot_id}
+            ).json()["id"]
+            for name in ("Low", "High")
+        )
+        response = client.put(f"/api/v1/missions/{low}/schedule", json={"priority": 1})
+        assert response.status_code == 200
+        assert response.json()["mission_id"] == low and response.json()["trigger"].startswith("date[")
+        assert client.put(f"/api/v1/missions/{high}/schedule", json={"priority": 5}).status_code == 200
+
+        # Both runs are queued before the robot asks, so priority decides
+        deadline = time.monotonic() + 5
+        while client.get(f"/api/v1/missions/{high}/schedule").status_code == 200 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        while client.get(f"/api/v1/missions/{low}/schedule").status_code == 200 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(0.2)
+
+        first = wait_for_mission(client, robot_id)
+        assert first["id"] == high
+        assert wait_for_mission(client, robot_id)["id"] == low
+        assert client.post(f"/api/v1/robots/{robot_id}/ready").status_code == 204
+        assert client.get("/api/v1/metrics/dispatch").json()["scheduler_running"] is True
+
+
+def test_recurring_schedule_and_validation():
+    """
+    Test case for recurring schedules and rejected schedule requests.
+
+    Verifies that interval and cron schedules report their next run, that they can
+    be cancelled, and that conflicting or malformed schedules and unknown missions
+    are refused.
+    """
+    with TestClient(app) as client:
+        robot_id = client.post("/api/v1/robots/", json={"name": "Recurring", "model_name": "Model R"}).json()["id"]
+        mission_id = client.post(
+            "/api/v1/missions/", json={"name": "Patrol", "description": "Hourly", "robot_id": robot_id}
+        ).json()["id"]
+
+        body = {"start_at": "2999-01-01T00:00:00Z", "interval_seconds": 3600, "priority": 2}
+        response = client.put(f"/api/v1/missions/{mission_id}/schedule", json=body)
+        assert response.status_code == 200
+        assert response.json()["next_run_time"].startswith("2999-01-01T00:00:00")
+        assert response.json()["priority"] == 2
+
+        response = client.put(f"/api/v1/missions/{mission_id}/schedule", json={"cron": "0 3 * * *"})
+        assert response.json()["trigger"].startswith("cron[")
+        assert client.get(f"/api/v1/missions/{mission_id}/schedule").json()["next_run_time"] is not None
+        assert client.delete(f"/api/v1/missions/{mission_id}/schedule").status_code == 204
+        assert client.get(f"/api/v1/missions/{mission_id}/schedule").status_code == 404
+
+        schedule_url = f"/api/v1/missions/{mission_id}/schedule"
+        assert client.put(schedule_url, json={"cron": "not a crontab"}).status_code == 422
+        assert client.put(schedule_url, json={"cron": "0 3 * * *", "interval_seconds": 60}).status_code == 422
+        assert client.put("/api/v1/missions/999999999/schedule", json={}).status_code == 404
+        assert client.post("/api/v1/robots/999999999/ready").status_code == 404
+
+
+def test_scheduling_requires_running_scheduler():
+    """Test case for scheduling requests in a process that does not run the scheduler."""
+    client = TestClient(app)
+    assert client.put("/api/v1/missions/1/schedule", json={}).status_code == 503
+    assert client.post("/api/v1/robots/1/ready").status_code == 503
+    assert client.post("/api/v1/missions/archive", params={"finished_before": "2000-01-01T00:00:00"}).status_code == 503
+
+
+def run_mission_now(client, mission_id, robot_id, timeout=5.0):
+    """Schedule a mission to run now and wait until its robot was assigned it."""
+    assert client.put(f"/api/v1/missions/{mission_id}/schedule", json={}).status_code == 200
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = client.get(f"/api/v1/missions/{mission_id}/status").json()["status"]
+        if status == "assigned":
+            return
+        if status == "queued":
+            # Assigned here, or right away when it becomes due if the robot already waits idle
+            client.post(f"/api/v1/robots/{robot_id}/ready")
+        time.sleep(0.05)
+    raise AssertionError(f"Mission {mission_id} was not assigned")
+
+
+def test_mission_lifecycle():
+    """
+    Test case for moving a dispatched mission through its statuses.
+
+    Verifies each transition and its timestamps, that transitions the current status
+    does not allow are refused with 409, that a stale `If-Match` is refused with 412,
+    and that missions can be listed by status.
+    """
+    with TestClient(app) as client:
+        robot_id = client.post("/api/v1/robots/", json={"name": "Worker", "model_name": "Model L"}).json()["id"]
+        mission_id = client.post(
+            "/api/v1/missions/", json={"name": "Deliver", "description": "Lifecycle", "robot_id": robot_id}
+        ).json()["id"]
+        status_url = f"/api/v1/missions/{mission_id}/status"
+        assert client.get(status_url).json()["status"] == "pending"
+        assert client.post(f"/api/v1/missions/{mission_id}/start").status_code == 409
+
+        run_mission_now(client, mission_id, robot_id)
+        response = client.get(status_url)
+        assigned = response.json()
+        assert assigned["status"] == "assigned" and assigned["assigned_at"] >= assigned["queued_at"]
+        etag = response.headers["ETag"]
+        assert client.post(f"/api/v1/missions/{mission_id}/complete").status_code == 409
+
+        stale = client.post(f"/api/v1/missions/{mission_id}/start", headers={"If-Match": f'"{mission_id}-1"'})
+        assert stale.status_code == 412
+        response = client.post(f"/api/v1/missions/{mission_id}/start", headers={"If-Match": etag})
+        assert response.status_code == 200 and response.json()["status"] == "running"
+        assert response.headers["ETag"] != etag
+        assert client.post(f"/api/v1/missions/{mission_id}/start").status_code == 409
+
+        done = client.post(f"/api/v1/missions/{mission_id}/complete").json()
+        assert done["status"] == "done" and done["finished_at"] >= done["started_at"] >= assigned["assigned_at"]
+        assert client.post(f"/api/v1/missions/{mission_id}/fail").status_code == 409
+
+        listed = client.get("/api/v1/missions/", params={"robot_id": robot_id, "status": "done"}).json()
+        assert [mission["id"] for mission in listed] == [mission_id]
+        assert client.get(f"/api/v1/robots/{robot_id}/missions", params={"status": "running"}).json() == []
+        assert client.get("/api/v1/missions/", params={"status": "lost"}).status_code == 422
+
+        # A finished mission runs again on its next schedule, with the previous run's times cleared
+        run_mission_now(client, mission_id, robot_id)
+        assert client.post(f"/api/v1/missions/{mission_id}/fail").json()["started_at"] is None
+        assert client.post("/api/v1/missions/999999999/start").status_code == 404
+        assert client.get("/api/v1/missions/999999999/status").status_code == 404
+
+
+def test_archive_finished_missions():
+    """
+    Test case for moving finished missions to the archive.
+
+    Verifies that missions that finished before the cutoff leave the mission
+    endpoints, while missions still in flight and missions with a schedule stay.
+    """
+    with TestClient(app) as client:
+        robot_id = client.post("/api/v1/robots/", json={"name": "Archivist", "model_name": "Model A"}).json()["id"]
+        finished, recurring, pending = (
+            client.post(
+                "/api/v1/missions/", json={"name": name, "description": "Archival", "robot_id": robot_id}
+            ).json()["id"]
+            for name in ("Finished", "Recurring", "Pending")
+        )
+        for mission_id in (finished, recurring):
+            run_mission_now(client, mission_id, robot_id)
+            assert client.post(f"/api/v1/missions/{mission_id}/fail").status_code == 200
+        body = {"start_at": "2999-01-01T00:00:00Z", "interval_seconds": 3600}
+        assert client.put(f"/api/v1/missions/{recurring}/schedule", json=body).status_code == 200
+
+        response = client.post("/api/v1/missions/archive", params={"finished_before": "2999-01-01T00:00:00"})
+        assert response.status_code == 200 and response.json()["archived"] >= 1
+        assert client.get(f"/api/v1/missions/{finished}").status_code == 404
+        assert client.get(f"/api/v1/missions/{recurring}/status").json()["status"] == "failed"
+        assert client.get(f"/api/v1/missions/{pending}/status").json()["status"] == "pending"
+        assert client.delete(f"/api/v1/missions/{recurring}/schedule").status_code == 204
@@ -0,0 +1,101 @@
+import logging
+import re
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app  # Import the FastAPI app
+from app.instrumentation import Exposition, Histogram, slow_request_log
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Fixture for setting up the FastAPI test client.
+
+    Creates a new `TestClient` instance for making HTTP requests to
+    the FastAPI application.
+    """
+    return TestClient(app)
+
+
+def sample(text, name, **labels):
+    """Return the value of the sample of a metric with exactly the given labels, or 0 if absent."""
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    pattern = re.escape(f"{name}{{{label_text}}}" if labels else name) + r" (\S+)$"
+    match = re.search(pattern, text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_histogram_buckets():
+    """
+    Test case for the fixed-bucket histogram.
+
+    Verifies that values are counted in the first bucket whose bound they do not
+    exceed, that the buckets are reported cumulatively and that the exposition
+    format escapes label values.
+    """
+    histogram = Histogram((1, 5, 10))
+    for value in (0, 1, 2, 5, 11, 100):
+        histogram.observe(value)
+    assert list(histogram.cumulative()) == [(1, 2), (5, 4), (10, 4), (float("inf"), 6)]
+    assert histogram.sum == 119
+    assert histogram.count == 6
+
+    exposition = Exposition()
+    exposition.histogram("latency", "Latency.", [({"route": 'say "hi"\n'}, histogram)])
+    text = exposition.render()
+    assert "# TYPE latency histogram" in text
+    assert 'latency_bucket{route="say \\"hi\\"\\n",le="+Inf"} 6' in text
+    assert 'latency_count{route="say \\"hi\\"\\n"} 6' in text
+
+
+def test_prometheus_metrics(client):
+    """
+    Test case for `GET /metrics`.
+
+    Creates a robot and fetches a missing mission, then verifies that both requests
+    are counted under their route templates with their status codes, that the SQL
+    statements they executed are counted, and that component counters are included.
+    """
+    before = client.get("/metrics").text
+    response = client.post("/api/v1/robots/", json={"name": f"metrics-{uuid.uuid4().hex}", "model_name": "Model M"})
+    assert response.status_code == 200
+    assert client.get("/api/v1/missions/999999999").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    after = response.text
+
+    def delta(name, **labels):
+        return sample(after, name, **labels) - sample(before, name, **labels)
+
+    robots = {"method": "POST", "route": "/api/v1/robots/"}
+    mission = {"method": "GET", "route": "/api/v1/missions/{mission_id}"}
+    assert delta("http_requests_total", **robots, status=200) == 1
+    assert delta("http_requests_total", **mission, status=404) == 1
+    assert delta("http_request_duration_seconds_count", **robots) == 1
+    assert delta("http_request_db_statements_sum", **robots) >= 1
+    assert delta("http_request_db_statements_sum", **mission) == 1
+    assert delta("http_request_db_seconds_sum", **robots) > 0
+    assert sample(after, "missions_app_db_statements_total", engine="async") > 0
+    assert "missions_app_cache_hits{" in after
+
+
+def test_slow_request_log(client, monkeypatch, caplog):
+    """
+    Test case for the slow-request log.
+
+    With every request sampled and a threshold every request exceeds, verifies that
+    a request is logged with its route, SQL statements and profile.
+    """
+    monkeypatch.setattr(slow_request_log, "threshold", 1e-9)
+    monkeypatch.setattr(slow_request_log, "profile_rate", 1.0)
+    with caplog.at_level(logging.WARNING, logger="app.instrumentation"):
+        assert client.get("/api/v1/missions/999999999").status_code == 404
+    messages = [record.getMessage() for record in caplog.records if record.name == "app.instrumentation"]
+    assert len(messages) == 1
+    assert "GET /api/v1/missions/999999999 (/api/v1/missions/{mission_id}) answered 404" in messages[0]
+    assert "1 SQL statements" in messages[0]
+    assert "Ordered by: cumulative time" in messages[0]
@@ -0,0 +1,43 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app  # Import the FastAPI app
+from app.db.base import engine
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Fixture for setting up the FastAPI test client.
+
+    Creates a new `TestClient` instance for making HTTP requests to
+    the FastAPI application.
+    """
+    return TestClient(app)
+
+
+def test_read_db_metrics(client):
+    """
+    Test case for the database pool metrics endpoint.
+
+    Issues a request that uses the database, then verifies that the async pool
+    reports at least one checkout and that both engines expose their counters.
+    """
+    client.get("/api/v1/robots/")
+    response = client.get("/api/v1/metrics/db")
+    assert response.status_code == 200
+    response_data = response.json()
+    assert set(response_data) == {"sync", "async"}
+    assert response_data["async"]["checkouts"] >= 1
+    assert {"connects", "checkins", "waits", "wait_seconds"} <= set(response_data["sync"])
+
+
+def test_sqlite_pragmas():
+    """
+    Test case for the SQLite connection pragmas.
+
+    Opens a connection on the application engine and verifies that WAL journaling
+    and `synchronous=NORMAL` are in effect.
+    """
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
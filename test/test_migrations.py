@@ -0,0 +1,99 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+from app.crud import mission as mission_crud
+from app.crud import robot as robot_crud
+
+# The schema as created by the first release, before versions and indexes were added
+FIRST_RELEASE_SCHEMA = (
+    "CREATE TABLE robots (id INTEGER NOT NULL PRIMARY KEY, name VARCHAR, model_name VARCHAR)",
+    "CREATE TABLE missions (id INTEGER NOT NULL PRIMARY KEY, name VARCHAR, description VARCHAR, "
+    "robot_id INTEGER REFERENCES robots (id))",
+    "INSERT INTO robots (id, name, model_name) VALUES (1, 'Old robot', 'Model A')",
+    "INSERT INTO missions (id, name, description, robot_id) VALUES (1, 'Old mission', 'Before versions', 1)",
+)
+
+
+def test_create_all_upgrades_first_release_database(tmp_path):
+    """
+    Test case for upgrading a database created by the first release.
+
+    Creates the original tables with a row each, runs `create_all` as the
+    application does on start, and verifies that the rows gained version 1 and can
+    be read through the current crud functions, and that the indexes added since
+    exist. A second run must be a no-op.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as connection:
+        for statement in FIRST_RELEASE_SCHEMA:
+            connection.execute(text(statement))
+
+    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    inspector = inspect(engine)
+    assert {"version", "priority", "queued_at", "assigned_at"} <= {
+        column["name"] for column in inspector.get_columns("missions")
+    }
+    assert {"ix_missions_robot_id_id", "ix_missions_robot_id_status", "ix_missions_status_queued_at"} <= {
+        index["name"] for index in inspector.get_indexes("missions")
+    }
+    assert "ix_robots_model_name" in {index["name"] for index in inspector.get_indexes("robots")}
+    db = sessionmaker(bind=engine)()
+    try:
+        assert robot_crud.get_robot_row(db, 1)._asdict() == {
+            "id": 1,
+            "name": "Old robot",
+            "model_name": "Model A",
+            "version": 1,
+        }
+        assert mission_crud.get_mission_row(db, 1).version == 1
+        assert mission_crud.get_mission(db, 1).priority == 0
+        assert mission_crud.get_mission_status(db, 1).status == "pending"
+    finally:
+        db.close()
+        engine.dispose()
+
+
+# Missions as recorded by the release that introduced dispatch, before statuses
+DISPATCH_RELEASE_SCHEMA = (
+    "CREATE TABLE missions (id INTEGER NOT NULL PRIMARY KEY, name VARCHAR, description VARCHAR, "
+    "robot_id INTEGER, version INTEGER NOT NULL DEFAULT 1, priority INTEGER NOT NULL DEFAULT 0, "
+    "queued_at BIGINT, assigned_at BIGINT)",
+    "CREATE INDEX ix_missions_assigned_at_queued_at ON missions (assigned_at, queued_at)",
+    "INSERT INTO missions (id, name, robot_id) VALUES (1, 'Never due', 1)",
+    "INSERT INTO missions (id, name, robot_id, queued_at) VALUES (2, 'Waiting', 1, 100)",
+    "INSERT INTO missions (id, name, robot_id, queued_at, assigned_at) VALUES (3, 'Handed out', 1, 100, 200)",
+)
+
+
+def test_create_all_backfills_statuses(tmp_path):
+    """
+    Test case for upgrading a database from before mission statuses.
+
+    Verifies that the status of existing missions is derived from their queue
+    timestamps, so queued missions are still dispatched after the upgrade, and that
+    the index the status indexes replaced is dropped.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'dispatch.db'}")
+    with engine.begin() as connection:
+        for statement in DISPATCH_RELEASE_SCHEMA:
+            connection.execute(text(statement))
+
+    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("missions")}
+    assert "ix_missions_status_finished_at" in indexes
+    assert "ix_missions_assigned_at_queued_at" not in indexes
+    db = sessionmaker(bind=engine)()
+    try:
+        assert [mission_crud.get_mission_status(db, mission_id).status for mission_id in (1, 2, 3)] == [
+            "pending",
+            "queued",
+            "assigned",
+        ]
+        assert [row.id for row in mission_crud.get_queued_missions(db)] == [2]
+    finally:
+        db.close()
+        engine.dispose()
@@ -1,6 +1,15 @@
+import json
+import uuid
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event, text
 from app.main import app  # Import the FastAPI app
+from app.api.api_v1.pagination import encode_cursor
+from app.db.async_base import async_engine
+from app.crud.mission import get_mission_row, get_mission_rows, missions_query, search_missions as missions_search
+from app.db.base import engine
 from app.db.session import get_db, SessionLocal
 from app.models.mission import Mission as MissionModel
 from app.schemas.mission import MissionCreate, MissionUpdate
@@ -27,6 +36,26 @@ def client():
 
 BASE_URL = "/api/v1/missions"
 
+@contextmanager
+def count_queries():
+    """Collect the SQL statements the API issues while the block runs."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+def query_plan(query):
+    """Return SQLite's EXPLAIN QUERY PLAN output for an ORM query as one string."""
+    sql = query.statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        return " | ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
 def test_create_mission(client, test_db):
     """Test the creation of a new mission.
 
@@ -105,3 +134,424 @@ def test_read_mission_not_found(client):
     response = client.get(f"{BASE_URL}/999")
     assert response.status_code == 404
     assert response.json() == {"detail": "Mission not found"}
+
+def test_read_missions_cursor(client, test_db):
+    """Test paging through missions with the keyset cursor.
+
+    Creates three missions and walks the listing two at a time, following the
+    `X-Next-Cursor` header. Verifies that pages do not overlap and that the cursor
+    mode returns the same rows as the equivalent offset page.
+    """
+    for i in range(3):
+        client.post(BASE_URL, json={"name": f"Cursor {i}", "description": "Paged", "robot_id": 1})
+
+    first = client.get(BASE_URL, params={"limit": 2})
+    assert first.status_code == 200
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get(BASE_URL, params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    first_ids = [m["id"] for m in first.json()]
+    second_ids = [m["id"] for m in second.json()]
+    assert second_ids and min(second_ids) > max(first_ids)
+    assert second.json() == client.get(BASE_URL, params={"limit": 2, "skip": 2}).json()
+
+def test_read_missions_invalid_cursor(client):
+    """Test that a malformed cursor is rejected with a 400 response."""
+    response = client.get(BASE_URL, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+
+def test_create_missions_bulk(client, test_db):
+    """Test creating several missions with one bulk request.
+
+    Sends three items, one of them invalid. Verifies that the valid missions are
+    created and retrievable, and that the invalid one is reported by index.
+    """
+    items = [
+        {"name": "Bulk 1", "description": "Bulk", "robot_id": 1},
+        {"name": "Bulk 2", "robot_id": 1},
+        {"name": "Bulk 3", "description": "Bulk", "robot_id": 2},
+    ]
+    response = client.post(f"{BASE_URL}/bulk", json=items)
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["ids"][1] is None
+    assert [error["index"] for error in response_data["errors"]] == [1]
+    created = client.get(f"{BASE_URL}/{response_data['ids'][2]}").json()
+    assert created["name"] == "Bulk 3"
+    assert response_data["ids"][2] == response_data["ids"][0] + 1
+
+def test_update_missions_bulk(client, test_db):
+    """Test updating several missions with one bulk request.
+
+    Verifies that existing missions are updated and that an unknown ID is reported
+    as an error without aborting the rest of the batch.
+    """
+    ids = client.post(f"{BASE_URL}/bulk", json=[{"name": "To Update", "description": "Bulk", "robot_id": 1}]).json()["ids"]
+    items = [
+        {"id": ids[0], "name": "Bulk Updated", "description": "Bulk", "robot_id": 3},
+        {"id": 10**9, "name": "Missing", "description": "Bulk", "robot_id": 3},
+    ]
+    response = client.put(f"{BASE_URL}/bulk", json=items)
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["ids"] == [ids[0], None]
+    assert response_data["errors"] == [{"index": 1, "detail": "Mission not found"}]
+    assert client.get(f"{BASE_URL}/{ids[0]}").json()["name"] == "Bulk Updated"
+
+def test_export_missions(client, test_db):
+    """Test streaming all missions as NDJSON, with and without gzip.
+
+    Creates a mission and exports the table. Verifies that every line is a JSON
+    object, that the new mission is present, and that the gzip variant decodes to
+    the same content.
+    """
+    mission_data = {"name": "Exported Mission", "description": "Export", "robot_id": 1}
+    mission_id = client.post(BASE_URL, json=mission_data).json()["id"]
+
+    response = client.get(f"{BASE_URL}/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert {**mission_data, "id": mission_id} in rows
+
+    compressed = client.get(f"{BASE_URL}/export", params={"gzip": True})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.text == response.text
+
+def test_import_missions_ndjson(client, test_db):
+    """Test importing missions from an NDJSON upload.
+
+    Uploads two valid lines around an unparseable and an invalid one. Verifies the
+    counts in the report and that the failed rows are reported by data row index.
+    """
+    lines = [
+        json.dumps({"name": "Imported 1", "description": "NDJSON", "robot_id": 1}),
+        "{not json",
+        json.dumps({"name": "Imported 2", "robot_id": 1}),
+        json.dumps({"name": "Imported 3", "description": "NDJSON", "robot_id": 2}),
+    ]
+    response = client.post(
+        f"{BASE_URL}/import", content="\n".join(lines) + "\n", headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["rows"], report["created"], report["failed"]) == (4, 2, 2)
+    assert [error["index"] for error in report["errors"]] == [1, 2]
+
+def test_import_missions_csv(client, test_db):
+    """Test importing missions from a CSV upload with a quoted multi-line field."""
+    body = 'name,description,robot_id\r\nCSV 1,"First, with comma",1\r\nCSV 2,"Spans\r\ntwo lines",2\r\n'
+    response = client.post(f"{BASE_URL}/import", params={"format": "csv"}, content=body)
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["rows"], report["created"], report["failed"]) == (2, 2, 0)
+
+def test_import_missions_unsupported_format(client):
+    """Test that an upload that is neither NDJSON nor CSV is rejected with 415."""
+    response = client.post(f"{BASE_URL}/import", content="<xml/>", headers={"Content-Type": "application/xml"})
+    assert response.status_code == 415
+
+def test_read_mission_etag(client, test_db):
+    """Test conditional GETs of a single mission and of a mission page.
+
+    Verifies that repeating a request with the returned ETag in `If-None-Match`
+    yields an empty 304, and that an update changes the mission's ETag.
+    """
+    mission_data = {"name": "ETag Mission", "description": "ETag", "robot_id": 1}
+    mission_id = client.post(BASE_URL, json=mission_data).json()["id"]
+
+    response = client.get(f"{BASE_URL}/{mission_id}")
+    etag = response.headers["ETag"]
+    cached = client.get(f"{BASE_URL}/{mission_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    page = client.get(BASE_URL, params={"limit": 5})
+    assert client.get(BASE_URL, params={"limit": 5}, headers={"If-None-Match": page.headers["ETag"]}).status_code == 304
+
+    client.put(f"{BASE_URL}/{mission_id}", json={**mission_data, "name": "ETag Mission 2"})
+    assert client.get(f"{BASE_URL}/{mission_id}", headers={"If-None-Match": etag}).status_code == 200
+
+def test_update_mission_if_match(client, test_db):
+    """Test optimistic concurrency on PUT with `If-Match`.
+
+    Verifies that an update carrying the current ETag succeeds and returns a new
+    ETag, and that replaying it with the now stale ETag is rejected with 412.
+    """
+    mission_data = {"name": "Locked Mission", "description": "Lock", "robot_id": 1}
+    create_response = client.post(BASE_URL, json=mission_data)
+    mission_id = create_response.json()["id"]
+    etag = create_response.headers["ETag"]
+
+    response = client.put(f"{BASE_URL}/{mission_id}", json={**mission_data, "name": "First"}, headers={"If-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    response = client.put(f"{BASE_URL}/{mission_id}", json={**mission_data, "name": "Second"}, headers={"If-Match": etag})
+    assert response.status_code == 412
+    assert client.get(f"{BASE_URL}/{mission_id}").json()["name"] == "First"
+
+def test_read_missions_expand_robot(client, test_db):
+    """Test embedding robots in a mission listing without N+1 queries.
+
+    Creates missions on three different robots and lists them with `expand=robot`.
+    Verifies each mission embeds its robot and that the page costs a single joined
+    query, while the plain listing has no `robot` key.
+    """
+    robot_ids = [
+        client.post("/api/v1/robots/", json={"name": f"Expand Robot {i}", "model_name": "Model X"}).json()["id"]
+        for i in range(3)
+    ]
+    first = client.post(BASE_URL, json={"name": "Expand 0", "description": "E", "robot_id": robot_ids[0]}).json()
+    for i in range(1, 6):
+        client.post(BASE_URL, json={"name": f"Expand {i}", "description": "E", "robot_id": robot_ids[i % 3]})
+    cursor = encode_cursor(first["id"] - 1)
+
+    with count_queries() as statements:
+        response = client.get(BASE_URL, params={"cursor": cursor, "limit": 6, "expand": "robot"})
+    assert response.status_code == 200
+    assert len(statements) == 1
+    missions = response.json()
+    assert len(missions) == 6
+    assert all(mission["robot"]["id"] == mission["robot_id"] for mission in missions)
+
+    plain = client.get(BASE_URL, params={"cursor": cursor, "limit": 6}).json()
+    assert all(set(mission) == {"id", "name", "description", "robot_id"} for mission in plain)
+
+def test_read_mission_expand_robot(client, test_db):
+    """Test embedding the robot in a single mission response with one query."""
+    robot_id = client.post("/api/v1/robots/", json={"name": "Solo Robot", "model_name": "Model S"}).json()["id"]
+    mission_id = client.post(BASE_URL, json={"name": "Solo", "description": "S", "robot_id": robot_id}).json()["id"]
+
+    with count_queries() as statements:
+        response = client.get(f"{BASE_URL}/{mission_id}", params={"expand": "robot"})
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert response.json()["robot"] == {"id": robot_id, "name": "Solo Robot", "model_name": "Model S"}
+
+def test_read_missions_filters(client, test_db):
+    """Test filtering the mission listing by robot, name prefix and robot model.
+
+    Creates missions on two robots of different models and verifies each filter,
+    alone and combined, returns exactly the matching missions in ID order. Names
+    and models carry a per-run tag, so rows left by earlier runs never match.
+    """
+    tag = uuid.uuid4().hex[:8]
+    model_a, model_b = f"Filter Model A {tag}", f"Filter Model B {tag}"
+    alpha = client.post("/api/v1/robots/", json={"name": "Filter A", "model_name": model_a}).json()["id"]
+    beta = client.post("/api/v1/robots/", json={"name": "Filter B", "model_name": model_b}).json()["id"]
+    names = [f"Filter {tag} survey", f"Filter {tag} sweep", f"Filter {tag} patrol"]
+    created = [
+        client.post(BASE_URL, json={"name": name, "description": "F", "robot_id": robot_id}).json()["id"]
+        for name, robot_id in zip(names, [alpha, beta, alpha])
+    ]
+
+    response = client.get(BASE_URL, params={"robot_id": alpha})
+    assert [m["id"] for m in response.json()] == [created[0], created[2]]
+
+    response = client.get(BASE_URL, params={"name_prefix": f"Filter {tag} s"})
+    assert [m["name"] for m in response.json()] == names[:2]
+
+    response = client.get(BASE_URL, params={"model_name": model_b})
+    assert [m["id"] for m in response.json()] == [created[1]]
+
+    response = client.get(BASE_URL, params={"model_name": model_a, "name_prefix": f"Filter {tag} p"})
+    assert [m["id"] for m in response.json()] == [created[2]]
+
+
+def test_read_missions_name_prefix_edge_cases(client, test_db):
+    """Test name prefixes that are not plain ASCII words.
+
+    Verifies that LIKE wildcards in the prefix are matched literally, that matching
+    is case-sensitive, and that a prefix ending in the largest code point is answered
+    instead of failing.
+    """
+    tag = uuid.uuid4().hex[:8]
+    names = [f"Edge {tag} 100%", f"Edge {tag} 1000", f"edge {tag} 100%"]
+    for name in names:
+        client.post(BASE_URL, json={"name": name, "description": "E", "robot_id": 1})
+
+    response = client.get(BASE_URL, params={"name_prefix": f"Edge {tag} 100%"})
+    assert [m["name"] for m in response.json()] == names[:1]
+
+    response = client.get(BASE_URL, params={"name_prefix": f"Edge {tag} 10_0"})
+    assert response.json() == []
+
+    response = client.get(BASE_URL, params={"name_prefix": f"Edge {tag}\U0010ffff"})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_read_missions_sort(client, test_db):
+    """Test the whitelisted sort keys and their interaction with cursors.
+
+    Verifies `name` and `-id` sorts, that a cursor continues a `-id` listing downwards,
+    that non-ID sorts return no cursor and reject one, and that unknown keys are rejected.
+    """
+    prefix = f"Sort {uuid.uuid4().hex[:8]} "
+    for name in ["c", "a", "b"]:
+        client.post(BASE_URL, json={"name": prefix + name, "description": "S", "robot_id": 1})
+
+    response = client.get(BASE_URL, params={"name_prefix": prefix, "sort": "name"})
+    assert [m["name"] for m in response.json()] == [prefix + "a", prefix + "b", prefix + "c"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get(BASE_URL, params={"name_prefix": prefix, "sort": "-id", "limit": 2})
+    assert [m["name"] for m in response.json()] == [prefix + "b", prefix + "a"]
+    response = client.get(
+        BASE_URL, params={"name_prefix": prefix, "sort": "-id", "cursor": response.headers["X-Next-Cursor"]}
+    )
+    assert [m["name"] for m in response.json()] == [prefix + "c"]
+
+    assert client.get(BASE_URL, params={"sort": "name", "cursor": encode_cursor(1)}).status_code == 400
+    assert client.get(BASE_URL, params={"sort": "description"}).status_code == 422
+
+
+def test_read_robot_missions(client, test_db):
+    """Test listing the missions of one robot through `GET /robots/{id}/missions`."""
+    robot_id = client.post("/api/v1/robots/", json={"name": "Owner", "model_name": "Model O"}).json()["id"]
+    ids = [
+        client.post(BASE_URL, json={"name": f"Owned {i}", "description": "O", "robot_id": robot_id}).json()["id"]
+        for i in range(3)
+    ]
+    client.post(BASE_URL, json={"name": "Not owned", "description": "O", "robot_id": 1})
+
+    response = client.get(f"/api/v1/robots/{robot_id}/missions", params={"limit": 2})
+    assert response.status_code == 200
+    assert [m["id"] for m in response.json()] == ids[:2]
+    assert "ETag" in response.headers
+    response = client.get(
+        f"/api/v1/robots/{robot_id}/missions", params={"cursor": response.headers["X-Next-Cursor"]}
+    )
+    assert [m["id"] for m in response.json()] == ids[2:]
+
+    assert client.get("/api/v1/robots/999999/missions").status_code == 404
+
+def test_mission_filters_use_indexes(test_db):
+    """Test that each filter is answered from an index rather than a table scan."""
+    db = SessionLocal()
+    try:
+        plan = query_plan(missions_query(db, robot_id=1, after_id=10).limit(100))
+        assert "ix_missions_robot_id_id" in plan
+        assert "SCAN" not in plan
+
+        plan = query_plan(missions_query(db, name_prefix="Filter", sort="name").limit(100))
+        assert "ix_missions_name" in plan
+        assert "SCAN" not in plan
+
+        plan = query_plan(missions_query(db, model_name="Model X").limit(100))
+        assert "ix_robots_model_name" in plan
+        assert "ix_missions_robot_id_id" in plan
+    finally:
+        db.close()
+
+def test_search_missions(client, test_db):
+    """Test full-text search over mission names and descriptions.
+
+    Verifies that all words must match, name matches rank above description
+    matches, results page by offset, and updates are reflected in the index. The
+    searched words carry a per-run tag, so missions from earlier runs never match.
+    """
+    tag = uuid.uuid4().hex[:8]
+    glacier, dune = f"glacier{tag}", f"dune{tag}"
+    in_name = client.post(
+        BASE_URL, json={"name": f"{glacier} mapping", "description": "Survey the ice shelf", "robot_id": 1}
+    ).json()["id"]
+    in_description = client.post(
+        BASE_URL, json={"name": "Routine run", "description": f"{glacier} photos near the ice field", "robot_id": 1}
+    ).json()["id"]
+
+    response = client.get(f"{BASE_URL}/search", params={"q": f"{glacier} ice"})
+    assert response.status_code == 200
+    assert [m["id"] for m in response.json()] == [in_name, in_description]
+
+    response = client.get(f"{BASE_URL}/search", params={"q": glacier.upper(), "skip": 1})
+    assert [m["id"] for m in response.json()] == [in_description]
+
+    response = client.get(f"{BASE_URL}/search", params={"q": f"{glacier} photos"})
+    assert [m["id"] for m in response.json()] == [in_description]
+
+    client.put(
+        f"{BASE_URL}/{in_description}", json={"name": "Routine run", "description": f"{dune} photos", "robot_id": 1}
+    )
+    response = client.get(f"{BASE_URL}/search", params={"q": glacier})
+    assert [m["id"] for m in response.json()] == [in_name]
+    response = client.get(f"{BASE_URL}/search", params={"q": dune})
+    assert [m["id"] for m in response.json()] == [in_description]
+
+    assert client.get(f"{BASE_URL}/search", params={"q": '"*'}).json() == []
+    assert client.get(f"{BASE_URL}/search").status_code == 422
+
+
+def test_search_missions_uses_fts_index(test_db):
+    """Test that search runs against the FTS5 table rather than scanning missions."""
+    db = SessionLocal()
+    try:
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            missions_search(db, "glacier")
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        assert "missions_fts MATCH" in statements[0]
+        assert "LIKE" not in statements[0]
+    finally:
+        db.close()
+
+def test_mission_reads_bypass_identity_map(client, test_db):
+    """Test that the read layer returns plain rows without building ORM instances."""
+    robot_id = client.post("/api/v1/robots/", json={"name": "Row Robot", "model_name": "Model R"}).json()["id"]
+    mission_id = client.post(BASE_URL, json={"name": "Row", "description": "R", "robot_id": robot_id}).json()["id"]
+    db = SessionLocal()
+    try:
+        rows = get_mission_rows(db, after_id=mission_id - 1, limit=1, expand_robot=True)
+        row = get_mission_row(db, mission_id)
+        assert rows[0].robot__name == "Row Robot"
+        assert row._asdict() == {"id": mission_id, "name": "Row", "description": "R", "robot_id": robot_id, "version": 1}
+        assert len(db.identity_map) == 0
+    finally:
+        db.close()
+
+def test_update_mission_single_statement(client, test_db):
+    """Test that PUT writes with one UPDATE and reads the row back at most once.
+
+    Without RETURNING support the row is selected after the UPDATE; no existence
+    check runs before it, and a missing mission is reported from the row count.
+    """
+    mission_id = client.post(BASE_URL, json={"name": "One shot", "description": "O", "robot_id": 1}).json()["id"]
+
+    with count_queries() as statements:
+        response = client.put(f"{BASE_URL}/{mission_id}", json={"name": "One shot 2", "description": "O", "robot_id": 1})
+    assert response.status_code == 200
+    assert response.json() == {"id": mission_id, "name": "One shot 2", "description": "O", "robot_id": 1}
+    assert response.headers["ETag"] == f'"{mission_id}-2"'
+    assert statements[0].startswith("UPDATE missions")
+    assert len(statements) <= 2
+
+    with count_queries() as statements:
+        response = client.put(f"{BASE_URL}/999999", json={"name": "Ghost", "description": "G", "robot_id": 1})
+    assert response.status_code == 404
+    assert len(statements) == 1
+
+def test_patch_mission(client, test_db):
+    """Test partial updates: only sent fields change, nulls are rejected, If-Match applies."""
+    mission_id = client.post(BASE_URL, json={"name": "Patchable", "description": "Before", "robot_id": 1}).json()["id"]
+
+    response = client.patch(f"{BASE_URL}/{mission_id}", json={"description": "After"})
+    assert response.status_code == 200
+    assert response.json() == {"id": mission_id, "name": "Patchable", "description": "After", "robot_id": 1}
+    assert client.get(f"{BASE_URL}/{mission_id}").json()["description"] == "After"
+
+    assert client.patch(f"{BASE_URL}/{mission_id}", json={"name": None}).status_code == 422
+    stale = client.patch(f"{BASE_URL}/{mission_id}", json={"name": "Late"}, headers={"If-Match": f'"{mission_id}-1"'})
+    assert stale.status_code == 412
+    current = client.patch(f"{BASE_URL}/{mission_id}", json={}, headers={"If-Match": response.headers["ETag"]})
+    assert current.status_code == 200
+    assert current.headers["ETag"] == response.headers["ETag"]
+    assert client.patch(f"{BASE_URL}/999999", json={"name": "Ghost"}).status_code == 404
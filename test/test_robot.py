@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app  # Import the FastAPI app
@@ -97,8 +99,10 @@ def test_read_robots(client, test_db):
 
     response = client.get("/api/v1/robots/")
     assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
     response_data = response.json()
     assert len(response_data) >= 2
+    assert all(set(robot) == {"id", "name", "model_name"} for robot in response_data)
 
 def test_read_robot_not_found(client):
     """
@@ -111,3 +115,94 @@ def test_read_robot_not_found(client):
     response = client.get("/api/v1/robots/999")
     assert response.status_code == 404
     assert response.json() == {"detail": "Robot not found"}
+
+def test_read_robots_cursor(client, test_db):
+    """
+    Test case for paging through robots with the keyset cursor.
+
+    Creates three robots and requests two pages of two robots each, passing the
+    `X-Next-Cursor` header of the first page as `cursor`. Verifies that the second
+    page continues strictly after the first one.
+    """
+    for i in range(3):
+        client.post("/api/v1/robots/", json={"name": f"Cursor Robot {i}", "model_name": "Model C"})
+
+    first = client.get("/api/v1/robots/", params={"limit": 2})
+    assert first.status_code == 200
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/api/v1/robots/", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert min(r["id"] for r in second.json()) > max(r["id"] for r in first.json())
+
+def test_create_and_update_robots_bulk(client, test_db):
+    """
+    Test case for the bulk robot endpoints.
+
+    Creates two robots with `POST /api/v1/robots/bulk`, then renames one of them with
+    `PUT /api/v1/robots/bulk`. Verifies the returned IDs and the stored data.
+    """
+    items = [{"name": "Bulk Robot 1", "model_name": "Model B"}, {"name": "Bulk Robot 2", "model_name": "Model B"}]
+    response = client.post("/api/v1/robots/bulk", json=items)
+    assert response.status_code == 200
+    ids = response.json()["ids"]
+    assert len(ids) == 2 and response.json()["errors"] == []
+
+    response = client.put("/api/v1/robots/bulk", json=[{"id": ids[1], "name": "Bulk Robot 2b", "model_name": "Model C"}])
+    assert response.status_code == 200
+    assert response.json()["ids"] == [ids[1]]
+    assert client.get(f"/api/v1/robots/{ids[1]}").json()["model_name"] == "Model C"
+
+def test_export_robots(client, test_db):
+    """
+    Test case for streaming all robots as NDJSON.
+
+    Creates a robot and sends a GET request to `/api/v1/robots/export`. Verifies that
+    each line is a JSON object and that the created robot is included.
+    """
+    robot_data = {"name": "Exported Robot", "model_name": "Model E"}
+    robot_id = client.post("/api/v1/robots/", json=robot_data).json()["id"]
+
+    response = client.get("/api/v1/robots/export")
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert {**robot_data, "id": robot_id} in rows
+
+def test_import_robots_csv(client, test_db):
+    """
+    Test case for importing robots from a CSV upload.
+
+    Sends a CSV body with a header row to `/api/v1/robots/import` and verifies the
+    import report counts.
+    """
+    body = "name,model_name\nImported Robot 1,Model I\nImported Robot 2,Model I\n"
+    response = client.post("/api/v1/robots/import", content=body, headers={"Content-Type": "text/csv"})
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["rows"], report["created"], report["failed"]) == (2, 2, 0)
+
+def test_read_robot_etag_and_if_match(client, test_db):
+    """
+    Test case for robot ETags.
+
+    Verifies that a GET with a matching `If-None-Match` returns 304 and that a PUT
+    with a stale `If-Match` is rejected with 412.
+    """
+    robot_data = {"name": "ETag Robot", "model_name": "Model T"}
+    robot_id = client.post("/api/v1/robots/", json=robot_data).json()["id"]
+    etag = client.get(f"/api/v1/robots/{robot_id}").headers["ETag"]
+    assert client.get(f"/api/v1/robots/{robot_id}", headers={"If-None-Match": etag}).status_code == 304
+
+    client.put(f"/api/v1/robots/{robot_id}", json={**robot_data, "name": "ETag Robot 2"})
+    response = client.put(f"/api/v1/robots/{robot_id}", json=robot_data, headers={"If-Match": etag})
+    assert response.status_code == 412
+
+def test_patch_robot(client, test_db):
+    """Test that PATCH only changes the fields it carries and bumps the ETag."""
+    robot = client.post("/api/v1/robots/", json={"name": "Patch Robot", "model_name": "Model P"}).json()
+
+    response = client.patch(f"/api/v1/robots/{robot['id']}", json={"model_name": "Model Q"})
+    assert response.status_code == 200
+    assert response.json() == {"id": robot["id"], "name": "Patch Robot", "model_name": "Model Q"}
+    assert response.headers["ETag"] == f'"{robot["id"]}-2"'
+    assert client.patch("/api/v1/robots/999999", json={"name": "Ghost"}).status_code == 404
@@ -0,0 +1,98 @@
+import math
+import uuid
+
+import numpy as np
+from fastapi.testclient import TestClient
+from app.main import app  # Import the FastAPI app
+from app.waypoints import batch_metrics, pack, path_length, simplify, unpack
+
+client = TestClient(app)
+
+
+def create_missions(count):
+    """Create a robot and `count` missions for it, returning the mission IDs."""
+    robot = client.post("/api/v1/robots/", json={"name": f"route-{uuid.uuid4().hex}", "model_name": "Route"})
+    payload = [{"name": "route", "description": "route test", "robot_id": robot.json()["id"]}] * count
+    return client.post("/api/v1/missions/bulk", json=payload).json()["ids"]
+
+
+def test_route_geometry():
+    """
+    Test case for the vectorized route geometry.
+
+    Verifies that packing round-trips, that simplification keeps the corners of a
+    path within the tolerance, and that the batch metrics of concatenated routes
+    match those of each route measured alone.
+    """
+    zigzag = np.array([[0, 0], [1, 0.01], [2, 0], [2, 5], [3, 5.02], [4, 5]], dtype=float)
+    assert np.array_equal(unpack(pack(zigzag)), zigzag)
+    assert simplify(zigzag, 0.1).tolist() == [[0, 0], [2, 0], [2, 5], [4, 5]]
+    assert len(simplify(zigzag, 0.001)) == len(zigzag)
+    spike = np.column_stack((np.arange(1000.0), np.zeros(1000)))
+    spike[700, 1] = 5
+    assert simplify(spike, 0.1).tolist() == [[0, 0], [699, 0], [700, 5], [701, 0], [999, 0]]
+
+    rng = np.random.default_rng(7)
+    routes = [rng.uniform(-100, 100, size=(n, 2)) for n in (1, 2, 50, 3)]
+    counts, lengths, boxes = batch_metrics([pack(route) for route in routes])
+    assert counts.tolist() == [1, 2, 50, 3]
+    for route, length, box in zip(routes, lengths, boxes):
+        assert math.isclose(length, path_length(route), abs_tol=1e-9)
+        assert box.tolist() == [*route.min(axis=0), *route.max(axis=0)]
+
+
+def test_upload_and_read_route():
+    """
+    Test case for a single mission's route.
+
+    Verifies that a route uploaded as JSON or packed is returned with its metrics,
+    simplified on request and packed to clients accepting binary, and that invalid
+    routes and unknown missions are refused.
+    """
+    [mission_id] = create_missions(1)
+    response = client.put(
+        f"/api/v1/missions/{mission_id}/route", json={"waypoints": [[0, 0], [3, 4], [3, 4.01], [3, 10]]}
+    )
+    assert response.status_code == 200
+    assert response.json()["length"] == 11.0 and response.json()["point_count"] == 4
+
+    route = client.get(f"/api/v1/missions/{mission_id}/route", params={"simplify": 0.1, "speed": 2}).json()
+    assert route["waypoints"] == [[0, 0], [3, 4], [3, 10]]
+    assert route["point_count"] == 4 and route["eta_seconds"] == 5.5
+    assert route["bbox"] == {"min_x": 0, "min_y": 0, "max_x": 3, "max_y": 10}
+
+    packed = np.array([[1, 1], [1, 2]], dtype="<f8").tobytes()
+    headers = {"Content-Type": "application/octet-stream"}
+    assert client.put(f"/api/v1/missions/{mission_id}/route", content=packed, headers=headers).json()["length"] == 1.0
+    response = client.get(f"/api/v1/missions/{mission_id}/route", headers={"Accept": "application/octet-stream"})
+    assert response.content == packed
+
+    assert client.put(f"/api/v1/missions/{mission_id}/route", content=packed[:-1], headers=headers).status_code == 422
+    assert client.put(f"/api/v1/missions/{mission_id}/route", json={"waypoints": []}).status_code == 422
+    assert client.put("/api/v1/missions/0/route", json={"waypoints": [[0, 0]]}).status_code == 404
+
+    assert client.delete(f"/api/v1/missions/{mission_id}/route").status_code == 204
+    assert client.get(f"/api/v1/missions/{mission_id}/route").status_code == 404
+
+
+def test_batch_routes():
+    """
+    Test case for the batch route endpoints.
+
+    Verifies that a batch upload reports invalid items and unknown missions per
+    item, and that the metrics of many routes come back in request order without
+    the missions that have no route.
+    """
+    mission_ids = create_missions(3)
+    items = [{"mission_id": mission_id, "waypoints": [[0, 0], [0, n + 1]]} for n, mission_id in enumerate(mission_ids)]
+    items += [{"mission_id": 0, "waypoints": [[0, 0]]}, {"mission_id": mission_ids[0], "waypoints": [["x", 0]]}]
+    result = client.put("/api/v1/missions/routes", json=items).json()
+    assert result["ids"] == [*mission_ids, None, None]
+    assert [error["index"] for error in result["errors"]] == [3, 4]
+
+    wanted = [mission_ids[2], 0, mission_ids[0]]
+    summaries = client.post("/api/v1/missions/routes/metrics", json={"mission_ids": wanted, "speed": 0.5}).json()
+    assert [(s["mission_id"], s["length"], s["eta_seconds"]) for s in summaries] == [
+        (mission_ids[2], 3.0, 6.0),
+        (mission_ids[0], 1.0, 2.0),
+    ]
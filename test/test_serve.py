@@ -0,0 +1,64 @@
+import os
+import signal
+import subprocess
+import sys
+from types import SimpleNamespace
+
+from app import serve
+
+# Imports app.main with a fresh database and reports what the import did
+IMPORT_CHECK = """
+import sys
+from sqlalchemy import inspect
+import app.main
+from app.db.base import engine
+print(sorted(inspect(engine).get_table_names()), "numpy" in sys.modules, "apscheduler" in sys.modules)
+"""
+
+
+def test_import_is_lazy(tmp_path):
+    """
+    Test case for importing the application.
+
+    Verifies that the import creates no table, leaving the schema to the startup
+    step, and imports neither NumPy nor APScheduler until they are used.
+    """
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{tmp_path / 'import.db'}"}
+    result = subprocess.run([sys.executable, "-c", IMPORT_CHECK], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["[]", "False", "False"]
+
+
+def test_exactly_one_worker_runs_the_scheduler(monkeypatch):
+    """
+    Test case for the production server's choice of the scheduler worker.
+
+    Verifies that only the first forked worker runs the scheduler, that a worker
+    forked after it exits takes over, that a reload without a replacement fork
+    recycles the newest worker instead, and that no worker runs it when the
+    scheduler is disabled.
+    """
+    monkeypatch.setattr(serve.gc, "freeze", lambda: None)
+    killed = []
+    server = SimpleNamespace(WORKERS={}, num_workers=2, kill_worker=lambda pid, sig: killed.append((pid, sig)))
+
+    def fork(pid):
+        worker = SimpleNamespace(pid=pid, age=pid)
+        serve.pre_fork(server, worker)
+        server.WORKERS[pid] = worker
+        return worker
+
+    first, second = fork(1), fork(2)
+    assert first.runs_scheduler and not second.runs_scheduler
+
+    serve.child_exit(server, server.WORKERS.pop(1))
+    assert killed == []
+    assert fork(3).runs_scheduler
+
+    # Reloading forks new workers before the old ones exit
+    fork(4), fork(5)
+    serve.child_exit(server, server.WORKERS.pop(3))
+    assert killed == [(5, signal.SIGTERM)]
+
+    monkeypatch.setenv("SCHEDULER_ENABLED", "0")
+    server.WORKERS.clear()
+    assert not fork(6).runs_scheduler
@@ -0,0 +1,112 @@
+import time
+import uuid
+
+from fastapi.testclient import TestClient
+from app.main import app  # Import the FastAPI app
+from app.crud.stats import aggregate_mission_stats
+from app.db.session import SessionLocal
+from app.stats import FleetStats
+
+
+class FakeClock:
+    """A settable clock for the status history."""
+
+    def __init__(self, now=1_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_fleet_stats_follow_writes():
+    """
+    Test case for the incremental counters.
+
+    Verifies that missions are counted per robot, per model and per status as they
+    are created, reassigned, moved through statuses and removed, and that a robot's
+    missions follow it to a new model.
+    """
+    stats = FleetStats(clock=FakeClock())
+    stats.robots_changed([(1, "Model A"), (2, "Model B")])
+    stats.missions_added([(1, "pending"), (1, "pending"), (2, "pending"), (3, "pending")])
+    stats.missions_moved([(1, 2)])
+    stats.status_changed("pending", "queued")
+    stats.robots_changed([(2, "Model A")])
+    stats.missions_removed([(3, "pending")])
+
+    snapshot = stats.snapshot()
+    assert snapshot["missions"] == 3
+    assert snapshot["by_status"] == {"pending": 2, "queued": 1, "assigned": 0, "running": 0, "done": 0, "failed": 0}
+    assert snapshot["by_robot"] == [{"robot_id": 1, "missions": 1}, {"robot_id": 2, "missions": 2}]
+    assert snapshot["by_model"] == [{"model_name": "Model A", "missions": 3}]
+
+
+def test_fleet_stats_reconcile_and_history():
+    """
+    Test case for reconciliation and the status history.
+
+    Verifies that replacing the counters reports how many had drifted, and that
+    buckets without changes repeat the counts of the bucket before them.
+    """
+    clock = FakeClock(now=600.0)
+    stats = FleetStats(history_bucket=60, history_size=3, clock=clock)
+    stats.missions_added([(1, "pending")])
+    clock.now += 120
+    stats.status_changed("pending", "queued")
+
+    assert stats.replace({1: 1}, {1: "Model A"}, {"queued": 1}) == 1  # the model count had not been known
+    assert stats.replace({1: 1}, {1: "Model A"}, {"queued": 1}) == 0
+    assert stats.stats()["reconciliations"] == 2
+
+    clock.now += 60
+    history = stats.history()
+    assert [point["at"] for point in history] == [660_000, 720_000, 780_000]
+    assert [point["by_status"]["queued"] for point in history] == [0, 1, 1]
+
+
+def test_stats_endpoint_matches_aggregate():
+    """
+    Test case for GET /stats.
+
+    Writes missions through the API, including a reassignment, a robot model change
+    and status transitions, and verifies that the counts served from memory equal
+    the GROUP BY aggregate over the tables.
+    """
+    model = f"Model {uuid.uuid4().hex[:8]}"
+    with TestClient(app) as client:
+        robots = [
+            client.post("/api/v1/robots/", json={"name": f"Counted {i}", "model_name": model}).json()["id"]
+            for i in range(2)
+        ]
+        missions = [
+            client.post(
+                "/api/v1/missions/", json={"name": f"Counted {i}", "description": "Stats", "robot_id": robots[0]}
+            ).json()["id"]
+            for i in range(3)
+        ]
+        client.post("/api/v1/missions/bulk", json=[{"name": "Bulk", "description": "Stats", "robot_id": robots[1]}] * 2)
+        assert client.patch(f"/api/v1/missions/{missions[0]}", json={"robot_id": robots[1]}).status_code == 200
+        assert client.patch(f"/api/v1/robots/{robots[1]}", json={"model_name": model + " v2"}).status_code == 200
+        assert client.put(f"/api/v1/missions/{missions[1]}/schedule", json={}).status_code == 200
+        deadline = time.monotonic() + 5
+        while client.get(f"/api/v1/missions/{missions[1]}/status").json()["status"] == "pending":
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+
+        stats = client.get("/api/v1/stats/").json()
+        by_model = {row["model_name"]: row["missions"] for row in stats["by_model"]}
+        assert by_model[model] == 2 and by_model[model + " v2"] == 3
+        assert {"robot_id": robots[1], "missions": 3} in stats["by_robot"]
+        assert stats["status_history"][-1]["by_status"] == stats["by_status"]
+
+        db = SessionLocal()
+        try:
+            expected = aggregate_mission_stats(db)
+        finally:
+            db.close()
+        stats = client.get("/api/v1/stats/").json()
+        assert stats["missions"] == expected["missions"]
+        assert {status: count for status, count in stats["by_status"].items() if count} == expected["by_status"]
+        assert stats["by_model"] == expected["by_model"]
+        assert stats["by_robot"] == expected["by_robot"]
+        assert client.get("/api/v1/metrics/stats").json()["reconciled_at"] is not None
@@ -0,0 +1,267 @@
+import asyncio
+import math
+import random
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app  # Import the FastAPI app
+from app.crud.telemetry import get_robot_states
+from app.db.session import SessionLocal
+from app.telemetry import BufferFull, RobotStateStore, TelemetryBuffer
+from app.telemetry.spatial import SpatialGrid
+
+# Epoch milliseconds of the first test sample
+T0 = 1_700_000_000_000
+
+
+def make_points(robot_id, count, step_ms=100, start=T0):
+    """Build `count` samples of one robot, `step_ms` apart."""
+    return [
+        {
+            "robot_id": robot_id,
+            "ts": start + i * step_ms,
+            "x": float(i),
+            "y": 2.0 * i,
+            "battery": 90.0,
+            "state": "moving",
+        }
+        for i in range(count)
+    ]
+
+
+def test_ingest_and_read_telemetry():
+    """
+    Test case for ingesting telemetry through the write-behind buffer.
+
+    Posts two batches while the application's lifespan is running, one of them
+    resending a sample, and verifies after shutdown has flushed the buffer that
+    every distinct sample is stored once and returned in time order.
+    """
+    with TestClient(app) as client:
+        response = client.post("/api/v1/telemetry/", json=make_points(9001, 50))
+        assert response.status_code == 202
+        assert response.json() == {"accepted": 50}
+        assert client.post("/api/v1/telemetry/", json=make_points(9001, 2, start=T0 + 4_900)).status_code == 202
+
+    client = TestClient(app)
+    response = client.get("/api/v1/telemetry/9001", params={"start": T0, "end": T0 + 10_000})
+    assert response.status_code == 200
+    samples = response.json()
+    assert len(samples) == 51
+    assert [sample["ts"] for sample in samples] == sorted(sample["ts"] for sample in samples)
+    assert samples[0] == {"ts": T0, "x": 0.0, "y": 0.0, "battery": 90.0, "state": "moving"}
+
+    response = client.get("/api/v1/telemetry/9001", params={"start": T0 + 1_000, "end": T0 + 2_000})
+    assert [sample["ts"] for sample in response.json()] == [T0 + i * 100 for i in range(10, 20)]
+
+
+def test_downsample_telemetry():
+    """
+    Test case for downsampled telemetry reads.
+
+    Stores 40 samples 100 ms apart and verifies that one-second buckets average
+    ten samples each and start on bucket boundaries.
+    """
+    client = TestClient(app)
+    assert client.post("/api/v1/telemetry/", json=make_points(9002, 40)).status_code == 202
+
+    response = client.get("/api/v1/telemetry/9002", params={"start": T0, "end": T0 + 4_000, "bucket_ms": 1_000})
+    assert response.status_code == 200
+    buckets = response.json()
+    assert [bucket["ts"] for bucket in buckets] == [T0 + i * 1_000 for i in range(4)]
+    assert all(bucket["samples"] == 10 for bucket in buckets)
+    assert buckets[0]["x"] == pytest.approx(4.5)
+    assert buckets[1]["y"] == pytest.approx(29.0)
+
+
+def test_telemetry_validation():
+    """
+    Test case for rejected telemetry requests.
+
+    Verifies that out-of-range samples fail validation and that an empty time
+    range is refused.
+    """
+    client = TestClient(app)
+    point = make_points(9003, 1)[0]
+    assert client.post("/api/v1/telemetry/", json=[{**point, "battery": 120}]).status_code == 422
+    assert client.get("/api/v1/telemetry/9003", params={"start": T0, "end": T0}).status_code == 400
+
+
+def test_telemetry_buffer_flush_thresholds():
+    """
+    Test case for the write-behind buffer's flush triggers.
+
+    Verifies that reaching `flush_rows` flushes promptly in one batch, that a
+    smaller batch is flushed once the interval elapses, that the bound refuses
+    excess samples and that stopping writes what is left.
+    """
+    batches = []
+
+    async def writer(rows):
+        batches.append(len(rows))
+        return len(rows)
+
+    async def scenario():
+        buffer = TelemetryBuffer(writer, flush_rows=100, flush_interval=0.2, max_pending=150)
+        await buffer.start()
+        await buffer.submit(make_points(1, 100))
+        await asyncio.sleep(0.05)
+        assert batches == [100]
+
+        await buffer.submit(make_points(1, 10))
+        await asyncio.sleep(0.05)
+        assert buffer.pending == 10
+        await asyncio.sleep(0.3)
+        assert batches == [100, 10]
+
+        await buffer.submit(make_points(1, 150))
+        with pytest.raises(BufferFull):
+            await buffer.submit(make_points(1, 1))
+        await buffer.stop()
+        assert buffer.pending == 0
+        return buffer.stats()
+
+    stats = asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert sum(batches) == 260
+    assert stats["written"] == 260 and stats["rejected"] == 1
+
+
+def test_telemetry_buffer_stop_during_flush():
+    """
+    Test case for stopping the write-behind buffer while a flush is in progress.
+
+    Verifies that the batch being written and the samples queued meanwhile are all
+    written before `stop` returns.
+    """
+    written = []
+
+    async def slow_writer(rows):
+        await asyncio.sleep(0.2)
+        written.extend(rows)
+        return len(rows)
+
+    async def scenario():
+        buffer = TelemetryBuffer(slow_writer, flush_rows=10, flush_interval=5, max_pending=100)
+        await buffer.start()
+        await buffer.submit(make_points(1, 10))
+        await asyncio.sleep(0.05)
+        await buffer.submit(make_points(1, 5, start=T0 + 10_000))
+        await buffer.stop()
+        return buffer.stats()
+
+    stats = asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert len(written) == 15
+    assert stats["written"] == 15 and stats["pending"] == 0 and stats["dropped"] == 0
+
+
+def test_robot_state_store_keeps_latest():
+    """
+    Test case for merging states into the in-memory latest-state store.
+
+    Verifies that only more recent samples replace a robot's state, that rows are
+    ordered by robot ID and that the cached rows are rebuilt after a change.
+    """
+    store = RobotStateStore()
+    assert store.apply_samples(make_points(2, 3) + make_points(1, 1)) == 4
+    rows = store.rows()
+    assert rows == [(1, T0, 0.0, 0.0, 90.0, "moving"), (2, T0 + 200, 2.0, 4.0, 90.0, "moving")]
+    assert store.rows() is rows
+
+    assert store.merge([(2, T0, 9.0, 9.0, 10.0, "idle")]) == 0
+    assert store.rows() is rows
+    assert store.merge([(1, T0 + 50, 5.0, 5.0, 80.0, "idle")]) == 1
+    assert store.rows()[0] == (1, T0 + 50, 5.0, 5.0, 80.0, "idle")
+    assert len(store) == 2
+
+
+def test_read_robot_states():
+    """
+    Test case for serving the latest robot states.
+
+    Flushes samples of a fresh robot, the most recent one first, and verifies that
+    `/robots/state` reports the most recent sample, and that the `robot_state`
+    summary table holds the same state for restoring the store after a restart.
+    """
+    robot_id = uuid.uuid4().int % 1_000_000_000
+    with TestClient(app) as client:
+        assert client.post("/api/v1/telemetry/", json=make_points(robot_id, 1, start=T0 + 5_000)).status_code == 202
+        assert client.post("/api/v1/telemetry/", json=make_points(robot_id, 20)).status_code == 202
+
+    response = TestClient(app).get("/api/v1/robots/state")
+    assert response.status_code == 200
+    states = {state["robot_id"]: state for state in response.json()}
+    expected = {"robot_id": robot_id, "ts": T0 + 5_000, "x": 0.0, "y": 0.0, "battery": 90.0, "state": "moving"}
+    assert states[robot_id] == expected
+
+    restarted = RobotStateStore()
+    with SessionLocal() as db:
+        restarted.merge(get_robot_states(db))
+    assert (robot_id, T0 + 5_000, 0.0, 0.0, 90.0, "moving") in restarted.rows()
+
+
+def test_spatial_grid_matches_linear_scan():
+    """
+    Test case for the spatial index of robot positions.
+
+    Moves random points around a grid and verifies that nearest-neighbour and box
+    queries, with and without filters, return what scanning every point returns.
+    """
+    rng = random.Random(7)
+    grid, points = SpatialGrid(cell_size=20.0), {}
+    for step in range(3_000):
+        point_id = rng.randrange(1_000)
+        points[point_id] = (rng.uniform(-500, 500), rng.uniform(-500, 500))
+        grid.move(point_id, *points[point_id])
+    grid.remove(0)
+    points.pop(0, None)
+
+    for _ in range(50):
+        x, y = rng.uniform(-700, 700), rng.uniform(-700, 700)
+        scan = sorted((math.dist((x, y), point), point_id) for point_id, point in points.items())
+        assert [point_id for _, point_id, _, _ in grid.nearest(x, y, 5)] == [point_id for _, point_id in scan[:5]]
+        even = [point_id for distance, point_id in scan if point_id % 2 == 0 and distance <= 100][:3]
+        found = grid.nearest(x, y, 3, accept=lambda point_id: point_id % 2 == 0, max_distance=100)
+        assert [point_id for _, point_id, _, _ in found] == even
+
+        min_x, max_x = sorted(rng.uniform(-600, 600) for _ in range(2))
+        min_y, max_y = sorted(rng.uniform(-600, 600) for _ in range(2))
+        inside = {i for i, (px, py) in points.items() if min_x <= px <= max_x and min_y <= py <= max_y}
+        assert {point_id for point_id, _, _ in grid.within_bbox(min_x, min_y, max_x, max_y)} == inside
+
+
+def test_read_nearby_robots():
+    """
+    Test case for the nearby and within-bbox robot queries.
+
+    Flushes samples placing fresh robots far from every other test's robots and
+    verifies that they are found nearest first, filtered by state and radius, and
+    by box, and that a robot's latest position replaces its earlier one.
+    """
+    base = uuid.uuid4().int % 1_000_000_000
+    origin = 1e7 + base
+    robots = [(base + 1, 3.0, "idle"), (base + 2, 1.0, "moving"), (base + 3, 50.0, "idle")]
+    points = [
+        {"robot_id": robot_id, "ts": T0, "x": origin + offset, "y": origin, "battery": 50.0, "state": state}
+        for robot_id, offset, state in robots
+    ]
+    moved = {**points[0], "ts": T0 + 1, "x": origin + 2.0}
+    with TestClient(app) as client:
+        assert client.post("/api/v1/telemetry/", json=points).status_code == 202
+        assert client.post("/api/v1/telemetry/", json=[moved]).status_code == 202
+
+    client = TestClient(app)
+    params = {"x": origin, "y": origin, "limit": 3}
+    nearby = client.get("/api/v1/robots/nearby", params=params).json()
+    assert [(robot["robot_id"], robot["distance"]) for robot in nearby] == [
+        (base + 2, 1.0),
+        (base + 1, 2.0),
+        (base + 3, 50.0),
+    ]
+    idle = client.get("/api/v1/robots/nearby", params={**params, "state": "idle", "radius": 10}).json()
+    assert [robot["robot_id"] for robot in idle] == [base + 1]
+
+    box = {"min_x": origin, "min_y": origin - 1, "max_x": origin + 10, "max_y": origin + 1}
+    inside = client.get("/api/v1/robots/within-bbox", params=box).json()
+    assert [robot["robot_id"] for robot in inside] == [base + 1, base + 2]
+    assert client.get("/api/v1/robots/within-bbox", params={**box, "max_x": origin - 1}).status_code == 400